@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""國務院報表基準測試：灌入大量治理紀錄後量測各報表聚合函式的延遲
+
+請對可丟棄的資料庫執行（DATABASE_URL），預設灌入 100 萬筆紀錄，平均分散於
+福利／稅收／身分／發行四張表與過去 12 個月。
+用法：python scripts/state_council_report_benchmark.py [rows] [months]
+"""
+
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import asyncpg
+
+# 添加項目根目錄到路徑
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.config.db_settings import PoolConfig  # noqa: E402
+
+GUILD_ID = 9_210_000_000_000_000_000
+MEMBERS = 1000
+ITERATIONS = 20
+
+# 每張表的灌入語句；$1 guild、$2 筆數、$3 成員數、$4 月數
+_SEED_SQL = {
+    "welfare_disbursements": """
+        INSERT INTO governance.welfare_disbursements (
+            guild_id, recipient_id, amount, disbursement_type, reference_id, disbursed_at
+        )
+        SELECT $1, 1 + (g % $3), 1 + (g % 500), '定期福利', NULL,
+               now() - random() * make_interval(months => $4)
+        FROM generate_series(1, $2) AS g
+    """,
+    "tax_records": """
+        INSERT INTO governance.tax_records (
+            guild_id, taxpayer_id, taxable_amount, tax_rate_percent, tax_amount,
+            tax_type, assessment_period, collected_at
+        )
+        SELECT $1, 1 + (g % $3), 1000, 10, 100, '所得稅', 'bench',
+               now() - random() * make_interval(months => $4)
+        FROM generate_series(1, $2) AS g
+    """,
+    "identity_records": """
+        INSERT INTO governance.identity_records (
+            guild_id, target_id, action, reason, performed_by, performed_at
+        )
+        SELECT $1, 1 + (g % $3),
+               (ARRAY['移除公民身分', '標記疑犯', '移除疑犯標記'])[1 + g % 3],
+               NULL, 1 + ((g + 7) % $3),
+               now() - random() * make_interval(months => $4)
+        FROM generate_series(1, $2) AS g
+    """,
+    "currency_issuances": """
+        INSERT INTO governance.currency_issuances (
+            guild_id, amount, reason, performed_by, month_period, issued_at
+        )
+        SELECT $1, 1 + (g % 1000), 'bench', 1 + (g % $3), 'bench',
+               now() - random() * make_interval(months => $4)
+        FROM generate_series(1, $2) AS g
+    """,
+}
+
+
+async def seed(conn: Any, *, rows: int, months: int) -> None:
+    """將 rows 筆紀錄平均灌入四張治理紀錄表"""
+    per_table = rows // len(_SEED_SQL)
+    for table, sql in _SEED_SQL.items():
+        t0 = time.perf_counter()
+        await conn.execute(sql, GUILD_ID, per_table, MEMBERS, months)
+        await conn.execute(f"ANALYZE governance.{table}")
+        print(f"{table}: 灌入 {per_table:,} 筆（{time.perf_counter() - t0:.1f}s）")
+
+
+async def timed(conn: Any, sql: str, *args: Any) -> float:
+    """重複執行 ITERATIONS 次，回傳平均毫秒"""
+    await conn.fetch(sql, *args)  # 暖快取
+    t0 = time.perf_counter()
+    for _ in range(ITERATIONS):
+        await conn.fetch(sql, *args)
+    return (time.perf_counter() - t0) / ITERATIONS * 1000
+
+
+async def measure(conn: Any, *, months: int) -> None:
+    now = datetime.now(timezone.utc)
+    windows = {
+        "最近 1 個月": (now - timedelta(days=30), now),
+        f"全部 {months} 個月": (now - timedelta(days=31 * months), now),
+    }
+
+    for label, (start, end) in windows.items():
+        print(f"\n期間：{label}")
+        financial_ms = await timed(
+            conn,
+            "SELECT * FROM governance.fn_report_financial_totals($1, $2, $3)",
+            GUILD_ID,
+            start,
+            end,
+        )
+        print(f"  財務摘要: {financial_ms:.2f} ms")
+        for department in ("內政部", "財政部", "國土安全部", "中央銀行"):
+            dept_ms = await timed(
+                conn,
+                "SELECT * FROM governance.fn_report_department_metrics($1, $2, $3, $4)",
+                GUILD_ID,
+                department,
+                start,
+                end,
+            )
+            print(f"  部門指標（{department}）: {dept_ms:.2f} ms")
+        activity_ms = await timed(
+            conn,
+            "SELECT * FROM governance.fn_report_activity($1, $2, $3, 10)",
+            GUILD_ID,
+            start,
+            end,
+        )
+        print(f"  活動統計: {activity_ms:.2f} ms")
+
+
+async def main(rows: int, months: int) -> None:
+    config = PoolConfig.model_validate({})
+    conn = await asyncpg.connect(dsn=config.dsn)
+    try:
+        t0 = time.perf_counter()
+        await seed(conn, rows=rows, months=months)
+        print(f"灌入完成: {time.perf_counter() - t0:.1f}s")
+        await measure(conn, months=months)
+    finally:
+        await conn.close()
+
+
+if __name__ == "__main__":
+    total_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    total_months = int(sys.argv[2]) if len(sys.argv) > 2 else 12
+    asyncio.run(main(total_rows, total_months))
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""通知去重快取微基準：確認大量事件下記憶體維持固定，並量測每次查詢成本"""
+
+import gc
+import os
+import sys
+import time
+
+# 添加項目根目錄到路徑
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.infra.telemetry.dedup import BoundedDedupCache  # noqa: E402
+
+
+def get_memory_usage() -> float:
+    """獲取當前常駐記憶體（MB）；無 /proc 時回傳 0"""
+    try:
+        with open("/proc/self/status", encoding="utf-8") as fh:
+            for line in fh:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return 0.0
+
+
+# 每 REPEAT_EVERY 個事件重送一次舊 ID，模擬 NOTIFY 與重連補播的重複事件
+REPEAT_EVERY = 10
+
+
+def run_benchmark(total_events: int, maxsize: int = 10000) -> bool:
+    """推送 total_events 個交易 ID，檢查快取大小與配置記憶體是否持平"""
+    cache = BoundedDedupCache(maxsize)
+    sample_every = max(total_events // 20, 1)
+    samples: list[float] = []
+
+    gc.collect()
+    started = time.perf_counter()
+    for i in range(total_events):
+        key = f"tx-{i - 1 if i % REPEAT_EVERY == 0 and i else i}"
+        cache.seen(key)
+        if i % sample_every == 0:
+            samples.append(get_memory_usage())
+    elapsed = time.perf_counter() - started
+
+    stats = cache.stats()
+    print(f"事件總數: {total_events:,}")
+    print(f"耗時: {elapsed:.2f}s（{elapsed / total_events * 1e9:.0f} ns/事件）")
+    print(f"快取統計: {stats}")
+    print("RSS 取樣（MB）: " + ", ".join(f"{s:.1f}" for s in samples))
+
+    if stats["size"] > maxsize:
+        print("⚠️  快取大小超過上限")
+        return False
+
+    # 快取填滿後（取樣中段以後）記憶體不應再成長
+    settled = samples[len(samples) // 2 :]
+    growth = max(settled) - min(settled)
+    print(f"穩定期記憶體波動: {growth:.2f} MB")
+    if growth > 1.0:
+        print("⚠️  快取填滿後記憶體仍持續成長")
+        return False
+
+    print("✅ 記憶體固定，去重快取沒有洩漏")
+    return True
+
+
+if __name__ == "__main__":
+    events = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    sys.exit(0 if run_benchmark(events) else 1)
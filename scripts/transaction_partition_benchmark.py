@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""currency_transactions 分區基準測試：灌入大量交易後量測每日上限、歷史分頁與歸檔耗時
+
+請對可丟棄的資料庫執行（DATABASE_URL），預設灌入 5,000 萬筆、分散於過去 12 個月。
+用法：python scripts/transaction_partition_benchmark.py [rows] [months]
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+from typing import Any
+
+import asyncpg
+
+# 添加項目根目錄到路徑
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.config.db_settings import PoolConfig  # noqa: E402
+
+GUILD_ID = 9_150_000_000_000_000_000
+MEMBERS = 1000
+CHUNK_ROWS = 1_000_000
+
+
+async def seed(conn: Any, *, rows: int, months: int) -> None:
+    """建立過去 months 個月的分區，並以 generate_series 分批灌入 rows 筆交易"""
+    await conn.execute(
+        "SELECT economy.fn_ensure_transaction_partitions(2, now() - make_interval(months => $1))",
+        months,
+    )
+    await conn.execute(
+        """
+        INSERT INTO economy.guild_member_balances (guild_id, member_id, current_balance)
+        SELECT $1, m, 0 FROM generate_series(1, $2) AS m
+        ON CONFLICT (guild_id, member_id) DO NOTHING
+        """,
+        GUILD_ID,
+        MEMBERS,
+    )
+
+    seeded = 0
+    while seeded < rows:
+        batch = min(CHUNK_ROWS, rows - seeded)
+        t0 = time.perf_counter()
+        await conn.execute(
+            """
+            INSERT INTO economy.currency_transactions (
+                guild_id, initiator_id, target_id, amount, direction, reason,
+                balance_after_initiator, balance_after_target, created_at
+            )
+            SELECT $1, 1 + (g % $3), 1 + ((g + 1) % $3), 1, 'transfer', NULL, 0, 0,
+                   now() - random() * make_interval(months => $4)
+            FROM generate_series(1, $2) AS g
+            """,
+            GUILD_ID,
+            batch,
+            MEMBERS,
+            months,
+        )
+        seeded += batch
+        print(f"已灌入 {seeded:,} / {rows:,} 筆（本批 {time.perf_counter() - t0:.1f}s）")
+
+    await conn.execute("ANALYZE economy.currency_transactions")
+
+
+async def explain(conn: Any, sql: str, *args: Any) -> tuple[float, int]:
+    """回傳 (執行毫秒, 實際掃描的分區數)"""
+    raw = await conn.fetchval(f"EXPLAIN (ANALYZE, FORMAT JSON) {sql}", *args)
+    plan = (json.loads(raw) if isinstance(raw, str) else raw)[0]
+
+    scanned: set[str] = set()
+
+    def walk(node: dict[str, Any]) -> None:
+        if node.get("Actual Loops", 0) and "Relation Name" in node:
+            scanned.add(node["Relation Name"])
+        for child in node.get("Plans", []):
+            walk(child)
+
+    walk(plan["Plan"])
+    return float(plan["Execution Time"]), len(scanned)
+
+
+async def measure(conn: Any) -> None:
+    partitions = await conn.fetchval(
+        """
+        SELECT count(*) FROM pg_inherits
+        WHERE inhparent = 'economy.currency_transactions'::regclass
+        """
+    )
+    print(f"\n即時表分區數: {partitions}")
+
+    daily_ms, daily_parts = await explain(
+        conn,
+        """
+        SELECT coalesce(sum(amount), 0) FROM economy.currency_transactions
+        WHERE guild_id = $1 AND initiator_id = $2 AND direction = 'transfer'
+          AND created_at >= date_trunc('day', now())
+        """,
+        GUILD_ID,
+        1,
+    )
+    print(f"每日上限查詢: {daily_ms:.2f} ms，掃描 {daily_parts} 個分區")
+
+    # 歷史分頁走函式內部查詢，直接量測呼叫耗時
+    cursor = await conn.fetchval("SELECT now() - interval '90 days'")
+    for label, args in (("第一頁", (None, None)), ("90 天前游標", (cursor, None))):
+        t0 = time.perf_counter()
+        for _ in range(20):
+            await conn.fetch(
+                "SELECT * FROM economy.fn_get_member_history($1, $2, 10, $3, $4)",
+                GUILD_ID,
+                1,
+                *args,
+            )
+        print(f"歷史分頁（{label}）: {(time.perf_counter() - t0) / 20 * 1000:.2f} ms/次")
+
+    t0 = time.perf_counter()
+    archived = await conn.fetch(
+        "SELECT * FROM economy.fn_archive_transaction_partitions(interval '30 days')"
+    )
+    print(
+        f"歸檔 {len(archived)} 個分區: {(time.perf_counter() - t0) * 1000:.1f} ms "
+        f"（{', '.join(r[0] for r in archived) or '無'}）"
+    )
+
+
+async def main(rows: int, months: int) -> None:
+    config = PoolConfig.model_validate({})
+    conn = await asyncpg.connect(dsn=config.dsn)
+    try:
+        t0 = time.perf_counter()
+        await seed(conn, rows=rows, months=months)
+        print(f"灌入完成: {time.perf_counter() - t0:.1f}s")
+        await measure(conn)
+    finally:
+        await conn.close()
+
+
+if __name__ == "__main__":
+    total_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000_000
+    total_months = int(sys.argv[2]) if len(sys.argv) > 2 else 12
+    asyncio.run(main(total_rows, total_months))
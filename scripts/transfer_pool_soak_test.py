@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""轉帳事件池長時間壓測：確認鎖表與檢查狀態不會隨處理量無限成長"""
+
+import asyncio
+import gc
+import logging
+import os
+import sys
+from types import SimpleNamespace
+from typing import Any, List
+from uuid import uuid4
+
+import structlog
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# 添加項目根目錄到路徑
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.bot.services.transfer_event_pool import TransferEventPoolCoordinator  # noqa: E402
+from src.infra.result import Ok  # noqa: E402
+
+# 每筆轉帳 = 3 個 transfer_check_result + 1 個 transfer_check_approved
+EVENTS_PER_TRANSFER = 4
+CHECK_TYPES = ("balance", "cooldown", "daily_limit")
+
+
+def get_memory_usage() -> float:
+    """獲取當前常駐記憶體（MB）；無 /proc 時退回峰值 RSS"""
+    try:
+        with open("/proc/self/status", encoding="utf-8") as fh:
+            for line in fh:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    if resource:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        if sys.platform == "darwin":
+            return usage.ru_maxrss / 1024 / 1024
+        return usage.ru_maxrss / 1024
+    return 0.0
+
+
+class _Transaction:
+    async def __aenter__(self) -> None:
+        return None
+
+    async def __aexit__(self, *exc: Any) -> None:
+        return None
+
+
+class _Connection:
+    """只回傳已核准列的假連線，讓協調器走完「核准 → 執行 → 完成」路徑"""
+
+    def transaction(self) -> _Transaction:
+        return _Transaction()
+
+    async def fetchrow(self, _query: str, transfer_id: Any) -> dict[str, Any]:
+        return {
+            "transfer_id": transfer_id,
+            "guild_id": 1,
+            "initiator_id": 2,
+            "target_id": 3,
+            "amount": 1,
+            "metadata": {},
+            "status": "approved",
+        }
+
+    async def execute(self, *_args: Any) -> str:
+        return "OK"
+
+
+class _Acquire:
+    def __init__(self, conn: _Connection) -> None:
+        self._conn = conn
+
+    async def __aenter__(self) -> _Connection:
+        return self._conn
+
+    async def __aexit__(self, *exc: Any) -> None:
+        return None
+
+
+class _Pool:
+    def __init__(self) -> None:
+        self._conn = _Connection()
+
+    def acquire(self) -> _Acquire:
+        return _Acquire(self._conn)
+
+
+class _PendingGateway:
+    async def update_status(self, *_args: Any, **_kwargs: Any) -> None:
+        return None
+
+
+class _TransferGateway:
+    async def transfer_currency(self, *_args: Any, **_kwargs: Any) -> Any:
+        return Ok(SimpleNamespace(transaction_id=uuid4()))
+
+
+async def _push_transfer(coordinator: TransferEventPoolCoordinator) -> None:
+    transfer_id = uuid4()
+    await asyncio.gather(
+        *(
+            coordinator.handle_check_result(transfer_id=transfer_id, check_type=name, result=1)
+            for name in CHECK_TYPES
+        )
+    )
+    await coordinator.handle_check_approved(transfer_id=transfer_id)
+
+
+async def run_soak(total_events: int, concurrency: int = 100) -> bool:
+    """推送 total_events 個合成事件並檢查 RSS 與登錄表大小是否持平"""
+    coordinator = TransferEventPoolCoordinator(
+        pool=_Pool(),  # type: ignore[arg-type]
+        pending_gateway=_PendingGateway(),  # type: ignore[arg-type]
+        transfer_gateway=_TransferGateway(),  # type: ignore[arg-type]
+    )
+    # 直接標記為運作中，避免啟動週期性清理（其會連線資料庫）
+    coordinator._running = True
+
+    transfers = total_events // EVENTS_PER_TRANSFER
+    rounds = max(transfers // concurrency, 1)
+    sample_every = max(rounds // 20, 1)
+
+    initial_memory = get_memory_usage()
+    print(f"初始記憶體使用: {initial_memory:.2f} MB")
+    print(f"事件總數: {rounds * concurrency * EVENTS_PER_TRANSFER:,}（{concurrency} 筆並行）")
+
+    memory_samples: List[float] = []
+    peak_sizes = dict.fromkeys(coordinator.stats(), 0)
+
+    for i in range(rounds):
+        await asyncio.gather(*(_push_transfer(coordinator) for _ in range(concurrency)))
+
+        for key, value in coordinator.stats().items():
+            peak_sizes[key] = max(peak_sizes[key], value)
+
+        if i % sample_every == 0:
+            gc.collect()
+            current_memory = get_memory_usage()
+            memory_samples.append(current_memory)
+            print(
+                f"第 {i * concurrency * EVENTS_PER_TRANSFER:,} 個事件後記憶體: "
+                f"{current_memory:.2f} MB, 登錄表: {coordinator.stats()}"
+            )
+
+    gc.collect()
+    final_memory = get_memory_usage()
+    final_sizes = coordinator.stats()
+
+    print("\n轉帳事件池壓測結果:")
+    print(f"初始記憶體: {initial_memory:.2f} MB")
+    print(f"最終記憶體: {final_memory:.2f} MB")
+    print(f"記憶體增長: {final_memory - initial_memory:.2f} MB")
+    print(f"登錄表峰值: {peak_sizes}")
+    print(f"登錄表最終: {final_sizes}")
+
+    if any(final_sizes.values()):
+        print("⚠️  處理完成後登錄表仍有殘留項目")
+        return False
+
+    # 以前 1/4 取樣（暖機後）與最後 1/4 取樣比較，排除啟動時的配置成本
+    if len(memory_samples) >= 4:
+        quarter = len(memory_samples) // 4
+        avg_first = sum(memory_samples[quarter : quarter * 2]) / quarter
+        avg_last = sum(memory_samples[-quarter:]) / quarter
+        trend_increase = avg_last - avg_first
+        print(f"趨勢分析: 後段比前段平均增加 {trend_increase:.2f} MB")
+
+        if trend_increase > 5.0:
+            print("⚠️  可能存在記憶體洩漏")
+            return False
+
+    print("✅ RSS 持平，沒有明顯記憶體洩漏")
+    return True
+
+
+if __name__ == "__main__":
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+    events = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    sys.exit(0 if asyncio.run(run_soak(events)) else 1)
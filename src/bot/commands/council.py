@@ -22,11 +22,13 @@ from src.bot.services.council_service import (
     VoteTotals,
 )
 from src.bot.services.department_registry import get_registry
+from src.bot.services.dm_dispatcher import DmMessage, get_dm_dispatcher
 from src.bot.services.permission_service import PermissionResult, PermissionService
 from src.bot.services.state_council_service import StateCouncilService
 from src.bot.services.supreme_assembly_service import SupremeAssemblyService
 from src.bot.ui.base import PersistentPanelView
 from src.bot.ui.council_paginator import CouncilProposalPaginator
+from src.bot.ui.live_refresh import PanelRefreshDebouncer, shared_summary
 from src.bot.utils.error_templates import ErrorMessageTemplates
 from src.db.gateway.council_governance import CouncilConfig, Proposal
 from src.db.pool import get_pool
@@ -40,6 +42,9 @@ from src.infra.result import (
 
 LOGGER = structlog.get_logger(__name__)
 
+# 投票私訊按鈕在 DM dispatcher 中的 View 種類（參數為提案 ID）
+_DM_VOTE_VIEW = "council_vote"
+
 
 # 針對 Discord Interaction 的 values 解析做統一型別收斂，
 # 以免 Pylance 在嚴格模式下將 comprehension 內的變數判為 Unknown。
@@ -664,7 +669,7 @@ async def _dm_council_for_voting(
 ) -> None:
     # 直接使用傳入的 Result 服務，移除 DI 回退與臨時新建
 
-    view = VotingView(proposal_id=proposal.proposal_id, service=service)
+    _register_dm_views(service)
     # Anonymous in-progress: only aggregated counts are shown in the button acknowledgment
 
     # 使用新的多身分組機制獲取所有理事
@@ -715,11 +720,21 @@ async def _dm_council_for_voting(
         text=(f"門檻 T={proposal.threshold_t}，" f"截止：{proposal.deadline_at:%Y-%m-%d %H:%M UTC}")
     )
 
-    for m in members:
-        try:
-            await m.send(embed=embed, view=view)
-        except Exception as exc:
-            LOGGER.warning("council.dm.failed", member=m.id, error=str(exc))
+    await get_dm_dispatcher().fan_out(
+        members,
+        DmMessage(embed=embed, view=(_DM_VOTE_VIEW, str(proposal.proposal_id))),
+        guild_id=guild.id,
+        dedup_key=f"council:vote:{proposal.proposal_id}",
+        client=client,
+    )
+
+
+def _register_dm_views(service: CouncilService) -> None:
+    """登記投票私訊的 VotingView 建構函式（outbox 中的訊息送出時重建按鈕）。"""
+    get_dm_dispatcher().register_view_builder(
+        _DM_VOTE_VIEW,
+        lambda proposal_id: VotingView(proposal_id=UUID(proposal_id), service=service),
+    )
 
 
 # --- Background scheduler for reminders and timeouts ---
@@ -732,6 +747,8 @@ def _install_background_scheduler(client: discord.Client, service: CouncilServic
     global _scheduler_task
     if _scheduler_task is not None:
         return
+    # 重啟後 outbox 中尚未送出的投票私訊需要此建構函式重建按鈕
+    _register_dm_views(service)
 
     async def _runner() -> None:
         await client.wait_until_ready()
@@ -779,23 +796,16 @@ def _install_background_scheduler(client: discord.Client, service: CouncilServic
                         # Try DM only unvoted members
                         guild = client.get_guild(p.guild_id)
                         if guild is not None:
-                            for uid in unvoted:
-                                member = guild.get_member(uid)
-                                if member is None:
-                                    try:
-                                        user = await client.fetch_user(uid)
-                                        await user.send(
-                                            f"提案 {p.proposal_id} 24 小時內截止，請盡速投票。"
-                                        )
-                                    except Exception:
-                                        pass
-                                else:
-                                    try:
-                                        await member.send(
-                                            f"提案 {p.proposal_id} 24 小時內截止，請盡速投票。"
-                                        )
-                                    except Exception:
-                                        pass
+                            # 不在快取中的成員以 ID 交由 dispatcher 解析
+                            await get_dm_dispatcher().fan_out(
+                                [guild.get_member(uid) or uid for uid in unvoted],
+                                DmMessage(
+                                    content=f"提案 {p.proposal_id} 24 小時內截止，請盡速投票。"
+                                ),
+                                guild_id=p.guild_id,
+                                dedup_key=f"council:reminder:{p.proposal_id}",
+                                client=client,
+                            )
                         await gw.mark_reminded(c2, proposal_id=p.proposal_id)
 
                 # 廣播剛結束的提案結果（逾時或已執行/失敗），避免重複
@@ -861,6 +871,12 @@ class CouncilPanelView(PersistentPanelView):
         self.council_role_id = council_role_id
         self._unsubscribe: Callable[[], Awaitable[None]] | None = None
         self._update_lock = asyncio.Lock()
+        # 事件突發時合併刷新；_latest_event 僅供日誌
+        self._latest_event: CouncilEvent | None = None
+        self._live_refresh = PanelRefreshDebouncer(
+            lambda: self._apply_live_update(self._latest_event),
+            name=f"council:{guild.id}",
+        )
         self._paginator: CouncilProposalPaginator | None = None
 
         # 元件：建案、提案選擇、匯出
@@ -956,11 +972,16 @@ class CouncilPanelView(PersistentPanelView):
                 raise ValueError("author_id is required")
             balance_service = BalanceService(get_pool())
             council_account_id = await self._resolve_council_account_id()
-            snap_result = await balance_service.get_balance_snapshot(
-                guild_id=self.guild.id,
-                requester_id=self.author_id,
-                target_member_id=council_account_id,
-                can_view_others=True,
+            requester_id = self.author_id
+            # 同一 guild 的多個面板同時刷新時共用一次餘額查詢
+            snap_result = await shared_summary(
+                ("council", self.guild.id, "balance"),
+                lambda: balance_service.get_balance_snapshot(
+                    guild_id=self.guild.id,
+                    requester_id=requester_id,
+                    target_member_id=council_account_id,
+                    can_view_others=True,
+                ),
             )
             if isinstance(snap_result, Ok):
                 snap = snap_result.value
@@ -1199,9 +1220,10 @@ class CouncilPanelView(PersistentPanelView):
             return
         if self.is_finished() or self._message is None:
             return
-        await self._apply_live_update(event)
+        self._latest_event = event
+        await self._live_refresh.trigger()
 
-    async def _apply_live_update(self, event: CouncilEvent) -> None:
+    async def _apply_live_update(self, event: CouncilEvent | None) -> None:
         if self._message is None or self.is_finished():
             return
         async with self._update_lock:
@@ -1215,23 +1237,25 @@ class CouncilPanelView(PersistentPanelView):
                     guild_id=self.guild.id,
                     error=str(exc),
                 )
-            try:
-                if embed is not None:
-                    await self._message.edit(embed=embed, view=self)
-                else:
-                    await self._message.edit(view=self)
-                LOGGER.debug(
-                    "council.panel.live_update.applied",
-                    guild_id=self.guild.id,
-                    kind=event.kind,
-                    proposal_id=str(event.proposal_id) if event.proposal_id else None,
-                )
-            except Exception as exc:  # pragma: no cover - defensive
-                LOGGER.warning(
-                    "council.panel.live_update.failed",
-                    guild_id=self.guild.id,
-                    error=str(exc),
-                )
+            if self._live_refresh.render_changed(embed, self):
+                try:
+                    if embed is not None:
+                        await self._message.edit(embed=embed, view=self)
+                    else:
+                        await self._message.edit(view=self)
+                    LOGGER.debug(
+                        "council.panel.live_update.applied",
+                        guild_id=self.guild.id,
+                        kind=event.kind if event else None,
+                        proposal_id=str(event.proposal_id) if event and event.proposal_id else None,
+                    )
+                except Exception as exc:  # pragma: no cover - defensive
+                    self._live_refresh.forget_render()
+                    LOGGER.warning(
+                        "council.panel.live_update.failed",
+                        guild_id=self.guild.id,
+                        error=str(exc),
+                    )
 
             # 同時更新分頁器以保持即時更新
             if hasattr(self, "_paginator") and self._paginator:
@@ -1303,6 +1327,7 @@ class CouncilPanelView(PersistentPanelView):
             )
 
     async def _cleanup_subscription(self) -> None:
+        self._live_refresh.cancel()
         if self._unsubscribe is None:
             self._message = None
             return
@@ -2213,22 +2238,19 @@ async def _broadcast_result(
 
     # 取得提案資訊（Result 模式）
     proposal_ok, proposal_err = _unwrap_result(await service.get_proposal(proposal_id=proposal_id))
-    proposer_user: discord.User | discord.Member | None = None
+    recipients: list[Any] = list(members)
     if proposal_err is None and proposal_ok is not None:
         proposal = cast(Proposal, proposal_ok)
-        proposer_user = guild.get_member(proposal.proposer_id) or await _safe_fetch_user(
-            client, proposal.proposer_id
-        )
-
-    recipients: list[discord.abc.Messageable] = []
-    recipients.extend(members)
-    if proposer_user is not None and proposer_user.id not in [m.id for m in members]:
-        recipients.append(proposer_user)
-    for m in recipients:
-        try:
-            await m.send(embed=result_embed)
-        except Exception:
-            pass
+        # 提案人若不在快取中，以 ID 交由 dispatcher 解析；與理事重複者由 dispatcher 去重
+        recipients.append(guild.get_member(proposal.proposer_id) or proposal.proposer_id)
+
+    await get_dm_dispatcher().fan_out(
+        recipients,
+        DmMessage(embed=result_embed),
+        guild_id=guild.id,
+        dedup_key=f"council:result:{proposal_id}",
+        client=client,
+    )
 
 
 async def _register_persistent_views(client: discord.Client, service: CouncilService) -> None:
@@ -32,7 +32,9 @@ from src.bot.services.state_council_service import (
 )
 from src.bot.services.supreme_assembly_service import SupremeAssemblyService
 from src.bot.ui.base import PersistentPanelView
+from src.bot.ui.live_refresh import PanelRefreshDebouncer, shared_summary
 from src.bot.utils.error_templates import ErrorMessageTemplates
+from src.cython_ext.state_council_models import StateCouncilSummary
 from src.db.pool import get_pool
 from src.infra.di.container import DependencyContainer
 from src.infra.events.state_council_events import (
@@ -433,47 +435,38 @@ def build_state_council_group(
         has_dept_permission = False
         departments = ["內政部", "財政部", "國土安全部", "中央銀行"]
         if permission_service is not None and not is_leader:
-            for dept in departments:
-                perm_check = await permission_service.check_department_permission(
+            perm_check = await permission_service.check_department_permissions_bulk(
+                guild_id=interaction.guild_id,
+                user_id=interaction.user.id,
+                user_roles=user_roles,
+                departments=departments,
+            )
+            if isinstance(perm_check, Err):
+                error_message = ErrorMessageTemplates.from_error(perm_check.error)
+                await send_message_compat(
+                    interaction,
+                    content=error_message,
+                    ephemeral=True,
+                )
+                return
+            has_dept_permission = any(result.allowed for result in perm_check.value.values())
+        elif not is_leader:
+            # 單次查詢取得所有部門權限，避免逐部門取用連線
+            try:
+                allowed_map = await service.check_department_permissions_bulk(
                     guild_id=interaction.guild_id,
                     user_id=interaction.user.id,
                     user_roles=user_roles,
-                    department=dept,
-                    operation="panel_access",
+                    departments=departments,
                 )
-                if isinstance(perm_check, Err):
-                    error_message = ErrorMessageTemplates.from_error(perm_check.error)
-                    await send_message_compat(
-                        interaction,
-                        content=error_message,
-                        ephemeral=True,
-                    )
-                    return
-                permission_result = perm_check.value
-                if permission_result.allowed:
-                    has_dept_permission = True
-                    break
-        elif not is_leader:
-            for dept in departments:
-                # Check department permission using unified StateCouncilService
-                try:
-                    allowed = await service.check_department_permission(
-                        guild_id=interaction.guild_id,
-                        user_id=interaction.user.id,
-                        department=dept,
-                        user_roles=user_roles,
-                    )
-                except Exception as exc:
-                    LOGGER.error(
-                        "state_council.panel.department_check_failed",
-                        error=str(exc),
-                        extra={"department": dept},
-                    )
-                    allowed = False
-
-                if allowed:
-                    has_dept_permission = True
-                    break
+            except Exception as exc:
+                LOGGER.error(
+                    "state_council.panel.department_check_failed",
+                    error=str(exc),
+                    extra={"departments": departments},
+                )
+                allowed_map = {}
+            has_dept_permission = any(allowed_map.values())
 
         if not (is_leader or has_dept_permission):
             await send_message_compat(
@@ -610,6 +603,12 @@ class StateCouncilPanelView(PersistentPanelView):
         # 即時事件訂閱
         self._unsubscribe: Callable[[], Awaitable[None]] | None = None
         self._update_lock = asyncio.Lock()
+        # 事件突發時合併刷新；_latest_event 僅供日誌
+        self._latest_event: StateCouncilEvent | None = None
+        self._live_refresh = PanelRefreshDebouncer(
+            lambda: self._apply_live_update(self._latest_event),
+            name=f"state_council:{guild_id}",
+        )
         self.current_page = "總覽"
         self.departments = ["內政部", "財政部", "國土安全部", "中央銀行", "法務部"]
         self._last_allowed_departments: list[str] = []
@@ -641,9 +640,10 @@ class StateCouncilPanelView(PersistentPanelView):
             return
         if self.message is None:
             return
-        await self._apply_live_update(event)
+        self._latest_event = event
+        await self._live_refresh.trigger()
 
-    async def _apply_live_update(self, event: StateCouncilEvent) -> None:
+    async def _apply_live_update(self, event: StateCouncilEvent | None) -> None:
         if self.message is None:
             return
         async with self._update_lock:
@@ -657,6 +657,8 @@ class StateCouncilPanelView(PersistentPanelView):
                     error=str(exc),
                 )
                 embed = None
+            if not self._live_refresh.render_changed(embed, self):
+                return
             try:
                 if embed is not None:
                     await self.message.edit(embed=embed, view=self)
@@ -665,10 +667,11 @@ class StateCouncilPanelView(PersistentPanelView):
                 LOGGER.debug(
                     "state_council.panel.live_update.applied",
                     guild_id=self.guild_id,
-                    kind=event.kind,
-                    cause=event.cause,
+                    kind=event.kind if event else None,
+                    cause=event.cause if event else None,
                 )
             except Exception as exc:  # pragma: no cover - 防禦性日誌
+                self._live_refresh.forget_render()
                 LOGGER.warning(
                     "state_council.panel.live_update.failed",
                     guild_id=self.guild_id,
@@ -676,6 +679,7 @@ class StateCouncilPanelView(PersistentPanelView):
                 )
 
     async def _cleanup_subscription(self) -> None:
+        self._live_refresh.cancel()
         if self._unsubscribe is None:
             self.message = None
             return
@@ -718,11 +722,30 @@ class StateCouncilPanelView(PersistentPanelView):
     async def _compute_allowed_departments(self) -> list[str]:
         if self.is_leader:
             return list(self.departments)
-        allowed: list[str] = []
-        for dept in self.departments:
-            if await self._has_department_permission(dept):
-                allowed.append(dept)
-        return allowed
+        departments = list(self.departments)
+        if self.permission_service is not None:
+            perm_check = await self.permission_service.check_department_permissions_bulk(
+                guild_id=self.guild_id,
+                user_id=self.author_id,
+                user_roles=self.user_roles,
+                departments=departments,
+            )
+            if isinstance(perm_check, Err):
+                LOGGER.warning(
+                    "state_council.panel.permission_check.error",
+                    guild_id=self.guild_id,
+                    departments=departments,
+                    error=str(perm_check.error),
+                )
+                return []
+            return [dept for dept in departments if perm_check.value[dept].allowed]
+        allowed_map = await self.service.check_department_permissions_bulk(
+            guild_id=self.guild_id,
+            user_id=self.author_id,
+            user_roles=self.user_roles,
+            departments=departments,
+        )
+        return [dept for dept in departments if allowed_map.get(dept, False)]
 
     async def _has_department_permission(self, department: str) -> bool:
         if self.is_leader:
@@ -785,6 +808,7 @@ class StateCouncilPanelView(PersistentPanelView):
             await self.refresh_options()
             embed = await self.build_summary_embed()
             await edit_message_compat(interaction, embed=embed, view=self)
+            self._live_refresh.forget_render()
 
         nav.callback = _on_nav_select
         self.add_item(nav)
@@ -826,6 +850,7 @@ class StateCouncilPanelView(PersistentPanelView):
             await self.refresh_options()
             embed = await self.build_summary_embed()
             await edit_message_compat(interaction, embed=embed, view=self)
+            self._live_refresh.forget_render()
 
         return callback
 
@@ -840,6 +865,7 @@ class StateCouncilPanelView(PersistentPanelView):
             await self.refresh_options()
             embed = await self.build_summary_embed()
             await edit_message_compat(interaction, embed=embed, view=self)
+            self._live_refresh.forget_render()
 
         return callback
 
@@ -1393,6 +1419,13 @@ class StateCouncilPanelView(PersistentPanelView):
         )
         return embed
 
+    async def _load_council_summary(self) -> StateCouncilSummary:
+        # 同一 guild 的多個面板同時刷新時共用一次摘要查詢
+        return await shared_summary(
+            ("state_council", self.guild_id, "council_summary"),
+            lambda: self.service.get_council_summary(guild_id=self.guild_id),
+        )
+
     async def build_summary_embed(self) -> discord.Embed:
         """Build embed content based on current page."""
         if self.current_page == "總覽":
@@ -1402,7 +1435,7 @@ class StateCouncilPanelView(PersistentPanelView):
 
     async def _build_overview_embed(self) -> discord.Embed:
         try:
-            summary = await self.service.get_council_summary(guild_id=self.guild_id)
+            summary = await self._load_council_summary()
         except Exception as e:
             LOGGER.error("Failed to get council summary", error=str(e))
             embed = discord.Embed(
@@ -1477,7 +1510,7 @@ class StateCouncilPanelView(PersistentPanelView):
     async def _build_department_embed(self) -> discord.Embed:
         department = self.current_page
         try:
-            summary = await self.service.get_council_summary(guild_id=self.guild_id)
+            summary = await self._load_council_summary()
             stats = summary.department_stats.get(department)
             if not stats:
                 raise ValueError(f"Department {department} not found")
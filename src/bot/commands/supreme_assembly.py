@@ -16,6 +16,7 @@ from src.bot.interaction_compat import (
 from src.bot.services.balance_service import BalanceService
 from src.bot.services.council_service import CouncilService, CouncilServiceResult
 from src.bot.services.department_registry import get_registry
+from src.bot.services.dm_dispatcher import DmMessage, get_dm_dispatcher
 from src.bot.services.permission_service import PermissionService
 from src.bot.services.state_council_service import StateCouncilService
 from src.bot.services.supreme_assembly_service import (
@@ -26,6 +27,7 @@ from src.bot.services.supreme_assembly_service import (
 )
 from src.bot.services.transfer_service import TransferService, TransferValidationError
 from src.bot.ui.base import PersistentPanelView
+from src.bot.ui.live_refresh import PanelRefreshDebouncer, shared_summary
 from src.bot.utils.error_templates import ErrorMessageTemplates
 from src.db.pool import get_pool
 from src.infra.di.container import DependencyContainer
@@ -42,6 +44,9 @@ T = TypeVar("T")
 
 LOGGER = structlog.get_logger(__name__)
 
+# 表決私訊按鈕在 DM dispatcher 中的 View 種類（參數為提案 ID）
+_DM_VOTE_VIEW = "supreme_assembly_vote"
+
 
 # 針對 Discord Interaction 的 values 解析做統一型別收斂，
 # 以免 Pylance 在嚴格模式下將 comprehension 內的 v 判為 Unknown。
@@ -566,6 +571,12 @@ class SupremeAssemblyPanelView(PersistentPanelView):
         self.is_member = is_member
         self._unsubscribe: Callable[[], Awaitable[None]] | None = None
         self._update_lock = asyncio.Lock()
+        # 事件突發時合併刷新；_latest_event 僅供日誌
+        self._latest_event: SupremeAssemblyEvent | None = None
+        self._live_refresh = PanelRefreshDebouncer(
+            lambda: self._apply_live_update(self._latest_event),
+            name=f"supreme_assembly:{guild.id}",
+        )
         self._paginator: Any | None = None  # 分頁器屬性
 
         # 元件：轉帳、發起表決（議長或人民代表）、傳召（僅議長）、使用指引
@@ -659,11 +670,16 @@ class SupremeAssemblyPanelView(PersistentPanelView):
                 raise ValueError("author_id is required")
             balance_service = BalanceService(get_pool())
             account_id = await self._resolve_account_id()
-            snap_result = await balance_service.get_balance_snapshot(
-                guild_id=self.guild.id,
-                requester_id=self.author_id,
-                target_member_id=account_id,
-                can_view_others=True,
+            requester_id = self.author_id
+            # 同一 guild 的多個面板同時刷新時共用一次餘額查詢
+            snap_result = await shared_summary(
+                ("supreme_assembly", self.guild.id, "balance"),
+                lambda: balance_service.get_balance_snapshot(
+                    guild_id=self.guild.id,
+                    requester_id=requester_id,
+                    target_member_id=account_id,
+                    can_view_others=True,
+                ),
             )
             if hasattr(snap_result, "is_err") and callable(getattr(snap_result, "is_err", None)):
                 _result = cast("Result[Any, Exception]", snap_result)
@@ -939,9 +955,10 @@ class SupremeAssemblyPanelView(PersistentPanelView):
             return
         if self.is_finished() or self._message is None:
             return
-        await self._apply_live_update(event)
+        self._latest_event = event
+        await self._live_refresh.trigger()
 
-    async def _apply_live_update(self, event: SupremeAssemblyEvent) -> None:
+    async def _apply_live_update(self, event: SupremeAssemblyEvent | None) -> None:
         if self._message is None or self.is_finished():
             return
         async with self._update_lock:
@@ -955,25 +972,28 @@ class SupremeAssemblyPanelView(PersistentPanelView):
                     guild_id=self.guild.id,
                     error=str(exc),
                 )
-            try:
-                if embed is not None:
-                    await self._message.edit(embed=embed, view=self)
-                else:
-                    await self._message.edit(view=self)
-                LOGGER.debug(
-                    "supreme_assembly.panel.live_update.applied",
-                    guild_id=self.guild.id,
-                    kind=event.kind,
-                    proposal_id=str(event.proposal_id) if event.proposal_id else None,
-                )
-            except Exception as exc:  # pragma: no cover - defensive
-                LOGGER.warning(
-                    "supreme_assembly.panel.live_update.failed",
-                    guild_id=self.guild.id,
-                    error=str(exc),
-                )
+            if self._live_refresh.render_changed(embed, self):
+                try:
+                    if embed is not None:
+                        await self._message.edit(embed=embed, view=self)
+                    else:
+                        await self._message.edit(view=self)
+                    LOGGER.debug(
+                        "supreme_assembly.panel.live_update.applied",
+                        guild_id=self.guild.id,
+                        kind=event.kind if event else None,
+                        proposal_id=str(event.proposal_id) if event and event.proposal_id else None,
+                    )
+                except Exception as exc:  # pragma: no cover - defensive
+                    self._live_refresh.forget_render()
+                    LOGGER.warning(
+                        "supreme_assembly.panel.live_update.failed",
+                        guild_id=self.guild.id,
+                        error=str(exc),
+                    )
 
     async def _cleanup_subscription(self) -> None:
+        self._live_refresh.cancel()
         if self._unsubscribe is None:
             self._message = None
             return
@@ -1659,7 +1679,7 @@ async def _dm_members_for_voting(
 ) -> None:
     """Send DM to members with voting buttons."""
     service = SupremeAssemblyService()
-    view = SupremeAssemblyVotingView(proposal_id=proposal.proposal_id, service=service)
+    _register_dm_views(service)
     cfg_result = await service.get_config(guild_id=guild.id)
     # 若尚未設定治理配置，直接返回
     if cfg_result.is_err():
@@ -1678,11 +1698,23 @@ async def _dm_members_for_voting(
         text=(f"門檻 T={proposal.threshold_t}，" f"截止：{proposal.deadline_at:%Y-%m-%d %H:%M UTC}")
     )
 
-    for m in members:
-        try:
-            await m.send(embed=embed, view=view)
-        except Exception as exc:
-            LOGGER.warning("supreme_assembly.dm.failed", member=m.id, error=str(exc))
+    await get_dm_dispatcher().fan_out(
+        members,
+        DmMessage(embed=embed, view=(_DM_VOTE_VIEW, str(proposal.proposal_id))),
+        guild_id=guild.id,
+        dedup_key=f"supreme_assembly:vote:{proposal.proposal_id}",
+        client=client,
+    )
+
+
+def _register_dm_views(service: SupremeAssemblyService) -> None:
+    """登記表決私訊的 View 建構函式（outbox 中的訊息送出時重建按鈕）。"""
+    get_dm_dispatcher().register_view_builder(
+        _DM_VOTE_VIEW,
+        lambda proposal_id: SupremeAssemblyVotingView(
+            proposal_id=UUID(proposal_id), service=service
+        ),
+    )
 
 
 async def _broadcast_result(
@@ -1724,22 +1756,19 @@ async def _broadcast_result(
 
     # 確認提案人
     proposal_result = await service.get_proposal(proposal_id=proposal_id)
-    proposer_user: discord.User | discord.Member | None = None
+    recipients: list[Any] = list(members)
     proposal_val = proposal_result.unwrap_or(None)
     if proposal_val is not None:
-        proposer_user = guild.get_member(proposal_val.proposer_id) or await _safe_fetch_user(
-            client, proposal_val.proposer_id
-        )
-
-    recipients: list[discord.abc.Messageable] = []
-    recipients.extend(members)
-    if proposer_user is not None and proposer_user.id not in [m.id for m in members]:
-        recipients.append(proposer_user)
-    for m in recipients:
-        try:
-            await m.send(embed=result_embed)
-        except Exception:
-            pass
+        # 提案人若不在快取中，以 ID 交由 dispatcher 解析；與議員重複者由 dispatcher 去重
+        recipients.append(guild.get_member(proposal_val.proposer_id) or proposal_val.proposer_id)
+
+    await get_dm_dispatcher().fan_out(
+        recipients,
+        DmMessage(embed=result_embed),
+        guild_id=guild.id,
+        dedup_key=f"supreme_assembly:result:{proposal_id}",
+        client=client,
+    )
 
 
 # --- Summon UI Components ---
@@ -2294,14 +2323,6 @@ def _format_proposal_desc(p: Any) -> str:
     return f"截止 {deadline}｜T={p.threshold_t}｜{desc or '無描述'}"
 
 
-async def _safe_fetch_user(client: discord.Client, user_id: int) -> discord.User | None:
-    """嘗試以 API 取回使用者；若失敗回傳 None。"""
-    try:
-        return await client.fetch_user(user_id)
-    except Exception:
-        return None
-
-
 # --- Background scheduler ---
 
 _scheduler_task: asyncio.Task[None] | None = None
@@ -2312,6 +2333,8 @@ def _install_background_scheduler(client: discord.Client, service: SupremeAssemb
     global _scheduler_task
     if _scheduler_task is not None:
         return
+    # 重啟後 outbox 中尚未送出的表決私訊需要此建構函式重建按鈕
+    _register_dm_views(service)
 
     async def _runner() -> None:
         await client.wait_until_ready()
@@ -2364,29 +2387,19 @@ def _install_background_scheduler(client: discord.Client, service: SupremeAssemb
                             unvoted = unvoted_res.unwrap_or_else(lambda: [])
                             guild = client.get_guild(p.guild_id)
                             if guild is not None:
-                                for uid in unvoted:
-                                    member = guild.get_member(uid)
-                                    if member is None:
-                                        try:
-                                            user = await client.fetch_user(uid)
-                                            await user.send(
-                                                (
-                                                    f"表決提案 {p.proposal_id} 24 小時內截止，"
-                                                    "請盡速投票。"
-                                                )
-                                            )
-                                        except Exception:
-                                            pass
-                                    else:
-                                        try:
-                                            await member.send(
-                                                (
-                                                    f"表決提案 {p.proposal_id} 24 小時內截止，"
-                                                    "請盡速投票。"
-                                                )
-                                            )
-                                        except Exception:
-                                            pass
+                                # 此迴圈每分鐘執行且沒有 mark_reminded，靠 dedup_key 只提醒一次
+                                await get_dm_dispatcher().fan_out(
+                                    [guild.get_member(uid) or uid for uid in unvoted],
+                                    DmMessage(
+                                        content=(
+                                            f"表決提案 {p.proposal_id} 24 小時內截止，"
+                                            "請盡速投票。"
+                                        )
+                                    ),
+                                    guild_id=p.guild_id,
+                                    dedup_key=f"supreme_assembly:reminder:{p.proposal_id}",
+                                    client=client,
+                                )
 
                 # Broadcast results for completed proposals
                 for pid in due_before:
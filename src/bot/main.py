@@ -12,6 +12,8 @@ import structlog
 from discord import app_commands
 from dotenv import load_dotenv
 
+from src.bot.services.dm_dispatcher import get_dm_dispatcher
+from src.bot.services.transaction_partitions import TransactionPartitionMaintainer
 from src.bot.services.transfer_event_pool import TransferEventPoolCoordinator
 from src.config.settings import BotSettings
 from src.db import pool as db_pool
@@ -45,6 +47,8 @@ class EconomyBot(discord.Client):
         self._transfer_coordinator: TransferEventPoolCoordinator | None = None
         if event_pool_enabled:
             self._transfer_coordinator = TransferEventPoolCoordinator()
+        self._partition_maintainer = TransactionPartitionMaintainer()
+        self._dm_dispatcher = get_dm_dispatcher()
 
         self._telemetry_listener = TelemetryListener(
             transfer_coordinator=self._transfer_coordinator,
@@ -62,8 +66,11 @@ class EconomyBot(discord.Client):
         # Start transfer event pool coordinator if enabled
         if self._transfer_coordinator is not None:
             await self._transfer_coordinator.start()
+        await self._partition_maintainer.start()
 
         _bootstrap_command_tree(self.tree, container=self._container)
+        # 指令載入後才啟動：重啟前未送出的投票私訊需要各指令登記的 View 建構函式
+        await self._dm_dispatcher.start(self)
 
         LOGGER.info("bot.commands.loaded", count=len(self.tree.get_commands()))
 
@@ -89,6 +96,8 @@ class EconomyBot(discord.Client):
             await self._telemetry_listener.stop()
             if self._transfer_coordinator is not None:
                 await self._transfer_coordinator.stop()
+            await self._partition_maintainer.stop()
+            await self._dm_dispatcher.stop()
         finally:
             await db_pool.close_pool()
             await super().close()
@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import inspect
 from datetime import datetime
-from typing import Any, Awaitable, Callable, TypeVar, cast
+from typing import Any, Awaitable, Callable, Sequence, TypeVar, cast
+from uuid import UUID
 
 from src.cython_ext.economy_balance_models import (
     BalanceSnapshot,
@@ -14,11 +15,13 @@ from src.cython_ext.economy_balance_models import (
     make_balance_snapshot,
     make_history_entry,
 )
+from src.db import pool as db_pool
 from src.db.gateway.economy_queries import (
     BalanceRecord,
     EconomyQueryGateway,
     HistoryRecord,
 )
+from src.infra.balance_cache import get_balance_cache
 from src.infra.result import DatabaseError, Err, Ok, Result
 from src.infra.types.db import ConnectionProtocol, PoolProtocol
 
@@ -103,18 +106,30 @@ class BalanceService:
 
         async def _run_result(
             conn: ConnectionProtocol,
-        ) -> Result[BalanceSnapshot, DatabaseError]:
-            result = await self._gateway.fetch_balance(
+        ) -> Result[BalanceRecord, DatabaseError]:
+            return await self._gateway.fetch_balance(
                 conn,
                 guild_id=guild_id,
                 member_id=target_id,
             )
+
+        # 未持有呼叫端交易，可經由程序內餘額快取讀取（命中時不取用連線）
+        load_error: DatabaseError | None = None
+
+        async def _load() -> BalanceRecord | None:
+            nonlocal load_error
+            # 載入結果會快取至 TTL 結束：一律讀主庫。失效（例如節流拒絕）或淘汰後快取中
+            # 沒有較新的版本可比對，落後的副本資料會被當成最新值提供整個 TTL。
+            result = await self._with_connection_result(connection, _run_result, primary=True)
             if result.is_err():
-                return Err(result.unwrap_err())
-            record = result.unwrap()
-            return Ok(self._to_snapshot(record))
+                load_error = result.unwrap_err()
+                return None
+            return result.unwrap()
 
-        return await self._with_connection_result(connection, _run_result)
+        record = await get_balance_cache().get_or_load(guild_id, target_id, _load)
+        if record is None:
+            return Err(load_error or DatabaseError(message="fn_get_balance returned no result."))
+        return Ok(self._to_snapshot(record))
 
     async def get_history(
         self,
@@ -125,6 +140,7 @@ class BalanceService:
         can_view_others: bool = False,
         limit: int = 10,
         cursor: datetime | None = None,
+        cursor_transaction_id: UUID | None = None,
         connection: ConnectionProtocol | None = None,
     ) -> HistoryPage | Result[HistoryPage, DatabaseError]:
         """Return a paginated set of transactions for the target member.
@@ -132,6 +148,9 @@ class BalanceService:
         Dual-mode 合約：
         - 明確提供 `connection` 時：直接回傳 HistoryPage 或丟出例外
         - `connection is None` 時：採用 Result 合約，回傳 Result[HistoryPage, DatabaseError]
+
+        分頁採 (created_at, transaction_id) keyset：下一頁請傳入上一頁的
+        `next_cursor` 與 `next_cursor_transaction_id`；只傳 `cursor` 時沿用舊的時間戳語意。
         """
         if limit < 1 or limit > 50:
             raise ValueError("History limit must be between 1 and 50.")
@@ -151,6 +170,7 @@ class BalanceService:
                     member_id=target_id,
                     limit=limit,
                     cursor=cursor,
+                    cursor_transaction_id=cursor_transaction_id,
                 )
 
                 # 同時支援 Result[Sequence[HistoryRecord], Error] 與舊版直接回傳 list[HistoryRecord]
@@ -161,25 +181,7 @@ class BalanceService:
                 else:
                     records = cast(list[HistoryRecord], result)
 
-                entries = [self._to_history_entry(record, target_id) for record in records]
-
-                next_cursor_value: datetime | None = None
-                if len(entries) == limit and entries:
-                    last_created = entries[-1].created_at
-                    # Pylance: 對 asyncpg.fetchval 回傳值進行顯式 cast，避免 Unknown 型別傳染
-                    has_more = cast(
-                        bool | None,
-                        await conn.fetchval(
-                            "SELECT economy.fn_has_more_history($1,$2,$3)",
-                            guild_id,
-                            target_id,
-                            last_created,
-                        ),
-                    )
-                    if bool(has_more):
-                        next_cursor_value = last_created
-
-                return HistoryPage(items=entries, next_cursor=next_cursor_value)
+                return self._to_history_page(records, target_id, limit)
 
             return await self._with_connection(connection, _run)
 
@@ -207,6 +209,7 @@ class BalanceService:
                 member_id=target_id,
                 limit=limit,
                 cursor=cursor,
+                cursor_transaction_id=cursor_transaction_id,
             )
 
             # 同時支援 Result[Sequence[HistoryRecord], Error] 與舊版直接回傳 list[HistoryRecord]
@@ -217,27 +220,27 @@ class BalanceService:
             else:
                 records = cast(list[HistoryRecord], result)
 
-            entries = [self._to_history_entry(record, target_id) for record in records]
-
-            next_cursor_value: datetime | None = None
-            if len(entries) == limit and entries:
-                last_created = entries[-1].created_at
-                has_more = cast(
-                    bool | None,
-                    await conn.fetchval(
-                        "SELECT economy.fn_has_more_history($1,$2,$3)",
-                        guild_id,
-                        target_id,
-                        last_created,
-                    ),
-                )
-                if bool(has_more):
-                    next_cursor_value = last_created
-
-            return Ok(HistoryPage(items=entries, next_cursor=next_cursor_value))
+            return Ok(self._to_history_page(records, target_id, limit))
 
         return await self._with_connection_result(connection, _run_result)
 
+    def _to_history_page(
+        self,
+        records: Sequence[HistoryRecord],
+        member_id: int,
+        limit: int,
+    ) -> HistoryPage:
+        # gateway 會多取一列：存在即代表還有下一頁，不需再查 fn_has_more_history
+        entries = [self._to_history_entry(record, member_id) for record in records[:limit]]
+        if len(records) <= limit or not entries:
+            return HistoryPage(items=entries, next_cursor=None)
+        last = records[limit - 1]
+        return HistoryPage(
+            items=entries,
+            next_cursor=last.created_at,
+            next_cursor_transaction_id=last.transaction_id,
+        )
+
     def _assert_permission(
         self,
         requester_id: int,
@@ -251,6 +254,10 @@ class BalanceService:
             BalancePermissionError,
         )
 
+    def _read_pool(self) -> PoolProtocol:
+        """歷史查詢可容忍短暫延遲：讀取副本可用時改走副本，否則使用注入的連線池。"""
+        return cast(PoolProtocol, db_pool.get_read_pool(cast(Any, self._pool)))
+
     async def _with_connection(
         self,
         connection: ConnectionProtocol | None,
@@ -259,7 +266,7 @@ class BalanceService:
         """Yield a connection, handling both pooled and injected connections.
 
         - 若呼叫端已傳入 `connection`，直接使用該連線（舊行為）。
-        - 否則，透過 `self._pool.acquire()` 取得連線。
+        - 否則，透過 `self._read_pool().acquire()` 取得連線。
 
         為了同時支援：
         - 真實 asyncpg pool：`pool.acquire()` 回傳 async context manager
@@ -269,7 +276,7 @@ class BalanceService:
         if connection is not None:
             return await func(connection)
 
-        cm_or_conn: Any = self._pool.acquire()
+        cm_or_conn: Any = self._read_pool().acquire()
 
         # 首選：asyncpg / 假 pool，直接回傳 async context manager
         if hasattr(cm_or_conn, "__aenter__"):
@@ -292,12 +299,18 @@ class BalanceService:
         self,
         connection: ConnectionProtocol | None,
         func: Callable[[ConnectionProtocol], Awaitable[Result[T, DatabaseError]]],
+        *,
+        primary: bool = False,
     ) -> Result[T, DatabaseError]:
-        """與 `_with_connection` 類似，但保留 Result 形態以配合 Result 型服務。"""
+        """與 `_with_connection` 類似，但保留 Result 形態以配合 Result 型服務。
+
+        `primary=True` 時略過讀取副本，直接使用注入的（主庫）連線池。
+        """
         if connection is not None:
             return await func(connection)
 
-        cm_or_conn: Any = self._pool.acquire()
+        pool = self._pool if primary else self._read_pool()
+        cm_or_conn: Any = pool.acquire()
 
         if hasattr(cm_or_conn, "__aenter__"):
             async with cm_or_conn as pooled_connection:
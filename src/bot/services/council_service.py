@@ -29,7 +29,8 @@ from src.db.gateway.council_governance import (
     Proposal,
     Tally,
 )
-from src.db.pool import get_pool
+from src.db.pool import get_pool, get_read_pool
+from src.infra.config_cache import get_config_cache
 from src.infra.events.council_events import CouncilEvent
 from src.infra.events.council_events import publish as publish_council_event
 from src.infra.result import (
@@ -114,7 +115,8 @@ class CouncilService:
                 council_role_id=council_role_id,
                 council_account_member_id=council_account_id,
             )
-            return Ok(config)
+        get_config_cache().invalidate(guild_id, "council")
+        return Ok(config)
 
     @async_returns_result(
         CouncilError,
@@ -126,18 +128,23 @@ class CouncilService:
     )
     async def get_config(self, *, guild_id: int) -> Result[CouncilConfig, CouncilError]:
         """Get council configuration for a guild."""
+        cfg = await get_config_cache().get_or_load(
+            "council", guild_id, "config", lambda: self._load_config(guild_id)
+        )
+        if cfg is None:
+            return Err(
+                GovernanceNotConfiguredError(
+                    "此公會尚未配置常任理事會治理。",
+                    context={"guild_id": guild_id},
+                )
+            )
+        return Ok(cfg)
+
+    async def _load_config(self, guild_id: int) -> CouncilConfig | None:
         pool: PoolProtocol = cast(PoolProtocol, get_pool())
         async with pool.acquire() as conn:
             c: ConnectionProtocol = conn
-            cfg = await self._gateway.fetch_config(c, guild_id=guild_id)
-            if cfg is None:
-                return Err(
-                    GovernanceNotConfiguredError(
-                        "此公會尚未配置常任理事會治理。",
-                        context={"guild_id": guild_id},
-                    )
-                )
-            return Ok(cfg)
+            return await self._gateway.fetch_config(c, guild_id=guild_id)
 
     # --- Proposal lifecycle ---
     @async_returns_result(
@@ -289,47 +296,36 @@ class CouncilService:
 
         async with pool.acquire() as conn:
             c: ConnectionProtocol = conn
-            proposal = await self._gateway.fetch_proposal(c, proposal_id=proposal_id)
-            if proposal is None:
-                return Err(
-                    ProposalNotFoundError(
-                        "找不到指定的提案。",
-                        context={"proposal_id": str(proposal_id)},
-                    )
-                )
-            if proposal.status != "進行中":
-                # Return current totals and status without voting
-                totals = await self._compute_totals(c, proposal_id, proposal)
-                final_status = proposal.status
-                return Ok((totals, final_status))
-
-            snapshot = await self._gateway.fetch_snapshot(c, proposal_id=proposal_id)
-            if voter_id not in snapshot:
-                return Err(
-                    VotingNotAllowedError(
-                        "投票人不在此提案的快照名單中。",
-                        context={"voter_id": voter_id, "proposal_id": str(proposal_id)},
-                    )
-                )
-
             async with c.transaction():
-                await self._gateway.upsert_vote(
+                # 快照檢查、寫入選票、計數更新與通過／否決判定於單一資料庫呼叫完成
+                outcome, proposal, tally = await self._gateway.cast_vote(
                     c,
                     proposal_id=proposal_id,
                     voter_id=voter_id,
                     choice=choice,
                 )
-                totals = await self._compute_totals(c, proposal_id, proposal)
-                final_status = "進行中"
-
-                # Passing threshold
-                if totals.approve >= proposal.threshold_t:
-                    await self._gateway.mark_status(
-                        c,
-                        proposal_id=proposal_id,
-                        status="已通過",
+                if proposal is None:
+                    return Err(
+                        ProposalNotFoundError(
+                            "找不到指定的提案。",
+                            context={"proposal_id": str(proposal_id)},
+                        )
                     )
-                    # Attempt execution immediately
+                if outcome == "not_in_snapshot":
+                    return Err(
+                        VotingNotAllowedError(
+                            "投票人不在此提案的快照名單中。",
+                            context={"voter_id": voter_id, "proposal_id": str(proposal_id)},
+                        )
+                    )
+                totals = self._totals_from_tally(proposal, tally)
+                final_status = proposal.status
+                if outcome == "closed":
+                    # Return current totals and status without voting
+                    return Ok((totals, final_status))
+
+                # Passing threshold: attempt execution immediately
+                if final_status == "已通過":
                     exec_result = await self._attempt_execution(c, proposal)
                     if isinstance(exec_result, Err):
                         # Execution failed, but proposal still passed
@@ -342,17 +338,6 @@ class CouncilService:
                     updated = await self._gateway.fetch_proposal(c, proposal_id=proposal_id)
                     if updated is not None:
                         final_status = updated.status
-                    else:
-                        final_status = "已通過"
-
-                # Early rejection: even if all remaining unvoted approve, cannot reach T
-                elif totals.approve + totals.remaining_unvoted < proposal.threshold_t:
-                    await self._gateway.mark_status(
-                        c,
-                        proposal_id=proposal_id,
-                        status="已否決",
-                    )
-                    final_status = "已否決"
 
             # Publish event
             event = CouncilEvent(
@@ -373,6 +358,10 @@ class CouncilService:
     ) -> VoteTotals:
         """Compute vote totals for a proposal."""
         tally: Tally = await self._gateway.fetch_tally(connection, proposal_id=proposal_id)
+        return self._totals_from_tally(proposal, tally)
+
+    @staticmethod
+    def _totals_from_tally(proposal: Proposal, tally: Tally) -> VoteTotals:
         remaining = max(0, proposal.snapshot_n - tally.total_voted)
         return VoteTotals(
             approve=tally.approve,
@@ -618,7 +607,8 @@ class CouncilService:
         self, *, guild_id: int, start: datetime, end: datetime
     ) -> Result[list[dict[str, object]], CouncilError]:
         """Export proposal data for a time interval."""
-        pool: PoolProtocol = cast(PoolProtocol, get_pool())
+        # 匯出為唯讀大量查詢，可由讀取副本承擔
+        pool: PoolProtocol = cast(PoolProtocol, get_read_pool(get_pool()))
         async with pool.acquire() as conn:
             c: ConnectionProtocol = conn
             data = await self._gateway.export_interval(
@@ -682,11 +672,16 @@ class CouncilService:
     )
     async def get_council_role_ids(self, *, guild_id: int) -> Result[Sequence[int], CouncilError]:
         """Get all council role IDs for a guild."""
+        role_ids = await get_config_cache().get_or_load(
+            "council", guild_id, "role_ids", lambda: self._load_council_role_ids(guild_id)
+        )
+        return Ok(role_ids)
+
+    async def _load_council_role_ids(self, guild_id: int) -> Sequence[int]:
         pool: PoolProtocol = cast(PoolProtocol, get_pool())
         async with pool.acquire() as conn:
             c: ConnectionProtocol = conn
-            role_ids = await self._gateway.get_council_role_ids(c, guild_id=guild_id)
-            return Ok(role_ids)
+            return await self._gateway.get_council_role_ids(c, guild_id=guild_id)
 
     @async_returns_result(
         CouncilError,
@@ -700,7 +695,8 @@ class CouncilService:
         async with pool.acquire() as conn:
             c: ConnectionProtocol = conn
             result = await self._gateway.add_council_role(c, guild_id=guild_id, role_id=role_id)
-            return Ok(result)
+        get_config_cache().invalidate(guild_id, "council")
+        return Ok(result)
 
     @async_returns_result(
         CouncilError,
@@ -716,7 +712,8 @@ class CouncilService:
         async with pool.acquire() as conn:
             c: ConnectionProtocol = conn
             result = await self._gateway.remove_council_role(c, guild_id=guild_id, role_id=role_id)
-            return Ok(result)
+        get_config_cache().invalidate(guild_id, "council")
+        return Ok(result)
 
     @async_returns_result(
         CouncilError,
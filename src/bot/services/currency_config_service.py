@@ -8,6 +8,7 @@ import structlog
 
 from src.cython_ext.currency_models import CurrencyConfigResult
 from src.db.gateway.economy_configuration import EconomyConfigurationGateway
+from src.infra.config_cache import get_config_cache
 from src.infra.types.db import ConnectionProtocol, PoolProtocol
 
 LOGGER = structlog.get_logger(__name__)
@@ -34,13 +35,22 @@ class CurrencyConfigService:
         guild_id: int,
         connection: ConnectionProtocol | None = None,
     ) -> CurrencyConfigResult:
-        """Get currency configuration for a guild, with defaults if not configured."""
+        """Get currency configuration for a guild, with defaults if not configured.
+
+        未指定連線時經由程序內設定快取讀取；指定連線時（可能位於尚未提交的交易中）
+        一律直接查詢，避免快取到未提交的值。
+        """
         if connection is None:
-            async with self._pool.acquire() as conn:
-                return await self._get_config(conn, guild_id=guild_id)
+            return await get_config_cache().get_or_load(
+                "currency", guild_id, "config", lambda: self._load_config(guild_id)
+            )
         else:
             return await self._get_config(connection, guild_id=guild_id)
 
+    async def _load_config(self, guild_id: int) -> CurrencyConfigResult:
+        async with self._pool.acquire() as conn:
+            return await self._get_config(conn, guild_id=guild_id)
+
     async def _get_config(
         self,
         connection: ConnectionProtocol,
@@ -74,22 +84,25 @@ class CurrencyConfigService:
         connection: ConnectionProtocol | None = None,
     ) -> CurrencyConfigResult:
         """Update currency configuration for a guild."""
-        if connection is None:
-            async with self._pool.acquire() as conn:
-                async with conn.transaction():
-                    return await self._update_config(
-                        conn,
-                        guild_id=guild_id,
-                        currency_name=currency_name,
-                        currency_icon=currency_icon,
-                    )
-        else:
-            return await self._update_config(
-                connection,
-                guild_id=guild_id,
-                currency_name=currency_name,
-                currency_icon=currency_icon,
-            )
+        try:
+            if connection is None:
+                async with self._pool.acquire() as conn:
+                    async with conn.transaction():
+                        return await self._update_config(
+                            conn,
+                            guild_id=guild_id,
+                            currency_name=currency_name,
+                            currency_icon=currency_icon,
+                        )
+            else:
+                return await self._update_config(
+                    connection,
+                    guild_id=guild_id,
+                    currency_name=currency_name,
+                    currency_icon=currency_icon,
+                )
+        finally:
+            get_config_cache().invalidate(guild_id, "currency")
 
     async def _update_config(
         self,
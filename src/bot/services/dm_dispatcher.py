@@ -0,0 +1,529 @@
+"""Rate-limited, concurrent DM fan-out for governance notifications.
+
+理事會／最高人民會議的投票通知、截止提醒與結果廣播原本逐一 `await member.send(...)`，
+找不到成員時再逐一 `client.fetch_user`；議員一多，一個提案就讓排程迴圈阻塞數分鐘並觸發
+Discord 全域速率限制。`DmDispatcher` 統一負責這些私訊：
+
+- 所有送出共用一個令牌桶（DM_RATE_PER_SECOND，預設每秒 25 則），並以
+  DM_CONCURRENCY（預設 10）限制同時進行的請求；收到 429 時依 retry_after 暫停整個桶；
+- 依 (dedup_key, 收件人) 去重：同一提案的通知、提醒或結果對同一人只送一次；
+- `start()` 之後訊息寫入 `governance.dm_outbox` 並立即返回，由背景 worker 以 SKIP LOCKED
+  租約領取後送出。程序重啟後未送出的列會重新領取；暫時性錯誤依指數退避重試，無法私訊
+  （Forbidden／NotFound）或超過重試上限則標記為失敗；
+- 未啟動（單元測試或沒有資料庫）時在呼叫端直接並行送出，不重試；送出失敗的收件人
+  不記入去重，之後以同一 dedup_key 呼叫時會再次嘗試；
+- `metrics()` 提供入列、去重、送達、失敗、重試與 429 次數。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Iterable, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, cast
+
+import discord
+import structlog
+
+from src.db import pool as db_pool
+from src.db.gateway.dm_outbox import DmOutboxGateway
+from src.infra.types.db import PoolProtocol
+
+LOGGER = structlog.get_logger(__name__)
+
+_DEFAULT_RATE_PER_SECOND = 25.0
+_DEFAULT_CONCURRENCY = 10
+# 背景 worker：每批領取數量、租約秒數（需遠大於送完一批所需時間）與未收到喚醒時的輪詢間隔
+_BATCH_SIZE = 100
+_LEASE_SECONDS = 300
+_POLL_SECONDS = 5.0
+# 暫時性錯誤：第 n 次失敗後等待 min(_RETRY_BASE_SECONDS * 2^(n-1), _RETRY_MAX_SECONDS)
+_MAX_ATTEMPTS = 5
+_RETRY_BASE_SECONDS = 5.0
+_RETRY_MAX_SECONDS = 900.0
+_RATE_LIMIT_FALLBACK_SECONDS = 5.0
+# 已完成列的保留期限（同時是持久去重的視窗；提案最長 72 小時）與清理週期
+_RETENTION = timedelta(days=7)
+_PRUNE_INTERVAL_SECONDS = 3600.0
+# 直接送出模式的記憶體去重紀錄，以及收件人物件快取的上限
+_MEMORY_LIMIT = 10000
+
+ViewBuilder = Callable[[str], "discord.ui.View | None"]
+
+
+def _float_from_env(name: str, default: float) -> float:
+    raw = os.getenv(name, "").strip()
+    if not raw:
+        return default
+    try:
+        return max(float(raw), 0.0)
+    except ValueError:
+        LOGGER.warning("dm_dispatcher.env.invalid", name=name, value=raw)
+        return default
+
+
+@dataclass(frozen=True, slots=True)
+class DmMessage:
+    """一則私訊；`view` 為 (種類, 參數)，送出時以 `register_view_builder` 登記的函式重建。"""
+
+    content: str | None = None
+    embed: discord.Embed | None = None
+    view: tuple[str, str] | None = None
+
+    def to_payload(self) -> dict[str, Any]:
+        return {
+            "content": self.content,
+            "embed": self.embed.to_dict() if self.embed is not None else None,
+            "view": list(self.view) if self.view is not None else None,
+        }
+
+    @classmethod
+    def from_payload(cls, payload: Mapping[str, Any]) -> DmMessage:
+        embed_data = payload.get("embed")
+        view = payload.get("view")
+        content = payload.get("content")
+        return cls(
+            content=str(content) if content is not None else None,
+            embed=discord.Embed.from_dict(embed_data) if isinstance(embed_data, dict) else None,
+            view=(
+                (str(view[0]), str(view[1])) if isinstance(view, list) and len(view) == 2 else None
+            ),
+        )
+
+
+class TokenBucket:
+    """Token bucket shared by every concurrent sender (`rate <= 0` disables limiting)."""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        self._rate = rate
+        self._capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self._capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._blocked_until = 0.0
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    async def acquire(self) -> None:
+        if self._rate <= 0:
+            return
+        # 先預約令牌（可為負數）再等待欠額：併發呼叫者依預約順序排開，不需輪詢
+        now = self._clock()
+        if now > self._updated:
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+        self._tokens -= 1
+        wait = (self._updated - now) + max(-self._tokens, 0.0) / self._rate
+        if wait > 0:
+            await self._sleep(wait)
+        # 等待期間若收到 429，延後到暫停結束
+        remaining = self._blocked_until - self._clock()
+        if remaining > 0:
+            await self._sleep(remaining)
+
+    def pause(self, seconds: float) -> None:
+        """收到 429 時呼叫：retry_after 結束前所有送出都會等待，之後從空桶開始補充。"""
+        self._blocked_until = max(self._blocked_until, self._clock() + seconds)
+        self._tokens = min(self._tokens, 0.0)
+        self._updated = max(self._updated, self._blocked_until)
+
+
+class DmDispatcher:
+    """Fan DMs out through a shared rate limiter, persisting them once started."""
+
+    def __init__(
+        self,
+        *,
+        pool: PoolProtocol | None = None,
+        gateway: DmOutboxGateway | None = None,
+        rate_per_second: float | None = None,
+        concurrency: int | None = None,
+        batch_size: int = _BATCH_SIZE,
+        poll_seconds: float = _POLL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        rate = (
+            rate_per_second
+            if rate_per_second is not None
+            else _float_from_env("DM_RATE_PER_SECOND", _DEFAULT_RATE_PER_SECOND)
+        )
+        if concurrency is None:
+            concurrency = int(_float_from_env("DM_CONCURRENCY", _DEFAULT_CONCURRENCY))
+        self._pool: PoolProtocol | None = pool
+        self._gateway = gateway or DmOutboxGateway()
+        self._bucket = TokenBucket(rate, clock=clock)
+        self._concurrency = max(concurrency, 1)
+        self._batch_size = batch_size
+        self._poll_seconds = poll_seconds
+        self._client: discord.Client | None = None
+        self._view_builders: dict[str, ViewBuilder] = {}
+        # 入列時已知的成員物件，worker 送出時優先使用，避免逐一 fetch_user
+        self._recipients: OrderedDict[int, Any] = OrderedDict()
+        self._delivered: OrderedDict[tuple[str, Hashable], None] = OrderedDict()
+        self._task: asyncio.Task[None] | None = None
+        self._work_available: asyncio.Event | None = None
+        self._running = False
+        self._metrics: dict[str, int] = {
+            "queued": 0,
+            "deduplicated": 0,
+            "sent": 0,
+            "failed": 0,
+            "retried": 0,
+            "rate_limited": 0,
+            "users_fetched": 0,
+        }
+
+    @property
+    def persistent(self) -> bool:
+        """是否經由 outbox 送出（已啟動且有資料庫連線池）。"""
+        return self._running and self._pool is not None
+
+    def metrics(self) -> dict[str, int]:
+        return dict(self._metrics)
+
+    def register_view_builder(self, kind: str, builder: ViewBuilder) -> None:
+        """登記 `DmMessage.view` 種類的建構函式（重複登記會覆蓋）。"""
+        self._view_builders[kind] = builder
+
+    async def start(self, client: discord.Client) -> None:
+        """Start the outbox worker; messages queued before a restart are sent first."""
+        self._client = client
+        if self._running:
+            return
+
+        if self._pool is None:
+            try:
+                self._pool = cast(PoolProtocol, await db_pool.init_pool())
+            except (RuntimeError, ValueError):
+                # 單元測試環境可能沒有 DATABASE_URL；維持直接送出模式
+                pass
+
+        self._running = True
+        if self._pool is not None:
+            self._work_available = asyncio.Event()
+            self._task = asyncio.create_task(self._run(), name="dm-dispatcher")
+            self._work_available.set()
+        LOGGER.info(
+            "dm_dispatcher.started",
+            persistent=self.persistent,
+            rate_per_second=self._bucket.rate,
+            concurrency=self._concurrency,
+        )
+
+    async def stop(self) -> None:
+        """Stop the worker; unsent rows stay in the outbox for the next start."""
+        if not self._running:
+            return
+
+        self._running = False
+        task, self._task = self._task, None
+        if task and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._work_available = None
+        LOGGER.info("dm_dispatcher.stopped")
+
+    async def fan_out(
+        self,
+        recipients: Iterable[Any],
+        message: DmMessage,
+        *,
+        guild_id: int,
+        dedup_key: str,
+        client: discord.Client | None = None,
+    ) -> int:
+        """Send `message` once to each recipient (member/user objects or user IDs).
+
+        已啟動時寫入 outbox 並回傳新入列的數量；否則直接送出並回傳成功送達的數量。
+        """
+        unique: dict[Hashable, Any] = {}
+        for recipient in recipients:
+            key = recipient if isinstance(recipient, int) else getattr(recipient, "id", recipient)
+            if key in unique:
+                self._metrics["deduplicated"] += 1
+                continue
+            unique[key] = recipient
+        if not unique:
+            return 0
+
+        if self.persistent:
+            return await self._enqueue(unique, message, guild_id=guild_id, dedup_key=dedup_key)
+
+        # 送出前先登記，避免並行呼叫重複送出；失敗者於送出後移除
+        targets: list[tuple[Hashable, Any]] = []
+        for key, recipient in unique.items():
+            marker = (dedup_key, key)
+            if marker in self._delivered:
+                self._metrics["deduplicated"] += 1
+                continue
+            self._delivered[marker] = None
+            targets.append((key, recipient))
+        while len(self._delivered) > _MEMORY_LIMIT:
+            self._delivered.popitem(last=False)
+
+        results = await self._deliver_many(
+            [(recipient, message) for _, recipient in targets], client or self._client
+        )
+        for (key, recipient), exc in zip(targets, results, strict=True):
+            if exc is not None:
+                self._delivered.pop((dedup_key, key), None)
+                self._metrics["failed"] += 1
+                LOGGER.warning(
+                    "dm_dispatcher.send_failed",
+                    recipient=getattr(recipient, "id", recipient),
+                    dedup_key=dedup_key,
+                    error=str(exc),
+                )
+        return sum(1 for exc in results if exc is None)
+
+    async def _enqueue(
+        self,
+        unique: Mapping[Hashable, Any],
+        message: DmMessage,
+        *,
+        guild_id: int,
+        dedup_key: str,
+    ) -> int:
+        recipient_ids: list[int] = []
+        for key, recipient in unique.items():
+            if not isinstance(key, int):
+                continue
+            recipient_ids.append(key)
+            if not isinstance(recipient, int):
+                self._recipients[key] = recipient
+                self._recipients.move_to_end(key)
+        while len(self._recipients) > _MEMORY_LIMIT:
+            self._recipients.popitem(last=False)
+
+        pool = cast(PoolProtocol, self._pool)
+        async with pool.acquire() as conn:
+            queued = await self._gateway.enqueue(
+                conn,
+                guild_id=guild_id,
+                recipient_ids=recipient_ids,
+                dedup_key=dedup_key,
+                payload=message.to_payload(),
+            )
+        self._metrics["queued"] += queued
+        self._metrics["deduplicated"] += len(recipient_ids) - queued
+        if queued and self._work_available is not None:
+            self._work_available.set()
+        return queued
+
+    async def _run(self) -> None:
+        last_prune: float | None = None
+        while self._running:
+            try:
+                event = self._work_available
+                if event is not None:
+                    try:
+                        await asyncio.wait_for(event.wait(), timeout=self._poll_seconds)
+                    except asyncio.TimeoutError:
+                        pass
+                    event.clear()
+                # 整批額滿代表可能仍有積壓，持續領取直到清空
+                while self._running and await self._drain_once() >= self._batch_size:
+                    pass
+                now = time.monotonic()
+                if last_prune is None or now - last_prune >= _PRUNE_INTERVAL_SECONDS:
+                    last_prune = now
+                    await self._prune()
+            except asyncio.CancelledError:
+                break
+            except Exception:
+                LOGGER.exception("dm_dispatcher.worker.error")
+                await asyncio.sleep(self._poll_seconds)
+
+    async def _drain_once(self) -> int:
+        """Claim one batch, send it concurrently and record the outcome of each row."""
+        if self._pool is None:
+            return 0
+        async with self._pool.acquire() as conn:
+            rows = await self._gateway.claim(
+                conn, limit=self._batch_size, lease_seconds=_LEASE_SECONDS
+            )
+        if not rows:
+            return 0
+
+        jobs = [
+            (
+                int(row["recipient_id"]),
+                DmMessage.from_payload(cast(Mapping[str, Any], row["payload"])),
+            )
+            for row in rows
+        ]
+        results = await self._deliver_many(jobs, self._client)
+
+        sent_ids: list[int] = []
+        async with self._pool.acquire() as conn:
+            for row, exc in zip(rows, results, strict=True):
+                outbox_id = int(row["outbox_id"])
+                if exc is None:
+                    sent_ids.append(outbox_id)
+                    continue
+                give_up, retry_after = _classify_failure(exc, int(row["attempts"]))
+                self._metrics["failed" if give_up else "retried"] += 1
+                LOGGER.warning(
+                    "dm_dispatcher.send_failed",
+                    outbox_id=outbox_id,
+                    recipient=int(row["recipient_id"]),
+                    attempts=int(row["attempts"]),
+                    give_up=give_up,
+                    error=str(exc),
+                )
+                await self._gateway.defer(
+                    conn,
+                    outbox_id=outbox_id,
+                    error=str(exc) or type(exc).__name__,
+                    retry_after=retry_after,
+                    give_up=give_up,
+                )
+            if sent_ids:
+                await self._gateway.mark_sent(conn, outbox_ids=sent_ids)
+        return len(rows)
+
+    async def _prune(self) -> None:
+        if self._pool is None:
+            return
+        async with self._pool.acquire() as conn:
+            deleted = await self._gateway.prune(
+                conn, before=datetime.now(timezone.utc) - _RETENTION
+            )
+        if deleted:
+            LOGGER.info("dm_dispatcher.pruned", deleted=deleted)
+
+    async def _deliver_many(
+        self, jobs: list[tuple[Any, DmMessage]], client: discord.Client | None
+    ) -> list[BaseException | None]:
+        """Send every job under the shared limiter; returns the exception (or None) per job."""
+        semaphore = asyncio.Semaphore(self._concurrency)
+        # 同一種類與參數的 View 在本批內共用一個實例（與原本共用 VotingView 相同）
+        views: dict[tuple[str, str], discord.ui.View | None] = {}
+
+        async def _one(recipient: Any, message: DmMessage) -> BaseException | None:
+            async with semaphore:
+                try:
+                    await self._send(recipient, message, client, views)
+                except Exception as exc:
+                    return exc
+                return None
+
+        return list(await asyncio.gather(*(_one(r, m) for r, m in jobs)))
+
+    async def _send(
+        self,
+        recipient: Any,
+        message: DmMessage,
+        client: discord.Client | None,
+        views: dict[tuple[str, str], discord.ui.View | None],
+    ) -> None:
+        target = recipient
+        if isinstance(recipient, int):
+            target = await self._resolve(recipient, client)
+
+        kwargs: dict[str, Any] = {}
+        if message.content is not None:
+            kwargs["content"] = message.content
+        if message.embed is not None:
+            kwargs["embed"] = message.embed
+        if message.view is not None:
+            if message.view not in views:
+                views[message.view] = self._build_view(*message.view)
+            view = views[message.view]
+            if view is not None:
+                kwargs["view"] = view
+
+        await self._bucket.acquire()
+        try:
+            await target.send(**kwargs)
+        except (discord.HTTPException, discord.RateLimited) as exc:
+            if _is_rate_limited(exc):
+                self._metrics["rate_limited"] += 1
+                self._bucket.pause(_retry_after(exc))
+            raise
+        self._metrics["sent"] += 1
+
+    async def _resolve(self, user_id: int, client: discord.Client | None) -> Any:
+        cached = self._recipients.get(user_id)
+        if cached is not None:
+            return cached
+        if client is None:
+            raise LookupError(f"cannot resolve user {user_id} without a Discord client")
+        user = client.get_user(user_id)
+        if user is None:
+            # fetch_user 本身也是一次 API 請求，同樣計入限速
+            await self._bucket.acquire()
+            self._metrics["users_fetched"] += 1
+            user = await client.fetch_user(user_id)
+        return user
+
+    def _build_view(self, kind: str, argument: str) -> discord.ui.View | None:
+        builder = self._view_builders.get(kind)
+        if builder is None:
+            LOGGER.warning("dm_dispatcher.view_builder.missing", kind=kind)
+            return None
+        try:
+            return builder(argument)
+        except Exception as exc:
+            LOGGER.warning("dm_dispatcher.view_builder.error", kind=kind, error=str(exc))
+            return None
+
+
+def _is_rate_limited(exc: BaseException) -> bool:
+    if isinstance(exc, discord.RateLimited):
+        return True
+    return isinstance(exc, discord.HTTPException) and exc.status == 429
+
+
+def _retry_after(exc: BaseException) -> float:
+    value = getattr(exc, "retry_after", None)
+    if isinstance(value, (int, float)) and value > 0:
+        return float(value)
+    return _RATE_LIMIT_FALLBACK_SECONDS
+
+
+def _classify_failure(exc: BaseException, attempts: int) -> tuple[bool, float]:
+    """回傳 (是否放棄, 幾秒後重試)。attempts 為含本次在內的嘗試次數。"""
+    if isinstance(exc, (discord.Forbidden, discord.NotFound)):
+        # 對方關閉私訊或使用者不存在：重試也不會成功
+        return True, 0.0
+    if _is_rate_limited(exc):
+        return attempts >= _MAX_ATTEMPTS, _retry_after(exc)
+    backoff = _RETRY_BASE_SECONDS * 2 ** max(attempts - 1, 0)
+    return attempts >= _MAX_ATTEMPTS, min(backoff, _RETRY_MAX_SECONDS)
+
+
+_dispatcher: DmDispatcher | None = None
+
+
+def get_dm_dispatcher() -> DmDispatcher:
+    """Return the process-wide DM dispatcher (created on first use)."""
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = DmDispatcher()
+    return _dispatcher
+
+
+__all__ = [
+    "DmDispatcher",
+    "DmMessage",
+    "TokenBucket",
+    "get_dm_dispatcher",
+]
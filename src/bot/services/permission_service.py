@@ -198,6 +198,58 @@ class StateCouncilPermissionChecker(PermissionChecker):
             return Err(dept_result.error)
         return Ok(bool(dept_result.value))
 
+    async def check_departments_bulk(
+        self,
+        *,
+        guild_id: int,
+        user_id: int,
+        user_roles: Sequence[int],
+        departments: Sequence[str],
+    ) -> Result[dict[str, PermissionResult], Error]:
+        """以單次查詢判斷多個部門的權限，結果與逐一呼叫 `check_permission` 相同。"""
+        bulk_result: Result[dict[str, bool], Error] = await _await_result(
+            self._state_council.check_department_permissions_bulk(
+                guild_id=guild_id,
+                user_id=user_id,
+                user_roles=user_roles,
+                departments=departments,
+            ),
+            failure_message="國務院部門權限檢查失敗",
+            log_event="state_council.permission.department_bulk.error",
+            log_context={
+                "guild_id": guild_id,
+                "user_id": user_id,
+                "departments": list(departments),
+            },
+        )
+        if isinstance(bulk_result, Err):
+            return Err(bulk_result.error)
+
+        leader_result = await self._has_leader_permission(
+            guild_id=guild_id, user_id=user_id, user_roles=user_roles
+        )
+        if isinstance(leader_result, Err):
+            return Err(leader_result.error)
+        is_leader = leader_result.value
+
+        results: dict[str, PermissionResult] = {}
+        for department in departments:
+            if is_leader:
+                results[department] = PermissionResult(
+                    allowed=True, permission_level="leader", reason="具備國務院領導權限"
+                )
+            elif bulk_result.value.get(department, False):
+                results[department] = PermissionResult(
+                    allowed=True,
+                    permission_level="department_head",
+                    reason=f"具備{department}權限",
+                )
+            else:
+                results[department] = PermissionResult(
+                    allowed=False, reason="不具備國務院領導或部門權限"
+                )
+        return Ok(results)
+
     async def check_permission(
         self,
         *,
@@ -521,6 +573,25 @@ class PermissionService:
             **kwargs,
         )
 
+    async def check_department_permissions_bulk(
+        self,
+        *,
+        guild_id: int,
+        user_id: int,
+        user_roles: Sequence[int],
+        departments: Sequence[str],
+    ) -> Result[dict[str, PermissionResult], Error]:
+        """一次檢查多個國務院部門的權限（面板開啟時使用）。"""
+        checker = self._get_checker("state_council")
+        if not isinstance(checker, StateCouncilPermissionChecker):
+            return Err(PermissionError("國務院服務未初始化"))
+        return await checker.check_departments_bulk(
+            guild_id=guild_id,
+            user_id=user_id,
+            user_roles=user_roles,
+            departments=departments,
+        )
+
     async def check_homeland_security_permission(
         self,
         *,
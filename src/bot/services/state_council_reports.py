@@ -12,18 +12,20 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, cast
+from typing import Any, Dict, List
 from unittest.mock import AsyncMock
 
 import structlog
 
 from src.bot.services.currency_config_service import CurrencyConfigService
-from src.db.gateway.economy_queries import EconomyQueryGateway
 from src.db.gateway.state_council_governance import StateCouncilGovernanceGateway
 from src.infra.types.db import ConnectionProtocol
 
 LOGGER = structlog.get_logger(__name__)
 
+# 有對應治理紀錄的部門；其他部門的指標固定為零
+_REPORT_DEPARTMENTS = frozenset({"內政部", "財政部", "國土安全部", "中央銀行"})
+
 
 @dataclass(frozen=True, slots=True)
 class FinancialSummary:
@@ -72,8 +74,6 @@ class StateCouncilReportGenerator:
     ) -> None:
         # 預設以可被 stub 的 AsyncMock 取代，便於單元測試注入回傳值
         self._gateway = gateway or AsyncMock(spec=StateCouncilGovernanceGateway)
-        # 經濟系統查詢：以即時餘額為單一真實來源
-        self._economy = EconomyQueryGateway()
         self._currency_service = currency_service
 
     async def generate_financial_summary(
@@ -85,38 +85,12 @@ class StateCouncilReportGenerator:
         end_date: datetime,
     ) -> FinancialSummary:
         """Generate financial summary for the specified period."""
-        # Get welfare disbursements
-        welfare_records = await self._gateway.fetch_welfare_disbursements(
-            connection, guild_id=guild_id, limit=10000
-        )
-        filtered_welfare = [
-            r
-            for r in welfare_records
-            if isinstance(r.disbursed_at, datetime) and start_date <= r.disbursed_at <= end_date
-        ]
-        total_welfare = sum(r.amount for r in filtered_welfare)
-
-        # Get tax records
-        tax_records = await self._gateway.fetch_tax_records(
-            connection, guild_id=guild_id, limit=10000
-        )
-        filtered_tax = [
-            r
-            for r in tax_records
-            if isinstance(r.collected_at, datetime) and start_date <= r.collected_at <= end_date
-        ]
-        total_tax = sum(r.tax_amount for r in filtered_tax)
-
-        # Get currency issuances
-        currency_records = await self._gateway.fetch_currency_issuances(
-            connection, guild_id=guild_id, limit=10000
+        # 期間過濾與加總皆在資料庫端完成
+        total_welfare, total_tax, total_issuance = (
+            await self._gateway.fetch_report_financial_totals(
+                connection, guild_id=guild_id, start=start_date, end=end_date
+            )
         )
-        filtered_currency = [
-            r
-            for r in currency_records
-            if isinstance(r.issued_at, datetime) and start_date <= r.issued_at <= end_date
-        ]
-        total_issuance = sum(r.amount for r in filtered_currency)
 
         # Calculate net flow (taxes + issuances - welfare)
         net_flow = total_tax + total_issuance - total_welfare
@@ -140,203 +114,51 @@ class StateCouncilReportGenerator:
         end_date: datetime,
     ) -> DepartmentMetrics:
         """Generate performance metrics for a specific department."""
-        if department == "內政部":
-            return await self._generate_welfare_metrics(
-                connection, guild_id=guild_id, start_date=start_date, end_date=end_date
-            )
-        elif department == "財政部":
-            return await self._generate_tax_metrics(
-                connection, guild_id=guild_id, start_date=start_date, end_date=end_date
-            )
-        elif department == "國土安全部":
-            return await self._generate_identity_metrics(
-                connection, guild_id=guild_id, start_date=start_date, end_date=end_date
-            )
-        elif department == "中央銀行":
-            return await self._generate_currency_metrics(
-                connection, guild_id=guild_id, start_date=start_date, end_date=end_date
-            )
-        else:
+        if department not in _REPORT_DEPARTMENTS:
             # Default case for unknown departments
-            return DepartmentMetrics(
+            return self._build_metrics(
                 department=department,
                 total_operations=0,
                 total_amount=0,
-                average_per_operation=0.0,
-                peak_activity_day="無數據",
-                most_common_operation="無操作",
+                peak_day=None,
+                most_common=None,
             )
 
-    async def _generate_welfare_metrics(
-        self,
-        connection: ConnectionProtocol,
-        *,
-        guild_id: int,
-        start_date: datetime,
-        end_date: datetime,
-    ) -> DepartmentMetrics:
-        """Generate metrics for Internal Affairs department."""
-        records = await self._gateway.fetch_welfare_disbursements(
-            connection, guild_id=guild_id, limit=10000
-        )
-        filtered_records = [
-            r
-            for r in records
-            if isinstance(r.disbursed_at, datetime) and start_date <= r.disbursed_at <= end_date
-        ]
-
-        operations: list[tuple[str, int, datetime, int | None]] = [
-            (
-                "福利發放",
-                int(cast(int, r.amount)),
-                cast(datetime, r.disbursed_at),
-                cast(int | None, getattr(r, "performed_by", None)),
-            )
-            for r in filtered_records
-        ]
-        total_amount = sum(int(cast(int, r.amount)) for r in filtered_records)
-
-        return self._calculate_metrics(
-            department="內政部",
-            operations=operations,
-            total_amount=total_amount,
-        )
-
-    async def _generate_tax_metrics(
-        self,
-        connection: ConnectionProtocol,
-        *,
-        guild_id: int,
-        start_date: datetime,
-        end_date: datetime,
-    ) -> DepartmentMetrics:
-        """Generate metrics for Finance department."""
-        records = await self._gateway.fetch_tax_records(connection, guild_id=guild_id, limit=10000)
-        filtered_records = [
-            r
-            for r in records
-            if isinstance(r.collected_at, datetime) and start_date <= r.collected_at <= end_date
-        ]
-
-        operations: list[tuple[str, int, datetime, int | None]] = [
-            (
-                "稅收徵收",
-                int(cast(int, r.tax_amount)),
-                cast(datetime, r.collected_at),
-                cast(int | None, getattr(r, "performed_by", None)),
+        total_operations, total_amount, peak_day, most_common = (
+            await self._gateway.fetch_report_department_metrics(
+                connection,
+                guild_id=guild_id,
+                department=department,
+                start=start_date,
+                end=end_date,
             )
-            for r in filtered_records
-        ]
-        total_amount = sum(int(cast(int, r.tax_amount)) for r in filtered_records)
-
-        return self._calculate_metrics(
-            department="財政部",
-            operations=operations,
-            total_amount=total_amount,
         )
-
-    async def _generate_identity_metrics(
-        self,
-        connection: ConnectionProtocol,
-        *,
-        guild_id: int,
-        start_date: datetime,
-        end_date: datetime,
-    ) -> DepartmentMetrics:
-        """Generate metrics for Security department."""
-        records = await self._gateway.fetch_identity_records(
-            connection, guild_id=guild_id, limit=10000
-        )
-        filtered_records = [
-            r
-            for r in records
-            if isinstance(r.performed_at, datetime) and start_date <= r.performed_at <= end_date
-        ]
-
-        operations: list[tuple[str, int, datetime, int | None]] = [
-            (r.action, 1, r.performed_at, cast(int | None, getattr(r, "performed_by", None)))
-            for r in filtered_records
-        ]
-        total_amount = len(operations)
-
-        return self._calculate_metrics(
-            department="國土安全部",
-            operations=operations,
-            total_amount=total_amount,
-        )
-
-    async def _generate_currency_metrics(
-        self,
-        connection: ConnectionProtocol,
-        *,
-        guild_id: int,
-        start_date: datetime,
-        end_date: datetime,
-    ) -> DepartmentMetrics:
-        """Generate metrics for Central Bank department."""
-        records = await self._gateway.fetch_currency_issuances(
-            connection, guild_id=guild_id, limit=10000
-        )
-        filtered_records = [
-            r
-            for r in records
-            if isinstance(r.issued_at, datetime) and start_date <= r.issued_at <= end_date
-        ]
-
-        operations: list[tuple[str, int, datetime, int | None]] = [
-            (
-                "貨幣發行",
-                int(cast(int, r.amount)),
-                cast(datetime, r.issued_at),
-                cast(int | None, getattr(r, "performed_by", None)),
-            )
-            for r in filtered_records
-        ]
-        total_amount = sum(int(cast(int, r.amount)) for r in filtered_records)
-
-        return self._calculate_metrics(
-            department="中央銀行",
-            operations=operations,
+        return self._build_metrics(
+            department=department,
+            total_operations=total_operations,
             total_amount=total_amount,
+            peak_day=peak_day,
+            most_common=most_common,
         )
 
-    def _calculate_metrics(
+    def _build_metrics(
         self,
         *,
         department: str,
-        operations: list[tuple[str, int, datetime, int | None]],
+        total_operations: int,
         total_amount: int,
+        peak_day: str | None,
+        most_common: str | None,
     ) -> DepartmentMetrics:
-        """Calculate metrics from operations data."""
-        # Calculate metrics
-        total_operations = len(operations)
-        average_per_operation = total_amount / total_operations if total_operations > 0 else 0
-
-        # Find peak activity day (tie-breaker: choose the later day)
-        daily_counts: dict[str, int] = {}
-        for _, _, timestamp, _ in operations:
-            day_key = timestamp.strftime("%Y-%m-%d")
-            daily_counts[day_key] = daily_counts.get(day_key, 0) + 1
-        if daily_counts:
-            peak_day = max(daily_counts.items(), key=lambda x: (x[1], x[0]))[0]
-        else:
-            peak_day = "無數據"
-
-        # Find most common operation
-        operation_counts: dict[str, int] = {}
-        for op_type, _, _, _ in operations:
-            operation_counts[op_type] = operation_counts.get(op_type, 0) + 1
-        most_common = (
-            max(operation_counts.items(), key=lambda x: x[1])[0] if operation_counts else "無操作"
-        )
-
+        """Build department metrics from the aggregates returned by SQL."""
+        average_per_operation = total_amount / total_operations if total_operations > 0 else 0.0
         return DepartmentMetrics(
             department=department,
             total_operations=total_operations,
             total_amount=total_amount,
             average_per_operation=average_per_operation,
-            peak_activity_day=peak_day,
-            most_common_operation=most_common,
+            peak_activity_day=peak_day or "無數據",
+            most_common_operation=most_common or "無操作",
         )
 
     async def generate_activity_report(
@@ -350,113 +172,34 @@ class StateCouncilReportGenerator:
         """Generate comprehensive activity report."""
         period = f"{start_date.strftime('%Y-%m-%d')} 至 {end_date.strftime('%Y-%m-%d')}"
 
-        # Collect all operations
-        all_operations: list[dict[str, Any]] = []
-
-        # Welfare disbursements
-        welfare_records = await self._gateway.fetch_welfare_disbursements(
-            connection, guild_id=guild_id, limit=10000
+        rows = await self._gateway.fetch_report_activity(
+            connection, guild_id=guild_id, start=start_date, end=end_date, top_limit=10
         )
-        for welfare_record in welfare_records:
-            if (
-                isinstance(welfare_record.disbursed_at, datetime)
-                and start_date <= welfare_record.disbursed_at <= end_date
-            ):
-                all_operations.append(
-                    {
-                        "type": "福利發放",
-                        "timestamp": welfare_record.disbursed_at,
-                        "user": welfare_record.recipient_id,
-                        "amount": welfare_record.amount,
-                    }
-                )
-
-        # Tax records
-        tax_records = await self._gateway.fetch_tax_records(
-            connection, guild_id=guild_id, limit=10000
-        )
-        for tax_record in tax_records:
-            if (
-                isinstance(tax_record.collected_at, datetime)
-                and start_date <= tax_record.collected_at <= end_date
-            ):
-                all_operations.append(
-                    {
-                        "type": "稅收徵收",
-                        "timestamp": tax_record.collected_at,
-                        "user": tax_record.taxpayer_id,
-                        "amount": tax_record.tax_amount,
-                    }
-                )
-
-        # Identity records
-        identity_records = await self._gateway.fetch_identity_records(
-            connection, guild_id=guild_id, limit=10000
-        )
-        for identity_record in identity_records:
-            if (
-                isinstance(identity_record.performed_at, datetime)
-                and start_date <= identity_record.performed_at <= end_date
-            ):
-                all_operations.append(
-                    {
-                        "type": "身分管理",
-                        "timestamp": identity_record.performed_at,
-                        "user": identity_record.target_id,
-                        "amount": 0,
-                    }
-                )
-
-        # Currency issuances
-        currency_records = await self._gateway.fetch_currency_issuances(
-            connection, guild_id=guild_id, limit=10000
-        )
-        for currency_record in currency_records:
-            if (
-                isinstance(currency_record.issued_at, datetime)
-                and start_date <= currency_record.issued_at <= end_date
-            ):
-                all_operations.append(
-                    {
-                        "type": "貨幣發行",
-                        "timestamp": currency_record.issued_at,
-                        "user": currency_record.performed_by,
-                        "amount": currency_record.amount,
-                    }
-                )
 
         # Note: 部門轉帳不計入活動操作總數（僅在高層報表中呈現餘額變化）
-
-        # Calculate statistics
-        total_operations = len(all_operations)
-        unique_users = len({op["user"] for op in all_operations})
-
-        # Operation breakdown
         operation_breakdown: dict[str, int] = {}
-        for op in all_operations:
-            op_type = op["type"]
-            operation_breakdown[op_type] = operation_breakdown.get(op_type, 0) + 1
+        daily_activity: dict[str, int] = {}
+        performers: list[tuple[int, int]] = []
+        unique_users = 0
+        for section, label, operations in rows:
+            if section == "operation" and label is not None:
+                operation_breakdown[label] = operations
+            elif section == "day" and label is not None:
+                daily_activity[label] = operations
+            elif section == "performer" and label is not None:
+                performers.append((int(label), operations))
+            elif section == "unique_users":
+                unique_users = operations
+
+        total_operations = sum(operation_breakdown.values())
         # Ensure keys exist for categories even if 0 (e.g., transfers not counted)
         for key in ("福利發放", "稅收徵收", "身分管理", "貨幣發行", "部門轉帳"):
             operation_breakdown.setdefault(key, 0)
 
-        # Daily activity
-        daily_activity: dict[str, int] = {}
-        for op in all_operations:
-            day_key = op["timestamp"].strftime("%Y-%m-%d")
-            daily_activity[day_key] = daily_activity.get(day_key, 0) + 1
-
-        # Top performers (users with most operations)
-        user_activity: dict[int, int] = {}
-        for op in all_operations:
-            user_id = op["user"]
-            user_activity[user_id] = user_activity.get(user_id, 0) + 1
-
+        # 與 SQL 端排名一致：次數由多到少，同數依使用者 ID
         top_performers = [
             {"user_id": user_id, "operations": count}
-            for user_id, count in sorted(user_activity.items(), key=lambda x: x[1], reverse=True)[
-                :10
-            ]
+            for user_id, count in sorted(performers, key=lambda x: (-x[1], x[0]))
         ]
 
         return ActivityReport(
@@ -464,7 +207,7 @@ class StateCouncilReportGenerator:
             total_operations=total_operations,
             unique_users=unique_users,
             operation_breakdown=operation_breakdown,
-            daily_activity=daily_activity,
+            daily_activity=dict(sorted(daily_activity.items())),
             top_performers=top_performers,
         )
 
@@ -504,18 +247,11 @@ class StateCouncilReportGenerator:
             connection, guild_id=guild_id, start_date=start_date, end_date=end_date
         )
 
-        # Get account balances
-        accounts = await self._gateway.fetch_government_accounts(connection, guild_id=guild_id)
-        account_balances: dict[str, int] = {}
-        for acc in accounts:
-            try:
-                snap = await self._economy.fetch_balance(
-                    connection, guild_id=guild_id, member_id=acc.account_id
-                )
-                account_balances[acc.department] = snap.balance  # type: ignore[union-attr]
-            except Exception:
-                # 後援：若經濟查詢失敗，使用 governance 留存值
-                account_balances[acc.department] = acc.balance
+        # 各部門餘額以經濟帳本為準（無帳本列時沿用治理層餘額），一次查詢取回
+        stats = await self._gateway.fetch_all_department_stats(
+            connection, guild_id=guild_id, month_period=f"{year}-{month:02d}"
+        )
+        account_balances: dict[str, int] = {stat.department: stat.balance for stat in stats}
 
         return {
             "period": f"{year}-{month:02d}",
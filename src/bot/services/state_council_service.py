@@ -3,6 +3,8 @@ from __future__ import annotations
 # 提供 JusticeService 名稱以滿足型別檢查（執行期最佳努力）
 # 使用動態導入避免 mypy 對未宣告 py.typed 的第三方模組提出警告。
 import inspect
+import os
+import weakref
 from datetime import datetime, timezone
 from typing import Any, Sequence, cast
 from unittest.mock import AsyncMock
@@ -20,6 +22,7 @@ from src.bot.services.transfer_service import (
 from src.cython_ext.state_council_models import (
     BusinessLicense,
     BusinessLicenseListResult,
+    DepartmentPermissionMap,
     DepartmentStats,
     StateCouncilSummary,
     Suspect,
@@ -27,7 +30,7 @@ from src.cython_ext.state_council_models import (
     SuspectReleaseResult,
 )
 from src.db.gateway.business_license import BusinessLicenseGateway
-from src.db.gateway.economy_queries import EconomyQueryGateway
+from src.db.gateway.economy_queries import BalanceRecord, EconomyQueryGateway
 from src.db.gateway.justice_governance import JusticeGovernanceGateway
 from src.db.gateway.state_council_governance import (
     CurrencyIssuance,
@@ -42,6 +45,8 @@ from src.db.gateway.state_council_governance import (
     WelfareDisbursement,
 )
 from src.db.pool import get_pool
+from src.infra.balance_cache import get_balance_cache
+from src.infra.config_cache import GuildConfigCache, get_config_cache
 from src.infra.db.connection_context import AcquireConnectionContext
 from src.infra.events.state_council_events import StateCouncilEvent
 from src.infra.events.state_council_events import publish as publish_state_council_event
@@ -53,6 +58,35 @@ LOGGER = structlog.get_logger(__name__)
 # Use shared AcquireConnectionContext from infra, with local alias for compatibility
 _AcquireConnectionContext = AcquireConnectionContext
 
+# 國務院總覽快照：共用同一 service 的面板對同一 guild 只查詢一次摘要；部門餘額變動事件與本程序的
+# 設定寫入會立即失效，存活秒數只是最後防線（例如身分紀錄不產生經濟事件）
+_DEFAULT_SUMMARY_TTL_SECONDS = 5.0
+# 每個 service 實例持有自己的快照（摘要來自該實例的 gateway）；失效時通知所有存活實例
+_summary_caches: weakref.WeakSet[GuildConfigCache] = weakref.WeakSet()
+
+
+def _summary_ttl_from_env() -> float:
+    raw = os.getenv("STATE_COUNCIL_SUMMARY_TTL", "").strip()
+    if not raw:
+        return _DEFAULT_SUMMARY_TTL_SECONDS
+    try:
+        return max(float(raw), 0.0)
+    except ValueError:
+        LOGGER.warning("state_council.summary_cache.ttl.invalid", value=raw)
+        return _DEFAULT_SUMMARY_TTL_SECONDS
+
+
+def _new_summary_cache() -> GuildConfigCache:
+    cache = GuildConfigCache(ttl_seconds=_summary_ttl_from_env(), maxsize=1024)
+    _summary_caches.add(cache)
+    return cache
+
+
+def invalidate_council_summary(guild_id: int | None = None) -> None:
+    """讓所有 service 實例中指定 guild（未指定則全部）的國務院總覽快照失效。"""
+    for cache in list(_summary_caches):
+        cache.invalidate(guild_id)
+
 
 class StateCouncilNotConfiguredError(RuntimeError):
     pass
@@ -113,20 +147,19 @@ class StateCouncilService:
         self._department_registry = department_registry or DepartmentRegistry()
         self._license_gateway = business_license_gateway or BusinessLicenseGateway()
         self._justice_gateway = JusticeGovernanceGateway()
+        self._summary_cache = _new_summary_cache()
 
     async def _get_economy_balance_snapshot(
         self, conn: Any, *, guild_id: int, member_id: int
     ) -> int | None:
-        """以唯讀方式取得經濟系統餘額，避免 fn_get_balance 造成鎖等待。
+        """以純讀取路徑取得經濟系統餘額（不建立帳本列、不取列鎖）。
 
-        - 優先使用 economy.fetch_balance_snapshot（Result 介面），回傳 int；
+        - 使用 economy.fetch_balance（Result 介面），尚無帳本列時為 0，回傳 int；
         - 發生任何錯誤時回退為 0，確保治理流程不中斷。
         """
 
         try:
-            result = await self._economy.fetch_balance_snapshot(
-                conn, guild_id=guild_id, member_id=member_id
-            )
+            result = await self._economy.fetch_balance(conn, guild_id=guild_id, member_id=member_id)
         except Exception:
             return None
 
@@ -144,6 +177,33 @@ class StateCouncilService:
         except Exception:
             return None
 
+    async def _get_cached_economy_balance(
+        self, conn: Any, *, guild_id: int, member_id: int
+    ) -> int | None:
+        """顯示與排序用的餘額讀取：經由程序內餘額快取，命中時不查詢資料庫。
+
+        對齊、扣款後回寫等寫入流程需要讀到本交易內的最新值，仍應使用
+        `_get_economy_balance_snapshot`。
+        """
+
+        async def _load() -> BalanceRecord | None:
+            result = await self._economy.fetch_balance(conn, guild_id=guild_id, member_id=member_id)
+            if not isinstance(result, Ok):
+                return None
+            record = result.unwrap()
+            return record if isinstance(record, BalanceRecord) else None
+
+        try:
+            record = await get_balance_cache().get_or_load(guild_id, member_id, _load)
+        except Exception:
+            record = None
+        if record is not None:
+            return record.balance
+        # 查詢失敗或測試替身：沿用原本的容錯讀取
+        return await self._get_economy_balance_snapshot(
+            conn, guild_id=guild_id, member_id=member_id
+        )
+
     def _get_auto_release_jobs(self, guild_id: int) -> dict[int, Any]:
         """Fetch in-memory auto-release metadata without importing at module load."""
 
@@ -634,20 +694,32 @@ class StateCouncilService:
                         balance=0,
                     )
 
-            return config
+        self._invalidate_config_cache(guild_id)
+        return config
 
     async def get_config(self, *, guild_id: int) -> StateCouncilConfig:
         """Get state council configuration for a guild."""
-        pool: PoolProtocol = cast(PoolProtocol, get_pool())
-        cm = await self._pool_acquire_cm(pool)
-        async with cm as conn:
-            cfg = await self._fetch_config(conn, guild_id=guild_id)
+        cfg = await get_config_cache().get_or_load(
+            "state_council", guild_id, "config", lambda: self._load_config(guild_id)
+        )
         if cfg is None:
             raise StateCouncilNotConfiguredError(
                 "State council governance is not configured for this guild."
             )
         return cfg
 
+    async def _load_config(self, guild_id: int) -> StateCouncilConfig | None:
+        pool: PoolProtocol = cast(PoolProtocol, get_pool())
+        cm = await self._pool_acquire_cm(pool)
+        async with cm as conn:
+            return await self._fetch_config(conn, guild_id=guild_id)
+
+    @staticmethod
+    def _invalidate_config_cache(guild_id: int) -> None:
+        # 資料庫觸發器亦會送出 governance_config_changed，這裡讓本程序立即讀到新值
+        get_config_cache().invalidate(guild_id, "state_council")
+        invalidate_council_summary(guild_id)
+
     async def update_citizen_role_config(
         self, *, guild_id: int, citizen_role_id: int | None
     ) -> StateCouncilConfig:
@@ -674,6 +746,7 @@ class StateCouncilService:
                 citizen_role_id=citizen_role_id,
                 suspect_role_id=existing.suspect_role_id,
             )
+        self._invalidate_config_cache(guild_id)
         return config
 
     async def update_suspect_role_config(
@@ -702,6 +775,7 @@ class StateCouncilService:
                 citizen_role_id=existing.citizen_role_id,
                 suspect_role_id=suspect_role_id,
             )
+        self._invalidate_config_cache(guild_id)
         return config
 
     async def ensure_government_accounts(self, *, guild_id: int, admin_id: int) -> None:
@@ -893,30 +967,30 @@ class StateCouncilService:
             return False
 
         try:
-            pool: PoolProtocol = cast(PoolProtocol, get_pool())
-            cm = await self._pool_acquire_cm(pool)
-            async with cm as conn:
-                # 檢查多角色配置
-                department_role_ids = await self._gateway.get_department_role_ids(
-                    conn, guild_id=guild_id, department=department
-                )
-
-                if department_role_ids:
-                    # 有多角色配置：檢查用戶是否擁有任一部門角色
-                    if bool(set(department_role_ids) & set(user_roles)):
-                        return True
+            # 檢查多角色配置
+            department_role_ids = await self.get_department_role_ids(
+                guild_id=guild_id, department=department
+            )
 
-                # 檢查傳統的單角色配置
-                dept_config = await self._gateway.fetch_department_config(
-                    conn, guild_id=guild_id, department=department
-                )
+            if department_role_ids:
+                # 有多角色配置：檢查用戶是否擁有任一部門角色
+                if bool(set(department_role_ids) & set(user_roles)):
+                    return True
+
+            # 檢查傳統的單角色配置
+            dept_config = await get_config_cache().get_or_load(
+                "state_council",
+                guild_id,
+                ("department_config", department),
+                lambda: self._load_department_config(guild_id, department),
+            )
 
-                if dept_config is not None:
-                    # 測試友善：若為 AsyncMock，視為通過
-                    if isinstance(dept_config, AsyncMock):
-                        return True
-                    if dept_config.role_id is not None and dept_config.role_id in user_roles:
-                        return True
+            if dept_config is not None:
+                # 測試友善：若為 AsyncMock，視為通過
+                if isinstance(dept_config, AsyncMock):
+                    return True
+                if dept_config.role_id is not None and dept_config.role_id in user_roles:
+                    return True
         except Exception as exc:
             LOGGER.warning(
                 "state_council.permission.department_check_failed",
@@ -937,6 +1011,57 @@ class StateCouncilService:
 
         return False
 
+    async def check_department_permissions_bulk(
+        self,
+        *,
+        guild_id: int,
+        user_id: int,
+        user_roles: Sequence[int],
+        departments: Sequence[str],
+    ) -> dict[str, bool]:
+        """一次判斷多個部門的存取權限（規則同 `check_department_permission`）。
+
+        領袖設定與所有部門身分組由單一查詢取得（並經設定快取），
+        面板開啟時不再逐部門取用連線。未完成國務院設定時全部拒絕。
+        """
+        permission_map = await get_config_cache().get_or_load(
+            "state_council",
+            guild_id,
+            "department_permission_map",
+            lambda: self._load_department_permission_map(guild_id),
+        )
+        if permission_map is None:
+            return dict.fromkeys(departments, False)
+
+        is_leader = bool(
+            (permission_map.leader_id and permission_map.leader_id == user_id)
+            or (permission_map.leader_role_id and permission_map.leader_role_id in user_roles)
+        )
+        roles = set(user_roles)
+        return {
+            department: is_leader
+            or bool(roles.intersection(permission_map.department_role_ids.get(department, ())))
+            for department in departments
+        }
+
+    async def _load_department_permission_map(
+        self, guild_id: int
+    ) -> DepartmentPermissionMap | None:
+        pool: PoolProtocol = cast(PoolProtocol, get_pool())
+        cm = await self._pool_acquire_cm(pool)
+        async with cm as conn:
+            return await self._gateway.fetch_department_permission_map(conn, guild_id=guild_id)
+
+    async def _load_department_config(
+        self, guild_id: int, department: str
+    ) -> DepartmentConfig | None:
+        pool: PoolProtocol = cast(PoolProtocol, get_pool())
+        cm = await self._pool_acquire_cm(pool)
+        async with cm as conn:
+            return await self._gateway.fetch_department_config(
+                conn, guild_id=guild_id, department=department
+            )
+
     # --- Department Role Management ---
     async def add_department_role(self, *, guild_id: int, department: str, role_id: int) -> bool:
         """為指定部門添加角色"""
@@ -944,9 +1069,11 @@ class StateCouncilService:
         cm = await self._pool_acquire_cm(pool)
         async with cm as conn:
             c: ConnectionProtocol = conn
-            return await self._gateway.add_department_role(
+            changed = await self._gateway.add_department_role(
                 c, guild_id=guild_id, department=department, role_id=role_id
             )
+        self._invalidate_config_cache(guild_id)
+        return changed
 
     async def remove_department_role(self, *, guild_id: int, department: str, role_id: int) -> bool:
         """從指定部門移除角色"""
@@ -954,12 +1081,22 @@ class StateCouncilService:
         cm = await self._pool_acquire_cm(pool)
         async with cm as conn:
             c: ConnectionProtocol = conn
-            return await self._gateway.remove_department_role(
+            changed = await self._gateway.remove_department_role(
                 c, guild_id=guild_id, department=department, role_id=role_id
             )
+        self._invalidate_config_cache(guild_id)
+        return changed
 
     async def get_department_role_ids(self, *, guild_id: int, department: str) -> Sequence[int]:
         """獲取部門的所有角色ID"""
+        return await get_config_cache().get_or_load(
+            "state_council",
+            guild_id,
+            ("department_roles", department),
+            lambda: self._load_department_role_ids(guild_id, department),
+        )
+
+    async def _load_department_role_ids(self, guild_id: int, department: str) -> Sequence[int]:
         pool: PoolProtocol = cast(PoolProtocol, get_pool())
         cm = await self._pool_acquire_cm(pool)
         async with cm as conn:
@@ -1518,10 +1655,7 @@ class StateCouncilService:
         except StateCouncilNotConfiguredError:
             return None
 
-        pool: PoolProtocol = cast(PoolProtocol, get_pool())
-        cm = await self._pool_acquire_cm(pool)
-        async with cm as conn:
-            configs = await self._gateway.fetch_department_configs(conn, guild_id=guild_id)
+        configs = await self.fetch_department_configs(guild_id=guild_id)
         for cfg in configs:
             if cfg.role_id == role_id:
                 return cfg.department
@@ -1542,8 +1676,17 @@ class StateCouncilService:
     async def fetch_department_configs(self, *, guild_id: int) -> Sequence[DepartmentConfig]:
         """列出指定公會的所有部門設定。
 
-        提供給指令層（例如 adjust 命令）使用的薄包裝，實際資料來源為 gateway。
+        提供給指令層（例如 adjust 命令）使用的薄包裝，實際資料來源為 gateway；
+        結果經由 governance 設定快取讀取。
         """
+        return await get_config_cache().get_or_load(
+            "state_council",
+            guild_id,
+            "department_configs",
+            lambda: self._load_department_configs(guild_id),
+        )
+
+    async def _load_department_configs(self, guild_id: int) -> Sequence[DepartmentConfig]:
         pool: PoolProtocol = cast(PoolProtocol, get_pool())
         cm = await self._pool_acquire_cm(pool)
         async with cm as conn:
@@ -1571,6 +1714,7 @@ class StateCouncilService:
             result = await self._gateway.upsert_department_config(
                 conn, guild_id=guild_id, department=department, **kwargs
             )
+        self._invalidate_config_cache(guild_id)
 
         # 發布部門配置變更事件
         try:
@@ -1609,7 +1753,7 @@ class StateCouncilService:
         pool: PoolProtocol = cast(PoolProtocol, get_pool())
         cm = await self._pool_acquire_cm(pool)
         async with cm as conn:
-            return await self._gateway.upsert_department_config(
+            result = await self._gateway.upsert_department_config(
                 conn,
                 guild_id=guild_id,
                 department=department,
@@ -1620,6 +1764,8 @@ class StateCouncilService:
                 tax_rate_percent=tax_rate_percent,
                 max_issuance_per_month=max_issuance_per_month,
             )
+        self._invalidate_config_cache(guild_id)
+        return result
 
     # --- Government Account Management ---
     async def get_department_balance(self, *, guild_id: int, department: str) -> int:
@@ -1634,7 +1780,7 @@ class StateCouncilService:
                 if account is not None
                 else self.derive_department_account_id(guild_id, department)
             )
-            bal = await self._get_economy_balance_snapshot(
+            bal = await self._get_cached_economy_balance(
                 conn, guild_id=guild_id, member_id=account_id
             )
             if bal is not None:
@@ -2871,87 +3017,42 @@ class StateCouncilService:
 
     # --- Statistics and Summary ---
     async def get_council_summary(self, *, guild_id: int) -> StateCouncilSummary:
-        """Get comprehensive summary of state council status."""
+        """Get comprehensive summary of state council status.
+
+        經由本實例每 guild 的短期快照讀取，多個面板同時刷新時只查詢一次。
+        """
+        return await self._summary_cache.get_or_load(
+            "state_council",
+            guild_id,
+            "council_summary",
+            lambda: self._load_council_summary(guild_id),
+        )
+
+    async def _load_council_summary(self, guild_id: int) -> StateCouncilSummary:
+        # 結果會存入每 guild 快照直到 TTL 結束：一律讀主庫。監聽器在帳本事件後立即失效快照，
+        # 此時落後的副本會把舊餘額寫回快照並提供整個 TTL。
         pool = get_pool()
         cm = await self._pool_acquire_cm(pool)
         async with cm as conn:
-            # Get config
             config = await self._fetch_config(conn, guild_id=guild_id)
             if config is None:
                 raise StateCouncilNotConfiguredError("State council not configured")
 
-            # 僅針對現有治理層帳戶統計（單元測試預期）
-            accounts = list(await self._safe_fetch_accounts(conn, guild_id=guild_id))
-            dept_balances: dict[str, int] = {}
-            for acc in accounts:
-                try:
-                    if isinstance(conn, AsyncMock):
-                        raise RuntimeError("mock connection cannot provide live economy balance")
-                    bal = await self._get_economy_balance_snapshot(
-                        conn, guild_id=guild_id, member_id=acc.account_id
-                    )
-                    if bal is not None:
-                        dept_balances[acc.department] = int(bal)
-                        continue
-                except Exception:
-                    pass
-                dept_balances[acc.department] = acc.balance
-            total_balance = sum(dept_balances.values())
+            # 各部門餘額（以經濟帳本為準）與統計以單一聚合查詢取得，延遲與紀錄筆數無關
+            current_month = datetime.now(tz=timezone.utc).strftime("%Y-%m")
+            stats = await self._gateway.fetch_all_department_stats(
+                conn, guild_id=guild_id, month_period=current_month
+            )
+            department_stats = {stat.department: stat for stat in stats}
 
-            # Get recent transfers
             recent_transfers = await self._gateway.fetch_interdepartment_transfers(
                 conn, guild_id=guild_id, limit=10
             )
 
-            # Calculate department stats
-            department_stats: dict[str, DepartmentStats] = {}
-            for account in accounts:
-                # Get welfare stats for Internal Affairs
-                welfare_total = 0
-                if account.department == "內政部":
-                    welfare_records = await self._gateway.fetch_welfare_disbursements(
-                        conn, guild_id=guild_id, limit=1000
-                    )
-                    welfare_total = sum(rec.amount for rec in welfare_records)
-
-                # Get tax stats for Finance
-                tax_total = 0
-                if account.department == "財政部":
-                    tax_records = await self._gateway.fetch_tax_records(
-                        conn, guild_id=guild_id, limit=1000
-                    )
-                    tax_total = sum(rec.tax_amount for rec in tax_records)
-
-                # Get identity stats for Security
-                identity_count = 0
-                if account.department == "國土安全部":
-                    identity_records = await self._gateway.fetch_identity_records(
-                        conn, guild_id=guild_id, limit=1000
-                    )
-                    identity_count = len(identity_records)
-
-                # Get currency stats for Central Bank
-                currency_issued = 0
-                if account.department == "中央銀行":
-                    current_month = datetime.now(tz=timezone.utc).strftime("%Y-%m")
-                    currency_records = await self._gateway.fetch_currency_issuances(
-                        conn, guild_id=guild_id, month_period=current_month, limit=1000
-                    )
-                    currency_issued = sum(rec.amount for rec in currency_records)
-
-                department_stats[account.department] = DepartmentStats(
-                    department=account.department,
-                    balance=dept_balances.get(account.department, account.balance),
-                    total_welfare_disbursed=welfare_total,
-                    total_tax_collected=tax_total,
-                    identity_actions_count=identity_count,
-                    currency_issued=currency_issued,
-                )
-
             return StateCouncilSummary(
                 leader_id=config.leader_id,
                 leader_role_id=config.leader_role_id,
-                total_balance=total_balance,
+                total_balance=sum(stat.balance for stat in department_stats.values()),
                 department_stats=department_stats,
                 recent_transfers=recent_transfers,
             )
@@ -2973,7 +3074,7 @@ class StateCouncilService:
             for acc in accounts:
                 # 從經濟系統取得即時餘額
                 try:
-                    bal = await self._get_economy_balance_snapshot(
+                    bal = await self._get_cached_economy_balance(
                         conn, guild_id=guild_id, member_id=acc.account_id
                     )
                     if bal is None:
@@ -3442,6 +3543,7 @@ class StateCouncilService:
 
 __all__ = [
     "StateCouncilService",
+    "invalidate_council_summary",
     "StateCouncilNotConfiguredError",
     "PermissionDeniedError",
     "InsufficientFundsError",
@@ -15,7 +15,8 @@ from src.db.gateway.supreme_assembly_governance import (
     SupremeAssemblyGovernanceGateway,
     Tally,
 )
-from src.db.pool import get_pool
+from src.db.pool import get_pool, get_read_pool
+from src.infra.config_cache import get_config_cache
 from src.infra.events.supreme_assembly_events import (
     SupremeAssemblyEvent,
     publish,
@@ -150,6 +151,7 @@ class SupremeAssemblyService:
                     speaker_role_id=speaker_role_id,
                     member_role_id=member_role_id,
                 )
+                get_config_cache().invalidate(guild_id, "supreme_assembly")
                 _ = await self.get_or_create_account_id(guild_id)
                 return config
 
@@ -160,10 +162,9 @@ class SupremeAssemblyService:
     ) -> Result[SupremeAssemblyConfig, SupremeAssemblyError]:
         @async_returns_result(SupremeAssemblyError, exception_map=_EXCEPTION_MAP)
         async def _impl() -> SupremeAssemblyConfig:
-            pool: PoolProtocol = cast(PoolProtocol, get_pool())
-            async with pool.acquire() as conn:
-                c: ConnectionProtocol = conn
-                cfg = await self._gateway.fetch_config(c, guild_id=guild_id)
+            cfg = await get_config_cache().get_or_load(
+                "supreme_assembly", guild_id, "config", lambda: self._load_config(guild_id)
+            )
             if cfg is None:
                 raise GovernanceNotConfiguredError(
                     "Supreme assembly governance is not configured for this guild."
@@ -172,6 +173,12 @@ class SupremeAssemblyService:
 
         return await _impl()
 
+    async def _load_config(self, guild_id: int) -> SupremeAssemblyConfig | None:
+        pool: PoolProtocol = cast(PoolProtocol, get_pool())
+        async with pool.acquire() as conn:
+            c: ConnectionProtocol = conn
+            return await self._gateway.fetch_config(c, guild_id=guild_id)
+
     async def get_account_balance(self, *, guild_id: int) -> Result[int, SupremeAssemblyError]:
         """Get the balance of the supreme assembly account for a guild."""
 
@@ -276,77 +283,31 @@ class SupremeAssemblyService:
             final_status: str
             async with pool.acquire() as conn:
                 c: ConnectionProtocol = conn
-                proposal = await self._gateway.fetch_proposal(c, proposal_id=proposal_id)
-                if proposal is None:
-                    raise RuntimeError("Proposal not found.")
-                if proposal.status != "進行中":
-                    totals = await self._compute_totals(c, proposal_id, proposal)
-                    final_status = proposal.status
-                else:
-                    snapshot = await self._gateway.fetch_snapshot(c, proposal_id=proposal_id)
-                    if voter_id not in snapshot:
-                        raise PermissionDeniedError(
-                            "Voter is not in the snapshot for this proposal."
-                        )
-
-                    async with c.transaction():
-                        try:
-                            await self._gateway.upsert_vote(
-                                c,
-                                proposal_id=proposal_id,
-                                voter_id=voter_id,
-                                choice=choice,
-                            )
-                        except RuntimeError as exc:
-                            if "already exists" in str(exc).lower():
-                                raise VoteAlreadyExistsError(
-                                    "Vote already exists and cannot be changed."
-                                ) from exc
-                            raise
-
-                        totals = await self._compute_totals(c, proposal_id, proposal)
-                        final_status = "進行中"
-
-                        if totals.approve >= proposal.threshold_t:
-                            await self._gateway.mark_status(
-                                c,
-                                proposal_id=proposal_id,
-                                status="已通過",
-                            )
-                            final_status = "已通過"
-                            await publish(
-                                SupremeAssemblyEvent(
-                                    guild_id=proposal.guild_id,
-                                    proposal_id=proposal_id,
-                                    kind="proposal_status_changed",
-                                    status="已通過",
-                                )
-                            )
-                        elif totals.approve + totals.remaining_unvoted < proposal.threshold_t:
-                            await self._gateway.mark_status(
-                                c,
-                                proposal_id=proposal_id,
-                                status="已否決",
-                            )
-                            final_status = "已否決"
-                            await publish(
-                                SupremeAssemblyEvent(
-                                    guild_id=proposal.guild_id,
-                                    proposal_id=proposal_id,
-                                    kind="proposal_status_changed",
-                                    status="已否決",
-                                )
-                            )
-                        else:
-                            await publish(
-                                SupremeAssemblyEvent(
-                                    guild_id=proposal.guild_id,
-                                    proposal_id=proposal_id,
-                                    kind="vote_cast",
-                                    status="進行中",
-                                )
-                            )
-
+                # 快照檢查、寫入選票、計數更新與通過／否決判定於單一資料庫呼叫完成
+                outcome, proposal, tally = await self._gateway.cast_vote(
+                    c,
+                    proposal_id=proposal_id,
+                    voter_id=voter_id,
+                    choice=choice,
+                )
+            if proposal is None:
+                raise RuntimeError("Proposal not found.")
+            if outcome == "not_in_snapshot":
+                raise PermissionDeniedError("Voter is not in the snapshot for this proposal.")
+            if outcome == "duplicate":
+                raise VoteAlreadyExistsError("Vote already exists and cannot be changed.")
+
+            totals = self._totals_from_tally(proposal, tally)
+            final_status = proposal.status
+            if outcome == "voted":
+                await publish(
+                    SupremeAssemblyEvent(
+                        guild_id=proposal.guild_id,
+                        proposal_id=proposal_id,
+                        kind="vote_cast" if final_status == "進行中" else "proposal_status_changed",
+                        status=final_status,
+                    )
+                )
             return (totals, final_status)
 
         return await _impl()
@@ -372,6 +333,10 @@ class SupremeAssemblyService:
         self, connection: ConnectionProtocol, proposal_id: UUID, proposal: Proposal
     ) -> VoteTotals:
         tally: Tally = await self._gateway.fetch_tally(connection, proposal_id=proposal_id)
+        return self._totals_from_tally(proposal, tally)
+
+    @staticmethod
+    def _totals_from_tally(proposal: Proposal, tally: Tally) -> VoteTotals:
         remaining = max(0, proposal.snapshot_n - tally.total_voted)
         return VoteTotals(
             approve=tally.approve,
@@ -450,7 +415,8 @@ class SupremeAssemblyService:
     ) -> Result[list[dict[str, object]], SupremeAssemblyError]:
         @async_returns_result(SupremeAssemblyError, exception_map=_EXCEPTION_MAP)
         async def _impl() -> list[dict[str, object]]:
-            pool: PoolProtocol = cast(PoolProtocol, get_pool())
+            # 匯出為唯讀大量查詢，可由讀取副本承擔
+            pool: PoolProtocol = cast(PoolProtocol, get_read_pool(get_pool()))
             async with pool.acquire() as conn:
                 c: ConnectionProtocol = conn
                 rows = await self._gateway.export_interval(
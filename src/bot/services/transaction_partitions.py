@@ -0,0 +1,143 @@
+"""Background upkeep for the monthly partitions of economy.currency_transactions.
+
+The bot (rather than pg_cron) keeps future partitions created ahead of time,
+moves whole expired partitions into the archive table and prunes the matching
+days from member_daily_transfer_totals.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from datetime import datetime, timedelta, timezone
+from typing import cast
+
+import structlog
+
+from src.db import pool as db_pool
+from src.db.gateway.economy_partitions import EconomyPartitionGateway
+from src.infra.types.db import PoolProtocol
+
+LOGGER = structlog.get_logger(__name__)
+
+# 維護週期；月分區至少提前 _MONTHS_AHEAD 個月建立，因此偶爾漏跑不影響寫入
+_MAINTENANCE_INTERVAL_SECONDS = 3600.0
+_MONTHS_AHEAD = 2
+# 預設與原 pg_cron 歸檔作業相同的保留期限；以整月為單位歸檔，即時表實際保留 30～61 天
+_DEFAULT_RETENTION_DAYS = 30
+
+
+def _retention_from_env() -> timedelta:
+    """讀取 ECONOMY_ARCHIVE_RETENTION_DAYS；未設定或無效時為 30 天。"""
+    raw = os.getenv("ECONOMY_ARCHIVE_RETENTION_DAYS", "").strip()
+    if not raw:
+        return timedelta(days=_DEFAULT_RETENTION_DAYS)
+    try:
+        days = int(raw)
+    except ValueError:
+        LOGGER.warning("transaction_partitions.retention.invalid", value=raw)
+        return timedelta(days=_DEFAULT_RETENTION_DAYS)
+    return timedelta(days=max(days, 1))
+
+
+class TransactionPartitionMaintainer:
+    """Periodically ensures upcoming partitions exist and archives expired ones."""
+
+    def __init__(
+        self,
+        *,
+        pool: PoolProtocol | None = None,
+        gateway: EconomyPartitionGateway | None = None,
+        retention: timedelta | None = None,
+        interval_seconds: float = _MAINTENANCE_INTERVAL_SECONDS,
+    ) -> None:
+        self._pool: PoolProtocol | None = pool
+        self._gateway = gateway or EconomyPartitionGateway()
+        self._retention = retention if retention is not None else _retention_from_env()
+        self._interval = interval_seconds
+        self._task: asyncio.Task[None] | None = None
+        self._running = False
+
+    async def start(self) -> None:
+        """Start the maintenance loop; the first pass runs immediately."""
+        if self._running:
+            return
+
+        if self._pool is None:
+            try:
+                self._pool = cast(PoolProtocol, await db_pool.init_pool())
+            except (RuntimeError, ValueError):
+                # 單元測試環境可能沒有 DATABASE_URL
+                pass
+
+        self._running = True
+        if self._pool is not None:
+            self._task = asyncio.create_task(self._run(), name="transaction-partition-maintenance")
+        LOGGER.info("transaction_partitions.maintainer.started")
+
+    async def stop(self) -> None:
+        """Stop the maintenance loop."""
+        if not self._running:
+            return
+
+        self._running = False
+        task, self._task = self._task, None
+        if task and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        LOGGER.info("transaction_partitions.maintainer.stopped")
+
+    async def run_once(self) -> tuple[int, list[str]]:
+        """Run one maintenance pass; returns (partitions created, partitions archived)."""
+        if self._pool is None:
+            return 0, []
+
+        # 各步驟各自提交：歸檔因鎖等待逾時失敗時，新分區仍然已建立
+        async with self._pool.acquire() as conn:
+            created_result = await self._gateway.ensure_transaction_partitions(
+                conn, months_ahead=_MONTHS_AHEAD
+            )
+            archived_result = await self._gateway.archive_transaction_partitions(
+                conn, retention=self._retention
+            )
+            # 每日轉出累計只有當日值用於上限檢查，與交易紀錄採相同保留期限
+            pruned_result = await self._gateway.prune_daily_transfer_totals(
+                conn, before=(datetime.now(timezone.utc) - self._retention).date()
+            )
+
+        created = created_result.unwrap() if created_result.is_ok() else 0
+        if created_result.is_err():
+            LOGGER.error(
+                "transaction_partitions.ensure.failed", error=str(created_result.unwrap_err())
+            )
+        archived = list(archived_result.unwrap()) if archived_result.is_ok() else []
+        if archived_result.is_err():
+            LOGGER.warning(
+                "transaction_partitions.archive.failed", error=str(archived_result.unwrap_err())
+            )
+
+        if pruned_result.is_err():
+            LOGGER.warning(
+                "transaction_partitions.prune_totals.failed", error=str(pruned_result.unwrap_err())
+            )
+
+        if created or archived:
+            LOGGER.info("transaction_partitions.maintained", created=created, archived=archived)
+        return created, archived
+
+    async def _run(self) -> None:
+        while self._running:
+            try:
+                await self.run_once()
+                await asyncio.sleep(self._interval)
+            except asyncio.CancelledError:
+                break
+            except Exception:
+                LOGGER.exception("transaction_partitions.maintainer.error")
+                await asyncio.sleep(self._interval)
+
+
+__all__ = ["TransactionPartitionMaintainer"]
@@ -1,15 +1,15 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime, timezone
+import os
+import time
 from typing import Any, Mapping, cast
 from uuid import UUID
 
 import asyncpg
 import structlog
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
-from src.cython_ext.transfer_pool_core import TransferCheckStateStore
+from src.cython_ext.transfer_pool_core import TransferCheckStateStore, TransferLockRegistry
 from src.db import pool as db_pool
 from src.db.gateway.economy_pending_transfers import PendingTransferGateway
 from src.db.gateway.economy_transfers import EconomyTransferGateway
@@ -17,6 +17,33 @@ from src.infra.types.db import ConnectionProtocol, PoolProtocol
 
 LOGGER = structlog.get_logger(__name__)
 
+# 未走到終態（例如核准事件由其他程序處理或事件遺失）的檢查狀態保留上限；
+# 需遠大於最長重試間隔（300 秒）。
+_CHECK_STATE_TTL_SECONDS = 3600.0
+# 重試排程：最長退避秒數、達上限即拒絕的次數，以及排程迴圈的輪詢間隔與每批領取數量
+_RETRY_MAX_DELAY_SECONDS = 300
+_RETRY_MAX_ATTEMPTS = 10
+_RETRY_POLL_SECONDS = 1.0
+_RETRY_BATCH_SIZE = 100
+# 執行 worker：每輪最多處理的核准轉帳數量（每筆各自一個交易），以及未收到喚醒時的
+# 輪詢間隔（補漏失的 NOTIFY）
+_EXECUTION_BATCH_SIZE = 50
+_EXECUTION_POLL_SECONDS = 5.0
+# 逾期清理每批處理的列數（每批一個交易）
+_EXPIRY_BATCH_SIZE = 1000
+
+
+def _workers_from_env() -> int:
+    """讀取 TRANSFER_EVENT_POOL_WORKERS；未設定或無效時為 0（沿用逐筆 NOTIFY 執行）。"""
+    raw = os.getenv("TRANSFER_EVENT_POOL_WORKERS", "").strip()
+    if not raw:
+        return 0
+    try:
+        return max(int(raw), 0)
+    except ValueError:
+        LOGGER.warning("transfer_event_pool.workers.invalid", value=raw)
+        return 0
+
 
 class TransferEventPoolCoordinator:
     """Coordinates pending transfer checks and execution via event-driven architecture."""
@@ -27,17 +54,24 @@ class TransferEventPoolCoordinator:
         pool: PoolProtocol | None = None,
         pending_gateway: PendingTransferGateway | None = None,
         transfer_gateway: EconomyTransferGateway | None = None,
+        workers: int | None = None,
     ) -> None:
         self._pool: PoolProtocol | None = pool
         self._pending_gateway = pending_gateway or PendingTransferGateway()
         self._transfer_gateway = transfer_gateway or EconomyTransferGateway()
         self._check_store = TransferCheckStateStore()
-        # Track retry tasks: transfer_id -> asyncio.Task
-        self._retry_tasks: dict[UUID, asyncio.Task[None]] = {}
         # 每一筆 transfer 綁定一把鎖，避免同一 transfer_id 的事件並行處理導致
         # 重複排程重試（例如多個 transfer_check_result 幾乎同時抵達）。
-        self._locks: dict[UUID, asyncio.Lock] = {}
+        # 鎖以參照計數管理，最後一個持有者離開後即移除，不會隨處理量無限成長。
+        self._locks = TransferLockRegistry()
         self._cleanup_task: asyncio.Task[None] | None = None
+        # 單一排程迴圈：以 pending_transfers.next_retry_at 驅動重試，重啟後仍可續行
+        self._retry_scheduler_task: asyncio.Task[None] | None = None
+        # 執行 worker 數量：> 0 時由 worker 以 SKIP LOCKED 批次領取 approved 列，
+        # 核准事件僅用於喚醒；0 則維持每個核准事件各自執行一筆。
+        self._worker_count = _workers_from_env() if workers is None else max(workers, 0)
+        self._worker_tasks: list[asyncio.Task[None]] = []
+        self._work_available = asyncio.Event()
         self._running = False
 
     @property
@@ -50,6 +84,13 @@ class TransferEventPoolCoordinator:
         # snapshot() 會回傳一個淺拷貝，避免外部程式意外修改內部狀態。
         return cast(Mapping[UUID, Mapping[str, int]], self._check_store.snapshot())
 
+    def stats(self) -> dict[str, int]:
+        """回傳內部登錄表的大小，供監控與記憶體壓測使用。"""
+        return {
+            "locks": len(self._locks),
+            "check_states": len(self._check_store),
+        }
+
     async def start(self) -> None:
         """Start the coordinator and begin periodic cleanup."""
         if self._running:
@@ -70,6 +111,15 @@ class TransferEventPoolCoordinator:
             self._cleanup_task = asyncio.create_task(
                 self._periodic_cleanup(), name="transfer-pool-cleanup"
             )
+            self._retry_scheduler_task = asyncio.create_task(
+                self._retry_scheduler(), name="transfer-pool-retry-scheduler"
+            )
+            self._worker_tasks = [
+                asyncio.create_task(self._execution_worker(), name=f"transfer-pool-worker-{i}")
+                for i in range(self._worker_count)
+            ]
+            # 啟動時先清一次積壓的核准轉帳（例如停機期間錯過的 NOTIFY）
+            self._work_available.set()
         LOGGER.info("transfer_event_pool.coordinator.started")
 
     async def stop(self) -> None:
@@ -79,34 +129,22 @@ class TransferEventPoolCoordinator:
 
         self._running = False
 
-        # Cancel retry tasks
-        for task in self._retry_tasks.values():
-            if not task.done():
+        # Cancel background tasks（已排程的重試保存在資料庫中，不會因停止而遺失）
+        for task in (self._retry_scheduler_task, self._cleanup_task, *self._worker_tasks):
+            if task and not task.done():
                 task.cancel()
-        self._retry_tasks.clear()
-
-        # Cancel cleanup task
-        if self._cleanup_task and not self._cleanup_task.done():
-            self._cleanup_task.cancel()
-            try:
-                await self._cleanup_task
-            except asyncio.CancelledError:
-                pass
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._worker_tasks = []
 
         self._check_store.clear()
         LOGGER.info("transfer_event_pool.coordinator.stopped")
 
-    def _get_lock(self, transfer_id: UUID) -> asyncio.Lock:
-        """取得指定 transfer 的鎖，用於序列化同一筆轉帳的事件處理。
-
-        asyncio 單執行緒事件迴圈下，dict 存取本身是原子的，因此這裡不需要
-        額外的 async 鎖來保護 self._locks，本函式內也不進行 await。
-        """
-        lock = self._locks.get(transfer_id)
-        if lock is None:
-            lock = asyncio.Lock()
-            self._locks[transfer_id] = lock
-        return lock
+    def _forget(self, transfer_id: UUID) -> None:
+        """轉帳進入終態（completed/rejected）後釋放其檢查狀態。"""
+        self._check_store.remove(transfer_id)
 
     async def handle_check_result(
         self,
@@ -121,7 +159,7 @@ class TransferEventPoolCoordinator:
 
         # 將同一 transfer_id 的檢查結果序列化處理，避免多個
         # transfer_check_result 同時抵達時重複排程重試。
-        async with self._get_lock(transfer_id):
+        async with self._locks.hold(transfer_id):
             all_received = self._check_store.record(transfer_id, check_type, result)
             if not all_received:
                 return
@@ -145,9 +183,14 @@ class TransferEventPoolCoordinator:
         if not self._running:
             return
 
+        if self._worker_tasks:
+            # worker 模式：喚醒 worker 批次領取，不在 listener 路徑上執行
+            self._work_available.set()
+            return
+
         # 和檢查結果共用同一把鎖，避免在極端情況下「核准事件」與
         # 「最後一個檢查結果」交錯造成競爭條件。
-        async with self._get_lock(transfer_id):
+        async with self._locks.hold(transfer_id):
             await self._execute_transfer(transfer_id)
 
     async def _execute_transfer(self, transfer_id: UUID) -> None:
@@ -179,40 +222,17 @@ class TransferEventPoolCoordinator:
                                 transfer_id=transfer_id,
                                 status="not_approved_or_already_processed",
                             )
+                            self._forget(transfer_id)
                             return
 
-                        result = await self._transfer_gateway.transfer_currency(
-                            c,
-                            guild_id=row["guild_id"],
-                            initiator_id=row["initiator_id"],
-                            target_id=row["target_id"],
-                            amount=row["amount"],
-                            metadata=dict(
-                                cast(Mapping[str, Any] | None, row.get("metadata")) or {}
-                            ),
-                        )
-
-                        # Gateway is Result-based; propagate errors as exceptions so that the
-                        # surrounding handler treats them as execution failures.
-                        if result.is_err():
-                            error = result.unwrap_err()
-                            cause = getattr(error, "cause", None)
-                            if isinstance(cause, BaseException):
-                                raise cause
-                            raise Exception(str(error))
-
-                        procedure = result.unwrap()
-
-                        # 標記完成
-                        await self._pending_gateway.update_status(
-                            c, transfer_id=transfer_id, new_status="completed"
-                        )
+                        procedure = await self._run_claimed_transfer(c, row)
 
                         LOGGER.info(
                             "transfer_event_pool.execute.success",
                             transfer_id=transfer_id,
                             transaction_id=procedure.transaction_id,
                         )
+                    self._forget(transfer_id)
                 except Exception as exc:
                     LOGGER.exception(
                         "transfer_event_pool.execute.failed",
@@ -224,6 +244,7 @@ class TransferEventPoolCoordinator:
                         await self._pending_gateway.update_status(
                             c, transfer_id=transfer_id, new_status="rejected"
                         )
+                        self._forget(transfer_id)
                     except Exception:
                         LOGGER.exception(
                             "transfer_event_pool.execute.status_update_failed",
@@ -232,17 +253,114 @@ class TransferEventPoolCoordinator:
         except Exception:
             LOGGER.exception("transfer_event_pool.execute.error", transfer_id=transfer_id)
 
+    async def _run_claimed_transfer(self, conn: ConnectionProtocol, row: Mapping[str, Any]) -> Any:
+        """Execute a claimed approved row and mark it completed; raises on failure."""
+        transfer_id = row["transfer_id"]
+        result = await self._transfer_gateway.transfer_currency(
+            conn,
+            guild_id=row["guild_id"],
+            initiator_id=row["initiator_id"],
+            target_id=row["target_id"],
+            amount=row["amount"],
+            metadata=dict(cast(Mapping[str, Any] | None, row.get("metadata")) or {}),
+        )
+
+        # Gateway is Result-based; propagate errors as exceptions so that the
+        # surrounding handler treats them as execution failures.
+        if result.is_err():
+            error = result.unwrap_err()
+            cause = getattr(error, "cause", None)
+            if isinstance(cause, BaseException):
+                raise cause
+            raise Exception(str(error))
+
+        # 標記完成
+        await self._pending_gateway.update_status(
+            conn, transfer_id=transfer_id, new_status="completed"
+        )
+        return result.unwrap()
+
+    async def _execution_worker(self) -> None:
+        """Drain approved transfers in batches until stopped."""
+        while self._running:
+            try:
+                try:
+                    await asyncio.wait_for(
+                        self._work_available.wait(), timeout=_EXECUTION_POLL_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                self._work_available.clear()
+                # 整批額滿代表可能仍有積壓，持續領取直到清空
+                while self._running and await self._drain_approved() >= _EXECUTION_BATCH_SIZE:
+                    pass
+            except asyncio.CancelledError:
+                break
+            except Exception:
+                LOGGER.exception("transfer_event_pool.worker.error")
+                await asyncio.sleep(_EXECUTION_POLL_SECONDS)
+
+    async def _drain_approved(self, *, connection: ConnectionProtocol | None = None) -> int:
+        """Execute up to one batch of approved transfers, each in its own short transaction.
+
+        每筆轉帳以 SKIP LOCKED 領取一列仍為 approved 的轉帳，在獨立交易內執行並立即提交：
+        帳本列鎖在該筆完成後就釋放，熱門帳戶（例如政府帳戶）與互動轉帳不必等待整批，
+        多個 worker 也不會長時間以不同順序持有多個帳戶的鎖。執行失敗時回滾到 savepoint
+        並在同一交易內標記為 rejected；死結或序列化衝突則保留為 approved 並結束本輪，
+        交由下一輪重新領取。回傳處理的筆數。
+        """
+        if connection is None:
+            if self._pool is None:
+                return 0
+            async with self._pool.acquire() as conn:
+                return await self._drain_approved(connection=conn)
+
+        c = connection
+        processed = 0
+        while processed < _EXECUTION_BATCH_SIZE:
+            procedure: Any = None
+            conflict = False
+            async with c.transaction():
+                rows = await self._pending_gateway.claim_approved(c, limit=1)
+                if not rows:
+                    break
+                row = rows[0]
+                transfer_id = row["transfer_id"]
+                try:
+                    async with c.transaction():
+                        procedure = await self._run_claimed_transfer(c, row)
+                except (asyncpg.DeadlockDetectedError, asyncpg.SerializationError):
+                    conflict = True
+                except Exception as exc:
+                    LOGGER.exception(
+                        "transfer_event_pool.execute.failed",
+                        transfer_id=transfer_id,
+                        error=str(exc),
+                    )
+                    # 若此更新失敗，只會回滾本筆交易，先前已提交的轉帳不受影響
+                    await self._pending_gateway.update_status(
+                        c, transfer_id=transfer_id, new_status="rejected"
+                    )
+
+            processed += 1
+            if conflict:
+                LOGGER.warning("transfer_event_pool.worker.conflict", transfer_id=transfer_id)
+                break
+            if procedure is not None:
+                LOGGER.info(
+                    "transfer_event_pool.execute.success",
+                    transfer_id=transfer_id,
+                    transaction_id=procedure.transaction_id,
+                )
+            self._forget(transfer_id)
+
+        return processed
+
     async def _schedule_retry(self, transfer_id: UUID) -> None:
-        """Schedule a retry for a failed transfer."""
+        """Schedule a retry for a failed transfer by persisting `next_retry_at`."""
         if self._pool is None:
             return
 
-        # Cancel existing retry task if any
-        if transfer_id in self._retry_tasks:
-            task = self._retry_tasks[transfer_id]
-            if not task.done():
-                task.cancel()
-
         try:
             async with self._pool.acquire() as conn:
                 c: ConnectionProtocol = conn
@@ -250,10 +368,11 @@ class TransferEventPoolCoordinator:
                     c, transfer_id=transfer_id
                 )
                 if pending is None:
+                    self._forget(transfer_id)
                     return
 
                 # Check retry count
-                if pending.retry_count >= 10:
+                if pending.retry_count >= _RETRY_MAX_ATTEMPTS:
                     LOGGER.info(
                         "transfer_event_pool.retry.max_reached",
                         transfer_id=transfer_id,
@@ -262,6 +381,7 @@ class TransferEventPoolCoordinator:
                     await self._pending_gateway.update_status(
                         conn, transfer_id=transfer_id, new_status="rejected"
                     )
+                    self._forget(transfer_id)
                     # 發送交易拒絕事件，供上層通知使用者
                     try:
                         # 明確型別轉型，避免 asyncpg 在 jsonb_build_object 參數型別推斷失敗
@@ -293,104 +413,67 @@ class TransferEventPoolCoordinator:
                         )
                     return
 
-                # Calculate retry delay using exponential backoff: 2^retry_count seconds,
-                # max 300 seconds. This matches Tenacity's exponential backoff pattern
-                delay_seconds = min(2**pending.retry_count, 300)
-
-                # Increment retry count
-                async with c.transaction():
-                    await c.execute(
-                        """
-                        UPDATE economy.pending_transfers
-                        SET retry_count = retry_count + 1,
-                            updated_at = timezone('utc', clock_timestamp())
-                        WHERE transfer_id = $1
-                        """,
-                        transfer_id,
-                    )
-
-                # Schedule retry
-                async def retry_task() -> None:
-                    await asyncio.sleep(delay_seconds)
-                    await self._retry_checks(transfer_id)
-
-                self._retry_tasks[transfer_id] = asyncio.create_task(
-                    retry_task(), name=f"transfer-retry-{transfer_id}"
+                # 指數退避（2^retry_count 秒，最長 300 秒）由資料庫計算並寫入 next_retry_at；
+                # 已排程時不會重複累加，多個副本同時收到檢查結果也只排一次。
+                next_retry_at = await self._pending_gateway.schedule_retry(
+                    c, transfer_id=transfer_id, max_delay_seconds=_RETRY_MAX_DELAY_SECONDS
                 )
+                if next_retry_at is None:
+                    LOGGER.debug(
+                        "transfer_event_pool.retry.already_scheduled",
+                        transfer_id=transfer_id,
+                    )
+                    return
 
                 LOGGER.info(
                     "transfer_event_pool.retry.scheduled",
                     transfer_id=transfer_id,
-                    delay_seconds=delay_seconds,
+                    next_retry_at=next_retry_at,
                     retry_count=pending.retry_count + 1,
                 )
         except Exception:
             LOGGER.exception("transfer_event_pool.retry.error", transfer_id=transfer_id)
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        retry=retry_if_exception_type((asyncpg.PostgresError, asyncio.TimeoutError)),
-        reraise=True,
-    )
-    async def _retry_checks(
-        self,
-        transfer_id: UUID,
-        *,
-        connection: ConnectionProtocol | None = None,
-    ) -> None:
-        """Retry all checks for a transfer with automatic retry on database errors."""
-        # 允許在測試中傳入既有的交易連線，避免不同連線看不到未提交變更
-        if connection is None and self._pool is None:
-            return
-
-        try:
-            if connection is None:
-                pool = self._pool
-                if pool is None:
-                    return
-                async with pool.acquire() as conn:
-                    c: ConnectionProtocol = conn
-                    # Reset status to checking to allow checks to run
-                    await self._pending_gateway.update_status(
-                        c, transfer_id=transfer_id, new_status="checking"
-                    )
-
-                    # Re-trigger all checks (each function returns void, so we use execute)
-                    await c.execute("SELECT economy.fn_check_transfer_balance($1)", transfer_id)
-                    await c.execute("SELECT economy.fn_check_transfer_cooldown($1)", transfer_id)
-                    await c.execute("SELECT economy.fn_check_transfer_daily_limit($1)", transfer_id)
+    async def _retry_scheduler(self) -> None:
+        """Single scheduler loop that claims due retries from the database."""
+        delay = _RETRY_POLL_SECONDS
+        while self._running:
+            try:
+                await asyncio.sleep(delay)
+                claimed = await self._run_due_retries()
+                # 整批額滿代表可能還有到期項目，立即再領取一次
+                delay = 0 if claimed >= _RETRY_BATCH_SIZE else _RETRY_POLL_SECONDS
+            except asyncio.CancelledError:
+                break
+            except Exception:
+                LOGGER.exception("transfer_event_pool.retry.scheduler_error")
+                delay = _RETRY_POLL_SECONDS
 
-                    # Clear check state to allow fresh evaluation
-                    self._check_store.remove(transfer_id)
+    async def _run_due_retries(self, *, connection: ConnectionProtocol | None = None) -> int:
+        """Claim due retries with FOR UPDATE SKIP LOCKED and re-evaluate them.
 
-                    LOGGER.debug(
-                        "transfer_event_pool.retry.checks_triggered",
-                        transfer_id=transfer_id,
-                    )
-            else:
-                conn = connection
-                # Reset status to checking to allow checks to run
-                await self._pending_gateway.update_status(
-                    conn, transfer_id=transfer_id, new_status="checking"
-                )
-
-                # Re-trigger all checks (each function returns void, so we use execute)
-                await conn.execute("SELECT economy.fn_check_transfer_balance($1)", transfer_id)
-                await conn.execute("SELECT economy.fn_check_transfer_cooldown($1)", transfer_id)
-                await conn.execute("SELECT economy.fn_check_transfer_daily_limit($1)", transfer_id)
+        領取與重新評估在同一交易內完成：程序中途結束時交易回滾，排程會保留給下一次
+        （或其他副本）處理；SKIP LOCKED 讓多個副本可同時領取不同的列。
+        """
+        if connection is None:
+            if self._pool is None:
+                return 0
+            async with self._pool.acquire() as conn:
+                return await self._run_due_retries(connection=conn)
 
-                # Clear check state to allow fresh evaluation
+        async with connection.transaction():
+            transfer_ids = await self._pending_gateway.claim_due_retries(
+                connection, limit=_RETRY_BATCH_SIZE
+            )
+            if not transfer_ids:
+                return 0
+            # 事件於交易提交後才送出，因此在此先清除舊的檢查狀態不會與新結果競爭
+            for transfer_id in transfer_ids:
                 self._check_store.remove(transfer_id)
+            await self._pending_gateway.evaluate_transfers(connection, transfer_ids=transfer_ids)
 
-                LOGGER.debug("transfer_event_pool.retry.checks_triggered", transfer_id=transfer_id)
-        except Exception:
-            LOGGER.exception("transfer_event_pool.retry.checks_error", transfer_id=transfer_id)
-            raise
-        finally:
-            # Remove retry task
-            if transfer_id in self._retry_tasks:
-                del self._retry_tasks[transfer_id]
+        LOGGER.debug("transfer_event_pool.retry.claimed", count=len(transfer_ids))
+        return len(transfer_ids)
 
     async def _periodic_cleanup(self) -> None:
         """Periodically clean up expired pending transfers."""
@@ -401,13 +484,21 @@ class TransferEventPoolCoordinator:
             try:
                 await asyncio.sleep(60)  # Run every minute
                 await self._cleanup_expired()
+                self._prune_stale_states()
             except asyncio.CancelledError:
                 break
             except Exception:
                 LOGGER.exception("transfer_event_pool.cleanup.error")
 
+    def _prune_stale_states(self) -> None:
+        """移除超過 TTL 仍未進入終態的檢查狀態，並記錄登錄表大小。"""
+        pruned = self._check_store.prune(_CHECK_STATE_TTL_SECONDS)
+        if pruned:
+            LOGGER.info("transfer_event_pool.cleanup.stale_states", count=pruned)
+        LOGGER.debug("transfer_event_pool.registry.sizes", **self.stats())
+
     async def _cleanup_expired(self, *, connection: ConnectionProtocol | None = None) -> None:
-        """Clean up expired pending transfers."""
+        """Clean up expired pending transfers in bounded, set-based chunks."""
         if connection is None and self._pool is None:
             return
 
@@ -418,68 +509,26 @@ class TransferEventPoolCoordinator:
                     return
 
             conn = connection
-            now = datetime.now(timezone.utc)
-            async with conn.transaction():
-                # 先以固定的 now 值更新，確保後續可用 updated_at 精準挑出本次處理的列
-                await conn.execute(
-                    """
-                    UPDATE economy.pending_transfers
-                    SET status = 'rejected',
-                        updated_at = $2
-                    WHERE expires_at IS NOT NULL
-                      AND expires_at < $1
-                      AND status IN ('pending', 'checking')
-                    """,
-                    now,
-                    now,
+            started = time.perf_counter()
+            total = 0
+            # 每批各自提交：大量積壓時不會形成單一巨大交易；拒絕事件由資料庫端合併送出
+            while True:
+                expired = await self._pending_gateway.expire_pending_transfers(
+                    conn, limit=_EXPIRY_BATCH_SIZE
                 )
-
-                # 精準撈出剛才更新過的列以逐筆通知
-                rows: list[Mapping[str, Any]] = await conn.fetch(
-                    """
-                    SELECT transfer_id, guild_id, initiator_id, target_id, amount
-                    FROM economy.pending_transfers
-                    WHERE expires_at IS NOT NULL
-                      AND expires_at < $1
-                      AND status = 'rejected'
-                      AND updated_at = $2
-                    """,
-                    now,
-                    now,
+                for transfer_id in expired:
+                    self._forget(transfer_id)
+                total += len(expired)
+                if len(expired) < _EXPIRY_BATCH_SIZE:
+                    break
+
+            if total:
+                elapsed = time.perf_counter() - started
+                LOGGER.info(
+                    "transfer_event_pool.cleanup.expired",
+                    count=total,
+                    elapsed_seconds=round(elapsed, 3),
+                    rows_per_second=round(total / elapsed) if elapsed > 0 else None,
                 )
-                for r in rows:
-                    try:
-                        await conn.execute(
-                            """
-                            SELECT pg_notify(
-                                'economy_events',
-                                jsonb_build_object(
-                                    'event_type', 'transaction_denied',
-                                    'reason', 'transfer_checks_expired',
-                                    'transfer_id', $1::uuid,
-                                    'guild_id', $2::bigint,
-                                    'initiator_id', $3::bigint,
-                                    'target_id', $4::bigint,
-                                    'amount', $5::bigint
-                                )::text
-                            )
-                            """,
-                            r["transfer_id"],
-                            r["guild_id"],
-                            r["initiator_id"],
-                            r["target_id"],
-                            r["amount"],
-                        )
-                    except Exception:
-                        LOGGER.exception(
-                            "transfer_event_pool.cleanup.notify_denied_failed",
-                            transfer_id=r["transfer_id"],
-                        )
-
-                if rows:
-                    LOGGER.info(
-                        "transfer_event_pool.cleanup.expired",
-                        count=len(rows),
-                    )
         except Exception:
             LOGGER.exception("transfer_event_pool.cleanup.error")
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, NoReturn, Sequence
 from uuid import UUID
 
 import asyncpg
@@ -54,6 +55,17 @@ class TransferThrottleError(TransferError):
         super().__init__(message, **kwargs)
 
 
+@dataclass(frozen=True, slots=True)
+class TransferItem:
+    """One leg of a batched transfer submitted via `TransferService.transfer_many`."""
+
+    initiator_id: int
+    target_id: int
+    amount: int
+    reason: str | None = None
+    metadata: dict[str, Any] | None = None
+
+
 class TransferService:
     """Coordinate validation and database interaction for currency transfers."""
 
@@ -154,23 +166,83 @@ class TransferService:
                 )
         # 依 Result 映射為例外或成功結果
         if base_result.is_err():
-            error = base_result.unwrap_err()
-            # 驗證錯誤 → 轉成 TransferValidationError
-            if isinstance(error, ValidationError):
-                raise TransferValidationError(error.message)
-            # 業務邏輯錯誤：依 context 映射為特定 TransferError
-            if isinstance(error, BusinessLogicError):
-                err_type = error.context.get("error_type")
-                if err_type == "insufficient_balance":
-                    raise InsufficientBalanceError(error.message)
-                if err_type == "throttle":
-                    raise TransferThrottleError(error.message)
-                raise TransferError(error.message)
-            # 其餘資料庫錯誤 → 一律視為 TransferError 包裝
-            raise TransferError(getattr(error, "message", str(error)))
+            self._raise_for_error(base_result.unwrap_err())
 
         return base_result.unwrap()
 
+    async def transfer_many(
+        self,
+        *,
+        guild_id: int,
+        transfers: Sequence[TransferItem],
+        connection: ConnectionProtocol | None = None,
+    ) -> list[TransferResult]:
+        """Apply several same-guild transfers atomically in one round-trip.
+
+        透過 `economy.fn_transfer_currency_batch` 於單一交易內完成所有轉帳，
+        回傳與輸入順序一致的 TransferResult 清單；任一筆失敗時整批回滾並以
+        與 `transfer_currency` 相同的例外型別回報。
+
+        批次轉帳屬於伺服器端發起的整批作業（福利發放、議案執行等），
+        因此不經過事件池，一律同步執行。
+        """
+        if not transfers:
+            return []
+
+        payload: list[dict[str, Any]] = []
+        for position, item in enumerate(transfers, start=1):
+            if item.initiator_id == item.target_id:
+                raise TransferValidationError(
+                    f"Initiator and target must be different members (batch item #{position})."
+                )
+            if item.amount <= 0:
+                raise TransferValidationError(
+                    f"Transfer amount must be a positive whole number (batch item #{position})."
+                )
+            item_metadata: dict[str, Any] = dict(item.metadata) if item.metadata else {}
+            if item.reason:
+                item_metadata["reason"] = item.reason
+            payload.append(
+                {
+                    "initiator_id": item.initiator_id,
+                    "target_id": item.target_id,
+                    "amount": item.amount,
+                    "metadata": item_metadata,
+                }
+            )
+
+        if connection is not None:
+            batch_result = await self._execute_batch(
+                connection, guild_id=guild_id, transfers=payload
+            )
+        else:
+            async with self._pool.acquire() as pooled_connection:
+                batch_result = await self._execute_batch(
+                    pooled_connection, guild_id=guild_id, transfers=payload
+                )
+
+        if batch_result.is_err():
+            self._raise_for_error(batch_result.unwrap_err())
+
+        return batch_result.unwrap()
+
+    @staticmethod
+    def _raise_for_error(error: Any) -> NoReturn:
+        """Map a Result error from the transfer gateway to a TransferError exception."""
+        # 驗證錯誤 → 轉成 TransferValidationError
+        if isinstance(error, ValidationError):
+            raise TransferValidationError(error.message)
+        # 業務邏輯錯誤：依 context 映射為特定 TransferError
+        if isinstance(error, BusinessLogicError):
+            err_type = error.context.get("error_type")
+            if err_type == "insufficient_balance":
+                raise InsufficientBalanceError(error.message)
+            if err_type == "throttle":
+                raise TransferThrottleError(error.message)
+            raise TransferError(error.message)
+        # 其餘資料庫錯誤 → 一律視為 TransferError 包裝
+        raise TransferError(getattr(error, "message", str(error)))
+
     async def _execute_transfer(
         self,
         connection: ConnectionProtocol,
@@ -228,6 +300,42 @@ class TransferService:
             LOGGER.exception("transfer_service.execute_transfer_internal_error")
             return Err(DatabaseError(f"Transaction failed: {e}"))
 
+    async def _execute_batch(
+        self,
+        connection: ConnectionProtocol,
+        *,
+        guild_id: int,
+        transfers: list[dict[str, Any]],
+    ) -> Result[list[TransferResult], DatabaseError | BusinessLogicError | ValidationError]:
+        """Execute a batch transfer inside its own transaction/savepoint."""
+        tx = connection.transaction()
+        await tx.start()
+        try:
+            gateway_result = await self._gateway.transfer_currency_batch(
+                connection,
+                guild_id=guild_id,
+                transfers=transfers,
+            )
+
+            if gateway_result.is_err():
+                error = gateway_result.unwrap_err()
+                cause = getattr(error, "cause", None)
+                await tx.rollback()
+                if isinstance(cause, asyncpg.PostgresError):
+                    return Err(self._handle_postgres_error(cause))
+                return Err(error)
+
+            db_results = gateway_result.unwrap()
+            await tx.commit()
+            return Ok([self._to_result(record) for record in db_results])
+        except Exception as e:  # pragma: no cover - 防禦性日誌
+            try:
+                await tx.rollback()
+            except Exception:
+                pass
+            LOGGER.exception("transfer_service.execute_batch_internal_error", guild_id=guild_id)
+            return Err(DatabaseError(f"Transaction failed: {e}"))
+
     def _to_result(self, db_result: TransferProcedureResult) -> TransferResult:
         return transfer_result_from_procedure(db_result)
 
@@ -0,0 +1,189 @@
+"""即時面板刷新的節流、合併與共用摘要。
+
+理事會／國務院／最高人民會議面板訂閱治理事件後，每個事件都會重建摘要並編輯訊息；
+一連串轉帳會讓每個開啟中的面板重建數十次並觸及 Discord 編輯速率限制。
+
+- `PanelRefreshDebouncer`：每個面板一個。安靜期內的第一個事件立即刷新（與原行為相同），
+  其後在視窗內抵達的事件合併為視窗結束時的一次刷新；
+- `render_changed()`：以 embed 與元件內容的雜湊比對上次送出的畫面，未變動時略過編輯；
+- `shared_summary()`：同一 guild 的多個面板同時重建時共用同一次摘要查詢（single-flight，
+  查詢完成即釋放，不保留過期資料；個別呼叫端取消不影響其他等待者）。
+
+視窗長度由 PANEL_REFRESH_WINDOW_SECONDS 設定（預設 2 秒；設為 0 停用節流）。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+import structlog
+
+LOGGER = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+_DEFAULT_WINDOW_SECONDS = 2.0
+
+_metrics: dict[str, int] = {
+    "events": 0,
+    "events_coalesced": 0,
+    "refreshes": 0,
+    "edits_skipped": 0,
+    "summaries_shared": 0,
+}
+
+_inflight: dict[Hashable, asyncio.Future[Any]] = {}
+
+
+def _window_from_env() -> float:
+    raw = os.getenv("PANEL_REFRESH_WINDOW_SECONDS", "").strip()
+    if not raw:
+        return _DEFAULT_WINDOW_SECONDS
+    try:
+        return max(float(raw), 0.0)
+    except ValueError:
+        LOGGER.warning("live_refresh.window.invalid", value=raw)
+        return _DEFAULT_WINDOW_SECONDS
+
+
+def live_refresh_metrics() -> dict[str, int]:
+    """Counters for coalesced events, refreshes, skipped edits and shared summaries."""
+    return dict(_metrics)
+
+
+class PanelRefreshDebouncer:
+    """Coalesce bursts of live-update events into at most one refresh per window."""
+
+    def __init__(
+        self,
+        refresh: Callable[[], Awaitable[None]],
+        *,
+        name: str,
+        window_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._refresh = refresh
+        self._name = name
+        self._window = window_seconds if window_seconds is not None else _window_from_env()
+        self._clock = clock
+        self._last_started: float | None = None
+        self._running = False
+        self._trailing: asyncio.Task[None] | None = None
+        self._last_render: str | None = None
+
+    async def trigger(self) -> None:
+        """Refresh now if the panel is idle, otherwise fold into the pending trailing refresh."""
+        _metrics["events"] += 1
+        if self._window <= 0:
+            await self._run()
+            return
+
+        if self._trailing is not None:
+            _metrics["events_coalesced"] += 1
+            return
+
+        now = self._clock()
+        idle = self._last_started is None or now - self._last_started >= self._window
+        if idle and not self._running:
+            await self._run()
+            return
+
+        _metrics["events_coalesced"] += 1
+        self._trailing = asyncio.create_task(
+            self._run_trailing(), name=f"panel-refresh-{self._name}"
+        )
+
+    def render_changed(self, embed: Any, view: Any) -> bool:
+        """回傳本次畫面是否與上次送出的不同；相同時計入略過的編輯。"""
+        fingerprint = _render_fingerprint(embed, view)
+        if fingerprint == self._last_render:
+            _metrics["edits_skipped"] += 1
+            LOGGER.debug("live_refresh.edit_skipped", panel=self._name)
+            return False
+        self._last_render = fingerprint
+        return True
+
+    def forget_render(self) -> None:
+        """清除上次的畫面雜湊，確保下一次刷新一定送出。
+
+        即時刷新編輯失敗時，以及面板自身的互動（換頁、按鈕）直接編輯訊息後呼叫。
+        """
+        self._last_render = None
+
+    def cancel(self) -> None:
+        """取消尚未執行的合併刷新（面板關閉時呼叫）。"""
+        task, self._trailing = self._trailing, None
+        if task is not None and not task.done():
+            task.cancel()
+
+    async def _run_trailing(self) -> None:
+        try:
+            started = self._last_started if self._last_started is not None else self._clock()
+            delay = started + self._window - self._clock()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        finally:
+            self._trailing = None
+        await self._run()
+
+    async def _run(self) -> None:
+        self._running = True
+        self._last_started = self._clock()
+        _metrics["refreshes"] += 1
+        try:
+            await self._refresh()
+        except Exception as exc:  # pragma: no cover - 防禦性日誌
+            LOGGER.warning("live_refresh.refresh_failed", panel=self._name, error=str(exc))
+        finally:
+            self._running = False
+
+
+async def shared_summary(key: Hashable, loader: Callable[[], Awaitable[T]]) -> T:
+    """同一 key 的並行呼叫共用一次 `loader()`；完成後即移除，之後的呼叫重新查詢。
+
+    查詢在獨立的 task 中執行，每個呼叫端只以 shield 等待：任一呼叫端被取消（面板逾時、
+    關閉）不會中斷查詢，也不會讓其他等待者收到 CancelledError。
+    """
+    task = _inflight.get(key)
+    if task is not None:
+        _metrics["summaries_shared"] += 1
+    else:
+        task = asyncio.ensure_future(loader())
+        _inflight[key] = task
+        task.add_done_callback(lambda done: _finish_shared(key, done))
+    result: T = await asyncio.shield(task)
+    return result
+
+
+def _finish_shared(key: Hashable, task: asyncio.Future[Any]) -> None:
+    if _inflight.get(key) is task:
+        del _inflight[key]
+    # 避免沒有等待者時出現 "exception was never retrieved" 警告
+    if not task.cancelled():
+        task.exception()
+
+
+def _render_fingerprint(embed: Any, view: Any) -> str:
+    embed_data = embed.to_dict() if embed is not None and hasattr(embed, "to_dict") else None
+    to_components = getattr(view, "to_components", None)
+    components = to_components() if callable(to_components) else None
+    payload = json.dumps(
+        {"embed": embed_data, "components": components},
+        sort_keys=True,
+        ensure_ascii=False,
+        default=repr,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+__all__ = [
+    "PanelRefreshDebouncer",
+    "live_refresh_metrics",
+    "shared_summary",
+]
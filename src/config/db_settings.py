@@ -22,12 +22,22 @@ class PoolConfig(BaseSettings):
     db_pool_timeout_seconds: float | None = Field(
         default=None, alias="DB_POOL_TIMEOUT_SECONDS", gt=0
     )
+    # 選填的讀取副本：唯讀查詢改走此連線池，副本落後超過上限時回退主庫
+    database_read_url: str | None = Field(default=None, alias="DATABASE_READ_URL")
+    database_read_max_lag_seconds: float = Field(
+        default=5.0, alias="DATABASE_READ_MAX_LAG_SECONDS", ge=0
+    )
 
     @property
     def dsn(self) -> str:
         """Database connection string (DSN)."""
         return self.database_url
 
+    @property
+    def read_dsn(self) -> str | None:
+        """Read replica connection string, or None when no replica is configured."""
+        return self.database_read_url
+
     @property
     def min_size(self) -> int:
         """Minimum pool size."""
@@ -57,6 +67,17 @@ class PoolConfig(BaseSettings):
             )
         return url
 
+    @field_validator("database_read_url")
+    @classmethod
+    def validate_database_read_url(cls, v: str | None) -> str | None:
+        """Treat a blank DATABASE_READ_URL as unset; otherwise require postgresql://."""
+        if v is None or not v.strip():
+            return None
+        url = v.strip()
+        if not url.startswith("postgresql://"):
+            raise ValueError("DATABASE_READ_URL must start with postgresql://.")
+        return url
+
     def model_post_init(self, __context: Any) -> None:
         """Validate that max_size >= min_size after all fields are set."""
         if self.db_pool_max_size < self.db_pool_min_size:
@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Sequence
+from uuid import UUID
 
 __all__ = [
     "BalanceSnapshot",
@@ -83,6 +84,8 @@ class HistoryPage:
 
     items: Sequence[HistoryEntry]
     next_cursor: datetime | None
+    # 與 next_cursor 組成 (created_at, transaction_id) keyset 游標
+    next_cursor_transaction_id: UUID | None = None
 
 
 def make_balance_snapshot(record: Any) -> BalanceSnapshot:
@@ -95,10 +95,12 @@ cdef class HistoryEntry:
 cdef class HistoryPage:
     cdef public object items
     cdef public object next_cursor
+    cdef public object next_cursor_transaction_id
 
-    def __cinit__(self, object items, object next_cursor):
+    def __cinit__(self, object items, object next_cursor, object next_cursor_transaction_id=None):
         self.items = items
         self.next_cursor = next_cursor
+        self.next_cursor_transaction_id = next_cursor_transaction_id
 
 
 cpdef BalanceSnapshot make_balance_snapshot(object record):
@@ -2,13 +2,14 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Sequence
+from typing import Mapping, Sequence
 from uuid import UUID
 
 __all__ = [
     "StateCouncilConfig",
     "DepartmentConfig",
     "DepartmentRoleConfig",
+    "DepartmentPermissionMap",
     "GovernmentAccount",
     "WelfareDisbursement",
     "TaxRecord",
@@ -75,6 +76,16 @@ class DepartmentRoleConfig:
     updated_at: datetime
 
 
+@dataclass(slots=True, frozen=True)
+class DepartmentPermissionMap:
+    """領袖設定與各部門身分組（多角色與傳統單角色的聯集）。"""
+
+    guild_id: int
+    leader_id: int | None
+    leader_role_id: int | None
+    department_role_ids: Mapping[str, Sequence[int]]
+
+
 @dataclass(slots=True, frozen=True)
 class GovernmentAccount:
     account_id: int
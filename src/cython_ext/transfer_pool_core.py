@@ -1,23 +1,34 @@
 from __future__ import annotations
 
-from collections import defaultdict
+import asyncio
+import time
+from types import TracebackType
 from typing import Mapping
 
-__all__ = ["TransferCheckStateStore"]
+__all__ = ["TransferCheckStateStore", "TransferLockRegistry"]
 
 
 class TransferCheckStateStore:
     """Python fallback for the Cython state tracker."""
 
-    __slots__ = ("_states", "_required")
+    __slots__ = ("_states", "_touched", "_required")
 
     def __init__(self) -> None:
-        self._states: dict[object, dict[str, int]] = defaultdict(dict)
+        self._states: dict[object, dict[str, int]] = {}
+        # 最後一次寫入的 monotonic 時間，供 prune() 清除遺留狀態
+        self._touched: dict[object, float] = {}
         self._required = frozenset({"balance", "cooldown", "daily_limit"})
 
+    def __len__(self) -> int:
+        return len(self._states)
+
     def record(self, transfer_id: object, check_type: str, result: int) -> bool:
-        state = self._states[transfer_id]
+        state = self._states.get(transfer_id)
+        if state is None:
+            state = {}
+            self._states[transfer_id] = state
         state[check_type] = result
+        self._touched[transfer_id] = time.monotonic()
         return self._required.issubset(state.keys())
 
     def get_state(self, transfer_id: object) -> Mapping[str, int]:
@@ -34,7 +45,96 @@ class TransferCheckStateStore:
         return {k: dict(v) for k, v in self._states.items()}
 
     def remove(self, transfer_id: object) -> bool:
+        self._touched.pop(transfer_id, None)
         return self._states.pop(transfer_id, None) is not None
 
+    def prune(self, max_age_seconds: float, *, now: float | None = None) -> int:
+        """Drop states not updated within `max_age_seconds`; returns the number removed.
+
+        用於清除未走到終態的遺留狀態（例如核准事件由其他程序處理、或事件遺失）。
+        """
+        cutoff = (time.monotonic() if now is None else now) - max_age_seconds
+        stale = [key for key, touched in self._touched.items() if touched < cutoff]
+        for key in stale:
+            self._touched.pop(key, None)
+            self._states.pop(key, None)
+        return len(stale)
+
     def clear(self) -> None:
         self._states.clear()
+        self._touched.clear()
+
+
+class TransferLockRegistry:
+    """Reference-counted per-transfer `asyncio.Lock` table.
+
+    鎖只在有持有者或等待者時存在；最後一個持有者離開即自動移除，
+    因此表格大小只與「處理中」的轉帳數量相關，而非曾處理過的轉帳總數。
+    """
+
+    __slots__ = ("_locks", "_refs")
+
+    def __init__(self) -> None:
+        self._locks: dict[object, asyncio.Lock] = {}
+        self._refs: dict[object, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._locks)
+
+    def hold(self, transfer_id: object) -> _TransferLockLease:
+        """Return an async context manager serialising work on `transfer_id`."""
+        return _TransferLockLease(self, transfer_id)
+
+    def _retain(self, transfer_id: object) -> asyncio.Lock:
+        # asyncio 單執行緒事件迴圈下 dict 操作為原子，這裡不進行 await
+        lock = self._locks.get(transfer_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[transfer_id] = lock
+            self._refs[transfer_id] = 1
+        else:
+            self._refs[transfer_id] += 1
+        return lock
+
+    def _release(self, transfer_id: object) -> None:
+        remaining = self._refs.get(transfer_id, 0) - 1
+        if remaining > 0:
+            self._refs[transfer_id] = remaining
+            return
+        self._refs.pop(transfer_id, None)
+        self._locks.pop(transfer_id, None)
+
+    def clear(self) -> None:
+        self._locks.clear()
+        self._refs.clear()
+
+
+class _TransferLockLease:
+    __slots__ = ("_registry", "_transfer_id", "_lock")
+
+    def __init__(self, registry: TransferLockRegistry, transfer_id: object) -> None:
+        self._registry = registry
+        self._transfer_id = transfer_id
+        self._lock: asyncio.Lock | None = None
+
+    async def __aenter__(self) -> None:
+        lock = self._registry._retain(self._transfer_id)
+        try:
+            await lock.acquire()
+        except BaseException:
+            # 等待期間被取消時也要釋放參照，避免殘留鎖
+            self._registry._release(self._transfer_id)
+            raise
+        self._lock = lock
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        lock = self._lock
+        self._lock = None
+        if lock is not None:
+            lock.release()
+            self._registry._release(self._transfer_id)
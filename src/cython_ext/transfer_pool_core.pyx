@@ -1,19 +1,28 @@
 # cython: language_level=3, embedsignature=True
 
+import asyncio
+import time
+
 cdef class TransferCheckStateStore:
     cdef dict _states
+    cdef dict _touched
     cdef object _required
 
     def __cinit__(self):
         self._states = {}
+        self._touched = {}
         self._required = frozenset({"balance", "cooldown", "daily_limit"})
 
+    def __len__(self):
+        return len(self._states)
+
     cpdef bint record(self, object transfer_id, str check_type, int result):
         cdef dict state = <dict>self._states.get(transfer_id)
         if state is None:
             state = {}
             self._states[transfer_id] = state
         state[check_type] = result
+        self._touched[transfer_id] = time.monotonic()
         return set(state.keys()).issuperset(self._required)
 
     cpdef object get_state(self, object transfer_id):
@@ -29,8 +38,83 @@ cdef class TransferCheckStateStore:
                 return False
         return True
 
+    cpdef object snapshot(self):
+        return {k: dict(v) for k, v in self._states.items()}
+
     cpdef bint remove(self, object transfer_id):
+        self._touched.pop(transfer_id, None)
         return self._states.pop(transfer_id, None) is not None
 
+    def prune(self, double max_age_seconds, *, now=None):
+        cdef double cutoff = (time.monotonic() if now is None else now) - max_age_seconds
+        cdef list stale = [key for key, touched in self._touched.items() if touched < cutoff]
+        for key in stale:
+            self._touched.pop(key, None)
+            self._states.pop(key, None)
+        return len(stale)
+
     cpdef void clear(self):
         self._states.clear()
+        self._touched.clear()
+
+
+cdef class TransferLockRegistry:
+    cdef dict _locks
+    cdef dict _refs
+
+    def __cinit__(self):
+        self._locks = {}
+        self._refs = {}
+
+    def __len__(self):
+        return len(self._locks)
+
+    def hold(self, object transfer_id):
+        return _TransferLockLease(self, transfer_id)
+
+    cpdef object _retain(self, object transfer_id):
+        lock = self._locks.get(transfer_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[transfer_id] = lock
+            self._refs[transfer_id] = 1
+        else:
+            self._refs[transfer_id] += 1
+        return lock
+
+    cpdef void _release(self, object transfer_id):
+        cdef long remaining = self._refs.get(transfer_id, 0) - 1
+        if remaining > 0:
+            self._refs[transfer_id] = remaining
+            return
+        self._refs.pop(transfer_id, None)
+        self._locks.pop(transfer_id, None)
+
+    cpdef void clear(self):
+        self._locks.clear()
+        self._refs.clear()
+
+
+class _TransferLockLease:
+    __slots__ = ("_registry", "_transfer_id", "_lock")
+
+    def __init__(self, registry, transfer_id):
+        self._registry = registry
+        self._transfer_id = transfer_id
+        self._lock = None
+
+    async def __aenter__(self):
+        lock = self._registry._retain(self._transfer_id)
+        try:
+            await lock.acquire()
+        except BaseException:
+            self._registry._release(self._transfer_id)
+            raise
+        self._lock = lock
+
+    async def __aexit__(self, exc_type, exc, tb):
+        lock = self._lock
+        self._lock = None
+        if lock is not None:
+            lock.release()
+            self._registry._release(self._transfer_id)
@@ -64,7 +64,7 @@ BEGIN
         v_direction := 'adjustment_grant';
         UPDATE economy.guild_member_balances
         SET current_balance = current_balance + p_amount,
-            last_modified_at = v_now
+            last_modified_at = greatest(v_now, last_modified_at + interval '1 microsecond')
         WHERE guild_id = p_guild_id AND member_id = p_target_id
         RETURNING current_balance INTO v_target_balance;
     ELSE
@@ -81,7 +81,7 @@ BEGIN
 
         UPDATE economy.guild_member_balances
         SET current_balance = current_balance + p_amount,
-            last_modified_at = v_now
+            last_modified_at = greatest(v_now, last_modified_at + interval '1 microsecond')
         WHERE guild_id = p_guild_id AND member_id = p_target_id
         RETURNING current_balance INTO v_target_balance;
     END IF;
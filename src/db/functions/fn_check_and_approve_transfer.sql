@@ -34,6 +34,7 @@ BEGIN
     WHERE transfer_id = p_transfer_id;
 
     -- 發送核准事件
+    -- 相容函式不經過精簡模式暫存區，直接送出，呼叫端不需 flush
     PERFORM pg_notify(
         'economy_events',
         jsonb_build_object(
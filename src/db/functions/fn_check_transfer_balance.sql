@@ -44,6 +44,7 @@ BEGIN
     WHERE transfer_id = p_transfer_id;
 
     -- Send NOTIFY event
+    -- 相容函式不經過精簡模式暫存區，直接送出，呼叫端不需 flush
     PERFORM pg_notify(
         'economy_events',
         jsonb_build_object(
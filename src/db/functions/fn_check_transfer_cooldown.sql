@@ -20,24 +20,16 @@ BEGIN
         RETURN;
     END IF;
 
-    -- Check if initiator is a government account
-    SELECT EXISTS (
-        SELECT 1
-        FROM governance.government_accounts ga
-        WHERE ga.account_id = v_initiator_id AND ga.guild_id = v_guild_id
-    )
-    INTO v_is_government;
+    -- 冷卻時間與政府帳戶旗標（is_government）位於同一帳本列
+    SELECT throttled_until, is_government
+    INTO v_throttled_until, v_is_government
+    FROM economy.guild_member_balances
+    WHERE guild_id = v_guild_id AND member_id = v_initiator_id;
 
     -- Exempt government accounts from cooldown
-    IF v_is_government THEN
+    IF coalesce(v_is_government, false) THEN
         v_check_result := 1;
     ELSE
-        -- Get throttled_until
-        SELECT throttled_until
-        INTO v_throttled_until
-        FROM economy.guild_member_balances
-        WHERE guild_id = v_guild_id AND member_id = v_initiator_id;
-
         -- Set check result: 1 if not throttled or expired, 0 if still throttled
         v_check_result := CASE
             WHEN v_throttled_until IS NULL THEN 1
@@ -57,6 +49,7 @@ BEGIN
     WHERE transfer_id = p_transfer_id;
 
     -- Send NOTIFY event
+    -- 相容函式不經過精簡模式暫存區，直接送出，呼叫端不需 flush
     PERFORM pg_notify(
         'economy_events',
         jsonb_build_object(
@@ -24,11 +24,14 @@ BEGIN
         RETURN;
     END IF;
 
-    -- Check if initiator is a government account
-    SELECT EXISTS (
-        SELECT 1
-        FROM governance.government_accounts ga
-        WHERE ga.account_id = v_initiator_id AND ga.guild_id = v_guild_id
+    -- Check if initiator is a government account（帳本列上的 is_government 旗標）
+    SELECT coalesce(
+        (
+            SELECT b.is_government
+            FROM economy.guild_member_balances b
+            WHERE b.guild_id = v_guild_id AND b.member_id = v_initiator_id
+        ),
+        false
     )
     INTO v_is_government;
 
@@ -44,14 +47,10 @@ BEGIN
             IF v_daily_limit <= 0 THEN
                 v_check_result := 1;
             ELSE
-                -- Calculate total transfers today
-                SELECT coalesce(SUM(amount), 0)
-                INTO v_total_today
-                FROM economy.currency_transactions
-                WHERE guild_id = v_guild_id
-                  AND initiator_id = v_initiator_id
-                  AND direction = 'transfer'
-                  AND created_at >= date_trunc('day', v_now);
+                -- 當日累計由 member_daily_transfer_totals 維護，O(1) 讀取
+                v_total_today := economy.fn_get_daily_transfer_total(
+                    v_guild_id, v_initiator_id, v_now
+                );
 
                 -- Set check result: 1 if within limit, 0 if exceeded
                 v_check_result := CASE
@@ -73,6 +72,7 @@ BEGIN
     WHERE transfer_id = p_transfer_id;
 
     -- Send NOTIFY event
+    -- 相容函式不經過精簡模式暫存區，直接送出，呼叫端不需 flush
     PERFORM pg_notify(
         'economy_events',
         jsonb_build_object(
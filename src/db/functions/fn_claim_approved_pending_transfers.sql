@@ -0,0 +1,23 @@
+-- Claim a batch of approved pending transfers for execution.
+--
+-- 以 FOR UPDATE SKIP LOCKED 領取 status = 'approved' 的列，多個 worker（或多個 bot 程序）
+-- 可同時呼叫而不會互相阻塞或重複執行。列鎖持有至呼叫端交易結束；呼叫端應在同一交易內
+-- 執行轉帳並將狀態更新為 completed / rejected。
+CREATE OR REPLACE FUNCTION economy.fn_claim_approved_pending_transfers(p_limit integer DEFAULT 50)
+RETURNS TABLE (
+    transfer_id uuid,
+    guild_id bigint,
+    initiator_id bigint,
+    target_id bigint,
+    amount bigint,
+    metadata jsonb
+)
+LANGUAGE sql
+AS $$
+    SELECT pt.transfer_id, pt.guild_id, pt.initiator_id, pt.target_id, pt.amount, pt.metadata
+    FROM economy.pending_transfers pt
+    WHERE pt.status = 'approved'
+    ORDER BY pt.updated_at
+    LIMIT p_limit
+    FOR UPDATE SKIP LOCKED;
+$$;
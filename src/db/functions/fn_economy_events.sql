@@ -0,0 +1,131 @@
+-- Helpers for emitting economy_events notifications.
+--
+-- 預設模式：fn_emit_economy_event 直接 pg_notify，與過去逐筆通知完全相同。
+-- 精簡模式（連線 GUC app.economy_notify_compact = on）：事件先暫存在交易區域
+-- GUC app.economy_event_buffer，直到 fn_flush_economy_events 被呼叫時才合併為
+--   {"event_type": "economy_events_batch", "events": [...]}
+-- 一次送出（超過 NOTIFY 8000 bytes 上限時自動切段）。
+--
+-- 暫存區每次寫入都需重新解析與序列化整個陣列，只適合每個交易少量事件的函式
+-- （fn_transfer_currency、fn_evaluate_pending_transfer 等，皆於結束前自行 flush）。
+-- 會產生大量事件的函式（批次轉帳、逾期清理）應在區域變數中收集事件，最後以
+-- fn_emit_economy_events 一次送出。個別的 fn_check_transfer_* 相容函式不經過暫存區，
+-- 一律直接 pg_notify，因此呼叫端不需要 flush。
+
+CREATE OR REPLACE FUNCTION economy.fn_emit_economy_event(p_event jsonb)
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF lower(coalesce(current_setting('app.economy_notify_compact', true), '')) IN ('on', 'true', '1') THEN
+        PERFORM set_config(
+            'app.economy_event_buffer',
+            (
+                coalesce(nullif(current_setting('app.economy_event_buffer', true), ''), '[]')::jsonb
+                || jsonb_build_array(p_event)
+            )::text,
+            true
+        );
+    ELSE
+        PERFORM pg_notify('economy_events', p_event::text);
+    END IF;
+END;
+$$;
+
+-- Emit many events at once (p_events is a JSON array, in emission order)
+-- 精簡模式下先送出本交易已暫存的事件以維持順序，再將 p_events 直接切段送出，
+-- 不經過暫存區；預設模式逐筆 pg_notify。
+CREATE OR REPLACE FUNCTION economy.fn_emit_economy_events(p_events jsonb)
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_event jsonb;
+BEGIN
+    IF p_events IS NULL OR jsonb_array_length(p_events) = 0 THEN
+        RETURN;
+    END IF;
+
+    IF lower(coalesce(current_setting('app.economy_notify_compact', true), '')) IN ('on', 'true', '1') THEN
+        PERFORM economy.fn_flush_economy_events();
+        PERFORM economy._notify_economy_events(p_events);
+    ELSE
+        FOR v_event IN SELECT e.value FROM jsonb_array_elements(p_events) AS e(value)
+        LOOP
+            PERFORM pg_notify('economy_events', v_event::text);
+        END LOOP;
+    END IF;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION economy.fn_flush_economy_events()
+RETURNS integer
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_buffer jsonb := coalesce(nullif(current_setting('app.economy_event_buffer', true), ''), '[]')::jsonb;
+BEGIN
+    IF jsonb_array_length(v_buffer) = 0 THEN
+        RETURN 0;
+    END IF;
+
+    PERFORM set_config('app.economy_event_buffer', '[]', true);
+    RETURN economy._notify_economy_events(v_buffer);
+END;
+$$;
+
+-- 將事件陣列切成不超過 NOTIFY 上限的分段送出；回傳送出的通知數
+CREATE OR REPLACE FUNCTION economy._notify_economy_events(p_events jsonb)
+RETURNS integer
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    -- NOTIFY payload 上限為 8000 bytes；保留空間給外層包裝
+    c_max_payload_bytes constant integer := 7000;
+    v_chunk jsonb[] := ARRAY[]::jsonb[];
+    v_chunk_bytes integer := 0;
+    v_event_bytes integer;
+    v_event jsonb;
+    v_sent integer := 0;
+BEGIN
+    FOR v_event IN SELECT e.value FROM jsonb_array_elements(p_events) AS e(value)
+    LOOP
+        v_event_bytes := octet_length(v_event::text);
+        IF cardinality(v_chunk) > 0 AND v_chunk_bytes + v_event_bytes > c_max_payload_bytes THEN
+            PERFORM economy._notify_economy_event_chunk(to_jsonb(v_chunk));
+            v_sent := v_sent + 1;
+            v_chunk := ARRAY[]::jsonb[];
+            v_chunk_bytes := 0;
+        END IF;
+        v_chunk := array_append(v_chunk, v_event);
+        -- 另計元素之間的分隔字元
+        v_chunk_bytes := v_chunk_bytes + v_event_bytes + 2;
+    END LOOP;
+
+    IF cardinality(v_chunk) = 0 THEN
+        RETURN v_sent;
+    END IF;
+    PERFORM economy._notify_economy_event_chunk(to_jsonb(v_chunk));
+    RETURN v_sent + 1;
+END;
+$$;
+
+-- 單一事件的分段直接以原格式送出，讓尚未支援批次格式的監聽端仍可解析
+CREATE OR REPLACE FUNCTION economy._notify_economy_event_chunk(p_events jsonb)
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF jsonb_array_length(p_events) = 1 THEN
+        PERFORM pg_notify('economy_events', (p_events->0)::text);
+    ELSE
+        PERFORM pg_notify(
+            'economy_events',
+            jsonb_build_object(
+                'event_type', 'economy_events_batch',
+                'events', p_events
+            )::text
+        );
+    END IF;
+END;
+$$;
@@ -0,0 +1,161 @@
+-- Evaluate all transfer checks (balance / cooldown / daily_limit) in one pass.
+--
+-- 取代依序呼叫 fn_check_transfer_balance / _cooldown / _daily_limit 的作法：
+-- 只讀取一次 pending_transfers、帳本列與政府帳戶判斷，三項結果以單一 UPDATE
+-- 寫入 checks，並於同一個 UPDATE 內在全數通過時直接轉為 approved。
+-- 仍逐項發出 transfer_check_result 事件（格式不變），核准時另發 transfer_check_approved。
+-- 個別的 fn_check_transfer_* 函式保留供相容與除錯使用。
+CREATE OR REPLACE FUNCTION economy.fn_evaluate_pending_transfer(p_transfer_id uuid)
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_now timestamptz := timezone('utc', clock_timestamp());
+    v_guild_id bigint;
+    v_initiator_id bigint;
+    v_target_id bigint;
+    v_amount bigint;
+    v_balance bigint;
+    v_throttled_until timestamptz;
+    v_is_government boolean := false;
+    -- 讀取應用層連線 GUC；未設定或 <= 0 視為「無上限」
+    v_daily_limit_text text := current_setting('app.transfer_daily_limit', true);
+    v_daily_limit bigint;
+    v_total_today bigint;
+    v_balance_result int;
+    v_cooldown_result int;
+    v_daily_limit_result int;
+    v_status text;
+BEGIN
+    SELECT guild_id, initiator_id, target_id, amount
+    INTO v_guild_id, v_initiator_id, v_target_id, v_amount
+    FROM economy.pending_transfers
+    WHERE transfer_id = p_transfer_id
+      AND status IN ('pending', 'checking');
+
+    IF NOT FOUND THEN
+        RETURN;
+    END IF;
+
+    -- Ensure ledger row exists
+    INSERT INTO economy.guild_member_balances (guild_id, member_id, current_balance, last_modified_at, created_at)
+    VALUES (v_guild_id, v_initiator_id, 0, v_now, v_now)
+    ON CONFLICT (guild_id, member_id) DO NOTHING;
+
+    -- is_government：政府部門帳戶旗標，與餘額、冷卻位於同一帳本列
+    SELECT current_balance, throttled_until, is_government
+    INTO v_balance, v_throttled_until, v_is_government
+    FROM economy.guild_member_balances
+    WHERE guild_id = v_guild_id AND member_id = v_initiator_id;
+
+    v_balance_result := CASE WHEN v_balance >= v_amount THEN 1 ELSE 0 END;
+
+    -- 政府部門帳戶免除冷卻與每日上限
+    IF v_is_government THEN
+        v_cooldown_result := 1;
+        v_daily_limit_result := 1;
+    ELSE
+        v_cooldown_result := CASE
+            WHEN v_throttled_until IS NULL THEN 1
+            WHEN v_throttled_until <= v_now THEN 1
+            ELSE 0
+        END;
+
+        IF v_daily_limit_text IS NULL OR NULLIF(v_daily_limit_text, '') IS NULL THEN
+            v_daily_limit_result := 1;
+        ELSE
+            v_daily_limit := v_daily_limit_text::bigint;
+            IF v_daily_limit <= 0 THEN
+                v_daily_limit_result := 1;
+            ELSE
+                v_total_today := economy.fn_get_daily_transfer_total(
+                    v_guild_id, v_initiator_id, v_now
+                );
+
+                v_daily_limit_result := CASE
+                    WHEN v_total_today + v_amount <= v_daily_limit THEN 1
+                    ELSE 0
+                END;
+            END IF;
+        END IF;
+    END IF;
+
+    -- 單一 UPDATE：寫入三項結果並視情況直接核准。
+    -- 以 status 條件防止並行評估重複核准（僅一筆能從 pending/checking 轉為 approved）。
+    UPDATE economy.pending_transfers
+    SET checks = coalesce(checks, '{}'::jsonb) || jsonb_build_object(
+            'balance', v_balance_result,
+            'cooldown', v_cooldown_result,
+            'daily_limit', v_daily_limit_result
+        ),
+        status = CASE
+            WHEN v_balance_result = 1 AND v_cooldown_result = 1 AND v_daily_limit_result = 1
+                THEN 'approved'
+            ELSE 'checking'
+        END,
+        updated_at = timezone('utc', clock_timestamp())
+    WHERE transfer_id = p_transfer_id
+      AND status IN ('pending', 'checking')
+    RETURNING status
+    INTO v_status;
+
+    IF NOT FOUND THEN
+        RETURN; -- 已被其他交易核准或終結
+    END IF;
+
+    PERFORM economy.fn_emit_economy_event(
+        jsonb_build_object(
+            'event_type', 'transfer_check_result',
+            'transfer_id', p_transfer_id,
+            'check_type', 'balance',
+            'result', v_balance_result,
+            'guild_id', v_guild_id,
+            'initiator_id', v_initiator_id,
+            'balance', v_balance,
+            'required', v_amount
+        )
+    );
+
+    PERFORM economy.fn_emit_economy_event(
+        jsonb_build_object(
+            'event_type', 'transfer_check_result',
+            'transfer_id', p_transfer_id,
+            'check_type', 'cooldown',
+            'result', v_cooldown_result,
+            'guild_id', v_guild_id,
+            'initiator_id', v_initiator_id,
+            'throttled_until', CASE WHEN v_is_government THEN NULL ELSE v_throttled_until END
+        )
+    );
+
+    PERFORM economy.fn_emit_economy_event(
+        jsonb_build_object(
+            'event_type', 'transfer_check_result',
+            'transfer_id', p_transfer_id,
+            'check_type', 'daily_limit',
+            'result', v_daily_limit_result,
+            'guild_id', v_guild_id,
+            'initiator_id', v_initiator_id,
+            'total_today', v_total_today,
+            'attempted_amount', v_amount,
+            'limit', v_daily_limit
+        )
+    );
+
+    IF v_status = 'approved' THEN
+        PERFORM economy.fn_emit_economy_event(
+            jsonb_build_object(
+                'event_type', 'transfer_check_approved',
+                'transfer_id', p_transfer_id,
+                'guild_id', v_guild_id,
+                'initiator_id', v_initiator_id,
+                'target_id', v_target_id,
+                'amount', v_amount
+            )
+        );
+    END IF;
+
+    -- 精簡通知模式下，三項檢查結果與核准事件合併為單一通知
+    PERFORM economy.fn_flush_economy_events();
+END;
+$$;
@@ -0,0 +1,62 @@
+-- Set-based expiry sweep for pending transfers.
+--
+-- 以單一 UPDATE ... RETURNING 將至多 p_limit 筆逾期（pending/checking）的轉帳標記為 rejected，
+-- 並將所有 transaction_denied 事件合併為 economy_events_batch 通知送出（超過 NOTIFY 上限時
+-- 由 _notify_economy_events 自動切段）。呼叫端以固定批量重複呼叫直到回傳筆數少於 p_limit，
+-- 避免大量積壓時形成單一巨大交易。FOR UPDATE SKIP LOCKED 讓多個副本可同時清理。
+CREATE OR REPLACE FUNCTION economy.fn_expire_pending_transfers(p_limit integer DEFAULT 1000)
+RETURNS SETOF uuid
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_ids uuid[];
+    v_events jsonb;
+BEGIN
+    WITH due AS (
+        SELECT pt.transfer_id
+        FROM economy.pending_transfers pt
+        WHERE pt.expires_at IS NOT NULL
+          AND pt.expires_at < clock_timestamp()
+          AND pt.status IN ('pending', 'checking')
+        ORDER BY pt.expires_at
+        LIMIT p_limit
+        FOR UPDATE SKIP LOCKED
+    ),
+    expired AS (
+        UPDATE economy.pending_transfers pt
+        SET status = 'rejected',
+            next_retry_at = NULL,
+            updated_at = timezone('utc', clock_timestamp())
+        FROM due
+        WHERE pt.transfer_id = due.transfer_id
+        RETURNING pt.transfer_id, pt.guild_id, pt.initiator_id, pt.target_id, pt.amount
+    )
+    SELECT
+        coalesce(array_agg(e.transfer_id), ARRAY[]::uuid[]),
+        coalesce(
+            jsonb_agg(
+                jsonb_build_object(
+                    'event_type', 'transaction_denied',
+                    'reason', 'transfer_checks_expired',
+                    'transfer_id', e.transfer_id,
+                    'guild_id', e.guild_id,
+                    'initiator_id', e.initiator_id,
+                    'target_id', e.target_id,
+                    'amount', e.amount
+                )
+            ),
+            '[]'::jsonb
+        )
+    INTO v_ids, v_events
+    FROM expired e;
+
+    IF cardinality(v_ids) > 0 THEN
+        -- 不論是否啟用精簡模式，逾期拒絕一律合併送出，避免逐筆 NOTIFY；
+        -- 先送出本交易已暫存的事件以維持順序，本批事件不經過暫存區
+        PERFORM economy.fn_flush_economy_events();
+        PERFORM economy._notify_economy_events(v_events);
+    END IF;
+
+    RETURN QUERY SELECT unnest(v_ids);
+END;
+$$;
@@ -1,4 +1,8 @@
 -- Stored function returning a member's current balance snapshot.
+--
+-- 純讀取：不再於讀取時補建帳本列（每次查詢都是一次寫入交易、列鎖與 WAL）。
+-- 尚無帳本列的成員回傳合成的零餘額；帳本列由第一次寫入（轉帳、調整、
+-- 政府帳戶同步）建立。宣告為 STABLE，可在唯讀交易與讀取副本上執行。
 CREATE OR REPLACE FUNCTION economy.fn_get_balance(
     p_guild_id bigint,
     p_member_id bigint
@@ -10,29 +14,16 @@ RETURNS TABLE (
     last_modified_at timestamptz,
     throttled_until timestamptz
 )
-LANGUAGE plpgsql
+LANGUAGE sql
+STABLE
 AS $$
-DECLARE
-    v_now timestamptz := timezone('utc', clock_timestamp());
-BEGIN
-    INSERT INTO economy.guild_member_balances (
-        guild_id,
-        member_id,
-        current_balance,
-        last_modified_at,
-        created_at
-    )
-    VALUES (p_guild_id, p_member_id, 0, v_now, v_now)
-    ON CONFLICT ON CONSTRAINT pk_guild_member_balances DO NOTHING;
-
-    RETURN QUERY
     SELECT
-        gb.guild_id,
-        gb.member_id,
-        gb.current_balance,
-        gb.last_modified_at,
+        p_guild_id,
+        p_member_id,
+        coalesce(gb.current_balance, 0)::bigint,
+        coalesce(gb.last_modified_at, timezone('utc', now())),
         gb.throttled_until
-    FROM economy.guild_member_balances AS gb
-    WHERE gb.guild_id = p_guild_id AND gb.member_id = p_member_id;
-END;
+    FROM (SELECT 1) AS one
+    LEFT JOIN economy.guild_member_balances AS gb
+           ON gb.guild_id = p_guild_id AND gb.member_id = p_member_id;
 $$;
@@ -0,0 +1,139 @@
+-- Keyset-paginated transaction history for a guild member, spanning live and archived rows.
+--
+-- 排序與游標皆為 (created_at, transaction_id) DESC；游標交易 ID 為 NULL 時退回舊行為
+-- （僅以 created_at < p_cursor_created_at 過濾）。發起與接收兩側各自走
+-- (guild_id, member, created_at DESC, transaction_id DESC) 索引後以 UNION ALL 合併，
+-- 取代無法使用索引的 `initiator_id = m OR target_id = m`。
+--
+-- 回傳最多 p_limit + 1 列：多出的一列僅供呼叫端判斷是否還有下一頁，取代
+-- fn_has_more_history 的第二次查詢。
+--
+-- 現行表不足一頁時接續查詢 currency_transactions_archive。歸檔以整個月分區為單位由現行表
+-- 移至歸檔表，因此歸檔列一律早於現行表的列，直接接在現行結果之後即維持排序。
+-- 游標另以單獨的 created_at <= 游標條件表示，讓兩張分區表都能剪除較新的月分區。
+CREATE OR REPLACE FUNCTION economy.fn_get_member_history(
+    p_guild_id bigint,
+    p_member_id bigint,
+    p_limit integer DEFAULT 10,
+    p_cursor_created_at timestamptz DEFAULT NULL,
+    p_cursor_transaction_id uuid DEFAULT NULL
+)
+RETURNS TABLE (
+    transaction_id uuid,
+    guild_id bigint,
+    initiator_id bigint,
+    target_id bigint,
+    amount bigint,
+    direction economy.transaction_direction,
+    reason text,
+    created_at timestamptz,
+    metadata jsonb,
+    balance_after_initiator bigint,
+    balance_after_target bigint
+)
+LANGUAGE plpgsql
+STABLE
+AS $$
+DECLARE
+    v_fetch integer;
+    v_found integer;
+    v_cursor_id uuid;
+BEGIN
+    IF p_limit IS NULL THEN
+        RAISE EXCEPTION 'History limit cannot be null.'
+            USING ERRCODE = '22004';
+    END IF;
+
+    IF p_limit < 1 OR p_limit > 50 THEN
+        RAISE EXCEPTION 'History limit must be between 1 and 50 inclusive.'
+            USING ERRCODE = '22023';
+    END IF;
+
+    v_fetch := p_limit + 1;
+    -- 無交易 ID 的舊版游標：以最小 UUID 作為同一時間點的下界，等同 created_at < cursor
+    v_cursor_id := COALESCE(p_cursor_transaction_id, '00000000-0000-0000-0000-000000000000'::uuid);
+
+    RETURN QUERY
+    SELECT h.*
+    FROM (
+        (
+            SELECT ct.transaction_id, ct.guild_id, ct.initiator_id, ct.target_id, ct.amount,
+                   ct.direction, ct.reason, ct.created_at, ct.metadata,
+                   ct.balance_after_initiator, ct.balance_after_target
+            FROM economy.currency_transactions AS ct
+            WHERE ct.guild_id = p_guild_id
+              AND ct.initiator_id = p_member_id
+              AND (
+                    p_cursor_created_at IS NULL
+                    OR (ct.created_at <= p_cursor_created_at
+                        AND (ct.created_at, ct.transaction_id) < (p_cursor_created_at, v_cursor_id))
+              )
+            ORDER BY ct.created_at DESC, ct.transaction_id DESC
+            LIMIT v_fetch
+        )
+        UNION ALL
+        (
+            SELECT ct.transaction_id, ct.guild_id, ct.initiator_id, ct.target_id, ct.amount,
+                   ct.direction, ct.reason, ct.created_at, ct.metadata,
+                   ct.balance_after_initiator, ct.balance_after_target
+            FROM economy.currency_transactions AS ct
+            WHERE ct.guild_id = p_guild_id
+              AND ct.target_id = p_member_id
+              AND ct.initiator_id <> p_member_id
+              AND (
+                    p_cursor_created_at IS NULL
+                    OR (ct.created_at <= p_cursor_created_at
+                        AND (ct.created_at, ct.transaction_id) < (p_cursor_created_at, v_cursor_id))
+              )
+            ORDER BY ct.created_at DESC, ct.transaction_id DESC
+            LIMIT v_fetch
+        )
+    ) AS h
+    ORDER BY h.created_at DESC, h.transaction_id DESC
+    LIMIT v_fetch;
+
+    GET DIAGNOSTICS v_found = ROW_COUNT;
+    IF v_found >= v_fetch THEN
+        RETURN;
+    END IF;
+
+    RETURN QUERY
+    SELECT h.*
+    FROM (
+        (
+            SELECT ca.transaction_id, ca.guild_id, ca.initiator_id, ca.target_id, ca.amount,
+                   ca.direction, ca.reason, ca.created_at, ca.metadata,
+                   ca.balance_after_initiator, ca.balance_after_target
+            FROM economy.currency_transactions_archive AS ca
+            WHERE ca.guild_id = p_guild_id
+              AND ca.initiator_id = p_member_id
+              AND (
+                    p_cursor_created_at IS NULL
+                    OR (ca.created_at <= p_cursor_created_at
+                        AND (ca.created_at, ca.transaction_id) < (p_cursor_created_at, v_cursor_id))
+              )
+            ORDER BY ca.created_at DESC, ca.transaction_id DESC
+            LIMIT v_fetch - v_found
+        )
+        UNION ALL
+        (
+            SELECT ca.transaction_id, ca.guild_id, ca.initiator_id, ca.target_id, ca.amount,
+                   ca.direction, ca.reason, ca.created_at, ca.metadata,
+                   ca.balance_after_initiator, ca.balance_after_target
+            FROM economy.currency_transactions_archive AS ca
+            WHERE ca.guild_id = p_guild_id
+              AND ca.target_id = p_member_id
+              AND ca.initiator_id <> p_member_id
+              AND (
+                    p_cursor_created_at IS NULL
+                    OR (ca.created_at <= p_cursor_created_at
+                        AND (ca.created_at, ca.transaction_id) < (p_cursor_created_at, v_cursor_id))
+              )
+            ORDER BY ca.created_at DESC, ca.transaction_id DESC
+            LIMIT v_fetch - v_found
+        )
+    ) AS h
+    ORDER BY h.created_at DESC, h.transaction_id DESC
+    LIMIT v_fetch - v_found;
+END;
+$$;
@@ -0,0 +1,88 @@
+-- 每位成員每日（UTC）轉出總額，與帳本寫入在同一交易內維護
+--
+-- 以陳述式層級觸發器讀取轉移表（transition table），批次寫入時每個
+-- (guild_id, member_id, day) 只 upsert 一次；只統計 direction = 'transfer' 的發起方金額，
+-- 與每日上限檢查原本的 SUM 條件一致。刪除交易（例如測試清理）時同步扣回。
+CREATE OR REPLACE FUNCTION economy.fn_track_daily_transfer_totals()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO economy.member_daily_transfer_totals AS t (guild_id, member_id, day, total)
+        SELECT n.guild_id, n.initiator_id, timezone('utc', n.created_at)::date, SUM(n.amount)
+        FROM new_rows n
+        WHERE n.direction = 'transfer'
+        GROUP BY n.guild_id, n.initiator_id, timezone('utc', n.created_at)::date
+        ON CONFLICT (guild_id, member_id, day)
+        DO UPDATE SET total = t.total + EXCLUDED.total;
+    ELSE
+        UPDATE economy.member_daily_transfer_totals AS t
+        SET total = t.total - d.total
+        FROM (
+            SELECT o.guild_id, o.initiator_id, timezone('utc', o.created_at)::date AS day,
+                   SUM(o.amount) AS total
+            FROM old_rows o
+            WHERE o.direction = 'transfer'
+            GROUP BY o.guild_id, o.initiator_id, timezone('utc', o.created_at)::date
+        ) AS d
+        WHERE t.guild_id = d.guild_id
+          AND t.member_id = d.initiator_id
+          AND t.day = d.day;
+    END IF;
+
+    RETURN NULL;
+END;
+$$;
+
+-- 轉移表觸發器一次只能對應一種事件，因此分別建立
+DROP TRIGGER IF EXISTS trg_daily_transfer_totals_insert ON economy.currency_transactions;
+CREATE TRIGGER trg_daily_transfer_totals_insert
+    AFTER INSERT ON economy.currency_transactions
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION economy.fn_track_daily_transfer_totals();
+
+DROP TRIGGER IF EXISTS trg_daily_transfer_totals_delete ON economy.currency_transactions;
+CREATE TRIGGER trg_daily_transfer_totals_delete
+    AFTER DELETE ON economy.currency_transactions
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION economy.fn_track_daily_transfer_totals();
+
+-- 讀取成員當日（UTC）累計轉出；無紀錄時為 0
+CREATE OR REPLACE FUNCTION economy.fn_get_daily_transfer_total(
+    p_guild_id bigint,
+    p_member_id bigint,
+    p_at timestamptz DEFAULT timezone('utc', clock_timestamp())
+)
+RETURNS bigint
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT coalesce(
+        (
+            SELECT t.total
+            FROM economy.member_daily_transfer_totals t
+            WHERE t.guild_id = p_guild_id
+              AND t.member_id = p_member_id
+              AND t.day = timezone('utc', p_at)::date
+        ),
+        0
+    );
+$$;
+
+-- 刪除 p_before 之前的每日累計（僅當日值用於上限檢查），回傳刪除列數
+CREATE OR REPLACE FUNCTION economy.fn_prune_daily_transfer_totals(p_before date)
+RETURNS integer
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_deleted integer;
+BEGIN
+    DELETE FROM economy.member_daily_transfer_totals
+    WHERE day < p_before;
+    GET DIAGNOSTICS v_deleted = ROW_COUNT;
+    RETURN v_deleted;
+END;
+$$;
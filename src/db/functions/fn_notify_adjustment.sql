@@ -6,8 +6,16 @@ LANGUAGE plpgsql
 AS $$
 DECLARE
     v_payload jsonb;
+    v_target_version timestamptz;
+    v_target_throttled_until timestamptz;
 BEGIN
     IF NEW.direction IN ('adjustment_grant', 'adjustment_deduct') THEN
+        -- 調整與本筆紀錄在同一交易內更新帳本列，此時讀到的即為調整後的版本
+        SELECT b.last_modified_at, b.throttled_until
+        INTO v_target_version, v_target_throttled_until
+        FROM economy.guild_member_balances b
+        WHERE b.guild_id = NEW.guild_id AND b.member_id = NEW.target_id;
+
         v_payload := jsonb_build_object(
             'event_type', 'adjustment_success',
             'transaction_id', NEW.transaction_id,
@@ -17,6 +25,9 @@ BEGIN
             'amount', NEW.amount,
             'direction', NEW.direction,
             'reason', NEW.reason,
+            'balance_after_target', NEW.balance_after_target,
+            'target_version', v_target_version,
+            'target_throttled_until', v_target_throttled_until,
             'metadata', NEW.metadata
         );
         PERFORM pg_notify('economy_events', v_payload::text);
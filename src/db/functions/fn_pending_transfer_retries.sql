@@ -0,0 +1,53 @@
+-- Durable retry scheduling for pending transfers.
+--
+-- 失敗的轉帳不再由各個 bot 程序以 asyncio 任務睡眠等待，而是記錄於
+-- pending_transfers.next_retry_at；排程迴圈以 FOR UPDATE SKIP LOCKED 批次領取到期列，
+-- 因此重啟後仍會續行，多個 bot 副本也能安全分擔重試工作。
+
+-- 排程下一次重試（指數退避：2^retry_count 秒，最長 p_max_delay_seconds）。
+-- 僅在尚未排程時生效，重複呼叫（例如多個副本同時收到檢查結果）只會累加一次。
+-- 回傳排定時間；未排程（已排程、已終結或不存在）時回傳 NULL。
+CREATE OR REPLACE FUNCTION economy.fn_schedule_pending_transfer_retry(
+    p_transfer_id uuid,
+    p_max_delay_seconds integer DEFAULT 300
+)
+RETURNS timestamptz
+LANGUAGE sql
+AS $$
+    UPDATE economy.pending_transfers
+    SET retry_count = retry_count + 1,
+        next_retry_at = timezone('utc', clock_timestamp())
+            + make_interval(secs => least(power(2, retry_count), p_max_delay_seconds)),
+        updated_at = timezone('utc', clock_timestamp())
+    WHERE transfer_id = p_transfer_id
+      AND status IN ('pending', 'checking')
+      AND next_retry_at IS NULL
+    RETURNING next_retry_at;
+$$;
+
+-- 領取到期的重試：清除 next_retry_at 並將狀態重設為 checking。
+-- 呼叫端應在同一交易內接著呼叫 fn_evaluate_pending_transfer；交易回滾時列會保留原排程。
+CREATE OR REPLACE FUNCTION economy.fn_claim_due_pending_transfer_retries(
+    p_limit integer DEFAULT 100
+)
+RETURNS SETOF uuid
+LANGUAGE sql
+AS $$
+    WITH due AS (
+        SELECT pt.transfer_id
+        FROM economy.pending_transfers pt
+        WHERE pt.next_retry_at IS NOT NULL
+          AND pt.next_retry_at <= timezone('utc', clock_timestamp())
+          AND pt.status IN ('pending', 'checking')
+        ORDER BY pt.next_retry_at
+        LIMIT p_limit
+        FOR UPDATE SKIP LOCKED
+    )
+    UPDATE economy.pending_transfers pt
+    SET next_retry_at = NULL,
+        status = 'checking',
+        updated_at = timezone('utc', clock_timestamp())
+    FROM due
+    WHERE pt.transfer_id = due.transfer_id
+    RETURNING pt.transfer_id;
+$$;
@@ -0,0 +1,66 @@
+-- Catch-up queries used by the telemetry listener after a LISTEN reconnect.
+--
+-- NOTIFY 不會保留給斷線中的監聽者；重連後以這兩個函式補回斷線期間遺失的事件。
+
+-- 依 (created_at, transaction_id) 鍵集分頁，將 currency_transactions 還原為與 NOTIFY 相同格式的
+-- transaction_success / adjustment_success 事件。首頁傳入 p_after_transaction_id = NULL。
+CREATE OR REPLACE FUNCTION economy.fn_list_economy_events_since(
+    p_since timestamptz,
+    p_after_transaction_id uuid DEFAULT NULL,
+    p_limit integer DEFAULT 500
+)
+RETURNS TABLE (
+    transaction_id uuid,
+    created_at timestamptz,
+    payload jsonb
+)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT
+        ct.transaction_id,
+        ct.created_at,
+        CASE
+            WHEN ct.direction = 'transfer' THEN jsonb_build_object(
+                'event_type', 'transaction_success',
+                'transaction_id', ct.transaction_id,
+                'guild_id', ct.guild_id,
+                'initiator_id', ct.initiator_id,
+                'target_id', ct.target_id,
+                'amount', ct.amount,
+                'metadata', ct.metadata
+            )
+            ELSE jsonb_build_object(
+                'event_type', 'adjustment_success',
+                'transaction_id', ct.transaction_id,
+                'guild_id', ct.guild_id,
+                'admin_id', ct.initiator_id,
+                'target_id', ct.target_id,
+                'amount', ct.amount,
+                'direction', ct.direction,
+                'reason', ct.reason,
+                'metadata', ct.metadata
+            )
+        END
+    FROM economy.currency_transactions ct
+    WHERE ct.direction IN ('transfer', 'adjustment_grant', 'adjustment_deduct')
+      AND (ct.created_at, ct.transaction_id) > (
+          p_since,
+          coalesce(p_after_transaction_id, '00000000-0000-0000-0000-000000000000'::uuid)
+      )
+    ORDER BY ct.created_at, ct.transaction_id
+    LIMIT p_limit;
+$$;
+
+-- 已核准但尚未執行的轉帳（其 transfer_check_approved 通知可能在斷線期間遺失）。
+CREATE OR REPLACE FUNCTION economy.fn_list_approved_pending_transfers(p_limit integer DEFAULT 500)
+RETURNS SETOF uuid
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT pt.transfer_id
+    FROM economy.pending_transfers pt
+    WHERE pt.status = 'approved'
+    ORDER BY pt.updated_at
+    LIMIT p_limit;
+$$;
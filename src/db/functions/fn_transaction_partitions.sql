@@ -0,0 +1,141 @@
+-- currency_transactions 月分區維護
+--
+-- 分區以 UTC 月份為邊界，命名為 currency_transactions_pYYYYMM；
+-- 未被任何月分區涵蓋的列落入 currency_transactions_default。
+-- 歸檔不再逐列 DELETE ... RETURNING，而是將整個過期月分區 DETACH
+-- 後 ATTACH 至 currency_transactions_archive（同樣以 created_at 範圍分區）。
+-- 兩個函式共用同一把 advisory lock，多個 bot 程序同時維護時會依序執行。
+
+-- 建立從 p_from（預設為本月）起到本月之後 p_months_ahead 個月的月分區，回傳新建數量
+CREATE OR REPLACE FUNCTION economy.fn_ensure_transaction_partitions(
+    p_months_ahead integer DEFAULT 2,
+    p_from timestamptz DEFAULT NULL
+)
+RETURNS integer
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_month timestamp;
+    v_last timestamp;
+    v_from timestamptz;
+    v_to timestamptz;
+    v_name text;
+    v_created integer := 0;
+BEGIN
+    PERFORM pg_advisory_xact_lock(hashtext('economy.currency_transactions.partitions'));
+
+    v_month := date_trunc('month', timezone('utc', coalesce(p_from, now())));
+    v_last := date_trunc('month', timezone('utc', now()))
+        + make_interval(months => greatest(p_months_ahead, 0));
+
+    WHILE v_month <= v_last LOOP
+        v_name := format('currency_transactions_p%s', to_char(v_month, 'YYYYMM'));
+        v_from := v_month AT TIME ZONE 'utc';
+        v_to := (v_month + interval '1 month') AT TIME ZONE 'utc';
+
+        -- 已存在（含已歸檔至 archive 的同名分區）則略過
+        IF to_regclass(format('economy.%I', v_name)) IS NULL THEN
+            -- 先建立獨立資料表並搬出 DEFAULT 分區中屬於該月的列，
+            -- 否則 ATTACH 會因 DEFAULT 分區違反新的分區條件而失敗
+            EXECUTE format(
+                'CREATE TABLE economy.%I (LIKE economy.currency_transactions '
+                'INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+                v_name
+            );
+            EXECUTE format(
+                'WITH moved AS ('
+                '  DELETE FROM economy.currency_transactions_default'
+                '  WHERE created_at >= $1 AND created_at < $2 RETURNING *'
+                ') INSERT INTO economy.%I SELECT * FROM moved',
+                v_name
+            ) USING v_from, v_to;
+            EXECUTE format(
+                'ALTER TABLE economy.currency_transactions ATTACH PARTITION economy.%I '
+                'FOR VALUES FROM (%L) TO (%L)',
+                v_name, v_from, v_to
+            );
+            v_created := v_created + 1;
+        END IF;
+
+        v_month := v_month + interval '1 month';
+    END LOOP;
+
+    RETURN v_created;
+END;
+$$;
+
+-- 將整月皆早於保留期限的分區由 currency_transactions 移至 currency_transactions_archive，
+-- 回傳被歸檔的分區名稱
+CREATE OR REPLACE FUNCTION economy.fn_archive_transaction_partitions(
+    p_retention interval DEFAULT interval '30 days'
+)
+RETURNS SETOF text
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_cutoff timestamptz := now() - p_retention;
+    v_name text;
+    v_month timestamp;
+    v_from timestamptz;
+    v_to timestamptz;
+BEGIN
+    PERFORM pg_advisory_xact_lock(hashtext('economy.currency_transactions.partitions'));
+    -- DETACH 需要父表的排他鎖；等待過久時放棄，交由下一輪維護重試
+    PERFORM set_config('lock_timeout', '5s', true);
+
+    FOR v_name IN
+        SELECT c.relname
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = 'economy.currency_transactions'::regclass
+          AND c.relname ~ '^currency_transactions_p[0-9]{6}$'
+        ORDER BY c.relname
+    LOOP
+        v_month := to_date(right(v_name, 6), 'YYYYMM')::timestamp;
+        v_from := v_month AT TIME ZONE 'utc';
+        v_to := (v_month + interval '1 month') AT TIME ZONE 'utc';
+        CONTINUE WHEN v_to > v_cutoff;
+
+        EXECUTE format(
+            'ALTER TABLE economy.currency_transactions DETACH PARTITION economy.%I',
+            v_name
+        );
+        -- 歸檔表不參照即時餘額，與既有 archive 表一致移除外鍵
+        EXECUTE format(
+            'ALTER TABLE economy.%I '
+            'DROP CONSTRAINT IF EXISTS fk_currency_transactions_initiator, '
+            'DROP CONSTRAINT IF EXISTS fk_currency_transactions_target',
+            v_name
+        );
+        BEGIN
+            EXECUTE format(
+                'ALTER TABLE economy.currency_transactions_archive ATTACH PARTITION economy.%I '
+                'FOR VALUES FROM (%L) TO (%L)',
+                v_name, v_from, v_to
+            );
+        EXCEPTION WHEN invalid_object_definition THEN
+            -- 與 currency_transactions_archive_legacy 的範圍重疊（早於分區化前的月份），
+            -- 改為將列併入既有歸檔分區
+            EXECUTE format(
+                'INSERT INTO economy.currency_transactions_archive SELECT * FROM economy.%I',
+                v_name
+            );
+            EXECUTE format('DROP TABLE economy.%I', v_name);
+        END;
+
+        RETURN NEXT v_name;
+    END LOOP;
+
+    RETURN;
+END;
+$$;
+
+-- 保留原有簽章供手動呼叫；排程歸檔由 bot 依 ECONOMY_ARCHIVE_RETENTION_DAYS 執行
+-- （063 已移除 pg_cron 的 economy_archive_30d 排程）。batch_size 已不再使用
+CREATE OR REPLACE PROCEDURE economy.proc_archive_old_transactions(batch_size integer DEFAULT 5000)
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    PERFORM economy.fn_archive_transaction_partitions(interval '30 days');
+END;
+$$;
@@ -25,7 +25,10 @@ BEGIN
     ON CONFLICT (guild_id, member_id)
     DO UPDATE
         SET throttled_until = v_until,
-            last_modified_at = v_now
+            last_modified_at = greatest(
+                v_now,
+                economy.guild_member_balances.last_modified_at + interval '1 microsecond'
+            )
         RETURNING economy.guild_member_balances.current_balance
         INTO v_balance;
 
@@ -60,8 +63,7 @@ BEGIN
         )
     );
 
-    PERFORM pg_notify(
-        'economy_events',
+    PERFORM economy.fn_emit_economy_event(
         jsonb_build_object(
             'event_type',
             'transaction_denied',
@@ -79,9 +81,11 @@ BEGIN
                     v_until
                 )
             )
-        )::text
+        )
     );
 
+    PERFORM economy.fn_flush_economy_events();
+
     RETURN v_until;
 END;
 $$;
@@ -101,6 +105,9 @@ DECLARE
     v_metadata jsonb := coalesce(p_metadata, '{}'::jsonb);
     v_initiator_balance bigint;
     v_target_balance bigint;
+    v_initiator_version timestamptz;
+    v_target_version timestamptz;
+    v_target_throttled_until timestamptz;
     v_throttled_until timestamptz;
     v_total_today bigint;
     v_transaction_id uuid;
@@ -130,16 +137,9 @@ BEGIN
     VALUES (p_guild_id, p_target_id, 0, v_now, v_now)
     ON CONFLICT (guild_id, member_id) DO NOTHING;
 
-    -- 判斷是否為政府部門帳戶（免除每日上限與冷卻限制）
-    SELECT EXISTS (
-               SELECT 1
-               FROM governance.government_accounts ga
-               WHERE ga.account_id = p_initiator_id AND ga.guild_id = p_guild_id
-           )
-    INTO v_is_government;
-
-    SELECT current_balance, throttled_until
-    INTO v_initiator_balance, v_throttled_until
+    -- is_government：政府部門帳戶（免除每日上限與冷卻限制），與帳本列一併鎖定讀取
+    SELECT current_balance, throttled_until, is_government
+    INTO v_initiator_balance, v_throttled_until, v_is_government
     FROM economy.guild_member_balances
     WHERE guild_id = p_guild_id AND member_id = p_initiator_id
     FOR UPDATE;
@@ -155,13 +155,10 @@ BEGIN
         IF v_daily_limit_text IS NOT NULL AND NULLIF(v_daily_limit_text, '') IS NOT NULL THEN
             v_daily_limit := v_daily_limit_text::bigint;
             IF v_daily_limit > 0 THEN
-                SELECT coalesce(SUM(amount), 0)
-                INTO v_total_today
-                FROM economy.currency_transactions
-                WHERE guild_id = p_guild_id
-                  AND initiator_id = p_initiator_id
-                  AND direction = 'transfer'
-                  AND created_at >= date_trunc('day', v_now);
+                -- 當日累計由 member_daily_transfer_totals 維護，O(1) 讀取
+                v_total_today := economy.fn_get_daily_transfer_total(
+                    p_guild_id, p_initiator_id, v_now
+                );
 
                 IF v_total_today + p_amount > v_daily_limit THEN
                     PERFORM economy.fn_record_throttle(
@@ -187,20 +184,22 @@ BEGIN
             USING ERRCODE = 'P0001';
     END IF;
 
+    -- last_modified_at 作為餘額版本：等待列鎖的交易其 v_now 可能早於前一筆，
+    -- 因此至少遞增 1 微秒，確保同一帳本列的版本嚴格遞增（程序內餘額快取依此判斷新舊）
     UPDATE economy.guild_member_balances
     SET current_balance = current_balance - p_amount,
-        last_modified_at = v_now,
+        last_modified_at = greatest(v_now, last_modified_at + interval '1 microsecond'),
         throttled_until = NULL
     WHERE guild_id = p_guild_id AND member_id = p_initiator_id
-    RETURNING current_balance
-    INTO v_initiator_balance;
+    RETURNING current_balance, last_modified_at
+    INTO v_initiator_balance, v_initiator_version;
 
     UPDATE economy.guild_member_balances
     SET current_balance = current_balance + p_amount,
-        last_modified_at = v_now
+        last_modified_at = greatest(v_now, last_modified_at + interval '1 microsecond')
     WHERE guild_id = p_guild_id AND member_id = p_target_id
-    RETURNING current_balance
-    INTO v_target_balance;
+    RETURNING current_balance, last_modified_at, throttled_until
+    INTO v_target_balance, v_target_version, v_target_throttled_until;
 
     INSERT INTO economy.currency_transactions (
         guild_id,
@@ -227,8 +226,7 @@ BEGIN
     RETURNING transaction_id, created_at
     INTO v_transaction_id, v_created_at;
 
-    PERFORM pg_notify(
-        'economy_events',
+    PERFORM economy.fn_emit_economy_event(
         jsonb_build_object(
             'event_type',
             'transaction_success',
@@ -242,11 +240,23 @@ BEGIN
             p_target_id,
             'amount',
             p_amount,
+            'balance_after_initiator',
+            v_initiator_balance,
+            'balance_after_target',
+            v_target_balance,
+            'initiator_version',
+            v_initiator_version,
+            'target_version',
+            v_target_version,
+            'target_throttled_until',
+            v_target_throttled_until,
             'metadata',
             jsonb_strip_nulls(v_metadata)
-        )::text
+        )
     );
 
+    PERFORM economy.fn_flush_economy_events();
+
     RETURN (
         v_transaction_id,
         p_guild_id,
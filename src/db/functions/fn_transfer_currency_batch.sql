@@ -0,0 +1,281 @@
+-- Batched transfer procedure: apply N same-guild transfers in a single transaction.
+--
+-- p_transfers 為 JSON 陣列，每個元素包含：
+--   {"initiator_id": bigint, "target_id": bigint, "amount": bigint, "metadata": jsonb}
+-- 回傳順序與輸入順序一致（每筆一列 economy.transfer_result）。
+-- 任一筆失敗（餘額不足、冷卻、每日上限、格式錯誤）會拋出例外並使整批回滾。
+CREATE OR REPLACE FUNCTION economy.fn_transfer_currency_batch(
+    p_guild_id bigint,
+    p_transfers jsonb
+)
+RETURNS SETOF economy.transfer_result
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_now timestamptz := timezone('utc', clock_timestamp());
+    v_item jsonb;
+    v_position bigint;
+    v_initiator_id bigint;
+    v_target_id bigint;
+    v_amount bigint;
+    v_metadata jsonb;
+    v_reason text;
+    v_initiator_balance bigint;
+    v_target_balance bigint;
+    v_initiator_version timestamptz;
+    v_target_version timestamptz;
+    v_target_throttled_until timestamptz;
+    v_throttled_until timestamptz;
+    v_transaction_id uuid;
+    v_created_at timestamptz;
+    v_member_ids bigint[];
+    v_government_ids bigint[];
+    -- 以連線層 GUC 控制每日上限；未設定或 <= 0 視為「無上限」
+    v_daily_limit_text text := current_setting('app.transfer_daily_limit', true);
+    v_daily_limit bigint := 0;
+    v_totals jsonb := '{}'::jsonb;
+    v_total_today bigint;
+    v_result economy.transfer_result;
+    -- transaction_success 事件先收集於區域陣列，結束前一次送出
+    v_events jsonb[] := ARRAY[]::jsonb[];
+BEGIN
+    IF p_transfers IS NULL OR jsonb_typeof(p_transfers) <> 'array' THEN
+        RAISE EXCEPTION 'Batch transfers must be provided as a JSON array.'
+            USING ERRCODE = '22023';
+    END IF;
+
+    IF jsonb_array_length(p_transfers) = 0 THEN
+        RETURN;
+    END IF;
+
+    -- 先完整驗證所有項目，避免套用到一半才發現格式錯誤
+    FOR v_item, v_position IN
+        SELECT e.value, e.ordinality
+        FROM jsonb_array_elements(p_transfers) WITH ORDINALITY AS e(value, ordinality)
+    LOOP
+        v_initiator_id := (v_item->>'initiator_id')::bigint;
+        v_target_id := (v_item->>'target_id')::bigint;
+        v_amount := (v_item->>'amount')::bigint;
+
+        IF v_initiator_id IS NULL OR v_target_id IS NULL OR v_amount IS NULL THEN
+            RAISE EXCEPTION 'Batch transfer #% is missing initiator_id, target_id or amount.', v_position
+                USING ERRCODE = '22023';
+        END IF;
+
+        IF v_initiator_id = v_target_id THEN
+            RAISE EXCEPTION 'Initiator and target must be distinct members for transfers (batch item #%).', v_position
+                USING ERRCODE = '22023';
+        END IF;
+
+        IF v_amount <= 0 THEN
+            RAISE EXCEPTION 'Transfer amount must be a positive whole number (batch item #%).', v_position
+                USING ERRCODE = '22023';
+        END IF;
+    END LOOP;
+
+    SELECT array_agg(DISTINCT m.member_id ORDER BY m.member_id)
+    INTO v_member_ids
+    FROM (
+        SELECT (e.value->>'initiator_id')::bigint AS member_id
+        FROM jsonb_array_elements(p_transfers) AS e(value)
+        UNION
+        SELECT (e.value->>'target_id')::bigint
+        FROM jsonb_array_elements(p_transfers) AS e(value)
+    ) AS m;
+
+    -- Ensure ledger rows exist（一次性建立所有涉及的帳本列）
+    INSERT INTO economy.guild_member_balances (guild_id, member_id, current_balance, last_modified_at, created_at)
+    SELECT p_guild_id, m.member_id, 0, v_now, v_now
+    FROM unnest(v_member_ids) AS m(member_id)
+    ORDER BY m.member_id
+    ON CONFLICT (guild_id, member_id) DO NOTHING;
+
+    -- 依 member_id 固定順序鎖定所有涉及的帳本列，避免並行批次/單筆轉帳互相死結
+    PERFORM 1
+    FROM economy.guild_member_balances
+    WHERE guild_id = p_guild_id
+      AND member_id = ANY(v_member_ids)
+    ORDER BY member_id
+    FOR UPDATE;
+
+    -- 判斷政府部門帳戶（免除每日上限與冷卻限制）：整批只讀一次已鎖定帳本列上的旗標
+    SELECT coalesce(array_agg(b.member_id), ARRAY[]::bigint[])
+    INTO v_government_ids
+    FROM economy.guild_member_balances b
+    WHERE b.guild_id = p_guild_id
+      AND b.member_id = ANY(v_member_ids)
+      AND b.is_government;
+
+    IF v_daily_limit_text IS NOT NULL AND NULLIF(v_daily_limit_text, '') IS NOT NULL THEN
+        v_daily_limit := v_daily_limit_text::bigint;
+    END IF;
+
+    -- 每日上限：一次讀取各發起人今日累計（member_daily_transfer_totals），批次內再逐筆累加
+    IF v_daily_limit > 0 THEN
+        SELECT coalesce(
+                   jsonb_object_agg(
+                       m.member_id::text,
+                       economy.fn_get_daily_transfer_total(p_guild_id, m.member_id, v_now)
+                   ),
+                   '{}'::jsonb
+               )
+        INTO v_totals
+        FROM unnest(v_member_ids) AS m(member_id)
+        WHERE NOT (m.member_id = ANY(v_government_ids));
+    END IF;
+
+    FOR v_item, v_position IN
+        SELECT e.value, e.ordinality
+        FROM jsonb_array_elements(p_transfers) WITH ORDINALITY AS e(value, ordinality)
+    LOOP
+        v_initiator_id := (v_item->>'initiator_id')::bigint;
+        v_target_id := (v_item->>'target_id')::bigint;
+        v_amount := (v_item->>'amount')::bigint;
+        v_metadata := v_item->'metadata';
+        IF v_metadata IS NULL OR jsonb_typeof(v_metadata) <> 'object' THEN
+            v_metadata := '{}'::jsonb;
+        END IF;
+        v_reason := nullif(v_metadata->>'reason', '');
+
+        -- 帳本列已於上方鎖定，這裡僅為讀取最新值
+        SELECT current_balance, throttled_until
+        INTO v_initiator_balance, v_throttled_until
+        FROM economy.guild_member_balances
+        WHERE guild_id = p_guild_id AND member_id = v_initiator_id;
+
+        IF NOT (v_initiator_id = ANY(v_government_ids)) THEN
+            IF v_throttled_until IS NOT NULL AND v_throttled_until > v_now THEN
+                RAISE EXCEPTION 'Transfer throttled: member % is on cooldown until % (batch item #%).',
+                    v_initiator_id, v_throttled_until, v_position
+                    USING ERRCODE = 'P0001';
+            END IF;
+
+            IF v_daily_limit > 0 THEN
+                v_total_today := coalesce((v_totals->>v_initiator_id::text)::bigint, 0);
+
+                IF v_total_today + v_amount > v_daily_limit THEN
+                    PERFORM economy.fn_record_throttle(
+                        p_guild_id,
+                        v_initiator_id,
+                        jsonb_build_object(
+                            'reason', 'daily_limit_exceeded',
+                            'limit', v_daily_limit,
+                            'attempted_amount', v_amount,
+                            'total_today', v_total_today
+                        )
+                    );
+
+                    RAISE EXCEPTION 'Transfer throttled: daily limit of % exceeded (batch item #%).',
+                        v_daily_limit, v_position
+                        USING ERRCODE = 'P0001';
+                END IF;
+
+                v_totals := jsonb_set(
+                    v_totals,
+                    ARRAY[v_initiator_id::text],
+                    to_jsonb(v_total_today + v_amount)
+                );
+            END IF;
+        END IF;
+
+        IF v_initiator_balance < v_amount THEN
+            RAISE EXCEPTION 'Transfer denied: insufficient funds for batch item #%. Balance available: %.',
+                v_position, v_initiator_balance
+                USING ERRCODE = 'P0001';
+        END IF;
+
+        -- 同一批次內同一成員可能被更新多次，版本（last_modified_at）須嚴格遞增
+        UPDATE economy.guild_member_balances
+        SET current_balance = current_balance - v_amount,
+            last_modified_at = greatest(v_now, last_modified_at + interval '1 microsecond'),
+            throttled_until = NULL
+        WHERE guild_id = p_guild_id AND member_id = v_initiator_id
+        RETURNING current_balance, last_modified_at
+        INTO v_initiator_balance, v_initiator_version;
+
+        UPDATE economy.guild_member_balances
+        SET current_balance = current_balance + v_amount,
+            last_modified_at = greatest(v_now, last_modified_at + interval '1 microsecond')
+        WHERE guild_id = p_guild_id AND member_id = v_target_id
+        RETURNING current_balance, last_modified_at, throttled_until
+        INTO v_target_balance, v_target_version, v_target_throttled_until;
+
+        INSERT INTO economy.currency_transactions (
+            guild_id,
+            initiator_id,
+            target_id,
+            amount,
+            direction,
+            reason,
+            balance_after_initiator,
+            balance_after_target,
+            metadata
+        )
+        VALUES (
+            p_guild_id,
+            v_initiator_id,
+            v_target_id,
+            v_amount,
+            'transfer',
+            v_reason,
+            v_initiator_balance,
+            v_target_balance,
+            jsonb_strip_nulls(v_metadata)
+        )
+        RETURNING transaction_id, created_at
+        INTO v_transaction_id, v_created_at;
+
+        -- 與 fn_transfer_currency 相同格式，listener 不需區分單筆或批次
+        v_events := array_append(
+            v_events,
+            jsonb_build_object(
+                'event_type',
+                'transaction_success',
+                'transaction_id',
+                v_transaction_id,
+                'guild_id',
+                p_guild_id,
+                'initiator_id',
+                v_initiator_id,
+                'target_id',
+                v_target_id,
+                'amount',
+                v_amount,
+                'balance_after_initiator',
+                v_initiator_balance,
+                'balance_after_target',
+                v_target_balance,
+                'initiator_version',
+                v_initiator_version,
+                'target_version',
+                v_target_version,
+                'target_throttled_until',
+                v_target_throttled_until,
+                'metadata',
+                jsonb_strip_nulls(v_metadata)
+            )
+        );
+
+        v_result := ROW(
+            v_transaction_id,
+            p_guild_id,
+            v_initiator_id,
+            v_target_id,
+            v_amount,
+            'transfer'::economy.transaction_direction,
+            v_created_at,
+            v_initiator_balance,
+            v_target_balance,
+            NULL::timestamptz,
+            jsonb_strip_nulls(v_metadata)
+        )::economy.transfer_result;
+
+        RETURN NEXT v_result;
+    END LOOP;
+
+    -- 預設模式逐筆送出；精簡通知模式下整批的 transaction_success 合併送出
+    PERFORM economy.fn_emit_economy_events(to_jsonb(v_events));
+
+    RETURN;
+END;
+$$;
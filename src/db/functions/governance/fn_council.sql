@@ -189,21 +189,124 @@ DECLARE v_votes int; v_ok boolean := false; BEGIN
     RETURN v_ok;
 END; $$;
 
--- Upsert a vote
+-- Upsert a vote and keep the proposal's vote counters in step
+-- 以提案列鎖序列化同一提案的投票：先讀舊選項再寫入，計數欄與 votes 表始終一致
 CREATE OR REPLACE FUNCTION governance.fn_upsert_vote(
     p_proposal_id uuid,
     p_voter_id bigint,
     p_choice text
 ) RETURNS void LANGUAGE plpgsql AS $$
+DECLARE
+    v_previous text;
 BEGIN
+    PERFORM 1 FROM governance.proposals AS p
+    WHERE p.proposal_id = p_proposal_id
+    FOR UPDATE;
+
+    SELECT v.choice INTO v_previous
+    FROM governance.votes AS v
+    WHERE v.proposal_id = p_proposal_id AND v.voter_id = p_voter_id;
+
     INSERT INTO governance.votes (proposal_id, voter_id, choice)
     VALUES (p_proposal_id, p_voter_id, p_choice)
     ON CONFLICT (proposal_id, voter_id)
     DO UPDATE SET choice = EXCLUDED.choice,
                   updated_at = timezone('utc', clock_timestamp());
+
+    IF v_previous IS DISTINCT FROM p_choice THEN
+        UPDATE governance.proposals AS p
+        SET approve_count = p.approve_count
+                + CASE WHEN p_choice = 'approve' THEN 1 ELSE 0 END
+                - CASE WHEN v_previous = 'approve' THEN 1 ELSE 0 END,
+            reject_count = p.reject_count
+                + CASE WHEN p_choice = 'reject' THEN 1 ELSE 0 END
+                - CASE WHEN v_previous = 'reject' THEN 1 ELSE 0 END,
+            abstain_count = p.abstain_count
+                + CASE WHEN p_choice = 'abstain' THEN 1 ELSE 0 END
+                - CASE WHEN v_previous = 'abstain' THEN 1 ELSE 0 END,
+            total_voted = p.total_voted + CASE WHEN v_previous IS NULL THEN 1 ELSE 0 END
+        WHERE p.proposal_id = p_proposal_id;
+    END IF;
+END; $$;
+
+-- Cast a vote in one round trip
+-- 鎖定提案 → 以主鍵探測快照名單 → 寫入選票與計數 → 依門檻判定通過／否決，回傳投票後的
+-- 提案與票數。outcome：voted / closed（非進行中，不寫入）/ not_in_snapshot / not_found。
+CREATE OR REPLACE FUNCTION governance.fn_cast_vote(
+    p_proposal_id uuid,
+    p_voter_id bigint,
+    p_choice text
+)
+RETURNS TABLE (
+    outcome text,
+    proposal_id uuid,
+    guild_id bigint,
+    proposer_id bigint,
+    target_id bigint,
+    amount bigint,
+    description text,
+    attachment_url text,
+    snapshot_n integer,
+    threshold_t integer,
+    deadline_at timestamptz,
+    status text,
+    reminder_sent boolean,
+    created_at timestamptz,
+    updated_at timestamptz,
+    target_department_id text,
+    approve integer,
+    reject integer,
+    abstain integer,
+    total_voted integer
+) LANGUAGE plpgsql AS $$
+DECLARE
+    v_status text;
+    v_outcome text := 'voted';
+BEGIN
+    SELECT p.status INTO v_status
+    FROM governance.proposals AS p
+    WHERE p.proposal_id = p_proposal_id
+    FOR UPDATE;
+
+    IF NOT FOUND THEN
+        outcome := 'not_found';
+        RETURN NEXT;
+        RETURN;
+    END IF;
+
+    IF v_status <> '進行中' THEN
+        v_outcome := 'closed';
+    ELSIF NOT EXISTS (
+        SELECT 1
+        FROM governance.proposal_snapshots AS ps
+        WHERE ps.proposal_id = p_proposal_id AND ps.member_id = p_voter_id
+    ) THEN
+        v_outcome := 'not_in_snapshot';
+    ELSE
+        PERFORM governance.fn_upsert_vote(p_proposal_id, p_voter_id, p_choice);
+
+        -- 達門檻即通過；即使其餘未投票者全數贊成也無法達門檻則提前否決
+        UPDATE governance.proposals AS p
+        SET status = CASE WHEN p.approve_count >= p.threshold_t THEN '已通過' ELSE '已否決' END,
+            updated_at = timezone('utc', clock_timestamp())
+        WHERE p.proposal_id = p_proposal_id
+          AND (
+              p.approve_count >= p.threshold_t
+              OR p.approve_count + greatest(p.snapshot_n - p.total_voted, 0) < p.threshold_t
+          );
+    END IF;
+
+    RETURN QUERY
+    SELECT v_outcome, p.proposal_id, p.guild_id, p.proposer_id, p.target_id, p.amount,
+           p.description, p.attachment_url, p.snapshot_n, p.threshold_t, p.deadline_at,
+           p.status, p.reminder_sent, p.created_at, p.updated_at, p.target_department_id,
+           p.approve_count, p.reject_count, p.abstain_count, p.total_voted
+    FROM governance.proposals AS p
+    WHERE p.proposal_id = p_proposal_id;
 END; $$;
 
 -- Fetch tally counts in one row
+-- 讀取 fn_upsert_vote 維護的計數欄（單列主鍵查詢）；不存在的提案回傳全 0
 CREATE OR REPLACE FUNCTION governance.fn_fetch_tally(p_proposal_id uuid)
 RETURNS TABLE (
     approve integer,
@@ -213,17 +316,13 @@ RETURNS TABLE (
 ) LANGUAGE plpgsql AS $$
 BEGIN
     RETURN QUERY
-    WITH counts AS (
-        SELECT choice, COUNT(*)::int AS c
-        FROM governance.votes WHERE proposal_id = p_proposal_id
-        GROUP BY choice
-    )
     SELECT
-        COALESCE(MAX(CASE WHEN choice = 'approve' THEN c END), 0) AS approve,
-        COALESCE(MAX(CASE WHEN choice = 'reject' THEN c END), 0) AS reject,
-        COALESCE(MAX(CASE WHEN choice = 'abstain' THEN c END), 0) AS abstain,
-        COALESCE(SUM(c)::int, 0) AS total_voted
-    FROM counts;
+        COALESCE(p.approve_count, 0),
+        COALESCE(p.reject_count, 0),
+        COALESCE(p.abstain_count, 0),
+        COALESCE(p.total_voted, 0)
+    FROM (SELECT 1) AS one
+    LEFT JOIN governance.proposals AS p ON p.proposal_id = p_proposal_id;
 END; $$;
 
 -- List votes detail (voter_id, choice)
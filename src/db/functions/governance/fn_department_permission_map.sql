@@ -0,0 +1,29 @@
+-- 一次取得國務院領袖設定與各部門可存取的身分組，供面板批次判斷部門權限。
+--
+-- 每個部門回傳一列，role_ids 為多角色設定（state_council_department_role_ids）與
+-- 傳統單角色設定（department_configs.role_id）的聯集；尚無任何部門設定時仍回傳一列
+-- （department 為 NULL）以攜帶領袖設定。未完成國務院設定的公會不回傳任何列。
+CREATE OR REPLACE FUNCTION governance.fn_get_department_permission_map(p_guild_id bigint)
+RETURNS TABLE (
+    leader_id bigint,
+    leader_role_id bigint,
+    department text,
+    role_ids bigint[]
+) LANGUAGE sql STABLE AS $$
+    SELECT c.leader_id, c.leader_role_id, d.department, d.role_ids
+    FROM governance.state_council_config AS c
+    LEFT JOIN LATERAL (
+        SELECT r.department, array_agg(DISTINCT r.role_id ORDER BY r.role_id) AS role_ids
+        FROM (
+            SELECT dr.department::text AS department, dr.role_id
+            FROM governance.state_council_department_role_ids AS dr
+            WHERE dr.guild_id = c.guild_id
+            UNION ALL
+            SELECT dc.department::text, dc.role_id
+            FROM governance.department_configs AS dc
+            WHERE dc.guild_id = c.guild_id AND dc.role_id IS NOT NULL
+        ) AS r
+        GROUP BY r.department
+    ) AS d ON true
+    WHERE c.guild_id = p_guild_id;
+$$;
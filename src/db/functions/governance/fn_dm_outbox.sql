@@ -0,0 +1,105 @@
+-- Governance DM outbox: persistent queue for rate-limited DM fan-out.
+-- Schema: governance
+--
+-- 投票通知、截止提醒與結果廣播先寫入 dm_outbox，再由 bot 程序內的 DmDispatcher 以
+-- 令牌桶限速、有限並行送出；程序重啟後未送出的列會被重新領取。
+-- 同一 (dedup_key, recipient_id) 只會入列一次，重複呼叫（例如每分鐘的提醒迴圈）不會重複私訊。
+
+-- Enqueue one message for many recipients; returns the number of new rows
+CREATE OR REPLACE FUNCTION governance.fn_enqueue_dm(
+    p_guild_id bigint,
+    p_recipient_ids bigint[],
+    p_dedup_key text,
+    p_payload jsonb
+) RETURNS integer LANGUAGE plpgsql AS $$
+DECLARE
+    v_inserted integer;
+BEGIN
+    INSERT INTO governance.dm_outbox (guild_id, recipient_id, dedup_key, payload)
+    SELECT DISTINCT p_guild_id, r.recipient_id, p_dedup_key, p_payload
+    FROM unnest(p_recipient_ids) AS r(recipient_id)
+    WHERE r.recipient_id IS NOT NULL
+    ON CONFLICT ON CONSTRAINT uq_governance_dm_outbox_dedup DO NOTHING;
+
+    GET DIAGNOSTICS v_inserted = ROW_COUNT;
+    RETURN v_inserted;
+END; $$;
+
+-- Claim a batch of due messages under a lease
+-- 以 FOR UPDATE SKIP LOCKED 領取到期的 pending 列，並將 next_attempt_at 推遲 p_lease_seconds
+-- 作為租約：送出在交易外進行，程序中途結束時租約到期即可被重新領取（至少送達一次）。
+CREATE OR REPLACE FUNCTION governance.fn_claim_dm_outbox(
+    p_limit integer DEFAULT 100,
+    p_lease_seconds integer DEFAULT 300
+)
+RETURNS TABLE (
+    outbox_id bigint,
+    guild_id bigint,
+    recipient_id bigint,
+    payload jsonb,
+    attempts integer
+) LANGUAGE plpgsql AS $$
+DECLARE
+    v_now timestamptz := timezone('utc', clock_timestamp());
+BEGIN
+    RETURN QUERY
+    WITH due AS (
+        SELECT o.outbox_id
+        FROM governance.dm_outbox AS o
+        WHERE o.status = 'pending' AND o.next_attempt_at <= v_now
+        ORDER BY o.next_attempt_at, o.outbox_id
+        LIMIT p_limit
+        FOR UPDATE SKIP LOCKED
+    )
+    UPDATE governance.dm_outbox AS o
+    SET attempts = o.attempts + 1,
+        next_attempt_at = v_now + make_interval(secs => p_lease_seconds)
+    FROM due
+    WHERE o.outbox_id = due.outbox_id
+    RETURNING o.outbox_id, o.guild_id, o.recipient_id, o.payload, o.attempts;
+END; $$;
+
+-- Mark delivered messages
+CREATE OR REPLACE FUNCTION governance.fn_complete_dm_outbox(p_outbox_ids bigint[])
+RETURNS integer LANGUAGE plpgsql AS $$
+DECLARE
+    v_updated integer;
+BEGIN
+    UPDATE governance.dm_outbox AS o
+    SET status = 'sent',
+        sent_at = timezone('utc', clock_timestamp()),
+        last_error = NULL
+    WHERE o.outbox_id = ANY(p_outbox_ids) AND o.status = 'pending';
+
+    GET DIAGNOSTICS v_updated = ROW_COUNT;
+    RETURN v_updated;
+END; $$;
+
+-- Reschedule a failed send, or give up on it
+CREATE OR REPLACE FUNCTION governance.fn_defer_dm_outbox(
+    p_outbox_id bigint,
+    p_error text,
+    p_retry_seconds double precision,
+    p_give_up boolean DEFAULT false
+) RETURNS void LANGUAGE plpgsql AS $$
+BEGIN
+    UPDATE governance.dm_outbox AS o
+    SET status = CASE WHEN p_give_up THEN 'failed' ELSE 'pending' END,
+        last_error = left(p_error, 500),
+        next_attempt_at = timezone('utc', clock_timestamp())
+            + make_interval(secs => greatest(p_retry_seconds, 0))
+    WHERE o.outbox_id = p_outbox_id AND o.status = 'pending';
+END; $$;
+
+-- Drop finished rows older than the cut-off (keeps the dedup window bounded)
+CREATE OR REPLACE FUNCTION governance.fn_prune_dm_outbox(p_before timestamptz)
+RETURNS integer LANGUAGE plpgsql AS $$
+DECLARE
+    v_deleted integer;
+BEGIN
+    DELETE FROM governance.dm_outbox AS o
+    WHERE o.status IN ('sent', 'failed') AND o.created_at < p_before;
+
+    GET DIAGNOSTICS v_deleted = ROW_COUNT;
+    RETURN v_deleted;
+END; $$;
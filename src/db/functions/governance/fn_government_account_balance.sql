@@ -0,0 +1,27 @@
+-- Project economy ledger balances onto governance.government_accounts.balance.
+--
+-- 政府帳戶餘額以經濟帳本為準：帳本列（is_government = true）的 current_balance
+-- 一有變動，即在同一交易內寫入治理層，listener 與服務層不必再逐筆回寫。
+-- 只在餘額實際變動時觸發；新建帳本列（餘額 0）不覆寫治理層既有餘額。
+CREATE OR REPLACE FUNCTION governance.fn_project_government_account_balance()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    UPDATE governance.government_accounts AS ga
+    SET balance = NEW.current_balance,
+        updated_at = timezone('utc', clock_timestamp())
+    WHERE ga.guild_id = NEW.guild_id
+      AND ga.account_id = NEW.member_id
+      AND ga.balance IS DISTINCT FROM NEW.current_balance;
+
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trigger_government_account_balance ON economy.guild_member_balances;
+CREATE TRIGGER trigger_government_account_balance
+    AFTER UPDATE OF current_balance ON economy.guild_member_balances
+    FOR EACH ROW
+    WHEN (NEW.is_government AND NEW.current_balance IS DISTINCT FROM OLD.current_balance)
+    EXECUTE FUNCTION governance.fn_project_government_account_balance();
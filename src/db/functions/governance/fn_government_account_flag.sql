@@ -0,0 +1,44 @@
+-- Keep economy.guild_member_balances.is_government in sync with governance.government_accounts.
+--
+-- 轉帳與事件池檢查以帳本列上的 is_government 旗標判斷是否免除冷卻／每日上限，
+-- 旗標與帳本列一同鎖定、讀取，不必再對 government_accounts 做 EXISTS 查詢。
+-- 政府帳戶建立時一併確保帳本列存在；刪除或更換 account_id 時清除舊列的旗標。
+CREATE OR REPLACE FUNCTION governance.fn_sync_government_account_flag()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE economy.guild_member_balances AS b
+        SET is_government = false
+        WHERE b.guild_id = OLD.guild_id
+          AND b.member_id = OLD.account_id
+          AND b.is_government
+          AND NOT EXISTS (
+                SELECT 1
+                FROM governance.government_accounts ga
+                WHERE ga.guild_id = OLD.guild_id AND ga.account_id = OLD.account_id
+          );
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO economy.guild_member_balances AS b (
+            guild_id, member_id, current_balance, is_government
+        )
+        VALUES (NEW.guild_id, NEW.account_id, 0, true)
+        ON CONFLICT (guild_id, member_id)
+        DO UPDATE SET is_government = true
+        WHERE NOT b.is_government;
+    END IF;
+
+    RETURN NULL;
+END;
+$$;
+
+-- 餘額同步（balance / updated_at）不影響身分，只在帳戶身分欄位異動時觸發
+DROP TRIGGER IF EXISTS trigger_government_account_flag ON governance.government_accounts;
+CREATE TRIGGER trigger_government_account_flag
+    AFTER INSERT OR DELETE OR UPDATE OF account_id, guild_id
+    ON governance.government_accounts
+    FOR EACH ROW
+    EXECUTE FUNCTION governance.fn_sync_government_account_flag();
@@ -0,0 +1,78 @@
+-- Emit governance_config_changed NOTIFY after writes to per-guild configuration tables.
+--
+-- 程序內的設定快取（src/infra/config_cache.py）依此通知失效；payload 含 guild_id 與 scope
+-- （council / state_council / supreme_assembly / currency），scope 由觸發器參數指定。
+-- 以觸發器實作可涵蓋所有 upsert 函式與直接寫入；同一交易內相同 payload 的 NOTIFY
+-- 會由 PostgreSQL 自動合併，批次寫入不會造成通知風暴。
+CREATE OR REPLACE FUNCTION governance.fn_notify_config_changed()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_guild_id bigint;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        v_guild_id := OLD.guild_id;
+    ELSE
+        v_guild_id := NEW.guild_id;
+    END IF;
+
+    PERFORM pg_notify(
+        'governance_config_changed',
+        jsonb_build_object('guild_id', v_guild_id, 'scope', TG_ARGV[0])::text
+    );
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trigger_council_config_changed ON governance.council_config;
+CREATE TRIGGER trigger_council_config_changed
+    AFTER INSERT OR UPDATE OR DELETE ON governance.council_config
+    FOR EACH ROW
+    EXECUTE FUNCTION governance.fn_notify_config_changed('council');
+
+DROP TRIGGER IF EXISTS trigger_council_role_ids_changed ON governance.council_role_ids;
+CREATE TRIGGER trigger_council_role_ids_changed
+    AFTER INSERT OR UPDATE OR DELETE ON governance.council_role_ids
+    FOR EACH ROW
+    EXECUTE FUNCTION governance.fn_notify_config_changed('council');
+
+DROP TRIGGER IF EXISTS trigger_state_council_config_changed ON governance.state_council_config;
+CREATE TRIGGER trigger_state_council_config_changed
+    AFTER INSERT OR UPDATE OR DELETE ON governance.state_council_config
+    FOR EACH ROW
+    EXECUTE FUNCTION governance.fn_notify_config_changed('state_council');
+
+DROP TRIGGER IF EXISTS trigger_department_configs_changed ON governance.department_configs;
+CREATE TRIGGER trigger_department_configs_changed
+    AFTER INSERT OR UPDATE OR DELETE ON governance.department_configs
+    FOR EACH ROW
+    EXECUTE FUNCTION governance.fn_notify_config_changed('state_council');
+
+DROP TRIGGER IF EXISTS trigger_department_role_ids_changed
+    ON governance.state_council_department_role_ids;
+CREATE TRIGGER trigger_department_role_ids_changed
+    AFTER INSERT OR UPDATE OR DELETE ON governance.state_council_department_role_ids
+    FOR EACH ROW
+    EXECUTE FUNCTION governance.fn_notify_config_changed('state_council');
+
+-- 政府帳戶的身分（帳號與所屬部門）異動；餘額同步更新不觸發
+DROP TRIGGER IF EXISTS trigger_government_accounts_changed ON governance.government_accounts;
+CREATE TRIGGER trigger_government_accounts_changed
+    AFTER INSERT OR DELETE OR UPDATE OF account_id, guild_id, department
+    ON governance.government_accounts
+    FOR EACH ROW
+    EXECUTE FUNCTION governance.fn_notify_config_changed('state_council');
+
+DROP TRIGGER IF EXISTS trigger_supreme_assembly_config_changed
+    ON governance.supreme_assembly_configurations;
+CREATE TRIGGER trigger_supreme_assembly_config_changed
+    AFTER INSERT OR UPDATE OR DELETE ON governance.supreme_assembly_configurations
+    FOR EACH ROW
+    EXECUTE FUNCTION governance.fn_notify_config_changed('supreme_assembly');
+
+DROP TRIGGER IF EXISTS trigger_economy_configurations_changed ON economy.economy_configurations;
+CREATE TRIGGER trigger_economy_configurations_changed
+    AFTER INSERT OR UPDATE OR DELETE ON economy.economy_configurations
+    FOR EACH ROW
+    EXECUTE FUNCTION governance.fn_notify_config_changed('currency');
@@ -0,0 +1,156 @@
+-- 國務院報表聚合：財務摘要、部門指標與活動統計
+--
+-- 報表產生器原本各自取回最多 10,000 筆福利／稅收／身分／發行紀錄，再於 Python
+-- 過濾期間並逐筆加總；資料量一大就同時造成截斷與延遲。以下函式在資料庫端以
+-- (guild_id, 時間) 索引限縮期間後 GROUP BY，只回傳聚合結果。
+--
+-- 期間為閉區間 [p_start, p_end]；日期鍵以 UTC 計算（與原本 strftime 的結果一致）。
+
+CREATE OR REPLACE FUNCTION governance.fn_report_financial_totals(
+    p_guild_id bigint,
+    p_start timestamptz,
+    p_end timestamptz
+)
+RETURNS TABLE (
+    total_welfare_disbursed bigint,
+    total_tax_collected bigint,
+    total_currency_issued bigint
+)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT
+        (SELECT coalesce(sum(w.amount), 0)::bigint
+         FROM governance.welfare_disbursements w
+         WHERE w.guild_id = p_guild_id
+           AND w.disbursed_at BETWEEN p_start AND p_end),
+        (SELECT coalesce(sum(t.tax_amount), 0)::bigint
+         FROM governance.tax_records t
+         WHERE t.guild_id = p_guild_id
+           AND t.collected_at BETWEEN p_start AND p_end),
+        (SELECT coalesce(sum(ci.amount), 0)::bigint
+         FROM governance.currency_issuances ci
+         WHERE ci.guild_id = p_guild_id
+           AND ci.issued_at BETWEEN p_start AND p_end);
+$$;
+
+-- 部門指標：依部門職掌選取對應紀錄（其他分支在規劃時即被常數條件排除）。
+-- 高峰日同數時取較晚的日期；主要操作同數時取最近一次出現者。
+CREATE OR REPLACE FUNCTION governance.fn_report_department_metrics(
+    p_guild_id bigint,
+    p_department text,
+    p_start timestamptz,
+    p_end timestamptz
+)
+RETURNS TABLE (
+    total_operations bigint,
+    total_amount bigint,
+    peak_activity_day text,
+    most_common_operation text
+)
+LANGUAGE sql
+STABLE
+AS $$
+    WITH ops AS (
+        SELECT '福利發放'::text AS operation, w.amount::bigint AS amount, w.disbursed_at AS at
+        FROM governance.welfare_disbursements w
+        WHERE p_department = '內政部'
+          AND w.guild_id = p_guild_id
+          AND w.disbursed_at BETWEEN p_start AND p_end
+        UNION ALL
+        SELECT '稅收徵收', t.tax_amount, t.collected_at
+        FROM governance.tax_records t
+        WHERE p_department = '財政部'
+          AND t.guild_id = p_guild_id
+          AND t.collected_at BETWEEN p_start AND p_end
+        UNION ALL
+        SELECT ir.action, 1, ir.performed_at
+        FROM governance.identity_records ir
+        WHERE p_department = '國土安全部'
+          AND ir.guild_id = p_guild_id
+          AND ir.performed_at BETWEEN p_start AND p_end
+        UNION ALL
+        SELECT '貨幣發行', ci.amount, ci.issued_at
+        FROM governance.currency_issuances ci
+        WHERE p_department = '中央銀行'
+          AND ci.guild_id = p_guild_id
+          AND ci.issued_at BETWEEN p_start AND p_end
+    )
+    SELECT
+        (SELECT count(*) FROM ops),
+        (SELECT coalesce(sum(o.amount), 0)::bigint FROM ops o),
+        (SELECT to_char(timezone('UTC', o.at), 'YYYY-MM-DD') AS day
+         FROM ops o
+         GROUP BY 1
+         ORDER BY count(*) DESC, 1 DESC
+         LIMIT 1),
+        (SELECT o.operation
+         FROM ops o
+         GROUP BY o.operation
+         ORDER BY count(*) DESC, max(o.at) DESC
+         LIMIT 1);
+$$;
+
+-- 活動統計：以 (section, label, operations) 列回傳
+--   operation    各操作類型次數（label 為類型名稱）
+--   day          每日操作次數（label 為 YYYY-MM-DD）
+--   performer    操作次數前 p_top_limit 名的使用者（label 為使用者 ID）
+--   unique_users 參與使用者數（label 為 NULL）
+-- 使用者依類型對應：福利為受領人、稅收為納稅人、身分為對象、發行為執行者。
+CREATE OR REPLACE FUNCTION governance.fn_report_activity(
+    p_guild_id bigint,
+    p_start timestamptz,
+    p_end timestamptz,
+    p_top_limit integer DEFAULT 10
+)
+RETURNS TABLE (
+    section text,
+    label text,
+    operations bigint
+)
+LANGUAGE sql
+STABLE
+AS $$
+    WITH ops AS (
+        SELECT '福利發放'::text AS operation, w.recipient_id AS user_id, w.disbursed_at AS at
+        FROM governance.welfare_disbursements w
+        WHERE w.guild_id = p_guild_id
+          AND w.disbursed_at BETWEEN p_start AND p_end
+        UNION ALL
+        SELECT '稅收徵收', t.taxpayer_id, t.collected_at
+        FROM governance.tax_records t
+        WHERE t.guild_id = p_guild_id
+          AND t.collected_at BETWEEN p_start AND p_end
+        UNION ALL
+        SELECT '身分管理', ir.target_id, ir.performed_at
+        FROM governance.identity_records ir
+        WHERE ir.guild_id = p_guild_id
+          AND ir.performed_at BETWEEN p_start AND p_end
+        UNION ALL
+        SELECT '貨幣發行', ci.performed_by, ci.issued_at
+        FROM governance.currency_issuances ci
+        WHERE ci.guild_id = p_guild_id
+          AND ci.issued_at BETWEEN p_start AND p_end
+    ),
+    per_user AS (
+        SELECT o.user_id,
+               count(*) AS operations,
+               row_number() OVER (ORDER BY count(*) DESC, o.user_id) AS rank
+        FROM ops o
+        GROUP BY o.user_id
+    )
+    SELECT 'operation'::text, o.operation, count(*)
+    FROM ops o
+    GROUP BY o.operation
+    UNION ALL
+    SELECT 'day', to_char(timezone('UTC', o.at), 'YYYY-MM-DD'), count(*)
+    FROM ops o
+    GROUP BY 2
+    UNION ALL
+    SELECT 'performer', pu.user_id::text, pu.operations
+    FROM per_user pu
+    WHERE pu.rank <= p_top_limit
+    UNION ALL
+    SELECT 'unique_users', NULL, count(*)
+    FROM per_user;
+$$;
@@ -0,0 +1,48 @@
+-- 國務院總覽：一次取回各部門餘額與統計
+--
+-- 餘額以經濟帳本為準（無帳本列時沿用治理層餘額）；福利、稅收、身分紀錄與
+-- 當月發行量以 guild 範圍的聚合計算，並依部門職掌分派（與原本服務層的判斷一致）。
+-- 聚合只讀取涵蓋索引，不再把紀錄逐筆載入應用程式加總。
+CREATE OR REPLACE FUNCTION governance.fn_state_council_summary(
+    p_guild_id bigint,
+    p_month_period text
+)
+RETURNS TABLE (
+    department text,
+    balance bigint,
+    total_welfare_disbursed bigint,
+    total_tax_collected bigint,
+    identity_actions_count bigint,
+    currency_issued bigint
+)
+LANGUAGE sql
+STABLE
+AS $$
+    WITH totals AS (
+        SELECT
+            (SELECT coalesce(sum(w.amount), 0)::bigint
+             FROM governance.welfare_disbursements w
+             WHERE w.guild_id = p_guild_id) AS welfare_total,
+            (SELECT coalesce(sum(t.tax_amount), 0)::bigint
+             FROM governance.tax_records t
+             WHERE t.guild_id = p_guild_id) AS tax_total,
+            (SELECT count(*)
+             FROM governance.identity_records ir
+             WHERE ir.guild_id = p_guild_id) AS identity_count,
+            (SELECT coalesce(sum(ci.amount), 0)::bigint
+             FROM governance.currency_issuances ci
+             WHERE ci.guild_id = p_guild_id AND ci.month_period = p_month_period) AS issued_total
+    )
+    SELECT ga.department,
+           coalesce(b.current_balance, ga.balance)::bigint,
+           CASE WHEN ga.department = '內政部' THEN tt.welfare_total ELSE 0 END,
+           CASE WHEN ga.department = '財政部' THEN tt.tax_total ELSE 0 END,
+           CASE WHEN ga.department = '國土安全部' THEN tt.identity_count ELSE 0 END,
+           CASE WHEN ga.department = '中央銀行' THEN tt.issued_total ELSE 0 END
+    FROM governance.government_accounts ga
+    LEFT JOIN economy.guild_member_balances b
+           ON b.guild_id = ga.guild_id AND b.member_id = ga.account_id
+    CROSS JOIN totals tt
+    WHERE ga.guild_id = p_guild_id
+    ORDER BY ga.department;
+$$;
@@ -0,0 +1,107 @@
+-- Supreme Assembly voting: counters on the proposal row and single round-trip casting.
+-- Schema: governance
+--
+-- 最高人民會議的選票不可更改：已投票者再次投票不寫入也不變更計數。
+-- 計數欄（approve_count / reject_count / abstain_count / total_voted）由本檔函式在
+-- 提案列鎖下與 supreme_assembly_votes 同步維護，讀取票數不再需要 GROUP BY。
+
+-- Record a vote; returns false when the voter has already voted
+CREATE OR REPLACE FUNCTION governance.fn_record_supreme_assembly_vote(
+    p_proposal_id uuid,
+    p_voter_id bigint,
+    p_choice text
+) RETURNS boolean LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM 1 FROM governance.supreme_assembly_proposals AS p
+    WHERE p.proposal_id = p_proposal_id
+    FOR UPDATE;
+
+    INSERT INTO governance.supreme_assembly_votes (proposal_id, voter_id, choice)
+    VALUES (p_proposal_id, p_voter_id, p_choice)
+    ON CONFLICT ON CONSTRAINT pk_governance_sa_votes DO NOTHING;
+
+    IF NOT FOUND THEN
+        RETURN false;
+    END IF;
+
+    UPDATE governance.supreme_assembly_proposals AS p
+    SET approve_count = p.approve_count + CASE WHEN p_choice = 'approve' THEN 1 ELSE 0 END,
+        reject_count = p.reject_count + CASE WHEN p_choice = 'reject' THEN 1 ELSE 0 END,
+        abstain_count = p.abstain_count + CASE WHEN p_choice = 'abstain' THEN 1 ELSE 0 END,
+        total_voted = p.total_voted + 1
+    WHERE p.proposal_id = p_proposal_id;
+    RETURN true;
+END; $$;
+
+-- Cast a vote in one round trip
+-- 鎖定提案 → 以主鍵探測快照名單 → 寫入選票與計數 → 依門檻判定通過／否決，回傳投票後的
+-- 提案與票數。outcome：voted / duplicate（已投過票）/ closed / not_in_snapshot / not_found。
+CREATE OR REPLACE FUNCTION governance.fn_cast_supreme_assembly_vote(
+    p_proposal_id uuid,
+    p_voter_id bigint,
+    p_choice text
+)
+RETURNS TABLE (
+    outcome text,
+    proposal_id uuid,
+    guild_id bigint,
+    proposer_id bigint,
+    title text,
+    description text,
+    snapshot_n integer,
+    threshold_t integer,
+    deadline_at timestamptz,
+    status text,
+    reminder_sent boolean,
+    created_at timestamptz,
+    updated_at timestamptz,
+    approve integer,
+    reject integer,
+    abstain integer,
+    total_voted integer
+) LANGUAGE plpgsql AS $$
+DECLARE
+    v_status text;
+    v_outcome text := 'voted';
+BEGIN
+    SELECT p.status INTO v_status
+    FROM governance.supreme_assembly_proposals AS p
+    WHERE p.proposal_id = p_proposal_id
+    FOR UPDATE;
+
+    IF NOT FOUND THEN
+        outcome := 'not_found';
+        RETURN NEXT;
+        RETURN;
+    END IF;
+
+    IF v_status <> '進行中' THEN
+        v_outcome := 'closed';
+    ELSIF NOT EXISTS (
+        SELECT 1
+        FROM governance.supreme_assembly_proposal_snapshots AS s
+        WHERE s.proposal_id = p_proposal_id AND s.member_id = p_voter_id
+    ) THEN
+        v_outcome := 'not_in_snapshot';
+    ELSIF NOT governance.fn_record_supreme_assembly_vote(p_proposal_id, p_voter_id, p_choice) THEN
+        v_outcome := 'duplicate';
+    ELSE
+        -- 達門檻即通過；即使其餘未投票者全數贊成也無法達門檻則提前否決
+        UPDATE governance.supreme_assembly_proposals AS p
+        SET status = CASE WHEN p.approve_count >= p.threshold_t THEN '已通過' ELSE '已否決' END,
+            updated_at = timezone('utc', clock_timestamp())
+        WHERE p.proposal_id = p_proposal_id
+          AND (
+              p.approve_count >= p.threshold_t
+              OR p.approve_count + greatest(p.snapshot_n - p.total_voted, 0) < p.threshold_t
+          );
+    END IF;
+
+    RETURN QUERY
+    SELECT v_outcome, p.proposal_id, p.guild_id, p.proposer_id, p.title, p.description,
+           p.snapshot_n, p.threshold_t, p.deadline_at, p.status, p.reminder_sent,
+           p.created_at, p.updated_at,
+           p.approve_count, p.reject_count, p.abstain_count, p.total_voted
+    FROM governance.supreme_assembly_proposals AS p
+    WHERE p.proposal_id = p_proposal_id;
+END; $$;
@@ -4,16 +4,8 @@ RETURNS trigger
 LANGUAGE plpgsql
 AS $$
 BEGIN
-    -- Update status to checking
-    UPDATE economy.pending_transfers
-    SET status = 'checking',
-        updated_at = timezone('utc', clock_timestamp())
-    WHERE transfer_id = NEW.transfer_id;
-
-    -- Trigger async checks
-    PERFORM economy.fn_check_transfer_balance(NEW.transfer_id);
-    PERFORM economy.fn_check_transfer_cooldown(NEW.transfer_id);
-    PERFORM economy.fn_check_transfer_daily_limit(NEW.transfer_id);
+    -- 單次評估三項檢查：寫入 checks 並在全數通過時直接核准（同時將狀態轉為 checking/approved）
+    PERFORM economy.fn_evaluate_pending_transfer(NEW.transfer_id);
 
     RETURN NEW;
 END;
@@ -277,6 +277,26 @@ class CouncilGovernanceGateway:
         assert row is not None
         return _tally_from_row(row)
 
+    async def cast_vote(
+        self,
+        connection: ConnectionProtocol,
+        *,
+        proposal_id: UUID,
+        voter_id: int,
+        choice: str,
+    ) -> tuple[str, Proposal | None, Tally]:
+        """單次往返完成投票：快照檢查、寫入選票與計數、門檻判定。
+
+        回傳 (outcome, 投票後的提案, 票數)；outcome 為 voted / closed /
+        not_in_snapshot / not_found（not_found 時提案為 None、票數為 0）。
+        """
+        row = await connection.fetchrow(
+            f"SELECT * FROM {self._schema}.fn_cast_vote($1,$2,$3)", proposal_id, voter_id, choice
+        )
+        if row is None or row["proposal_id"] is None:
+            return "not_found", None, Tally(approve=0, reject=0, abstain=0, total_voted=0)
+        return str(row["outcome"]), _proposal_from_row(row), _tally_from_row(row)
+
     async def fetch_votes_detail(
         self, connection: ConnectionProtocol, *, proposal_id: UUID
     ) -> Sequence[tuple[int, str]]:
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Mapping, Sequence, cast
+
+from src.infra.types.db import ConnectionProtocol
+
+
+class DmOutboxGateway:
+    """Gateway for the governance DM outbox (see `fn_dm_outbox.sql`)."""
+
+    def __init__(self, *, schema: str = "governance") -> None:
+        self._schema = schema
+
+    async def enqueue(
+        self,
+        connection: ConnectionProtocol,
+        *,
+        guild_id: int,
+        recipient_ids: Sequence[int],
+        dedup_key: str,
+        payload: Mapping[str, Any],
+    ) -> int:
+        """Queue one message for each recipient; returns rows not already queued."""
+        sql = f"SELECT {self._schema}.fn_enqueue_dm($1, $2, $3, $4)"
+        inserted = await connection.fetchval(
+            sql, guild_id, [int(r) for r in recipient_ids], dedup_key, dict(payload)
+        )
+        return int(inserted or 0)
+
+    async def claim(
+        self,
+        connection: ConnectionProtocol,
+        *,
+        limit: int = 100,
+        lease_seconds: int = 300,
+    ) -> list[Mapping[str, Any]]:
+        """Claim due messages (SKIP LOCKED) under a lease; no transaction required."""
+        sql = f"SELECT * FROM {self._schema}.fn_claim_dm_outbox($1, $2)"
+        records = await connection.fetch(sql, limit, lease_seconds)
+        return [cast(Mapping[str, Any], record) for record in records]
+
+    async def mark_sent(self, connection: ConnectionProtocol, *, outbox_ids: Sequence[int]) -> int:
+        sql = f"SELECT {self._schema}.fn_complete_dm_outbox($1)"
+        updated = await connection.fetchval(sql, list(outbox_ids))
+        return int(updated or 0)
+
+    async def defer(
+        self,
+        connection: ConnectionProtocol,
+        *,
+        outbox_id: int,
+        error: str,
+        retry_after: float,
+        give_up: bool = False,
+    ) -> None:
+        sql = f"SELECT {self._schema}.fn_defer_dm_outbox($1, $2, $3, $4)"
+        await connection.execute(sql, outbox_id, error, float(retry_after), give_up)
+
+    async def prune(self, connection: ConnectionProtocol, *, before: datetime) -> int:
+        sql = f"SELECT {self._schema}.fn_prune_dm_outbox($1)"
+        deleted = await connection.fetchval(sql, before)
+        return int(deleted or 0)
+
+
+__all__ = ["DmOutboxGateway"]
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Sequence
+
+from src.infra.result import DatabaseError, async_returns_result
+from src.infra.types.db import ConnectionProtocol as AsyncPGConnectionProto
+
+
+class EconomyPartitionGateway:
+    """Gateway wrapper around currency_transactions retention maintenance functions."""
+
+    def __init__(self, *, schema: str = "economy") -> None:
+        self._schema = schema
+
+    @async_returns_result(DatabaseError)
+    async def ensure_transaction_partitions(
+        self,
+        connection: AsyncPGConnectionProto,
+        *,
+        months_ahead: int,
+    ) -> int:
+        """建立本月起至 `months_ahead` 個月後的月分區，回傳新建的分區數量。"""
+        sql = f"SELECT {self._schema}.fn_ensure_transaction_partitions($1)"
+        created = await connection.fetchval(sql, months_ahead)
+        return int(created or 0)
+
+    @async_returns_result(DatabaseError)
+    async def archive_transaction_partitions(
+        self,
+        connection: AsyncPGConnectionProto,
+        *,
+        retention: timedelta,
+    ) -> Sequence[str]:
+        """將整月皆超過保留期限的分區移至 archive，回傳被移動的分區名稱。"""
+        sql = f"SELECT * FROM {self._schema}.fn_archive_transaction_partitions($1)"
+        records = await connection.fetch(sql, retention)
+        return [str(record[0]) for record in records]
+
+    @async_returns_result(DatabaseError)
+    async def prune_daily_transfer_totals(
+        self,
+        connection: AsyncPGConnectionProto,
+        *,
+        before: date,
+    ) -> int:
+        """刪除 `before` 之前的每日轉出累計，回傳刪除列數。"""
+        sql = f"SELECT {self._schema}.fn_prune_daily_transfer_totals($1)"
+        deleted = await connection.fetchval(sql, before)
+        return int(deleted or 0)
+
+
+__all__ = ["EconomyPartitionGateway"]
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 # noqa: D104
 from datetime import datetime
-from typing import Any
+from typing import Any, Mapping, cast
 from uuid import UUID
 
 from src.cython_ext.pending_transfer_models import (
@@ -87,6 +87,74 @@ class PendingTransferGateway:
         # Function returns void, so we use execute
         await connection.execute(sql, transfer_id, new_status)
 
+    async def schedule_retry(
+        self,
+        connection: ConnectionProtocol,
+        *,
+        transfer_id: UUID,
+        max_delay_seconds: int = 300,
+    ) -> datetime | None:
+        """Persist the next retry time; returns None when a retry is already scheduled."""
+        sql = f"SELECT {self._schema}.fn_schedule_pending_transfer_retry($1, $2)"
+        result = await connection.fetchval(sql, transfer_id, max_delay_seconds)
+        return cast(datetime | None, result)
+
+    async def claim_due_retries(
+        self,
+        connection: ConnectionProtocol,
+        *,
+        limit: int = 100,
+    ) -> list[UUID]:
+        """Claim due retries (FOR UPDATE SKIP LOCKED); call inside a transaction."""
+        sql = f"SELECT * FROM {self._schema}.fn_claim_due_pending_transfer_retries($1)"
+        records = await connection.fetch(sql, limit)
+        return [UUID(str(record[0])) for record in records]
+
+    async def claim_approved(
+        self,
+        connection: ConnectionProtocol,
+        *,
+        limit: int = 50,
+    ) -> list[Mapping[str, Any]]:
+        """Claim approved transfers (FOR UPDATE SKIP LOCKED); call inside a transaction."""
+        sql = f"SELECT * FROM {self._schema}.fn_claim_approved_pending_transfers($1)"
+        records = await connection.fetch(sql, limit)
+        return [cast(Mapping[str, Any], record) for record in records]
+
+    async def expire_pending_transfers(
+        self,
+        connection: ConnectionProtocol,
+        *,
+        limit: int = 1000,
+    ) -> list[UUID]:
+        """Reject up to `limit` expired transfers and emit their denial events."""
+        sql = f"SELECT * FROM {self._schema}.fn_expire_pending_transfers($1)"
+        records = await connection.fetch(sql, limit)
+        return [UUID(str(record[0])) for record in records]
+
+    async def list_approved(
+        self,
+        connection: ConnectionProtocol,
+        *,
+        limit: int = 500,
+    ) -> list[UUID]:
+        """List approved transfers that have not been executed yet (oldest first)."""
+        sql = f"SELECT * FROM {self._schema}.fn_list_approved_pending_transfers($1)"
+        records = await connection.fetch(sql, limit)
+        return [UUID(str(record[0])) for record in records]
+
+    async def evaluate_transfers(
+        self,
+        connection: ConnectionProtocol,
+        *,
+        transfer_ids: list[UUID],
+    ) -> None:
+        """Re-run the consolidated checks for the given transfers."""
+        sql = (
+            f"SELECT {self._schema}.fn_evaluate_pending_transfer(t) " "FROM unnest($1::uuid[]) AS t"
+        )
+        await connection.execute(sql, transfer_ids)
+
     # --- Result-based wrappers ---
 
     @async_returns_result(DatabaseError)
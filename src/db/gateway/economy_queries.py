@@ -66,6 +66,7 @@ class EconomyQueryGateway:
         guild_id: int,
         member_id: int,
     ) -> BalanceRecord:
+        """純讀取餘額；尚無帳本列的成員回傳零餘額（不會建立帳本列）。"""
         sql = f"SELECT * FROM {self._schema}.fn_get_balance($1, $2)"
         record = await connection.fetchrow(sql, guild_id, member_id)
         if record is None:
@@ -80,7 +81,7 @@ class EconomyQueryGateway:
         guild_id: int,
         member_id: int,
     ) -> BalanceRecord | None:
-        """Read-only balance query that skips fn_get_balance side effects."""
+        """Read-only balance query that returns None when the member has no ledger row."""
         sql = f"""
             SELECT
                 guild_id,
@@ -105,12 +106,29 @@ class EconomyQueryGateway:
         member_id: int,
         limit: int,
         cursor: datetime | None,
+        cursor_transaction_id: UUID | None = None,
     ) -> Sequence[HistoryRecord]:
-        sql = f"SELECT * FROM {self._schema}.fn_get_history($1, $2, $3, $4)"
+        """Return up to `limit + 1` rows; the extra row only signals that a next page exists."""
+        sql = f"SELECT * FROM {self._schema}.fn_get_member_history($1, $2, $3, $4, $5)"
         records = cast(
-            list[Mapping[str, Any]], await connection.fetch(sql, guild_id, member_id, limit, cursor)
+            list[Mapping[str, Any]],
+            await connection.fetch(sql, guild_id, member_id, limit, cursor, cursor_transaction_id),
         )
         return [_history_from_record(record) for record in records]
 
+    @async_returns_result(DatabaseError)
+    async def fetch_events_since(
+        self,
+        connection: AsyncPGConnectionProto,
+        *,
+        since: datetime,
+        after_transaction_id: UUID | None = None,
+        limit: int = 500,
+    ) -> Sequence[Mapping[str, Any]]:
+        """Replay committed transactions as economy_events payloads (keyset-paged)."""
+        sql = f"SELECT * FROM {self._schema}.fn_list_economy_events_since($1, $2, $3)"
+        records = await connection.fetch(sql, since, after_transaction_id, limit)
+        return cast(list[Mapping[str, Any]], records)
+
 
 __all__ = ["BalanceRecord", "EconomyQueryGateway", "HistoryRecord"]
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 # noqa: D104
-from typing import Any
+from typing import Any, Mapping, Sequence
 
 from src.cython_ext.economy_transfer_models import (
     TransferProcedureResult,
@@ -40,3 +40,34 @@ class EconomyTransferGateway:
         if record is None:
             raise RuntimeError("fn_transfer_currency returned no result.")
         return build_transfer_procedure_result(record)
+
+    @async_returns_result(DatabaseError, exception_map={RuntimeError: DatabaseError})
+    async def transfer_currency_batch(
+        self,
+        connection: ConnectionProtocol,
+        *,
+        guild_id: int,
+        transfers: Sequence[Mapping[str, Any]],
+    ) -> list[TransferProcedureResult]:
+        """Apply several same-guild transfers in a single round-trip.
+
+        每筆 `transfers` 項目需包含 initiator_id/target_id/amount，可選 metadata；
+        回傳結果與輸入順序一致。任一筆失敗時整批由資料庫端拋錯。
+        """
+        payload = [
+            {
+                "initiator_id": int(item["initiator_id"]),
+                "target_id": int(item["target_id"]),
+                "amount": int(item["amount"]),
+                "metadata": dict(item.get("metadata") or {}),
+            }
+            for item in transfers
+        ]
+        sql = f"SELECT * FROM {self._schema}.fn_transfer_currency_batch($1, $2)"
+        records = await connection.fetch(sql, guild_id, payload)
+        if len(records) != len(payload):
+            raise RuntimeError(
+                "fn_transfer_currency_batch returned "
+                f"{len(records)} results for {len(payload)} transfers."
+            )
+        return [build_transfer_procedure_result(record) for record in records]
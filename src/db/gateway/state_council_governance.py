@@ -6,6 +6,7 @@ from typing import Any, Sequence, cast
 from src.cython_ext.state_council_models import (
     CurrencyIssuance,
     DepartmentConfig,
+    DepartmentPermissionMap,
     DepartmentRoleConfig,
     DepartmentStats,
     GovernmentAccount,
@@ -682,6 +683,30 @@ class StateCouncilGovernanceGateway:
             return []
         return [int(role_id) for role_id in role_ids]
 
+    async def fetch_department_permission_map(
+        self, connection: ConnectionProtocol, *, guild_id: int
+    ) -> DepartmentPermissionMap | None:
+        """以單一查詢取得領袖設定與所有部門身分組；未完成國務院設定時回傳 None。"""
+        rows = await connection.fetch(
+            f"SELECT * FROM {self._schema}.fn_get_department_permission_map($1)",
+            guild_id,
+        )
+        if not rows:
+            return None
+        department_role_ids: dict[str, list[int]] = {}
+        for row in rows:
+            department = row["department"]
+            if department is None:
+                continue
+            department_role_ids[str(department)] = [int(r) for r in row["role_ids"] or ()]
+        first = rows[0]
+        return DepartmentPermissionMap(
+            guild_id=guild_id,
+            leader_id=first["leader_id"],
+            leader_role_id=first["leader_role_id"],
+            department_role_ids=department_role_ids,
+        )
+
     async def list_department_role_configs(
         self, connection: ConnectionProtocol, *, guild_id: int
     ) -> Sequence[DepartmentRoleConfig]:
@@ -1008,6 +1033,96 @@ class StateCouncilGovernanceGateway:
             currency_issued=0,
         )
 
+    async def fetch_all_department_stats(
+        self, connection: ConnectionProtocol, *, guild_id: int, month_period: str
+    ) -> Sequence[DepartmentStats]:
+        """一次取回各部門餘額與福利／稅收／身分紀錄／當月發行統計。"""
+        rows = await connection.fetch(
+            f"SELECT * FROM {self._schema}.fn_state_council_summary($1,$2)",
+            guild_id,
+            month_period,
+        )
+        return [
+            DepartmentStats(
+                department=row["department"],
+                balance=int(row["balance"]),
+                total_welfare_disbursed=int(row["total_welfare_disbursed"]),
+                total_tax_collected=int(row["total_tax_collected"]),
+                identity_actions_count=int(row["identity_actions_count"]),
+                currency_issued=int(row["currency_issued"]),
+            )
+            for row in rows
+        ]
+
+    # --- Report Aggregates ---
+    async def fetch_report_financial_totals(
+        self,
+        connection: ConnectionProtocol,
+        *,
+        guild_id: int,
+        start: datetime,
+        end: datetime,
+    ) -> tuple[int, int, int]:
+        """回傳期間內的 (福利發放總額, 稅收總額, 貨幣發行總額)。"""
+        row = await connection.fetchrow(
+            f"SELECT * FROM {self._schema}.fn_report_financial_totals($1,$2,$3)",
+            guild_id,
+            start,
+            end,
+        )
+        if row is None:
+            return 0, 0, 0
+        return (
+            int(row["total_welfare_disbursed"]),
+            int(row["total_tax_collected"]),
+            int(row["total_currency_issued"]),
+        )
+
+    async def fetch_report_department_metrics(
+        self,
+        connection: ConnectionProtocol,
+        *,
+        guild_id: int,
+        department: str,
+        start: datetime,
+        end: datetime,
+    ) -> tuple[int, int, str | None, str | None]:
+        """回傳期間內的 (操作數, 總金額, 高峰日, 主要操作)；無紀錄時後兩者為 None。"""
+        row = await connection.fetchrow(
+            f"SELECT * FROM {self._schema}.fn_report_department_metrics($1,$2,$3,$4)",
+            guild_id,
+            department,
+            start,
+            end,
+        )
+        if row is None:
+            return 0, 0, None, None
+        return (
+            int(row["total_operations"]),
+            int(row["total_amount"]),
+            row["peak_activity_day"],
+            row["most_common_operation"],
+        )
+
+    async def fetch_report_activity(
+        self,
+        connection: ConnectionProtocol,
+        *,
+        guild_id: int,
+        start: datetime,
+        end: datetime,
+        top_limit: int = 10,
+    ) -> Sequence[tuple[str, str | None, int]]:
+        """回傳活動統計的 (section, label, operations) 列，section 定義見 SQL 函式。"""
+        rows = await connection.fetch(
+            f"SELECT * FROM {self._schema}.fn_report_activity($1,$2,$3,$4)",
+            guild_id,
+            start,
+            end,
+            top_limit,
+        )
+        return [(row["section"], row["label"], int(row["operations"])) for row in rows]
+
     # --- Permission Methods for Service ---
     async def fetch_member_roles(
         self, connection: ConnectionProtocol, *, guild_id: int, member_id: int
@@ -1024,6 +1139,7 @@ __all__ = [
     "StateCouncilConfig",
     "DepartmentConfig",
     "DepartmentRoleConfig",
+    "DepartmentStats",
     "GovernmentAccount",
     "WelfareDisbursement",
     "TaxRecord",
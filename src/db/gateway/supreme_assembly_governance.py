@@ -296,35 +296,43 @@ class SupremeAssemblyGovernanceGateway:
         choice: str,
     ) -> None:
         # Note: For supreme assembly, votes are immutable - if vote exists, raise error
-        # Check if vote already exists
-        check_sql = f"""
-            SELECT 1 FROM {self._schema}.supreme_assembly_votes
-            WHERE proposal_id = $1 AND voter_id = $2
-        """
-        exists: bool = (await connection.fetchval(check_sql, proposal_id, voter_id)) is not None
-        if exists:
+        # 寫入與計數更新由資料庫函式在提案列鎖下一次完成（ON CONFLICT 取代先查再寫）
+        sql = f"SELECT {self._schema}.fn_record_supreme_assembly_vote($1, $2, $3)"
+        recorded = bool(await connection.fetchval(sql, proposal_id, voter_id, choice))
+        if not recorded:
             raise RuntimeError("Vote already exists and cannot be changed")
 
-        insert_sql = f"""
-            INSERT INTO {self._schema}.supreme_assembly_votes (proposal_id, voter_id, choice)
-            VALUES ($1, $2, $3)
+    async def cast_vote(
+        self,
+        connection: AsyncPGConnectionProto,
+        *,
+        proposal_id: UUID,
+        voter_id: int,
+        choice: str,
+    ) -> tuple[str, Proposal | None, Tally]:
+        """單次往返完成投票：快照檢查、寫入選票與計數、門檻判定。
+
+        回傳 (outcome, 投票後的提案, 票數)；outcome 為 voted / duplicate / closed /
+        not_in_snapshot / not_found（not_found 時提案為 None、票數為 0）。
         """
-        await connection.execute(insert_sql, proposal_id, voter_id, choice)
+        sql = f"SELECT * FROM {self._schema}.fn_cast_supreme_assembly_vote($1, $2, $3)"
+        row: Mapping[str, Any] | None = await connection.fetchrow(
+            sql, proposal_id, voter_id, choice
+        )
+        if row is None or row["proposal_id"] is None:
+            return "not_found", None, Tally(approve=0, reject=0, abstain=0, total_voted=0)
+        return str(row["outcome"]), _proposal_from_row(row), _tally_from_row(row)
 
     async def fetch_tally(self, connection: AsyncPGConnectionProto, *, proposal_id: UUID) -> Tally:
+        # 讀取投票函式維護的計數欄；不存在的提案回傳全 0
         sql = f"""
-            WITH counts AS (
-                SELECT choice, COUNT(*)::int AS c
-                FROM {self._schema}.supreme_assembly_votes
-                WHERE proposal_id = $1
-                GROUP BY choice
-            )
             SELECT
-                COALESCE(MAX(CASE WHEN choice = 'approve' THEN c END), 0) AS approve,
-                COALESCE(MAX(CASE WHEN choice = 'reject' THEN c END), 0) AS reject,
-                COALESCE(MAX(CASE WHEN choice = 'abstain' THEN c END), 0) AS abstain,
-                COALESCE(SUM(c)::int, 0) AS total_voted
-            FROM counts
+                COALESCE(p.approve_count, 0) AS approve,
+                COALESCE(p.reject_count, 0) AS reject,
+                COALESCE(p.abstain_count, 0) AS abstain,
+                COALESCE(p.total_voted, 0) AS total_voted
+            FROM (SELECT 1) AS one
+            LEFT JOIN {self._schema}.supreme_assembly_proposals AS p ON p.proposal_id = $1
         """
         row: Mapping[str, Any] | None = await connection.fetchrow(sql, proposal_id)
         assert row is not None
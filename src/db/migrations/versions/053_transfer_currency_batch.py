@@ -0,0 +1,35 @@
+"""Install batched transfer procedure fn_transfer_currency_batch.
+
+Adds `economy.fn_transfer_currency_batch(guild_id, transfers jsonb)` which
+applies N same-guild transfers in one transaction/round-trip. Ledger rows
+are locked once in member_id order, the government-account probe and the
+daily-limit SUM run once per batch instead of once per transfer.
+
+Revision ID: 053_transfer_currency_batch
+Down Revision: 052_allow_council_targets
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from alembic import op
+
+revision = "053_transfer_currency_batch"
+down_revision = "052_allow_council_targets"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(_load_sql("fn_transfer_currency_batch.sql"))
+
+
+def downgrade() -> None:
+    op.execute("DROP FUNCTION IF EXISTS economy.fn_transfer_currency_batch(bigint, jsonb)")
+
+
+def _load_sql(filename: str) -> str:
+    base_path = Path(__file__).resolve().parents[2]
+    sql_path = base_path / "functions" / filename
+    return sql_path.read_text(encoding="utf-8")
@@ -0,0 +1,58 @@
+"""Evaluate pending-transfer checks in a single pass.
+
+Adds `economy.fn_evaluate_pending_transfer`, which reads the pending row once,
+computes the balance / cooldown / daily-limit checks together, writes `checks`
+and approves the transfer in one UPDATE. The insert trigger is switched to it.
+
+Revision ID: 055_evaluate_pending_transfer
+Down Revision: 054_compact_economy_notify
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from alembic import op
+
+revision = "055_evaluate_pending_transfer"
+down_revision = "054_compact_economy_notify"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(_load_sql("fn_evaluate_pending_transfer.sql"))
+    op.execute(_load_sql("trigger_pending_transfer_check.sql"))
+
+
+def downgrade() -> None:
+    # 還原為依序呼叫三個檢查函式的觸發器
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION economy.trigger_pending_transfer_check()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            UPDATE economy.pending_transfers
+            SET status = 'checking',
+                updated_at = timezone('utc', clock_timestamp())
+            WHERE transfer_id = NEW.transfer_id;
+
+            PERFORM economy.fn_check_transfer_balance(NEW.transfer_id);
+            PERFORM economy.fn_check_transfer_cooldown(NEW.transfer_id);
+            PERFORM economy.fn_check_transfer_daily_limit(NEW.transfer_id);
+            PERFORM economy.fn_flush_economy_events();
+
+            RETURN NEW;
+        END;
+        $$;
+        """
+    )
+    op.execute("DROP FUNCTION IF EXISTS economy.fn_evaluate_pending_transfer(uuid)")
+
+
+def _load_sql(filename: str) -> str:
+    base_path = Path(__file__).resolve().parents[2]
+    sql_path = base_path / "functions" / filename
+    return sql_path.read_text(encoding="utf-8")
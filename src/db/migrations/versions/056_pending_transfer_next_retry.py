@@ -0,0 +1,56 @@
+"""Persist pending-transfer retry schedule in the database.
+
+Adds `economy.pending_transfers.next_retry_at` (with a partial index) and the
+`fn_schedule_pending_transfer_retry` / `fn_claim_due_pending_transfer_retries`
+functions used by the transfer event pool's retry scheduler loop.
+
+Revision ID: 056_pending_transfer_next_retry
+Down Revision: 055_evaluate_pending_transfer
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "056_pending_transfer_next_retry"
+down_revision = "055_evaluate_pending_transfer"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "pending_transfers",
+        sa.Column("next_retry_at", postgresql.TIMESTAMP(timezone=True), nullable=True),
+        schema="economy",
+    )
+    op.create_index(
+        "ix_pending_transfers_next_retry_at",
+        "pending_transfers",
+        ["next_retry_at"],
+        unique=False,
+        schema="economy",
+        postgresql_where=sa.text("next_retry_at IS NOT NULL"),
+    )
+    op.execute(_load_sql("fn_pending_transfer_retries.sql"))
+
+
+def downgrade() -> None:
+    op.execute("DROP FUNCTION IF EXISTS economy.fn_claim_due_pending_transfer_retries(integer)")
+    op.execute("DROP FUNCTION IF EXISTS economy.fn_schedule_pending_transfer_retry(uuid, integer)")
+    op.drop_index(
+        "ix_pending_transfers_next_retry_at",
+        table_name="pending_transfers",
+        schema="economy",
+    )
+    op.drop_column("pending_transfers", "next_retry_at", schema="economy")
+
+
+def _load_sql(filename: str) -> str:
+    base_path = Path(__file__).resolve().parents[2]
+    sql_path = base_path / "functions" / filename
+    return sql_path.read_text(encoding="utf-8")
@@ -0,0 +1,34 @@
+"""Add batch claiming of approved pending transfers for execution workers.
+
+Adds `economy.fn_claim_approved_pending_transfers`, which hands out approved
+rows with FOR UPDATE SKIP LOCKED so that several workers or bot processes can
+drain the execution queue concurrently.
+
+Revision ID: 057_claim_approved_transfers
+Down Revision: 056_pending_transfer_next_retry
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from alembic import op
+
+revision = "057_claim_approved_transfers"
+down_revision = "056_pending_transfer_next_retry"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(_load_sql("fn_claim_approved_pending_transfers.sql"))
+
+
+def downgrade() -> None:
+    op.execute("DROP FUNCTION IF EXISTS economy.fn_claim_approved_pending_transfers(integer)")
+
+
+def _load_sql(filename: str) -> str:
+    base_path = Path(__file__).resolve().parents[2]
+    sql_path = base_path / "functions" / filename
+    return sql_path.read_text(encoding="utf-8")
@@ -0,0 +1,34 @@
+"""Add the set-based expiry sweep for pending transfers.
+
+Adds `economy.fn_expire_pending_transfers`, which rejects a bounded chunk of
+expired transfers with one UPDATE ... RETURNING and emits all denials as
+batched economy_events notifications.
+
+Revision ID: 058_expire_pending_transfers
+Down Revision: 057_claim_approved_transfers
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from alembic import op
+
+revision = "058_expire_pending_transfers"
+down_revision = "057_claim_approved_transfers"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(_load_sql("fn_expire_pending_transfers.sql"))
+
+
+def downgrade() -> None:
+    op.execute("DROP FUNCTION IF EXISTS economy.fn_expire_pending_transfers(integer)")
+
+
+def _load_sql(filename: str) -> str:
+    base_path = Path(__file__).resolve().parents[2]
+    sql_path = base_path / "functions" / filename
+    return sql_path.read_text(encoding="utf-8")
@@ -0,0 +1,50 @@
+"""Add catch-up queries for the telemetry listener.
+
+Adds `economy.fn_list_economy_events_since` (keyset-paged replay of
+currency_transactions as economy_events payloads) and
+`economy.fn_list_approved_pending_transfers`, plus the
+(created_at, transaction_id) index the replay pages over.
+
+Revision ID: 059_replay_economy_events
+Down Revision: 058_expire_pending_transfers
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from alembic import op
+
+revision = "059_replay_economy_events"
+down_revision = "058_expire_pending_transfers"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_currency_transactions_created_at",
+        "currency_transactions",
+        ["created_at", "transaction_id"],
+        unique=False,
+        schema="economy",
+    )
+    op.execute(_load_sql("fn_replay_economy_events.sql"))
+
+
+def downgrade() -> None:
+    op.execute("DROP FUNCTION IF EXISTS economy.fn_list_approved_pending_transfers(integer)")
+    op.execute(
+        "DROP FUNCTION IF EXISTS economy.fn_list_economy_events_since(timestamptz, uuid, integer)"
+    )
+    op.drop_index(
+        "ix_currency_transactions_created_at",
+        table_name="currency_transactions",
+        schema="economy",
+    )
+
+
+def _load_sql(filename: str) -> str:
+    base_path = Path(__file__).resolve().parents[2]
+    sql_path = base_path / "functions" / filename
+    return sql_path.read_text(encoding="utf-8")
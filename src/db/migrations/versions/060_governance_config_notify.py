@@ -0,0 +1,36 @@
+"""Emit governance_config_changed NOTIFY from per-guild configuration tables.
+
+Adds `governance.fn_notify_config_changed` and row triggers on the council,
+state council (config, departments, department roles), supreme assembly and
+currency configuration tables so in-process config caches can be
+invalidated across bot processes.
+
+Revision ID: 060_governance_config_notify
+Down Revision: 059_replay_economy_events
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from alembic import op
+
+revision = "060_governance_config_notify"
+down_revision = "059_replay_economy_events"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(_load_sql("governance/fn_notify_config_changed.sql"))
+
+
+def downgrade() -> None:
+    # CASCADE 一併移除各設定表上的觸發器
+    op.execute("DROP FUNCTION IF EXISTS governance.fn_notify_config_changed() CASCADE")
+
+
+def _load_sql(relative_path: str) -> str:
+    base_path = Path(__file__).resolve().parents[2]
+    sql_path = base_path / "functions" / relative_path
+    return sql_path.read_text(encoding="utf-8")
@@ -0,0 +1,34 @@
+"""Add a single-query department permission map for panel permission checks.
+
+Adds `governance.fn_get_department_permission_map`, which returns the state
+council leader configuration together with every department's role mappings
+so panels can evaluate all departments with one round trip.
+
+Revision ID: 061_department_permission_map
+Down Revision: 060_governance_config_notify
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from alembic import op
+
+revision = "061_department_permission_map"
+down_revision = "060_governance_config_notify"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(_load_sql("governance/fn_department_permission_map.sql"))
+
+
+def downgrade() -> None:
+    op.execute("DROP FUNCTION IF EXISTS governance.fn_get_department_permission_map(bigint)")
+
+
+def _load_sql(relative_path: str) -> str:
+    base_path = Path(__file__).resolve().parents[2]
+    sql_path = base_path / "functions" / relative_path
+    return sql_path.read_text(encoding="utf-8")
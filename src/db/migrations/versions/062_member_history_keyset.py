@@ -0,0 +1,86 @@
+"""Keyset-paginated member history backed by per-side indexes, including the archive.
+
+- Adds `economy.fn_get_member_history` ((created_at, transaction_id) keyset cursor,
+  limit + 1 lookahead, fall-through into `currency_transactions_archive`).
+- Replaces the (guild_id, initiator_id|target_id, created_at) indexes on
+  `currency_transactions` with versions that also order by transaction_id, and
+  adds the same indexes to the archive table.
+
+`fn_get_history` / `fn_has_more_history` are left in place for older callers.
+
+Revision ID: 062_member_history_keyset
+Down Revision: 061_department_permission_map
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "062_member_history_keyset"
+down_revision = "061_department_permission_map"
+branch_labels = None
+depends_on = None
+
+_HISTORY_INDEXES = (
+    ("initiator", "initiator_id"),
+    ("target", "target_id"),
+)
+
+
+def upgrade() -> None:
+    for table in ("currency_transactions", "currency_transactions_archive"):
+        for side, column in _HISTORY_INDEXES:
+            op.create_index(
+                f"ix_{table}_guild_{side}_history",
+                table,
+                ["guild_id", column, sa.text("created_at DESC"), sa.text("transaction_id DESC")],
+                unique=False,
+                schema="economy",
+            )
+
+    # 新索引以相同欄位為前綴，舊索引可完全被取代
+    op.drop_index(
+        "ix_currency_transactions_guild_initiator_created",
+        table_name="currency_transactions",
+        schema="economy",
+    )
+    op.drop_index(
+        "ix_currency_transactions_guild_target_created",
+        table_name="currency_transactions",
+        schema="economy",
+    )
+
+    op.execute(_load_sql("fn_get_member_history.sql"))
+
+
+def downgrade() -> None:
+    op.execute(
+        "DROP FUNCTION IF EXISTS "
+        "economy.fn_get_member_history(bigint, bigint, integer, timestamptz, uuid)"
+    )
+
+    for side, column in _HISTORY_INDEXES:
+        op.create_index(
+            f"ix_currency_transactions_guild_{side}_created",
+            "currency_transactions",
+            ["guild_id", column, "created_at"],
+            unique=False,
+            schema="economy",
+        )
+
+    for table in ("currency_transactions", "currency_transactions_archive"):
+        for side, _column in _HISTORY_INDEXES:
+            op.drop_index(
+                f"ix_{table}_guild_{side}_history",
+                table_name=table,
+                schema="economy",
+            )
+
+
+def _load_sql(filename: str) -> str:
+    base_path = Path(__file__).resolve().parents[2]
+    sql_path = base_path / "functions" / filename
+    return sql_path.read_text(encoding="utf-8")
@@ -0,0 +1,269 @@
+"""Range-partition currency_transactions by month; archive by moving partitions.
+
+- Rebuilds `economy.currency_transactions` as `PARTITION BY RANGE (created_at)`
+  with UTC monthly partitions (`currency_transactions_pYYYYMM`) plus a DEFAULT
+  partition. The primary key becomes (transaction_id, created_at) because a
+  partitioned table's unique constraints must include the partition key.
+- Rebuilds `economy.currency_transactions_archive` the same way; the existing
+  archive table is attached as `currency_transactions_archive_legacy` covering
+  everything before the first live month.
+- Adds `economy.fn_ensure_transaction_partitions` / `fn_archive_transaction_partitions`
+  and rewrites `proc_archive_old_transactions` to DETACH expired partitions and
+  ATTACH them to the archive instead of a row-by-row DELETE ... RETURNING.
+- Reloads `economy.fn_get_member_history` with a plain `created_at <=` cursor bound
+  so history pages prune partitions newer than the cursor.
+
+The bot keeps future partitions created and archives expired ones (see
+TransactionPartitionMaintainer, retention from ECONOMY_ARCHIVE_RETENTION_DAYS), so
+the pg_cron `economy_archive_30d` job from 004 is unscheduled here; otherwise it
+would keep archiving at a fixed 30 days regardless of the configured retention.
+
+Revision ID: 063_partition_currency_txns
+Down Revision: 062_member_history_keyset
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from alembic import op
+
+# 注意：revision ID 長度必須在 alembic_version.version_num 欄位限制（目前為 VARCHAR(32)）以內
+revision = "063_partition_currency_txns"
+down_revision = "062_member_history_keyset"
+branch_labels = None
+depends_on = None
+
+_HISTORY_INDEXES = (
+    ("initiator", "initiator_id"),
+    ("target", "target_id"),
+)
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE economy.currency_transactions RENAME TO currency_transactions_unpartitioned;
+        ALTER TABLE economy.currency_transactions_unpartitioned
+            RENAME CONSTRAINT currency_transactions_pkey TO currency_transactions_unpartitioned_pkey;
+        DROP TRIGGER IF EXISTS trg_notify_adjustment
+            ON economy.currency_transactions_unpartitioned;
+        DROP INDEX IF EXISTS economy.ix_currency_transactions_created_at;
+        DROP INDEX IF EXISTS economy.ix_currency_transactions_guild_initiator_history;
+        DROP INDEX IF EXISTS economy.ix_currency_transactions_guild_target_history;
+
+        ALTER TABLE economy.currency_transactions_archive
+            RENAME TO currency_transactions_archive_legacy;
+        ALTER INDEX IF EXISTS economy.ix_currency_transactions_archive_guild_created
+            RENAME TO ix_currency_transactions_archive_legacy_guild_created;
+        ALTER INDEX IF EXISTS economy.ix_currency_transactions_archive_guild_initiator_history
+            RENAME TO ix_currency_transactions_archive_legacy_guild_initiator_history;
+        ALTER INDEX IF EXISTS economy.ix_currency_transactions_archive_guild_target_history
+            RENAME TO ix_currency_transactions_archive_legacy_guild_target_history;
+        """
+    )
+
+    op.execute(
+        """
+        CREATE TABLE economy.currency_transactions (
+            LIKE economy.currency_transactions_unpartitioned
+                INCLUDING DEFAULTS INCLUDING CONSTRAINTS,
+            CONSTRAINT currency_transactions_pkey PRIMARY KEY (transaction_id, created_at)
+        ) PARTITION BY RANGE (created_at);
+
+        ALTER TABLE economy.currency_transactions
+            ADD CONSTRAINT fk_currency_transactions_initiator
+                FOREIGN KEY (guild_id, initiator_id)
+                REFERENCES economy.guild_member_balances (guild_id, member_id)
+                ON UPDATE CASCADE ON DELETE RESTRICT,
+            ADD CONSTRAINT fk_currency_transactions_target
+                FOREIGN KEY (guild_id, target_id)
+                REFERENCES economy.guild_member_balances (guild_id, member_id)
+                ON UPDATE CASCADE ON DELETE SET NULL;
+
+        CREATE INDEX ix_currency_transactions_created_at
+            ON economy.currency_transactions (created_at, transaction_id);
+
+        CREATE TABLE economy.currency_transactions_default
+            PARTITION OF economy.currency_transactions DEFAULT;
+
+        CREATE TABLE economy.currency_transactions_archive (
+            LIKE economy.currency_transactions_unpartitioned
+                INCLUDING DEFAULTS INCLUDING CONSTRAINTS
+        ) PARTITION BY RANGE (created_at);
+
+        CREATE INDEX ix_currency_transactions_archive_guild_created
+            ON economy.currency_transactions_archive (guild_id, created_at);
+        """
+    )
+    for table in ("currency_transactions", "currency_transactions_archive"):
+        for side, column in _HISTORY_INDEXES:
+            op.execute(
+                f"CREATE INDEX ix_{table}_guild_{side}_history ON economy.{table} "
+                f"(guild_id, {column}, created_at DESC, transaction_id DESC)"
+            )
+
+    op.execute(_load_sql("fn_transaction_partitions.sql"))
+    op.execute(_load_sql("fn_get_member_history.sql"))
+
+    # 舊歸檔表整段掛為 archive 的第一個分區（上界為第一個即時月份）；
+    # 即時表中早於該界線的列先併入舊歸檔表，確保兩邊的範圍不重疊。
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            v_month timestamp;
+            v_boundary timestamptz;
+        BEGIN
+            SELECT date_trunc('month', timezone('utc', max(created_at))) + interval '1 month'
+            INTO v_month
+            FROM economy.currency_transactions_archive_legacy;
+
+            IF v_month IS NULL THEN
+                SELECT date_trunc('month', timezone('utc', coalesce(min(created_at), now())))
+                INTO v_month
+                FROM economy.currency_transactions_unpartitioned;
+            END IF;
+            v_boundary := v_month AT TIME ZONE 'utc';
+
+            INSERT INTO economy.currency_transactions_archive_legacy
+            SELECT * FROM economy.currency_transactions_unpartitioned
+            WHERE created_at < v_boundary;
+
+            PERFORM economy.fn_ensure_transaction_partitions(2, v_boundary);
+
+            INSERT INTO economy.currency_transactions
+            SELECT * FROM economy.currency_transactions_unpartitioned
+            WHERE created_at >= v_boundary;
+
+            EXECUTE format(
+                'ALTER TABLE economy.currency_transactions_archive '
+                'ATTACH PARTITION economy.currency_transactions_archive_legacy '
+                'FOR VALUES FROM (MINVALUE) TO (%L)',
+                v_boundary
+            );
+        END$$;
+        """
+    )
+
+    op.execute(
+        """
+        DROP TABLE economy.currency_transactions_unpartitioned;
+
+        CREATE TRIGGER trg_notify_adjustment
+        AFTER INSERT ON economy.currency_transactions
+        FOR EACH ROW
+        EXECUTE FUNCTION economy.fn_notify_adjustment();
+        """
+    )
+
+    # 歸檔改由 bot 依設定的保留期限執行；移除 004 的固定 30 天排程（無 pg_cron 時略過）
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            jid int;
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+                SELECT jobid INTO jid FROM cron.job WHERE jobname = 'economy_archive_30d';
+                IF jid IS NOT NULL THEN
+                    PERFORM cron.unschedule(jid);
+                END IF;
+            END IF;
+        END$$;
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        DO $outer$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+                IF NOT EXISTS (
+                    SELECT 1 FROM cron.job WHERE jobname = 'economy_archive_30d'
+                ) THEN
+                    PERFORM cron.schedule(
+                        'economy_archive_30d',
+                        '10 2 * * *',
+                        $cmd$CALL economy.proc_archive_old_transactions();$cmd$
+                    );
+                END IF;
+            END IF;
+        END$outer$;
+        """
+    )
+    op.execute(
+        """
+        DROP FUNCTION IF EXISTS economy.fn_archive_transaction_partitions(interval);
+        DROP FUNCTION IF EXISTS economy.fn_ensure_transaction_partitions(integer, timestamptz);
+
+        CREATE OR REPLACE PROCEDURE economy.proc_archive_old_transactions(batch_size integer DEFAULT 5000)
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            v_cutoff timestamptz := timezone('utc', now()) - interval '30 days';
+        BEGIN
+            WITH moved AS (
+                DELETE FROM economy.currency_transactions ct
+                WHERE ct.created_at < v_cutoff
+                RETURNING *
+            )
+            INSERT INTO economy.currency_transactions_archive SELECT * FROM moved;
+        END;
+        $$;
+
+        CREATE TABLE economy.currency_transactions_plain (
+            LIKE economy.currency_transactions INCLUDING DEFAULTS INCLUDING CONSTRAINTS
+        );
+        INSERT INTO economy.currency_transactions_plain
+        SELECT * FROM economy.currency_transactions;
+
+        CREATE TABLE economy.currency_transactions_archive_plain (
+            LIKE economy.currency_transactions_archive INCLUDING DEFAULTS INCLUDING CONSTRAINTS
+        );
+        INSERT INTO economy.currency_transactions_archive_plain
+        SELECT * FROM economy.currency_transactions_archive;
+
+        DROP TABLE economy.currency_transactions;
+        DROP TABLE economy.currency_transactions_archive;
+
+        ALTER TABLE economy.currency_transactions_plain RENAME TO currency_transactions;
+        ALTER TABLE economy.currency_transactions_archive_plain
+            RENAME TO currency_transactions_archive;
+
+        ALTER TABLE economy.currency_transactions
+            ADD CONSTRAINT currency_transactions_pkey PRIMARY KEY (transaction_id),
+            ADD CONSTRAINT fk_currency_transactions_initiator
+                FOREIGN KEY (guild_id, initiator_id)
+                REFERENCES economy.guild_member_balances (guild_id, member_id)
+                ON UPDATE CASCADE ON DELETE RESTRICT,
+            ADD CONSTRAINT fk_currency_transactions_target
+                FOREIGN KEY (guild_id, target_id)
+                REFERENCES economy.guild_member_balances (guild_id, member_id)
+                ON UPDATE CASCADE ON DELETE SET NULL;
+
+        CREATE INDEX ix_currency_transactions_created_at
+            ON economy.currency_transactions (created_at, transaction_id);
+        CREATE INDEX ix_currency_transactions_archive_guild_created
+            ON economy.currency_transactions_archive (guild_id, created_at);
+
+        CREATE TRIGGER trg_notify_adjustment
+        AFTER INSERT ON economy.currency_transactions
+        FOR EACH ROW
+        EXECUTE FUNCTION economy.fn_notify_adjustment();
+        """
+    )
+    for table in ("currency_transactions", "currency_transactions_archive"):
+        for side, column in _HISTORY_INDEXES:
+            op.execute(
+                f"CREATE INDEX ix_{table}_guild_{side}_history ON economy.{table} "
+                f"(guild_id, {column}, created_at DESC, transaction_id DESC)"
+            )
+
+
+def _load_sql(filename: str) -> str:
+    base_path = Path(__file__).resolve().parents[2]
+    sql_path = base_path / "functions" / filename
+    return sql_path.read_text(encoding="utf-8")
@@ -0,0 +1,972 @@
+"""Flag government accounts on their ledger rows.
+
+- Adds `economy.guild_member_balances.is_government`, kept in sync with
+  `governance.government_accounts` by `governance.fn_sync_government_account_flag`,
+  and backfills it (creating ledger rows for accounts that have none yet).
+- Reloads the transfer, batch transfer and transfer-check functions so the
+  cooldown / daily-limit exemption reads the flag from the ledger row they
+  already read or lock instead of probing `government_accounts`.
+- Reloads the governance config NOTIFY triggers so government account identity
+  changes also invalidate the in-process `state_council` cache.
+
+Revision ID: 065_government_account_flag
+Down Revision: 064_member_daily_transfer_totals
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "065_government_account_flag"
+down_revision = "064_member_daily_transfer_totals"
+branch_labels = None
+depends_on = None
+
+_RELOADED = (
+    "fn_transfer_currency.sql",
+    "fn_transfer_currency_batch.sql",
+    "fn_check_transfer_cooldown.sql",
+    "fn_check_transfer_daily_limit.sql",
+    "fn_evaluate_pending_transfer.sql",
+    "governance/fn_notify_config_changed.sql",
+)
+
+# 前一版（064）：冷卻／每日上限豁免以 EXISTS 查詢 government_accounts 判斷
+_PREVIOUS_FUNCTIONS = (
+    # fn_transfer_currency.sql
+    """
+-- Stored procedures implementing economy transfer logic and throttling.
+CREATE OR REPLACE FUNCTION economy.fn_record_throttle(
+    p_guild_id bigint,
+    p_member_id bigint,
+    p_metadata jsonb DEFAULT '{}'::jsonb
+)
+RETURNS timestamptz
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_now timestamptz := timezone('utc', clock_timestamp());
+    v_until timestamptz := v_now + interval '300 seconds';
+    v_metadata jsonb := coalesce(p_metadata, '{}'::jsonb);
+    v_balance bigint;
+BEGIN
+    INSERT INTO economy.guild_member_balances (
+        guild_id,
+        member_id,
+        current_balance,
+        last_modified_at,
+        throttled_until,
+        created_at
+    )
+    VALUES (p_guild_id, p_member_id, 0, v_now, v_until, v_now)
+    ON CONFLICT (guild_id, member_id)
+    DO UPDATE
+        SET throttled_until = v_until,
+            last_modified_at = v_now
+        RETURNING economy.guild_member_balances.current_balance
+        INTO v_balance;
+
+    INSERT INTO economy.currency_transactions (
+        guild_id,
+        initiator_id,
+        target_id,
+        amount,
+        direction,
+        reason,
+        balance_after_initiator,
+        balance_after_target,
+        metadata
+    )
+    VALUES (
+        p_guild_id,
+        p_member_id,
+        NULL,
+        0,
+        'throttle_block',
+        'Transfer throttled',
+        v_balance,
+        NULL,
+        jsonb_strip_nulls(
+            coalesce(v_metadata, '{}'::jsonb)
+            || jsonb_build_object(
+                'throttle_until',
+                v_until,
+                'triggered_at',
+                v_now
+            )
+        )
+    );
+
+    PERFORM economy.fn_emit_economy_event(
+        jsonb_build_object(
+            'event_type',
+            'transaction_denied',
+            'reason',
+            'throttle_block',
+            'guild_id',
+            p_guild_id,
+            'initiator_id',
+            p_member_id,
+            'metadata',
+            jsonb_strip_nulls(
+                coalesce(v_metadata, '{}'::jsonb)
+                || jsonb_build_object(
+                    'throttle_until',
+                    v_until
+                )
+            )
+        )
+    );
+
+    PERFORM economy.fn_flush_economy_events();
+
+    RETURN v_until;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION economy.fn_transfer_currency(
+    p_guild_id bigint,
+    p_initiator_id bigint,
+    p_target_id bigint,
+    p_amount bigint,
+    p_metadata jsonb DEFAULT '{}'::jsonb
+)
+RETURNS economy.transfer_result
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_now timestamptz := timezone('utc', clock_timestamp());
+    v_metadata jsonb := coalesce(p_metadata, '{}'::jsonb);
+    v_initiator_balance bigint;
+    v_target_balance bigint;
+    v_throttled_until timestamptz;
+    v_total_today bigint;
+    v_transaction_id uuid;
+    v_created_at timestamptz;
+    v_reason text := nullif(v_metadata->>'reason', '');
+    -- 以連線層 GUC 控制每日上限；未設定或 <= 0 視為「無上限」
+    v_daily_limit_text text := current_setting('app.transfer_daily_limit', true);
+    v_daily_limit bigint;
+    v_is_government boolean := false;
+BEGIN
+    IF p_initiator_id = p_target_id THEN
+        RAISE EXCEPTION 'Initiator and target must be distinct members for transfers.'
+            USING ERRCODE = '22023';
+    END IF;
+
+    IF p_amount <= 0 THEN
+        RAISE EXCEPTION 'Transfer amount must be a positive whole number.'
+            USING ERRCODE = '22023';
+    END IF;
+
+    -- Ensure ledger rows exist
+    INSERT INTO economy.guild_member_balances (guild_id, member_id, current_balance, last_modified_at, created_at)
+    VALUES (p_guild_id, p_initiator_id, 0, v_now, v_now)
+    ON CONFLICT (guild_id, member_id) DO NOTHING;
+
+    INSERT INTO economy.guild_member_balances (guild_id, member_id, current_balance, last_modified_at, created_at)
+    VALUES (p_guild_id, p_target_id, 0, v_now, v_now)
+    ON CONFLICT (guild_id, member_id) DO NOTHING;
+
+    -- 判斷是否為政府部門帳戶（免除每日上限與冷卻限制）
+    SELECT EXISTS (
+               SELECT 1
+               FROM governance.government_accounts ga
+               WHERE ga.account_id = p_initiator_id AND ga.guild_id = p_guild_id
+           )
+    INTO v_is_government;
+
+    SELECT current_balance, throttled_until
+    INTO v_initiator_balance, v_throttled_until
+    FROM economy.guild_member_balances
+    WHERE guild_id = p_guild_id AND member_id = p_initiator_id
+    FOR UPDATE;
+
+    -- 政府帳戶不受冷卻限制
+    IF (NOT v_is_government) AND v_throttled_until IS NOT NULL AND v_throttled_until > v_now THEN
+        RAISE EXCEPTION 'Transfer throttled: member is on cooldown until %.', v_throttled_until
+            USING ERRCODE = 'P0001';
+    END IF;
+
+    -- 非政府帳戶才檢查每日上限；未設定 GUC 或 <= 0 則跳過檢查（視為無上限）
+    IF NOT v_is_government THEN
+        IF v_daily_limit_text IS NOT NULL AND NULLIF(v_daily_limit_text, '') IS NOT NULL THEN
+            v_daily_limit := v_daily_limit_text::bigint;
+            IF v_daily_limit > 0 THEN
+                -- 當日累計由 member_daily_transfer_totals 維護，O(1) 讀取
+                v_total_today := economy.fn_get_daily_transfer_total(
+                    p_guild_id, p_initiator_id, v_now
+                );
+
+                IF v_total_today + p_amount > v_daily_limit THEN
+                    PERFORM economy.fn_record_throttle(
+                        p_guild_id,
+                        p_initiator_id,
+                        jsonb_build_object(
+                            'reason', 'daily_limit_exceeded',
+                            'limit', v_daily_limit,
+                            'attempted_amount', p_amount,
+                            'total_today', v_total_today
+                        )
+                    );
+
+                    RAISE EXCEPTION 'Transfer throttled: daily limit of % exceeded.', v_daily_limit
+                        USING ERRCODE = 'P0001';
+                END IF;
+            END IF;
+        END IF;
+    END IF;
+
+    IF v_initiator_balance < p_amount THEN
+        RAISE EXCEPTION 'Transfer denied: insufficient funds. Balance available: %.', v_initiator_balance
+            USING ERRCODE = 'P0001';
+    END IF;
+
+    UPDATE economy.guild_member_balances
+    SET current_balance = current_balance - p_amount,
+        last_modified_at = v_now,
+        throttled_until = NULL
+    WHERE guild_id = p_guild_id AND member_id = p_initiator_id
+    RETURNING current_balance
+    INTO v_initiator_balance;
+
+    UPDATE economy.guild_member_balances
+    SET current_balance = current_balance + p_amount,
+        last_modified_at = v_now
+    WHERE guild_id = p_guild_id AND member_id = p_target_id
+    RETURNING current_balance
+    INTO v_target_balance;
+
+    INSERT INTO economy.currency_transactions (
+        guild_id,
+        initiator_id,
+        target_id,
+        amount,
+        direction,
+        reason,
+        balance_after_initiator,
+        balance_after_target,
+        metadata
+    )
+    VALUES (
+        p_guild_id,
+        p_initiator_id,
+        p_target_id,
+        p_amount,
+        'transfer',
+        v_reason,
+        v_initiator_balance,
+        v_target_balance,
+        jsonb_strip_nulls(v_metadata)
+    )
+    RETURNING transaction_id, created_at
+    INTO v_transaction_id, v_created_at;
+
+    PERFORM economy.fn_emit_economy_event(
+        jsonb_build_object(
+            'event_type',
+            'transaction_success',
+            'transaction_id',
+            v_transaction_id,
+            'guild_id',
+            p_guild_id,
+            'initiator_id',
+            p_initiator_id,
+            'target_id',
+            p_target_id,
+            'amount',
+            p_amount,
+            'metadata',
+            jsonb_strip_nulls(v_metadata)
+        )
+    );
+
+    PERFORM economy.fn_flush_economy_events();
+
+    RETURN (
+        v_transaction_id,
+        p_guild_id,
+        p_initiator_id,
+        p_target_id,
+        p_amount,
+        'transfer'::economy.transaction_direction,
+        v_created_at,
+        v_initiator_balance,
+        v_target_balance,
+        NULL::timestamptz,
+        jsonb_strip_nulls(v_metadata)
+    );
+END;
+$$;
+""",
+    # fn_transfer_currency_batch.sql
+    """
+-- Batched transfer procedure: apply N same-guild transfers in a single transaction.
+--
+-- p_transfers 為 JSON 陣列，每個元素包含：
+--   {"initiator_id": bigint, "target_id": bigint, "amount": bigint, "metadata": jsonb}
+-- 回傳順序與輸入順序一致（每筆一列 economy.transfer_result）。
+-- 任一筆失敗（餘額不足、冷卻、每日上限、格式錯誤）會拋出例外並使整批回滾。
+CREATE OR REPLACE FUNCTION economy.fn_transfer_currency_batch(
+    p_guild_id bigint,
+    p_transfers jsonb
+)
+RETURNS SETOF economy.transfer_result
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_now timestamptz := timezone('utc', clock_timestamp());
+    v_item jsonb;
+    v_position bigint;
+    v_initiator_id bigint;
+    v_target_id bigint;
+    v_amount bigint;
+    v_metadata jsonb;
+    v_reason text;
+    v_initiator_balance bigint;
+    v_target_balance bigint;
+    v_throttled_until timestamptz;
+    v_transaction_id uuid;
+    v_created_at timestamptz;
+    v_member_ids bigint[];
+    v_government_ids bigint[];
+    -- 以連線層 GUC 控制每日上限；未設定或 <= 0 視為「無上限」
+    v_daily_limit_text text := current_setting('app.transfer_daily_limit', true);
+    v_daily_limit bigint := 0;
+    v_totals jsonb := '{}'::jsonb;
+    v_total_today bigint;
+    v_result economy.transfer_result;
+BEGIN
+    IF p_transfers IS NULL OR jsonb_typeof(p_transfers) <> 'array' THEN
+        RAISE EXCEPTION 'Batch transfers must be provided as a JSON array.'
+            USING ERRCODE = '22023';
+    END IF;
+
+    IF jsonb_array_length(p_transfers) = 0 THEN
+        RETURN;
+    END IF;
+
+    -- 先完整驗證所有項目，避免套用到一半才發現格式錯誤
+    FOR v_item, v_position IN
+        SELECT e.value, e.ordinality
+        FROM jsonb_array_elements(p_transfers) WITH ORDINALITY AS e(value, ordinality)
+    LOOP
+        v_initiator_id := (v_item->>'initiator_id')::bigint;
+        v_target_id := (v_item->>'target_id')::bigint;
+        v_amount := (v_item->>'amount')::bigint;
+
+        IF v_initiator_id IS NULL OR v_target_id IS NULL OR v_amount IS NULL THEN
+            RAISE EXCEPTION 'Batch transfer #% is missing initiator_id, target_id or amount.', v_position
+                USING ERRCODE = '22023';
+        END IF;
+
+        IF v_initiator_id = v_target_id THEN
+            RAISE EXCEPTION 'Initiator and target must be distinct members for transfers (batch item #%).', v_position
+                USING ERRCODE = '22023';
+        END IF;
+
+        IF v_amount <= 0 THEN
+            RAISE EXCEPTION 'Transfer amount must be a positive whole number (batch item #%).', v_position
+                USING ERRCODE = '22023';
+        END IF;
+    END LOOP;
+
+    SELECT array_agg(DISTINCT m.member_id ORDER BY m.member_id)
+    INTO v_member_ids
+    FROM (
+        SELECT (e.value->>'initiator_id')::bigint AS member_id
+        FROM jsonb_array_elements(p_transfers) AS e(value)
+        UNION
+        SELECT (e.value->>'target_id')::bigint
+        FROM jsonb_array_elements(p_transfers) AS e(value)
+    ) AS m;
+
+    -- Ensure ledger rows exist（一次性建立所有涉及的帳本列）
+    INSERT INTO economy.guild_member_balances (guild_id, member_id, current_balance, last_modified_at, created_at)
+    SELECT p_guild_id, m.member_id, 0, v_now, v_now
+    FROM unnest(v_member_ids) AS m(member_id)
+    ORDER BY m.member_id
+    ON CONFLICT (guild_id, member_id) DO NOTHING;
+
+    -- 依 member_id 固定順序鎖定所有涉及的帳本列，避免並行批次/單筆轉帳互相死結
+    PERFORM 1
+    FROM economy.guild_member_balances
+    WHERE guild_id = p_guild_id
+      AND member_id = ANY(v_member_ids)
+    ORDER BY member_id
+    FOR UPDATE;
+
+    -- 判斷政府部門帳戶（免除每日上限與冷卻限制）：整批只查一次
+    SELECT coalesce(array_agg(ga.account_id), ARRAY[]::bigint[])
+    INTO v_government_ids
+    FROM governance.government_accounts ga
+    WHERE ga.guild_id = p_guild_id
+      AND ga.account_id = ANY(v_member_ids);
+
+    IF v_daily_limit_text IS NOT NULL AND NULLIF(v_daily_limit_text, '') IS NOT NULL THEN
+        v_daily_limit := v_daily_limit_text::bigint;
+    END IF;
+
+    -- 每日上限：一次讀取各發起人今日累計（member_daily_transfer_totals），批次內再逐筆累加
+    IF v_daily_limit > 0 THEN
+        SELECT coalesce(
+                   jsonb_object_agg(
+                       m.member_id::text,
+                       economy.fn_get_daily_transfer_total(p_guild_id, m.member_id, v_now)
+                   ),
+                   '{}'::jsonb
+               )
+        INTO v_totals
+        FROM unnest(v_member_ids) AS m(member_id)
+        WHERE NOT (m.member_id = ANY(v_government_ids));
+    END IF;
+
+    FOR v_item, v_position IN
+        SELECT e.value, e.ordinality
+        FROM jsonb_array_elements(p_transfers) WITH ORDINALITY AS e(value, ordinality)
+    LOOP
+        v_initiator_id := (v_item->>'initiator_id')::bigint;
+        v_target_id := (v_item->>'target_id')::bigint;
+        v_amount := (v_item->>'amount')::bigint;
+        v_metadata := v_item->'metadata';
+        IF v_metadata IS NULL OR jsonb_typeof(v_metadata) <> 'object' THEN
+            v_metadata := '{}'::jsonb;
+        END IF;
+        v_reason := nullif(v_metadata->>'reason', '');
+
+        -- 帳本列已於上方鎖定，這裡僅為讀取最新值
+        SELECT current_balance, throttled_until
+        INTO v_initiator_balance, v_throttled_until
+        FROM economy.guild_member_balances
+        WHERE guild_id = p_guild_id AND member_id = v_initiator_id;
+
+        IF NOT (v_initiator_id = ANY(v_government_ids)) THEN
+            IF v_throttled_until IS NOT NULL AND v_throttled_until > v_now THEN
+                RAISE EXCEPTION 'Transfer throttled: member % is on cooldown until % (batch item #%).',
+                    v_initiator_id, v_throttled_until, v_position
+                    USING ERRCODE = 'P0001';
+            END IF;
+
+            IF v_daily_limit > 0 THEN
+                v_total_today := coalesce((v_totals->>v_initiator_id::text)::bigint, 0);
+
+                IF v_total_today + v_amount > v_daily_limit THEN
+                    PERFORM economy.fn_record_throttle(
+                        p_guild_id,
+                        v_initiator_id,
+                        jsonb_build_object(
+                            'reason', 'daily_limit_exceeded',
+                            'limit', v_daily_limit,
+                            'attempted_amount', v_amount,
+                            'total_today', v_total_today
+                        )
+                    );
+
+                    RAISE EXCEPTION 'Transfer throttled: daily limit of % exceeded (batch item #%).',
+                        v_daily_limit, v_position
+                        USING ERRCODE = 'P0001';
+                END IF;
+
+                v_totals := jsonb_set(
+                    v_totals,
+                    ARRAY[v_initiator_id::text],
+                    to_jsonb(v_total_today + v_amount)
+                );
+            END IF;
+        END IF;
+
+        IF v_initiator_balance < v_amount THEN
+            RAISE EXCEPTION 'Transfer denied: insufficient funds for batch item #%. Balance available: %.',
+                v_position, v_initiator_balance
+                USING ERRCODE = 'P0001';
+        END IF;
+
+        UPDATE economy.guild_member_balances
+        SET current_balance = current_balance - v_amount,
+            last_modified_at = v_now,
+            throttled_until = NULL
+        WHERE guild_id = p_guild_id AND member_id = v_initiator_id
+        RETURNING current_balance
+        INTO v_initiator_balance;
+
+        UPDATE economy.guild_member_balances
+        SET current_balance = current_balance + v_amount,
+            last_modified_at = v_now
+        WHERE guild_id = p_guild_id AND member_id = v_target_id
+        RETURNING current_balance
+        INTO v_target_balance;
+
+        INSERT INTO economy.currency_transactions (
+            guild_id,
+            initiator_id,
+            target_id,
+            amount,
+            direction,
+            reason,
+            balance_after_initiator,
+            balance_after_target,
+            metadata
+        )
+        VALUES (
+            p_guild_id,
+            v_initiator_id,
+            v_target_id,
+            v_amount,
+            'transfer',
+            v_reason,
+            v_initiator_balance,
+            v_target_balance,
+            jsonb_strip_nulls(v_metadata)
+        )
+        RETURNING transaction_id, created_at
+        INTO v_transaction_id, v_created_at;
+
+        -- 與 fn_transfer_currency 相同格式，listener 不需區分單筆或批次
+        PERFORM economy.fn_emit_economy_event(
+            jsonb_build_object(
+                'event_type',
+                'transaction_success',
+                'transaction_id',
+                v_transaction_id,
+                'guild_id',
+                p_guild_id,
+                'initiator_id',
+                v_initiator_id,
+                'target_id',
+                v_target_id,
+                'amount',
+                v_amount,
+                'metadata',
+                jsonb_strip_nulls(v_metadata)
+            )
+        );
+
+        v_result := ROW(
+            v_transaction_id,
+            p_guild_id,
+            v_initiator_id,
+            v_target_id,
+            v_amount,
+            'transfer'::economy.transaction_direction,
+            v_created_at,
+            v_initiator_balance,
+            v_target_balance,
+            NULL::timestamptz,
+            jsonb_strip_nulls(v_metadata)
+        )::economy.transfer_result;
+
+        RETURN NEXT v_result;
+    END LOOP;
+
+    -- 精簡通知模式下，整批的 transaction_success 於此合併送出
+    PERFORM economy.fn_flush_economy_events();
+
+    RETURN;
+END;
+$$;
+""",
+    # fn_check_transfer_cooldown.sql
+    """
+-- Check if initiator is on cooldown
+CREATE OR REPLACE FUNCTION economy.fn_check_transfer_cooldown(p_transfer_id uuid)
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_guild_id bigint;
+    v_initiator_id bigint;
+    v_throttled_until timestamptz;
+    v_now timestamptz := timezone('utc', clock_timestamp());
+    v_check_result int;
+    v_is_government boolean := false;
+BEGIN
+    SELECT guild_id, initiator_id
+    INTO v_guild_id, v_initiator_id
+    FROM economy.pending_transfers
+    WHERE transfer_id = p_transfer_id;
+
+    IF NOT FOUND THEN
+        RETURN;
+    END IF;
+
+    -- Check if initiator is a government account
+    SELECT EXISTS (
+        SELECT 1
+        FROM governance.government_accounts ga
+        WHERE ga.account_id = v_initiator_id AND ga.guild_id = v_guild_id
+    )
+    INTO v_is_government;
+
+    -- Exempt government accounts from cooldown
+    IF v_is_government THEN
+        v_check_result := 1;
+    ELSE
+        -- Get throttled_until
+        SELECT throttled_until
+        INTO v_throttled_until
+        FROM economy.guild_member_balances
+        WHERE guild_id = v_guild_id AND member_id = v_initiator_id;
+
+        -- Set check result: 1 if not throttled or expired, 0 if still throttled
+        v_check_result := CASE
+            WHEN v_throttled_until IS NULL THEN 1
+            WHEN v_throttled_until <= v_now THEN 1
+            ELSE 0
+        END;
+    END IF;
+
+    -- Update checks JSONB
+    UPDATE economy.pending_transfers
+    SET checks = jsonb_set(
+        coalesce(checks, '{}'::jsonb),
+        '{cooldown}',
+        to_jsonb(v_check_result)
+    ),
+    updated_at = timezone('utc', clock_timestamp())
+    WHERE transfer_id = p_transfer_id;
+
+    -- Send NOTIFY event
+    PERFORM economy.fn_emit_economy_event(
+        jsonb_build_object(
+            'event_type',
+            'transfer_check_result',
+            'transfer_id',
+            p_transfer_id,
+            'check_type',
+            'cooldown',
+            'result',
+            v_check_result,
+            'guild_id',
+            v_guild_id,
+            'initiator_id',
+            v_initiator_id,
+            'throttled_until',
+            v_throttled_until
+        )
+    );
+
+    -- Check if all checks are complete and passed
+    PERFORM economy._check_and_approve_transfer(p_transfer_id);
+END;
+$$;
+""",
+    # fn_check_transfer_daily_limit.sql
+    """
+-- Check if initiator has exceeded daily transfer limit
+CREATE OR REPLACE FUNCTION economy.fn_check_transfer_daily_limit(p_transfer_id uuid)
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_guild_id bigint;
+    v_initiator_id bigint;
+    v_amount bigint;
+    v_total_today bigint;
+    -- 讀取應用層連線 GUC；未設定或 <= 0 視為「無上限」
+    v_daily_limit_text text := current_setting('app.transfer_daily_limit', true);
+    v_daily_limit bigint;
+    v_check_result int;
+    v_now timestamptz := timezone('utc', clock_timestamp());
+    v_is_government boolean := false;
+BEGIN
+    SELECT guild_id, initiator_id, amount
+    INTO v_guild_id, v_initiator_id, v_amount
+    FROM economy.pending_transfers
+    WHERE transfer_id = p_transfer_id;
+
+    IF NOT FOUND THEN
+        RETURN;
+    END IF;
+
+    -- Check if initiator is a government account
+    SELECT EXISTS (
+        SELECT 1
+        FROM governance.government_accounts ga
+        WHERE ga.account_id = v_initiator_id AND ga.guild_id = v_guild_id
+    )
+    INTO v_is_government;
+
+    -- Exempt government accounts from daily limit
+    IF v_is_government THEN
+        v_check_result := 1;
+    ELSE
+        -- 若未提供 GUC 或提供空字串／非正數，則視為「無上限」直接通過
+        IF v_daily_limit_text IS NULL OR NULLIF(v_daily_limit_text, '') IS NULL THEN
+            v_check_result := 1;
+        ELSE
+            v_daily_limit := v_daily_limit_text::bigint;
+            IF v_daily_limit <= 0 THEN
+                v_check_result := 1;
+            ELSE
+                -- 當日累計由 member_daily_transfer_totals 維護，O(1) 讀取
+                v_total_today := economy.fn_get_daily_transfer_total(
+                    v_guild_id, v_initiator_id, v_now
+                );
+
+                -- Set check result: 1 if within limit, 0 if exceeded
+                v_check_result := CASE
+                    WHEN v_total_today + v_amount <= v_daily_limit THEN 1
+                    ELSE 0
+                END;
+            END IF;
+        END IF;
+    END IF;
+
+    -- Update checks JSONB
+    UPDATE economy.pending_transfers
+    SET checks = jsonb_set(
+        coalesce(checks, '{}'::jsonb),
+        '{daily_limit}',
+        to_jsonb(v_check_result)
+    ),
+    updated_at = timezone('utc', clock_timestamp())
+    WHERE transfer_id = p_transfer_id;
+
+    -- Send NOTIFY event
+    PERFORM economy.fn_emit_economy_event(
+        jsonb_build_object(
+            'event_type',
+            'transfer_check_result',
+            'transfer_id',
+            p_transfer_id,
+            'check_type',
+            'daily_limit',
+            'result',
+            v_check_result,
+            'guild_id',
+            v_guild_id,
+            'initiator_id',
+            v_initiator_id,
+            'total_today',
+            v_total_today,
+            'attempted_amount',
+            v_amount,
+            'limit',
+            v_daily_limit
+        )
+    );
+
+    -- Check if all checks are complete and passed
+    PERFORM economy._check_and_approve_transfer(p_transfer_id);
+END;
+$$;
+""",
+    # fn_evaluate_pending_transfer.sql
+    """
+-- Evaluate all transfer checks (balance / cooldown / daily_limit) in one pass.
+--
+-- 取代依序呼叫 fn_check_transfer_balance / _cooldown / _daily_limit 的作法：
+-- 只讀取一次 pending_transfers、帳本列與政府帳戶判斷，三項結果以單一 UPDATE
+-- 寫入 checks，並於同一個 UPDATE 內在全數通過時直接轉為 approved。
+-- 仍逐項發出 transfer_check_result 事件（格式不變），核准時另發 transfer_check_approved。
+-- 個別的 fn_check_transfer_* 函式保留供相容與除錯使用。
+CREATE OR REPLACE FUNCTION economy.fn_evaluate_pending_transfer(p_transfer_id uuid)
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_now timestamptz := timezone('utc', clock_timestamp());
+    v_guild_id bigint;
+    v_initiator_id bigint;
+    v_target_id bigint;
+    v_amount bigint;
+    v_balance bigint;
+    v_throttled_until timestamptz;
+    v_is_government boolean := false;
+    -- 讀取應用層連線 GUC；未設定或 <= 0 視為「無上限」
+    v_daily_limit_text text := current_setting('app.transfer_daily_limit', true);
+    v_daily_limit bigint;
+    v_total_today bigint;
+    v_balance_result int;
+    v_cooldown_result int;
+    v_daily_limit_result int;
+    v_status text;
+BEGIN
+    SELECT guild_id, initiator_id, target_id, amount
+    INTO v_guild_id, v_initiator_id, v_target_id, v_amount
+    FROM economy.pending_transfers
+    WHERE transfer_id = p_transfer_id
+      AND status IN ('pending', 'checking');
+
+    IF NOT FOUND THEN
+        RETURN;
+    END IF;
+
+    -- Ensure ledger row exists
+    INSERT INTO economy.guild_member_balances (guild_id, member_id, current_balance, last_modified_at, created_at)
+    VALUES (v_guild_id, v_initiator_id, 0, v_now, v_now)
+    ON CONFLICT (guild_id, member_id) DO NOTHING;
+
+    SELECT current_balance, throttled_until
+    INTO v_balance, v_throttled_until
+    FROM economy.guild_member_balances
+    WHERE guild_id = v_guild_id AND member_id = v_initiator_id;
+
+    SELECT EXISTS (
+        SELECT 1
+        FROM governance.government_accounts ga
+        WHERE ga.account_id = v_initiator_id AND ga.guild_id = v_guild_id
+    )
+    INTO v_is_government;
+
+    v_balance_result := CASE WHEN v_balance >= v_amount THEN 1 ELSE 0 END;
+
+    -- 政府部門帳戶免除冷卻與每日上限
+    IF v_is_government THEN
+        v_cooldown_result := 1;
+        v_daily_limit_result := 1;
+    ELSE
+        v_cooldown_result := CASE
+            WHEN v_throttled_until IS NULL THEN 1
+            WHEN v_throttled_until <= v_now THEN 1
+            ELSE 0
+        END;
+
+        IF v_daily_limit_text IS NULL OR NULLIF(v_daily_limit_text, '') IS NULL THEN
+            v_daily_limit_result := 1;
+        ELSE
+            v_daily_limit := v_daily_limit_text::bigint;
+            IF v_daily_limit <= 0 THEN
+                v_daily_limit_result := 1;
+            ELSE
+                v_total_today := economy.fn_get_daily_transfer_total(
+                    v_guild_id, v_initiator_id, v_now
+                );
+
+                v_daily_limit_result := CASE
+                    WHEN v_total_today + v_amount <= v_daily_limit THEN 1
+                    ELSE 0
+                END;
+            END IF;
+        END IF;
+    END IF;
+
+    -- 單一 UPDATE：寫入三項結果並視情況直接核准。
+    -- 以 status 條件防止並行評估重複核准（僅一筆能從 pending/checking 轉為 approved）。
+    UPDATE economy.pending_transfers
+    SET checks = coalesce(checks, '{}'::jsonb) || jsonb_build_object(
+            'balance', v_balance_result,
+            'cooldown', v_cooldown_result,
+            'daily_limit', v_daily_limit_result
+        ),
+        status = CASE
+            WHEN v_balance_result = 1 AND v_cooldown_result = 1 AND v_daily_limit_result = 1
+                THEN 'approved'
+            ELSE 'checking'
+        END,
+        updated_at = timezone('utc', clock_timestamp())
+    WHERE transfer_id = p_transfer_id
+      AND status IN ('pending', 'checking')
+    RETURNING status
+    INTO v_status;
+
+    IF NOT FOUND THEN
+        RETURN; -- 已被其他交易核准或終結
+    END IF;
+
+    PERFORM economy.fn_emit_economy_event(
+        jsonb_build_object(
+            'event_type', 'transfer_check_result',
+            'transfer_id', p_transfer_id,
+            'check_type', 'balance',
+            'result', v_balance_result,
+            'guild_id', v_guild_id,
+            'initiator_id', v_initiator_id,
+            'balance', v_balance,
+            'required', v_amount
+        )
+    );
+
+    PERFORM economy.fn_emit_economy_event(
+        jsonb_build_object(
+            'event_type', 'transfer_check_result',
+            'transfer_id', p_transfer_id,
+            'check_type', 'cooldown',
+            'result', v_cooldown_result,
+            'guild_id', v_guild_id,
+            'initiator_id', v_initiator_id,
+            'throttled_until', CASE WHEN v_is_government THEN NULL ELSE v_throttled_until END
+        )
+    );
+
+    PERFORM economy.fn_emit_economy_event(
+        jsonb_build_object(
+            'event_type', 'transfer_check_result',
+            'transfer_id', p_transfer_id,
+            'check_type', 'daily_limit',
+            'result', v_daily_limit_result,
+            'guild_id', v_guild_id,
+            'initiator_id', v_initiator_id,
+            'total_today', v_total_today,
+            'attempted_amount', v_amount,
+            'limit', v_daily_limit
+        )
+    );
+
+    IF v_status = 'approved' THEN
+        PERFORM economy.fn_emit_economy_event(
+            jsonb_build_object(
+                'event_type', 'transfer_check_approved',
+                'transfer_id', p_transfer_id,
+                'guild_id', v_guild_id,
+                'initiator_id', v_initiator_id,
+                'target_id', v_target_id,
+                'amount', v_amount
+            )
+        );
+    END IF;
+
+    -- 精簡通知模式下，三項檢查結果與核准事件合併為單一通知
+    PERFORM economy.fn_flush_economy_events();
+END;
+$$;
+""",
+)
+
+
+def upgrade() -> None:
+    op.add_column(
+        "guild_member_balances",
+        sa.Column("is_government", sa.Boolean(), nullable=False, server_default=sa.false()),
+        schema="economy",
+    )
+
+    op.execute(_load_sql("governance/fn_government_account_flag.sql"))
+    op.execute(
+        """
+        INSERT INTO economy.guild_member_balances (
+            guild_id, member_id, current_balance, is_government
+        )
+        SELECT ga.guild_id, ga.account_id, 0, true
+        FROM governance.government_accounts ga
+        ON CONFLICT (guild_id, member_id) DO UPDATE SET is_government = true
+        """
+    )
+
+    for filename in _RELOADED:
+        op.execute(_load_sql(filename))
+
+
+def downgrade() -> None:
+    # 先還原不讀取 is_government 的函式本體，再移除同步觸發器與欄位
+    for sql in _PREVIOUS_FUNCTIONS:
+        op.execute(sql)
+    op.execute(
+        "DROP TRIGGER IF EXISTS trigger_government_accounts_changed"
+        " ON governance.government_accounts"
+    )
+    op.execute(
+        "DROP TRIGGER IF EXISTS trigger_government_account_flag"
+        " ON governance.government_accounts"
+    )
+    op.execute("DROP FUNCTION IF EXISTS governance.fn_sync_government_account_flag()")
+    op.drop_column("guild_member_balances", "is_government", schema="economy")
+
+
+def _load_sql(filename: str) -> str:
+    base_path = Path(__file__).resolve().parents[2]
+    sql_path = base_path / "functions" / filename
+    return sql_path.read_text(encoding="utf-8")
@@ -0,0 +1,53 @@
+"""Project ledger balances onto government accounts.
+
+- Adds `governance.fn_project_government_account_balance` and its trigger on
+  `economy.guild_member_balances`, so flagged ledger rows write their balance
+  to `governance.government_accounts` inside the transfer transaction.
+- Backfills every government account from its ledger row once.
+
+Revision ID: 066_gov_account_balance_proj
+Down Revision: 065_government_account_flag
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from alembic import op
+
+# 注意：revision ID 長度必須在 alembic_version.version_num 欄位限制（目前為 VARCHAR(32)）以內
+revision = "066_gov_account_balance_proj"
+down_revision = "065_government_account_flag"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(_load_sql("governance/fn_government_account_balance.sql"))
+    op.execute(
+        """
+        UPDATE governance.government_accounts AS ga
+        SET balance = b.current_balance,
+            updated_at = timezone('utc', clock_timestamp())
+        FROM economy.guild_member_balances AS b
+        WHERE b.guild_id = ga.guild_id
+          AND b.member_id = ga.account_id
+          AND ga.balance IS DISTINCT FROM b.current_balance
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        DROP TRIGGER IF EXISTS trigger_government_account_balance
+            ON economy.guild_member_balances;
+        DROP FUNCTION IF EXISTS governance.fn_project_government_account_balance();
+        """
+    )
+
+
+def _load_sql(filename: str) -> str:
+    base_path = Path(__file__).resolve().parents[2]
+    sql_path = base_path / "functions" / filename
+    return sql_path.read_text(encoding="utf-8")
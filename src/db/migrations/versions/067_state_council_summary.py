@@ -0,0 +1,71 @@
+"""Aggregate state council summary in one query.
+
+- Adds `governance.fn_state_council_summary(guild_id, month_period)` returning
+  per-department balance, welfare total, tax total, identity action count and
+  current-month issuance in a single round trip.
+- Adds covering indexes so each aggregate is answered from the index alone.
+
+Revision ID: 067_state_council_summary
+Down Revision: 066_gov_account_balance_proj
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from alembic import op
+
+revision = "067_state_council_summary"
+down_revision = "066_gov_account_balance_proj"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_governance_welfare_disbursements_guild_amount",
+        "welfare_disbursements",
+        ["guild_id"],
+        schema="governance",
+        postgresql_include=["amount"],
+    )
+    op.create_index(
+        "ix_governance_tax_records_guild_amount",
+        "tax_records",
+        ["guild_id"],
+        schema="governance",
+        postgresql_include=["tax_amount"],
+    )
+    op.create_index(
+        "ix_governance_currency_issuances_guild_month",
+        "currency_issuances",
+        ["guild_id", "month_period"],
+        schema="governance",
+        postgresql_include=["amount"],
+    )
+    op.execute(_load_sql("governance/fn_state_council_summary.sql"))
+
+
+def downgrade() -> None:
+    op.execute("DROP FUNCTION IF EXISTS governance.fn_state_council_summary(bigint, text)")
+    op.drop_index(
+        "ix_governance_currency_issuances_guild_month",
+        table_name="currency_issuances",
+        schema="governance",
+    )
+    op.drop_index(
+        "ix_governance_tax_records_guild_amount",
+        table_name="tax_records",
+        schema="governance",
+    )
+    op.drop_index(
+        "ix_governance_welfare_disbursements_guild_amount",
+        table_name="welfare_disbursements",
+        schema="governance",
+    )
+
+
+def _load_sql(filename: str) -> str:
+    base_path = Path(__file__).resolve().parents[2]
+    sql_path = base_path / "functions" / filename
+    return sql_path.read_text(encoding="utf-8")
@@ -0,0 +1,86 @@
+"""Aggregate state council reports in SQL.
+
+- Adds `governance.fn_report_financial_totals`, `fn_report_department_metrics`
+  and `fn_report_activity`, which honour the report period in SQL and return
+  only aggregates instead of the raw welfare/tax/identity/issuance rows.
+- Adds (guild_id, timestamp) covering indexes so each period is answered by an
+  index-only range scan.
+
+Revision ID: 068_council_report_aggregates
+Down Revision: 067_state_council_summary
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from alembic import op
+
+# 注意：revision ID 長度必須在 alembic_version.version_num 欄位限制（目前為 VARCHAR(32)）以內
+revision = "068_council_report_aggregates"
+down_revision = "067_state_council_summary"
+branch_labels = None
+depends_on = None
+
+# (索引名稱, 資料表, 時間欄位, 涵蓋欄位)
+_PERIOD_INDEXES = (
+    (
+        "ix_governance_welfare_disbursements_guild_period",
+        "welfare_disbursements",
+        "disbursed_at",
+        ["amount", "recipient_id"],
+    ),
+    (
+        "ix_governance_tax_records_guild_period",
+        "tax_records",
+        "collected_at",
+        ["tax_amount", "taxpayer_id"],
+    ),
+    (
+        "ix_governance_identity_records_guild_period",
+        "identity_records",
+        "performed_at",
+        ["action", "target_id"],
+    ),
+    (
+        "ix_governance_currency_issuances_guild_period",
+        "currency_issuances",
+        "issued_at",
+        ["amount", "performed_by"],
+    ),
+)
+
+
+def upgrade() -> None:
+    for name, table, column, include in _PERIOD_INDEXES:
+        op.create_index(
+            name,
+            table,
+            ["guild_id", column],
+            schema="governance",
+            postgresql_include=include,
+        )
+    op.execute(_load_sql("governance/fn_state_council_reports.sql"))
+
+
+def downgrade() -> None:
+    op.execute(
+        "DROP FUNCTION IF EXISTS governance.fn_report_activity("
+        "bigint, timestamptz, timestamptz, integer)"
+    )
+    op.execute(
+        "DROP FUNCTION IF EXISTS governance.fn_report_department_metrics("
+        "bigint, text, timestamptz, timestamptz)"
+    )
+    op.execute(
+        "DROP FUNCTION IF EXISTS governance.fn_report_financial_totals("
+        "bigint, timestamptz, timestamptz)"
+    )
+    for name, table, _column, _include in reversed(_PERIOD_INDEXES):
+        op.drop_index(name, table_name=table, schema="governance")
+
+
+def _load_sql(filename: str) -> str:
+    base_path = Path(__file__).resolve().parents[2]
+    sql_path = base_path / "functions" / filename
+    return sql_path.read_text(encoding="utf-8")
@@ -0,0 +1,76 @@
+"""Serve balance reads without writing.
+
+- Replaces `economy.fn_get_balance` with a STABLE SQL function that only
+  reads `guild_member_balances` and synthesises a zero balance for members
+  without a ledger row. Ledger rows are created by the first write (transfer,
+  adjustment or government account sync), which already upsert them.
+
+Revision ID: 069_write_free_balance_read
+Down Revision: 068_council_report_aggregates
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from alembic import op
+
+revision = "069_write_free_balance_read"
+down_revision = "068_council_report_aggregates"
+branch_labels = None
+depends_on = None
+
+# 前一版：讀取時以 INSERT ... ON CONFLICT DO NOTHING 補建帳本列
+_UPSERTING_FN_GET_BALANCE = """
+CREATE OR REPLACE FUNCTION economy.fn_get_balance(
+    p_guild_id bigint,
+    p_member_id bigint
+)
+RETURNS TABLE (
+    guild_id bigint,
+    member_id bigint,
+    balance bigint,
+    last_modified_at timestamptz,
+    throttled_until timestamptz
+)
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_now timestamptz := timezone('utc', clock_timestamp());
+BEGIN
+    INSERT INTO economy.guild_member_balances (
+        guild_id,
+        member_id,
+        current_balance,
+        last_modified_at,
+        created_at
+    )
+    VALUES (p_guild_id, p_member_id, 0, v_now, v_now)
+    ON CONFLICT ON CONSTRAINT pk_guild_member_balances DO NOTHING;
+
+    RETURN QUERY
+    SELECT
+        gb.guild_id,
+        gb.member_id,
+        gb.current_balance,
+        gb.last_modified_at,
+        gb.throttled_until
+    FROM economy.guild_member_balances AS gb
+    WHERE gb.guild_id = p_guild_id AND gb.member_id = p_member_id;
+END;
+$$;
+"""
+
+
+def upgrade() -> None:
+    op.execute(_load_sql("fn_get_balance.sql"))
+
+
+def downgrade() -> None:
+    op.execute(_UPSERTING_FN_GET_BALANCE)
+
+
+def _load_sql(filename: str) -> str:
+    base_path = Path(__file__).resolve().parents[2]
+    sql_path = base_path / "functions" / filename
+    return sql_path.read_text(encoding="utf-8")
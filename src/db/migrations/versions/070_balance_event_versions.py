@@ -0,0 +1,738 @@
+"""Carry post-transaction balances and versions on economy NOTIFY payloads.
+
+- `transaction_success` events (single and batched transfers) now include
+  `balance_after_initiator` / `balance_after_target` and the ledger rows'
+  `last_modified_at` as `initiator_version` / `target_version`, plus the
+  target's `target_throttled_until` (the initiator's throttle is always
+  cleared by a transfer).
+- `adjustment_success` events include `balance_after_target`,
+  `target_version` and `target_throttled_until`.
+- Balance writes bump `last_modified_at` by at least one microsecond so the
+  version of a ledger row strictly increases even when a transaction waited
+  on the row lock; the in-process balance cache uses it to order events and
+  reads.
+
+Revision ID: 070_balance_event_versions
+Down Revision: 069_write_free_balance_read
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from alembic import op
+
+revision = "070_balance_event_versions"
+down_revision = "069_write_free_balance_read"
+branch_labels = None
+depends_on = None
+
+_RELOADED = (
+    "fn_transfer_currency.sql",
+    "fn_transfer_currency_batch.sql",
+    "fn_adjust_balance.sql",
+    "fn_notify_adjustment.sql",
+)
+
+# 前一版（069）：payload 不含交易後餘額與版本，last_modified_at 直接設為當下時間
+_PREVIOUS_FUNCTIONS = (
+    # fn_transfer_currency.sql
+    """
+-- Stored procedures implementing economy transfer logic and throttling.
+CREATE OR REPLACE FUNCTION economy.fn_record_throttle(
+    p_guild_id bigint,
+    p_member_id bigint,
+    p_metadata jsonb DEFAULT '{}'::jsonb
+)
+RETURNS timestamptz
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_now timestamptz := timezone('utc', clock_timestamp());
+    v_until timestamptz := v_now + interval '300 seconds';
+    v_metadata jsonb := coalesce(p_metadata, '{}'::jsonb);
+    v_balance bigint;
+BEGIN
+    INSERT INTO economy.guild_member_balances (
+        guild_id,
+        member_id,
+        current_balance,
+        last_modified_at,
+        throttled_until,
+        created_at
+    )
+    VALUES (p_guild_id, p_member_id, 0, v_now, v_until, v_now)
+    ON CONFLICT (guild_id, member_id)
+    DO UPDATE
+        SET throttled_until = v_until,
+            last_modified_at = v_now
+        RETURNING economy.guild_member_balances.current_balance
+        INTO v_balance;
+
+    INSERT INTO economy.currency_transactions (
+        guild_id,
+        initiator_id,
+        target_id,
+        amount,
+        direction,
+        reason,
+        balance_after_initiator,
+        balance_after_target,
+        metadata
+    )
+    VALUES (
+        p_guild_id,
+        p_member_id,
+        NULL,
+        0,
+        'throttle_block',
+        'Transfer throttled',
+        v_balance,
+        NULL,
+        jsonb_strip_nulls(
+            coalesce(v_metadata, '{}'::jsonb)
+            || jsonb_build_object(
+                'throttle_until',
+                v_until,
+                'triggered_at',
+                v_now
+            )
+        )
+    );
+
+    PERFORM economy.fn_emit_economy_event(
+        jsonb_build_object(
+            'event_type',
+            'transaction_denied',
+            'reason',
+            'throttle_block',
+            'guild_id',
+            p_guild_id,
+            'initiator_id',
+            p_member_id,
+            'metadata',
+            jsonb_strip_nulls(
+                coalesce(v_metadata, '{}'::jsonb)
+                || jsonb_build_object(
+                    'throttle_until',
+                    v_until
+                )
+            )
+        )
+    );
+
+    PERFORM economy.fn_flush_economy_events();
+
+    RETURN v_until;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION economy.fn_transfer_currency(
+    p_guild_id bigint,
+    p_initiator_id bigint,
+    p_target_id bigint,
+    p_amount bigint,
+    p_metadata jsonb DEFAULT '{}'::jsonb
+)
+RETURNS economy.transfer_result
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_now timestamptz := timezone('utc', clock_timestamp());
+    v_metadata jsonb := coalesce(p_metadata, '{}'::jsonb);
+    v_initiator_balance bigint;
+    v_target_balance bigint;
+    v_throttled_until timestamptz;
+    v_total_today bigint;
+    v_transaction_id uuid;
+    v_created_at timestamptz;
+    v_reason text := nullif(v_metadata->>'reason', '');
+    -- 以連線層 GUC 控制每日上限；未設定或 <= 0 視為「無上限」
+    v_daily_limit_text text := current_setting('app.transfer_daily_limit', true);
+    v_daily_limit bigint;
+    v_is_government boolean := false;
+BEGIN
+    IF p_initiator_id = p_target_id THEN
+        RAISE EXCEPTION 'Initiator and target must be distinct members for transfers.'
+            USING ERRCODE = '22023';
+    END IF;
+
+    IF p_amount <= 0 THEN
+        RAISE EXCEPTION 'Transfer amount must be a positive whole number.'
+            USING ERRCODE = '22023';
+    END IF;
+
+    -- Ensure ledger rows exist
+    INSERT INTO economy.guild_member_balances (guild_id, member_id, current_balance, last_modified_at, created_at)
+    VALUES (p_guild_id, p_initiator_id, 0, v_now, v_now)
+    ON CONFLICT (guild_id, member_id) DO NOTHING;
+
+    INSERT INTO economy.guild_member_balances (guild_id, member_id, current_balance, last_modified_at, created_at)
+    VALUES (p_guild_id, p_target_id, 0, v_now, v_now)
+    ON CONFLICT (guild_id, member_id) DO NOTHING;
+
+    -- is_government：政府部門帳戶（免除每日上限與冷卻限制），與帳本列一併鎖定讀取
+    SELECT current_balance, throttled_until, is_government
+    INTO v_initiator_balance, v_throttled_until, v_is_government
+    FROM economy.guild_member_balances
+    WHERE guild_id = p_guild_id AND member_id = p_initiator_id
+    FOR UPDATE;
+
+    -- 政府帳戶不受冷卻限制
+    IF (NOT v_is_government) AND v_throttled_until IS NOT NULL AND v_throttled_until > v_now THEN
+        RAISE EXCEPTION 'Transfer throttled: member is on cooldown until %.', v_throttled_until
+            USING ERRCODE = 'P0001';
+    END IF;
+
+    -- 非政府帳戶才檢查每日上限；未設定 GUC 或 <= 0 則跳過檢查（視為無上限）
+    IF NOT v_is_government THEN
+        IF v_daily_limit_text IS NOT NULL AND NULLIF(v_daily_limit_text, '') IS NOT NULL THEN
+            v_daily_limit := v_daily_limit_text::bigint;
+            IF v_daily_limit > 0 THEN
+                -- 當日累計由 member_daily_transfer_totals 維護，O(1) 讀取
+                v_total_today := economy.fn_get_daily_transfer_total(
+                    p_guild_id, p_initiator_id, v_now
+                );
+
+                IF v_total_today + p_amount > v_daily_limit THEN
+                    PERFORM economy.fn_record_throttle(
+                        p_guild_id,
+                        p_initiator_id,
+                        jsonb_build_object(
+                            'reason', 'daily_limit_exceeded',
+                            'limit', v_daily_limit,
+                            'attempted_amount', p_amount,
+                            'total_today', v_total_today
+                        )
+                    );
+
+                    RAISE EXCEPTION 'Transfer throttled: daily limit of % exceeded.', v_daily_limit
+                        USING ERRCODE = 'P0001';
+                END IF;
+            END IF;
+        END IF;
+    END IF;
+
+    IF v_initiator_balance < p_amount THEN
+        RAISE EXCEPTION 'Transfer denied: insufficient funds. Balance available: %.', v_initiator_balance
+            USING ERRCODE = 'P0001';
+    END IF;
+
+    UPDATE economy.guild_member_balances
+    SET current_balance = current_balance - p_amount,
+        last_modified_at = v_now,
+        throttled_until = NULL
+    WHERE guild_id = p_guild_id AND member_id = p_initiator_id
+    RETURNING current_balance
+    INTO v_initiator_balance;
+
+    UPDATE economy.guild_member_balances
+    SET current_balance = current_balance + p_amount,
+        last_modified_at = v_now
+    WHERE guild_id = p_guild_id AND member_id = p_target_id
+    RETURNING current_balance
+    INTO v_target_balance;
+
+    INSERT INTO economy.currency_transactions (
+        guild_id,
+        initiator_id,
+        target_id,
+        amount,
+        direction,
+        reason,
+        balance_after_initiator,
+        balance_after_target,
+        metadata
+    )
+    VALUES (
+        p_guild_id,
+        p_initiator_id,
+        p_target_id,
+        p_amount,
+        'transfer',
+        v_reason,
+        v_initiator_balance,
+        v_target_balance,
+        jsonb_strip_nulls(v_metadata)
+    )
+    RETURNING transaction_id, created_at
+    INTO v_transaction_id, v_created_at;
+
+    PERFORM economy.fn_emit_economy_event(
+        jsonb_build_object(
+            'event_type',
+            'transaction_success',
+            'transaction_id',
+            v_transaction_id,
+            'guild_id',
+            p_guild_id,
+            'initiator_id',
+            p_initiator_id,
+            'target_id',
+            p_target_id,
+            'amount',
+            p_amount,
+            'metadata',
+            jsonb_strip_nulls(v_metadata)
+        )
+    );
+
+    PERFORM economy.fn_flush_economy_events();
+
+    RETURN (
+        v_transaction_id,
+        p_guild_id,
+        p_initiator_id,
+        p_target_id,
+        p_amount,
+        'transfer'::economy.transaction_direction,
+        v_created_at,
+        v_initiator_balance,
+        v_target_balance,
+        NULL::timestamptz,
+        jsonb_strip_nulls(v_metadata)
+    );
+END;
+$$;
+""",
+    # fn_transfer_currency_batch.sql
+    """
+-- Batched transfer procedure: apply N same-guild transfers in a single transaction.
+--
+-- p_transfers 為 JSON 陣列，每個元素包含：
+--   {"initiator_id": bigint, "target_id": bigint, "amount": bigint, "metadata": jsonb}
+-- 回傳順序與輸入順序一致（每筆一列 economy.transfer_result）。
+-- 任一筆失敗（餘額不足、冷卻、每日上限、格式錯誤）會拋出例外並使整批回滾。
+CREATE OR REPLACE FUNCTION economy.fn_transfer_currency_batch(
+    p_guild_id bigint,
+    p_transfers jsonb
+)
+RETURNS SETOF economy.transfer_result
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_now timestamptz := timezone('utc', clock_timestamp());
+    v_item jsonb;
+    v_position bigint;
+    v_initiator_id bigint;
+    v_target_id bigint;
+    v_amount bigint;
+    v_metadata jsonb;
+    v_reason text;
+    v_initiator_balance bigint;
+    v_target_balance bigint;
+    v_throttled_until timestamptz;
+    v_transaction_id uuid;
+    v_created_at timestamptz;
+    v_member_ids bigint[];
+    v_government_ids bigint[];
+    -- 以連線層 GUC 控制每日上限；未設定或 <= 0 視為「無上限」
+    v_daily_limit_text text := current_setting('app.transfer_daily_limit', true);
+    v_daily_limit bigint := 0;
+    v_totals jsonb := '{}'::jsonb;
+    v_total_today bigint;
+    v_result economy.transfer_result;
+BEGIN
+    IF p_transfers IS NULL OR jsonb_typeof(p_transfers) <> 'array' THEN
+        RAISE EXCEPTION 'Batch transfers must be provided as a JSON array.'
+            USING ERRCODE = '22023';
+    END IF;
+
+    IF jsonb_array_length(p_transfers) = 0 THEN
+        RETURN;
+    END IF;
+
+    -- 先完整驗證所有項目，避免套用到一半才發現格式錯誤
+    FOR v_item, v_position IN
+        SELECT e.value, e.ordinality
+        FROM jsonb_array_elements(p_transfers) WITH ORDINALITY AS e(value, ordinality)
+    LOOP
+        v_initiator_id := (v_item->>'initiator_id')::bigint;
+        v_target_id := (v_item->>'target_id')::bigint;
+        v_amount := (v_item->>'amount')::bigint;
+
+        IF v_initiator_id IS NULL OR v_target_id IS NULL OR v_amount IS NULL THEN
+            RAISE EXCEPTION 'Batch transfer #% is missing initiator_id, target_id or amount.', v_position
+                USING ERRCODE = '22023';
+        END IF;
+
+        IF v_initiator_id = v_target_id THEN
+            RAISE EXCEPTION 'Initiator and target must be distinct members for transfers (batch item #%).', v_position
+                USING ERRCODE = '22023';
+        END IF;
+
+        IF v_amount <= 0 THEN
+            RAISE EXCEPTION 'Transfer amount must be a positive whole number (batch item #%).', v_position
+                USING ERRCODE = '22023';
+        END IF;
+    END LOOP;
+
+    SELECT array_agg(DISTINCT m.member_id ORDER BY m.member_id)
+    INTO v_member_ids
+    FROM (
+        SELECT (e.value->>'initiator_id')::bigint AS member_id
+        FROM jsonb_array_elements(p_transfers) AS e(value)
+        UNION
+        SELECT (e.value->>'target_id')::bigint
+        FROM jsonb_array_elements(p_transfers) AS e(value)
+    ) AS m;
+
+    -- Ensure ledger rows exist（一次性建立所有涉及的帳本列）
+    INSERT INTO economy.guild_member_balances (guild_id, member_id, current_balance, last_modified_at, created_at)
+    SELECT p_guild_id, m.member_id, 0, v_now, v_now
+    FROM unnest(v_member_ids) AS m(member_id)
+    ORDER BY m.member_id
+    ON CONFLICT (guild_id, member_id) DO NOTHING;
+
+    -- 依 member_id 固定順序鎖定所有涉及的帳本列，避免並行批次/單筆轉帳互相死結
+    PERFORM 1
+    FROM economy.guild_member_balances
+    WHERE guild_id = p_guild_id
+      AND member_id = ANY(v_member_ids)
+    ORDER BY member_id
+    FOR UPDATE;
+
+    -- 判斷政府部門帳戶（免除每日上限與冷卻限制）：整批只讀一次已鎖定帳本列上的旗標
+    SELECT coalesce(array_agg(b.member_id), ARRAY[]::bigint[])
+    INTO v_government_ids
+    FROM economy.guild_member_balances b
+    WHERE b.guild_id = p_guild_id
+      AND b.member_id = ANY(v_member_ids)
+      AND b.is_government;
+
+    IF v_daily_limit_text IS NOT NULL AND NULLIF(v_daily_limit_text, '') IS NOT NULL THEN
+        v_daily_limit := v_daily_limit_text::bigint;
+    END IF;
+
+    -- 每日上限：一次讀取各發起人今日累計（member_daily_transfer_totals），批次內再逐筆累加
+    IF v_daily_limit > 0 THEN
+        SELECT coalesce(
+                   jsonb_object_agg(
+                       m.member_id::text,
+                       economy.fn_get_daily_transfer_total(p_guild_id, m.member_id, v_now)
+                   ),
+                   '{}'::jsonb
+               )
+        INTO v_totals
+        FROM unnest(v_member_ids) AS m(member_id)
+        WHERE NOT (m.member_id = ANY(v_government_ids));
+    END IF;
+
+    FOR v_item, v_position IN
+        SELECT e.value, e.ordinality
+        FROM jsonb_array_elements(p_transfers) WITH ORDINALITY AS e(value, ordinality)
+    LOOP
+        v_initiator_id := (v_item->>'initiator_id')::bigint;
+        v_target_id := (v_item->>'target_id')::bigint;
+        v_amount := (v_item->>'amount')::bigint;
+        v_metadata := v_item->'metadata';
+        IF v_metadata IS NULL OR jsonb_typeof(v_metadata) <> 'object' THEN
+            v_metadata := '{}'::jsonb;
+        END IF;
+        v_reason := nullif(v_metadata->>'reason', '');
+
+        -- 帳本列已於上方鎖定，這裡僅為讀取最新值
+        SELECT current_balance, throttled_until
+        INTO v_initiator_balance, v_throttled_until
+        FROM economy.guild_member_balances
+        WHERE guild_id = p_guild_id AND member_id = v_initiator_id;
+
+        IF NOT (v_initiator_id = ANY(v_government_ids)) THEN
+            IF v_throttled_until IS NOT NULL AND v_throttled_until > v_now THEN
+                RAISE EXCEPTION 'Transfer throttled: member % is on cooldown until % (batch item #%).',
+                    v_initiator_id, v_throttled_until, v_position
+                    USING ERRCODE = 'P0001';
+            END IF;
+
+            IF v_daily_limit > 0 THEN
+                v_total_today := coalesce((v_totals->>v_initiator_id::text)::bigint, 0);
+
+                IF v_total_today + v_amount > v_daily_limit THEN
+                    PERFORM economy.fn_record_throttle(
+                        p_guild_id,
+                        v_initiator_id,
+                        jsonb_build_object(
+                            'reason', 'daily_limit_exceeded',
+                            'limit', v_daily_limit,
+                            'attempted_amount', v_amount,
+                            'total_today', v_total_today
+                        )
+                    );
+
+                    RAISE EXCEPTION 'Transfer throttled: daily limit of % exceeded (batch item #%).',
+                        v_daily_limit, v_position
+                        USING ERRCODE = 'P0001';
+                END IF;
+
+                v_totals := jsonb_set(
+                    v_totals,
+                    ARRAY[v_initiator_id::text],
+                    to_jsonb(v_total_today + v_amount)
+                );
+            END IF;
+        END IF;
+
+        IF v_initiator_balance < v_amount THEN
+            RAISE EXCEPTION 'Transfer denied: insufficient funds for batch item #%. Balance available: %.',
+                v_position, v_initiator_balance
+                USING ERRCODE = 'P0001';
+        END IF;
+
+        UPDATE economy.guild_member_balances
+        SET current_balance = current_balance - v_amount,
+            last_modified_at = v_now,
+            throttled_until = NULL
+        WHERE guild_id = p_guild_id AND member_id = v_initiator_id
+        RETURNING current_balance
+        INTO v_initiator_balance;
+
+        UPDATE economy.guild_member_balances
+        SET current_balance = current_balance + v_amount,
+            last_modified_at = v_now
+        WHERE guild_id = p_guild_id AND member_id = v_target_id
+        RETURNING current_balance
+        INTO v_target_balance;
+
+        INSERT INTO economy.currency_transactions (
+            guild_id,
+            initiator_id,
+            target_id,
+            amount,
+            direction,
+            reason,
+            balance_after_initiator,
+            balance_after_target,
+            metadata
+        )
+        VALUES (
+            p_guild_id,
+            v_initiator_id,
+            v_target_id,
+            v_amount,
+            'transfer',
+            v_reason,
+            v_initiator_balance,
+            v_target_balance,
+            jsonb_strip_nulls(v_metadata)
+        )
+        RETURNING transaction_id, created_at
+        INTO v_transaction_id, v_created_at;
+
+        -- 與 fn_transfer_currency 相同格式，listener 不需區分單筆或批次
+        PERFORM economy.fn_emit_economy_event(
+            jsonb_build_object(
+                'event_type',
+                'transaction_success',
+                'transaction_id',
+                v_transaction_id,
+                'guild_id',
+                p_guild_id,
+                'initiator_id',
+                v_initiator_id,
+                'target_id',
+                v_target_id,
+                'amount',
+                v_amount,
+                'metadata',
+                jsonb_strip_nulls(v_metadata)
+            )
+        );
+
+        v_result := ROW(
+            v_transaction_id,
+            p_guild_id,
+            v_initiator_id,
+            v_target_id,
+            v_amount,
+            'transfer'::economy.transaction_direction,
+            v_created_at,
+            v_initiator_balance,
+            v_target_balance,
+            NULL::timestamptz,
+            jsonb_strip_nulls(v_metadata)
+        )::economy.transfer_result;
+
+        RETURN NEXT v_result;
+    END LOOP;
+
+    -- 精簡通知模式下，整批的 transaction_success 於此合併送出
+    PERFORM economy.fn_flush_economy_events();
+
+    RETURN;
+END;
+$$;
+""",
+    # fn_adjust_balance.sql
+    """
+-- Stored procedure implementing administrative adjustments (grant/deduct) with audit.
+-- Returns a compact result payload for application consumption.
+
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_type t JOIN pg_namespace n ON n.oid = t.typnamespace
+        WHERE t.typname = 'adjustment_result' AND n.nspname = 'economy'
+    ) THEN
+        CREATE TYPE economy.adjustment_result AS (
+            transaction_id uuid,
+            guild_id bigint,
+            admin_id bigint,
+            target_id bigint,
+            amount bigint,
+            direction economy.transaction_direction,
+            created_at timestamptz,
+            target_balance_after bigint,
+            metadata jsonb
+        );
+    END IF;
+END$$;
+
+CREATE OR REPLACE FUNCTION economy.fn_adjust_balance(
+    p_guild_id bigint,
+    p_admin_id bigint,
+    p_target_id bigint,
+    p_amount bigint,
+    p_reason text,
+    p_metadata jsonb DEFAULT '{}'::jsonb
+)
+RETURNS economy.adjustment_result
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_now timestamptz := timezone('utc', clock_timestamp());
+    v_metadata jsonb := coalesce(p_metadata, '{}'::jsonb);
+    v_reason text := nullif(p_reason, '');
+    v_target_balance bigint;
+    v_direction economy.transaction_direction;
+    v_amount_abs bigint := abs(p_amount);
+    v_tx uuid;
+    v_created timestamptz;
+BEGIN
+    IF v_reason IS NULL THEN
+        RAISE EXCEPTION 'Adjustment reason is required.' USING ERRCODE = '22023';
+    END IF;
+
+    IF p_amount = 0 THEN
+        RAISE EXCEPTION 'Adjustment amount must be non-zero.' USING ERRCODE = '22023';
+    END IF;
+
+    -- Ensure ledger rows exist (FKs require both initiator/admin and target)
+    INSERT INTO economy.guild_member_balances (guild_id, member_id, current_balance, last_modified_at, created_at)
+    VALUES (p_guild_id, p_admin_id, 0, v_now, v_now)
+    ON CONFLICT (guild_id, member_id) DO NOTHING;
+
+    -- Ensure target ledger row exists
+    INSERT INTO economy.guild_member_balances (guild_id, member_id, current_balance, last_modified_at, created_at)
+    VALUES (p_guild_id, p_target_id, 0, v_now, v_now)
+    ON CONFLICT (guild_id, member_id) DO NOTHING;
+
+    IF p_amount > 0 THEN
+        v_direction := 'adjustment_grant';
+        UPDATE economy.guild_member_balances
+        SET current_balance = current_balance + p_amount,
+            last_modified_at = v_now
+        WHERE guild_id = p_guild_id AND member_id = p_target_id
+        RETURNING current_balance INTO v_target_balance;
+    ELSE
+        v_direction := 'adjustment_deduct';
+        -- lock row and validate will not go below zero
+        SELECT current_balance INTO v_target_balance
+        FROM economy.guild_member_balances
+        WHERE guild_id = p_guild_id AND member_id = p_target_id
+        FOR UPDATE;
+
+        IF v_target_balance + p_amount < 0 THEN
+            RAISE EXCEPTION 'Adjustment denied: balance cannot drop below zero.' USING ERRCODE = 'P0001';
+        END IF;
+
+        UPDATE economy.guild_member_balances
+        SET current_balance = current_balance + p_amount,
+            last_modified_at = v_now
+        WHERE guild_id = p_guild_id AND member_id = p_target_id
+        RETURNING current_balance INTO v_target_balance;
+    END IF;
+
+    INSERT INTO economy.currency_transactions (
+        guild_id,
+        initiator_id,
+        target_id,
+        amount,
+        direction,
+        reason,
+        balance_after_initiator,
+        balance_after_target,
+        metadata
+    )
+    VALUES (
+        p_guild_id,
+        p_admin_id,
+        p_target_id,
+        v_amount_abs,
+        v_direction,
+        v_reason,
+        v_target_balance,
+        v_target_balance,
+        jsonb_strip_nulls(v_metadata)
+    )
+    RETURNING transaction_id, created_at INTO v_tx, v_created;
+
+    RETURN (
+        v_tx,
+        p_guild_id,
+        p_admin_id,
+        p_target_id,
+        v_amount_abs,
+        v_direction,
+        v_created,
+        v_target_balance,
+        jsonb_strip_nulls(v_metadata)
+    );
+END;
+$$;
+""",
+    # fn_notify_adjustment.sql
+    """
+-- Trigger function to emit NOTIFY payloads for adjustment transactions.
+
+CREATE OR REPLACE FUNCTION economy.fn_notify_adjustment()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_payload jsonb;
+BEGIN
+    IF NEW.direction IN ('adjustment_grant', 'adjustment_deduct') THEN
+        v_payload := jsonb_build_object(
+            'event_type', 'adjustment_success',
+            'transaction_id', NEW.transaction_id,
+            'guild_id', NEW.guild_id,
+            'admin_id', NEW.initiator_id,
+            'target_id', NEW.target_id,
+            'amount', NEW.amount,
+            'direction', NEW.direction,
+            'reason', NEW.reason,
+            'metadata', NEW.metadata
+        );
+        PERFORM pg_notify('economy_events', v_payload::text);
+    END IF;
+    RETURN NULL;
+END;
+$$;
+""",
+)
+
+
+def upgrade() -> None:
+    for filename in _RELOADED:
+        op.execute(_load_sql(filename))
+
+
+def downgrade() -> None:
+    for sql in _PREVIOUS_FUNCTIONS:
+        op.execute(sql)
+
+
+def _load_sql(filename: str) -> str:
+    base_path = Path(__file__).resolve().parents[2]
+    sql_path = base_path / "functions" / filename
+    return sql_path.read_text(encoding="utf-8")
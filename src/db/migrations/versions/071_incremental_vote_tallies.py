@@ -0,0 +1,137 @@
+"""Maintain vote tallies on the proposal rows and cast votes in one round trip.
+
+- Adds `approve_count` / `reject_count` / `abstain_count` / `total_voted` to
+  `governance.proposals` and `governance.supreme_assembly_proposals`, and
+  backfills them from the vote tables.
+- `governance.fn_upsert_vote` now updates the council counters under the
+  proposal row lock and `governance.fn_fetch_tally` reads them instead of
+  grouping every vote.
+- New `governance.fn_cast_vote` / `governance.fn_cast_supreme_assembly_vote`
+  check the snapshot with a primary-key probe, record the vote, update the
+  counters and apply the pass / early-reject threshold, returning the
+  proposal and its tally in a single call.
+
+Revision ID: 071_incremental_vote_tallies
+Down Revision: 070_balance_event_versions
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "071_incremental_vote_tallies"
+down_revision = "070_balance_event_versions"
+branch_labels = None
+depends_on = None
+
+_COUNTERS = ("approve_count", "reject_count", "abstain_count", "total_voted")
+
+# (提案表, 選票表)
+_TABLES = (
+    ("proposals", "votes"),
+    ("supreme_assembly_proposals", "supreme_assembly_votes"),
+)
+
+_RELOADED = (
+    "governance/fn_council.sql",
+    "governance/fn_supreme_assembly_votes.sql",
+)
+
+# 前一版（070）：fn_upsert_vote 只寫入選票，fn_fetch_tally 由 votes 表分組計數
+_PREVIOUS_COUNCIL_VOTE_FUNCTIONS = """
+-- Upsert a vote
+CREATE OR REPLACE FUNCTION governance.fn_upsert_vote(
+    p_proposal_id uuid,
+    p_voter_id bigint,
+    p_choice text
+) RETURNS void LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO governance.votes (proposal_id, voter_id, choice)
+    VALUES (p_proposal_id, p_voter_id, p_choice)
+    ON CONFLICT (proposal_id, voter_id)
+    DO UPDATE SET choice = EXCLUDED.choice,
+                  updated_at = timezone('utc', clock_timestamp());
+END; $$;
+
+-- Fetch tally counts in one row
+CREATE OR REPLACE FUNCTION governance.fn_fetch_tally(p_proposal_id uuid)
+RETURNS TABLE (
+    approve integer,
+    reject integer,
+    abstain integer,
+    total_voted integer
+) LANGUAGE plpgsql AS $$
+BEGIN
+    RETURN QUERY
+    WITH counts AS (
+        SELECT choice, COUNT(*)::int AS c
+        FROM governance.votes WHERE proposal_id = p_proposal_id
+        GROUP BY choice
+    )
+    SELECT
+        COALESCE(MAX(CASE WHEN choice = 'approve' THEN c END), 0) AS approve,
+        COALESCE(MAX(CASE WHEN choice = 'reject' THEN c END), 0) AS reject,
+        COALESCE(MAX(CASE WHEN choice = 'abstain' THEN c END), 0) AS abstain,
+        COALESCE(SUM(c)::int, 0) AS total_voted
+    FROM counts;
+END; $$;
+"""
+
+
+def upgrade() -> None:
+    for proposals, _ in _TABLES:
+        for column in _COUNTERS:
+            op.add_column(
+                proposals,
+                sa.Column(column, sa.Integer(), nullable=False, server_default=sa.text("0")),
+                schema="governance",
+            )
+
+    for proposals, votes in _TABLES:
+        op.execute(
+            f"""
+            UPDATE governance.{proposals} AS p
+            SET approve_count = t.approve,
+                reject_count = t.reject,
+                abstain_count = t.abstain,
+                total_voted = t.total
+            FROM (
+                SELECT v.proposal_id,
+                       count(*) FILTER (WHERE v.choice = 'approve')::int AS approve,
+                       count(*) FILTER (WHERE v.choice = 'reject')::int AS reject,
+                       count(*) FILTER (WHERE v.choice = 'abstain')::int AS abstain,
+                       count(*)::int AS total
+                FROM governance.{votes} AS v
+                GROUP BY v.proposal_id
+            ) AS t
+            WHERE p.proposal_id = t.proposal_id
+            """
+        )
+
+    for filename in _RELOADED:
+        op.execute(_load_sql(filename))
+
+
+def downgrade() -> None:
+    # 先還原不讀寫計數欄的函式本體，再移除新增的投票函式與計數欄
+    op.execute(_PREVIOUS_COUNCIL_VOTE_FUNCTIONS)
+    op.execute(
+        "DROP FUNCTION IF EXISTS governance.fn_cast_supreme_assembly_vote(uuid, bigint, text)"
+    )
+    op.execute(
+        "DROP FUNCTION IF EXISTS governance.fn_record_supreme_assembly_vote(uuid, bigint, text)"
+    )
+    op.execute("DROP FUNCTION IF EXISTS governance.fn_cast_vote(uuid, bigint, text)")
+
+    for proposals, _ in _TABLES:
+        for column in _COUNTERS:
+            op.drop_column(proposals, column, schema="governance")
+
+
+def _load_sql(filename: str) -> str:
+    base_path = Path(__file__).resolve().parents[2]
+    sql_path = base_path / "functions" / filename
+    return sql_path.read_text(encoding="utf-8")
@@ -0,0 +1,88 @@
+"""Persistent outbox for governance DM fan-out.
+
+- Adds `governance.dm_outbox`: one row per (dedup_key, recipient) with the
+  message payload, delivery status, attempt count and next attempt time.
+- Adds `governance.fn_enqueue_dm`, `fn_claim_dm_outbox` (SKIP LOCKED claim
+  under a lease), `fn_complete_dm_outbox`, `fn_defer_dm_outbox` and
+  `fn_prune_dm_outbox`, used by the bot's DM dispatcher so vote requests,
+  reminders and result broadcasts survive restarts and are queued only once
+  per recipient and key.
+
+Revision ID: 072_governance_dm_outbox
+Down Revision: 071_incremental_vote_tallies
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "072_governance_dm_outbox"
+down_revision = "071_incremental_vote_tallies"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "dm_outbox",
+        sa.Column("outbox_id", sa.BigInteger(), sa.Identity(), nullable=False),
+        sa.Column("guild_id", sa.BigInteger(), nullable=False),
+        sa.Column("recipient_id", sa.BigInteger(), nullable=False),
+        sa.Column("dedup_key", sa.Text(), nullable=False),
+        sa.Column("payload", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("status", sa.Text(), nullable=False, server_default=sa.text("'pending'")),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column(
+            "next_attempt_at",
+            postgresql.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=sa.text("timezone('utc', now())"),
+        ),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at",
+            postgresql.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=sa.text("timezone('utc', now())"),
+        ),
+        sa.Column("sent_at", postgresql.TIMESTAMP(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("outbox_id", name="pk_governance_dm_outbox"),
+        sa.UniqueConstraint("dedup_key", "recipient_id", name="uq_governance_dm_outbox_dedup"),
+        sa.CheckConstraint(
+            "status IN ('pending', 'sent', 'failed')", name="ck_governance_dm_outbox_status"
+        ),
+        schema="governance",
+    )
+    # 領取只掃描待送列
+    op.create_index(
+        "ix_governance_dm_outbox_due",
+        "dm_outbox",
+        ["next_attempt_at"],
+        schema="governance",
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+    op.execute(_load_sql("governance/fn_dm_outbox.sql"))
+
+
+def downgrade() -> None:
+    op.execute("DROP FUNCTION IF EXISTS governance.fn_prune_dm_outbox(timestamptz)")
+    op.execute(
+        "DROP FUNCTION IF EXISTS governance.fn_defer_dm_outbox"
+        "(bigint, text, double precision, boolean)"
+    )
+    op.execute("DROP FUNCTION IF EXISTS governance.fn_complete_dm_outbox(bigint[])")
+    op.execute("DROP FUNCTION IF EXISTS governance.fn_claim_dm_outbox(integer, integer)")
+    op.execute("DROP FUNCTION IF EXISTS governance.fn_enqueue_dm(bigint, bigint[], text, jsonb)")
+    op.drop_index("ix_governance_dm_outbox_due", table_name="dm_outbox", schema="governance")
+    op.drop_table("dm_outbox", schema="governance")
+
+
+def _load_sql(filename: str) -> str:
+    base_path = Path(__file__).resolve().parents[2]
+    sql_path = base_path / "functions" / filename
+    return sql_path.read_text(encoding="utf-8")
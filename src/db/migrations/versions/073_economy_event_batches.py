@@ -0,0 +1,806 @@
+"""Emit batched economy events without re-parsing the per-transaction buffer.
+
+- Adds `economy.fn_emit_economy_events(jsonb)`, which sends an array of events
+  at once (per event by default, chunked batches in compact mode), and
+  `economy._notify_economy_events(jsonb)`, the chunking helper now shared with
+  `fn_flush_economy_events`.
+- `fn_transfer_currency_batch` collects its `transaction_success` events in a
+  local array and emits them once; `fn_expire_pending_transfers` sends its
+  denials directly instead of round-tripping them through the GUC buffer.
+  Appending to the buffer re-parsed and re-serialised it on every event, which
+  was quadratic in the number of recipients.
+- The legacy `fn_check_transfer_*` / `_check_and_approve_transfer` functions
+  notify directly again, so compact mode no longer drops their events when a
+  caller does not flush.
+
+Revision ID: 073_economy_event_batches
+Down Revision: 072_governance_dm_outbox
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from alembic import op
+
+revision = "073_economy_event_batches"
+down_revision = "072_governance_dm_outbox"
+branch_labels = None
+depends_on = None
+
+_RELOADED = (
+    "fn_transfer_currency_batch.sql",
+    "fn_expire_pending_transfers.sql",
+    "fn_check_and_approve_transfer.sql",
+    "fn_check_transfer_balance.sql",
+    "fn_check_transfer_cooldown.sql",
+    "fn_check_transfer_daily_limit.sql",
+)
+
+# 前一版（072）：事件逐筆附加至 GUC 緩衝，舊版檢查函式經 fn_emit_economy_event 送出
+_PREVIOUS_FUNCTIONS = (
+    # fn_economy_events.sql
+    """
+-- Helpers for emitting economy_events notifications.
+--
+-- 預設模式：fn_emit_economy_event 直接 pg_notify，與過去逐筆通知完全相同。
+-- 精簡模式（連線 GUC app.economy_notify_compact = on）：事件先暫存在交易區域
+-- GUC app.economy_event_buffer，直到 fn_flush_economy_events 被呼叫時才合併為
+--   {"event_type": "economy_events_batch", "events": [...]}
+-- 一次送出（超過 NOTIFY 8000 bytes 上限時自動切段）。
+--
+-- 注意：精簡模式下直接呼叫 fn_check_transfer_* 的程式需自行在交易結束前呼叫
+-- fn_flush_economy_events，否則暫存事件會隨交易結束而遺失。
+
+CREATE OR REPLACE FUNCTION economy.fn_emit_economy_event(p_event jsonb)
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF lower(coalesce(current_setting('app.economy_notify_compact', true), '')) IN ('on', 'true', '1') THEN
+        PERFORM set_config(
+            'app.economy_event_buffer',
+            (
+                coalesce(nullif(current_setting('app.economy_event_buffer', true), ''), '[]')::jsonb
+                || jsonb_build_array(p_event)
+            )::text,
+            true
+        );
+    ELSE
+        PERFORM pg_notify('economy_events', p_event::text);
+    END IF;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION economy.fn_flush_economy_events()
+RETURNS integer
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    -- NOTIFY payload 上限為 8000 bytes；保留空間給外層包裝
+    c_max_payload_bytes constant integer := 7000;
+    v_buffer jsonb := coalesce(nullif(current_setting('app.economy_event_buffer', true), ''), '[]')::jsonb;
+    v_chunk jsonb := '[]'::jsonb;
+    v_event jsonb;
+    v_sent integer := 0;
+BEGIN
+    IF jsonb_array_length(v_buffer) = 0 THEN
+        RETURN 0;
+    END IF;
+
+    PERFORM set_config('app.economy_event_buffer', '[]', true);
+
+    FOR v_event IN SELECT e.value FROM jsonb_array_elements(v_buffer) AS e(value)
+    LOOP
+        IF jsonb_array_length(v_chunk) > 0
+           AND octet_length(v_chunk::text) + octet_length(v_event::text) > c_max_payload_bytes THEN
+            PERFORM economy._notify_economy_event_chunk(v_chunk);
+            v_sent := v_sent + 1;
+            v_chunk := '[]'::jsonb;
+        END IF;
+        v_chunk := v_chunk || jsonb_build_array(v_event);
+    END LOOP;
+
+    PERFORM economy._notify_economy_event_chunk(v_chunk);
+    RETURN v_sent + 1;
+END;
+$$;
+
+-- 單一事件的分段直接以原格式送出，讓尚未支援批次格式的監聽端仍可解析
+CREATE OR REPLACE FUNCTION economy._notify_economy_event_chunk(p_events jsonb)
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF jsonb_array_length(p_events) = 1 THEN
+        PERFORM pg_notify('economy_events', (p_events->0)::text);
+    ELSE
+        PERFORM pg_notify(
+            'economy_events',
+            jsonb_build_object(
+                'event_type', 'economy_events_batch',
+                'events', p_events
+            )::text
+        );
+    END IF;
+END;
+$$;
+""",
+    # fn_transfer_currency_batch.sql
+    """
+-- Batched transfer procedure: apply N same-guild transfers in a single transaction.
+--
+-- p_transfers 為 JSON 陣列，每個元素包含：
+--   {"initiator_id": bigint, "target_id": bigint, "amount": bigint, "metadata": jsonb}
+-- 回傳順序與輸入順序一致（每筆一列 economy.transfer_result）。
+-- 任一筆失敗（餘額不足、冷卻、每日上限、格式錯誤）會拋出例外並使整批回滾。
+CREATE OR REPLACE FUNCTION economy.fn_transfer_currency_batch(
+    p_guild_id bigint,
+    p_transfers jsonb
+)
+RETURNS SETOF economy.transfer_result
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_now timestamptz := timezone('utc', clock_timestamp());
+    v_item jsonb;
+    v_position bigint;
+    v_initiator_id bigint;
+    v_target_id bigint;
+    v_amount bigint;
+    v_metadata jsonb;
+    v_reason text;
+    v_initiator_balance bigint;
+    v_target_balance bigint;
+    v_initiator_version timestamptz;
+    v_target_version timestamptz;
+    v_target_throttled_until timestamptz;
+    v_throttled_until timestamptz;
+    v_transaction_id uuid;
+    v_created_at timestamptz;
+    v_member_ids bigint[];
+    v_government_ids bigint[];
+    -- 以連線層 GUC 控制每日上限；未設定或 <= 0 視為「無上限」
+    v_daily_limit_text text := current_setting('app.transfer_daily_limit', true);
+    v_daily_limit bigint := 0;
+    v_totals jsonb := '{}'::jsonb;
+    v_total_today bigint;
+    v_result economy.transfer_result;
+BEGIN
+    IF p_transfers IS NULL OR jsonb_typeof(p_transfers) <> 'array' THEN
+        RAISE EXCEPTION 'Batch transfers must be provided as a JSON array.'
+            USING ERRCODE = '22023';
+    END IF;
+
+    IF jsonb_array_length(p_transfers) = 0 THEN
+        RETURN;
+    END IF;
+
+    -- 先完整驗證所有項目，避免套用到一半才發現格式錯誤
+    FOR v_item, v_position IN
+        SELECT e.value, e.ordinality
+        FROM jsonb_array_elements(p_transfers) WITH ORDINALITY AS e(value, ordinality)
+    LOOP
+        v_initiator_id := (v_item->>'initiator_id')::bigint;
+        v_target_id := (v_item->>'target_id')::bigint;
+        v_amount := (v_item->>'amount')::bigint;
+
+        IF v_initiator_id IS NULL OR v_target_id IS NULL OR v_amount IS NULL THEN
+            RAISE EXCEPTION 'Batch transfer #% is missing initiator_id, target_id or amount.', v_position
+                USING ERRCODE = '22023';
+        END IF;
+
+        IF v_initiator_id = v_target_id THEN
+            RAISE EXCEPTION 'Initiator and target must be distinct members for transfers (batch item #%).', v_position
+                USING ERRCODE = '22023';
+        END IF;
+
+        IF v_amount <= 0 THEN
+            RAISE EXCEPTION 'Transfer amount must be a positive whole number (batch item #%).', v_position
+                USING ERRCODE = '22023';
+        END IF;
+    END LOOP;
+
+    SELECT array_agg(DISTINCT m.member_id ORDER BY m.member_id)
+    INTO v_member_ids
+    FROM (
+        SELECT (e.value->>'initiator_id')::bigint AS member_id
+        FROM jsonb_array_elements(p_transfers) AS e(value)
+        UNION
+        SELECT (e.value->>'target_id')::bigint
+        FROM jsonb_array_elements(p_transfers) AS e(value)
+    ) AS m;
+
+    -- Ensure ledger rows exist（一次性建立所有涉及的帳本列）
+    INSERT INTO economy.guild_member_balances (guild_id, member_id, current_balance, last_modified_at, created_at)
+    SELECT p_guild_id, m.member_id, 0, v_now, v_now
+    FROM unnest(v_member_ids) AS m(member_id)
+    ORDER BY m.member_id
+    ON CONFLICT (guild_id, member_id) DO NOTHING;
+
+    -- 依 member_id 固定順序鎖定所有涉及的帳本列，避免並行批次/單筆轉帳互相死結
+    PERFORM 1
+    FROM economy.guild_member_balances
+    WHERE guild_id = p_guild_id
+      AND member_id = ANY(v_member_ids)
+    ORDER BY member_id
+    FOR UPDATE;
+
+    -- 判斷政府部門帳戶（免除每日上限與冷卻限制）：整批只讀一次已鎖定帳本列上的旗標
+    SELECT coalesce(array_agg(b.member_id), ARRAY[]::bigint[])
+    INTO v_government_ids
+    FROM economy.guild_member_balances b
+    WHERE b.guild_id = p_guild_id
+      AND b.member_id = ANY(v_member_ids)
+      AND b.is_government;
+
+    IF v_daily_limit_text IS NOT NULL AND NULLIF(v_daily_limit_text, '') IS NOT NULL THEN
+        v_daily_limit := v_daily_limit_text::bigint;
+    END IF;
+
+    -- 每日上限：一次讀取各發起人今日累計（member_daily_transfer_totals），批次內再逐筆累加
+    IF v_daily_limit > 0 THEN
+        SELECT coalesce(
+                   jsonb_object_agg(
+                       m.member_id::text,
+                       economy.fn_get_daily_transfer_total(p_guild_id, m.member_id, v_now)
+                   ),
+                   '{}'::jsonb
+               )
+        INTO v_totals
+        FROM unnest(v_member_ids) AS m(member_id)
+        WHERE NOT (m.member_id = ANY(v_government_ids));
+    END IF;
+
+    FOR v_item, v_position IN
+        SELECT e.value, e.ordinality
+        FROM jsonb_array_elements(p_transfers) WITH ORDINALITY AS e(value, ordinality)
+    LOOP
+        v_initiator_id := (v_item->>'initiator_id')::bigint;
+        v_target_id := (v_item->>'target_id')::bigint;
+        v_amount := (v_item->>'amount')::bigint;
+        v_metadata := v_item->'metadata';
+        IF v_metadata IS NULL OR jsonb_typeof(v_metadata) <> 'object' THEN
+            v_metadata := '{}'::jsonb;
+        END IF;
+        v_reason := nullif(v_metadata->>'reason', '');
+
+        -- 帳本列已於上方鎖定，這裡僅為讀取最新值
+        SELECT current_balance, throttled_until
+        INTO v_initiator_balance, v_throttled_until
+        FROM economy.guild_member_balances
+        WHERE guild_id = p_guild_id AND member_id = v_initiator_id;
+
+        IF NOT (v_initiator_id = ANY(v_government_ids)) THEN
+            IF v_throttled_until IS NOT NULL AND v_throttled_until > v_now THEN
+                RAISE EXCEPTION 'Transfer throttled: member % is on cooldown until % (batch item #%).',
+                    v_initiator_id, v_throttled_until, v_position
+                    USING ERRCODE = 'P0001';
+            END IF;
+
+            IF v_daily_limit > 0 THEN
+                v_total_today := coalesce((v_totals->>v_initiator_id::text)::bigint, 0);
+
+                IF v_total_today + v_amount > v_daily_limit THEN
+                    PERFORM economy.fn_record_throttle(
+                        p_guild_id,
+                        v_initiator_id,
+                        jsonb_build_object(
+                            'reason', 'daily_limit_exceeded',
+                            'limit', v_daily_limit,
+                            'attempted_amount', v_amount,
+                            'total_today', v_total_today
+                        )
+                    );
+
+                    RAISE EXCEPTION 'Transfer throttled: daily limit of % exceeded (batch item #%).',
+                        v_daily_limit, v_position
+                        USING ERRCODE = 'P0001';
+                END IF;
+
+                v_totals := jsonb_set(
+                    v_totals,
+                    ARRAY[v_initiator_id::text],
+                    to_jsonb(v_total_today + v_amount)
+                );
+            END IF;
+        END IF;
+
+        IF v_initiator_balance < v_amount THEN
+            RAISE EXCEPTION 'Transfer denied: insufficient funds for batch item #%. Balance available: %.',
+                v_position, v_initiator_balance
+                USING ERRCODE = 'P0001';
+        END IF;
+
+        -- 同一批次內同一成員可能被更新多次，版本（last_modified_at）須嚴格遞增
+        UPDATE economy.guild_member_balances
+        SET current_balance = current_balance - v_amount,
+            last_modified_at = greatest(v_now, last_modified_at + interval '1 microsecond'),
+            throttled_until = NULL
+        WHERE guild_id = p_guild_id AND member_id = v_initiator_id
+        RETURNING current_balance, last_modified_at
+        INTO v_initiator_balance, v_initiator_version;
+
+        UPDATE economy.guild_member_balances
+        SET current_balance = current_balance + v_amount,
+            last_modified_at = greatest(v_now, last_modified_at + interval '1 microsecond')
+        WHERE guild_id = p_guild_id AND member_id = v_target_id
+        RETURNING current_balance, last_modified_at, throttled_until
+        INTO v_target_balance, v_target_version, v_target_throttled_until;
+
+        INSERT INTO economy.currency_transactions (
+            guild_id,
+            initiator_id,
+            target_id,
+            amount,
+            direction,
+            reason,
+            balance_after_initiator,
+            balance_after_target,
+            metadata
+        )
+        VALUES (
+            p_guild_id,
+            v_initiator_id,
+            v_target_id,
+            v_amount,
+            'transfer',
+            v_reason,
+            v_initiator_balance,
+            v_target_balance,
+            jsonb_strip_nulls(v_metadata)
+        )
+        RETURNING transaction_id, created_at
+        INTO v_transaction_id, v_created_at;
+
+        -- 與 fn_transfer_currency 相同格式，listener 不需區分單筆或批次
+        PERFORM economy.fn_emit_economy_event(
+            jsonb_build_object(
+                'event_type',
+                'transaction_success',
+                'transaction_id',
+                v_transaction_id,
+                'guild_id',
+                p_guild_id,
+                'initiator_id',
+                v_initiator_id,
+                'target_id',
+                v_target_id,
+                'amount',
+                v_amount,
+                'balance_after_initiator',
+                v_initiator_balance,
+                'balance_after_target',
+                v_target_balance,
+                'initiator_version',
+                v_initiator_version,
+                'target_version',
+                v_target_version,
+                'target_throttled_until',
+                v_target_throttled_until,
+                'metadata',
+                jsonb_strip_nulls(v_metadata)
+            )
+        );
+
+        v_result := ROW(
+            v_transaction_id,
+            p_guild_id,
+            v_initiator_id,
+            v_target_id,
+            v_amount,
+            'transfer'::economy.transaction_direction,
+            v_created_at,
+            v_initiator_balance,
+            v_target_balance,
+            NULL::timestamptz,
+            jsonb_strip_nulls(v_metadata)
+        )::economy.transfer_result;
+
+        RETURN NEXT v_result;
+    END LOOP;
+
+    -- 精簡通知模式下，整批的 transaction_success 於此合併送出
+    PERFORM economy.fn_flush_economy_events();
+
+    RETURN;
+END;
+$$;
+""",
+    # fn_expire_pending_transfers.sql
+    """
+-- Set-based expiry sweep for pending transfers.
+--
+-- 以單一 UPDATE ... RETURNING 將至多 p_limit 筆逾期（pending/checking）的轉帳標記為 rejected，
+-- 並將所有 transaction_denied 事件合併為 economy_events_batch 通知送出（超過 NOTIFY 上限時
+-- 由 fn_flush_economy_events 自動切段）。呼叫端以固定批量重複呼叫直到回傳筆數少於 p_limit，
+-- 避免大量積壓時形成單一巨大交易。FOR UPDATE SKIP LOCKED 讓多個副本可同時清理。
+CREATE OR REPLACE FUNCTION economy.fn_expire_pending_transfers(p_limit integer DEFAULT 1000)
+RETURNS SETOF uuid
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_ids uuid[];
+    v_events jsonb;
+BEGIN
+    WITH due AS (
+        SELECT pt.transfer_id
+        FROM economy.pending_transfers pt
+        WHERE pt.expires_at IS NOT NULL
+          AND pt.expires_at < clock_timestamp()
+          AND pt.status IN ('pending', 'checking')
+        ORDER BY pt.expires_at
+        LIMIT p_limit
+        FOR UPDATE SKIP LOCKED
+    ),
+    expired AS (
+        UPDATE economy.pending_transfers pt
+        SET status = 'rejected',
+            next_retry_at = NULL,
+            updated_at = timezone('utc', clock_timestamp())
+        FROM due
+        WHERE pt.transfer_id = due.transfer_id
+        RETURNING pt.transfer_id, pt.guild_id, pt.initiator_id, pt.target_id, pt.amount
+    )
+    SELECT
+        coalesce(array_agg(e.transfer_id), ARRAY[]::uuid[]),
+        coalesce(
+            jsonb_agg(
+                jsonb_build_object(
+                    'event_type', 'transaction_denied',
+                    'reason', 'transfer_checks_expired',
+                    'transfer_id', e.transfer_id,
+                    'guild_id', e.guild_id,
+                    'initiator_id', e.initiator_id,
+                    'target_id', e.target_id,
+                    'amount', e.amount
+                )
+            ),
+            '[]'::jsonb
+        )
+    INTO v_ids, v_events
+    FROM expired e;
+
+    IF cardinality(v_ids) > 0 THEN
+        -- 不論是否啟用精簡模式，逾期拒絕一律合併送出，避免逐筆 NOTIFY
+        PERFORM set_config(
+            'app.economy_event_buffer',
+            (
+                coalesce(nullif(current_setting('app.economy_event_buffer', true), ''), '[]')::jsonb
+                || v_events
+            )::text,
+            true
+        );
+        PERFORM economy.fn_flush_economy_events();
+    END IF;
+
+    RETURN QUERY SELECT unnest(v_ids);
+END;
+$$;
+""",
+    # fn_check_and_approve_transfer.sql
+    """
+-- Internal helper function to check if all checks passed and approve transfer
+CREATE OR REPLACE FUNCTION economy._check_and_approve_transfer(p_transfer_id uuid)
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_guild_id bigint;
+    v_initiator_id bigint;
+    v_target_id bigint;
+    v_amount bigint;
+BEGIN
+    -- 以單一原子 UPDATE 判斷所有檢查是否通過，並從 checking 轉為 approved。
+    -- 若並行呼叫，僅會有 1 筆能成功更新（避免重複核准與重複通知）。
+    UPDATE economy.pending_transfers pt
+    SET status = 'approved',
+        updated_at = timezone('utc', clock_timestamp())
+    WHERE pt.transfer_id = p_transfer_id
+      AND pt.status = 'checking'
+      AND (pt.checks->>'balance') IS NOT NULL
+      AND (pt.checks->>'cooldown') IS NOT NULL
+      AND (pt.checks->>'daily_limit') IS NOT NULL
+      AND (pt.checks->>'balance')::int = 1
+      AND (pt.checks->>'cooldown')::int = 1
+      AND (pt.checks->>'daily_limit')::int = 1;
+
+    IF NOT FOUND THEN
+        RETURN; -- 不是 checking 狀態或尚未全部通過，或已被其他交易更新
+    END IF;
+
+    -- 取出必要欄位以便通知（這裡不需要 FOR UPDATE，因為狀態已更新為 approved）
+    SELECT guild_id, initiator_id, target_id, amount
+    INTO v_guild_id, v_initiator_id, v_target_id, v_amount
+    FROM economy.pending_transfers
+    WHERE transfer_id = p_transfer_id;
+
+    -- 發送核准事件
+    PERFORM economy.fn_emit_economy_event(
+        jsonb_build_object(
+            'event_type', 'transfer_check_approved',
+            'transfer_id', p_transfer_id,
+            'guild_id', v_guild_id,
+            'initiator_id', v_initiator_id,
+            'target_id', v_target_id,
+            'amount', v_amount
+        )
+    );
+END;
+$$;
+""",
+    # fn_check_transfer_balance.sql
+    """
+-- Check if initiator has sufficient balance
+CREATE OR REPLACE FUNCTION economy.fn_check_transfer_balance(p_transfer_id uuid)
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_guild_id bigint;
+    v_initiator_id bigint;
+    v_amount bigint;
+    v_balance bigint;
+    v_check_result int;
+BEGIN
+    SELECT guild_id, initiator_id, amount
+    INTO v_guild_id, v_initiator_id, v_amount
+    FROM economy.pending_transfers
+    WHERE transfer_id = p_transfer_id;
+
+    IF NOT FOUND THEN
+        RETURN;
+    END IF;
+
+    -- Ensure ledger row exists
+    INSERT INTO economy.guild_member_balances (guild_id, member_id, current_balance, last_modified_at, created_at)
+    VALUES (v_guild_id, v_initiator_id, 0, timezone('utc', clock_timestamp()), timezone('utc', clock_timestamp()))
+    ON CONFLICT (guild_id, member_id) DO NOTHING;
+
+    -- Get current balance
+    SELECT current_balance
+    INTO v_balance
+    FROM economy.guild_member_balances
+    WHERE guild_id = v_guild_id AND member_id = v_initiator_id;
+
+    -- Set check result: 1 if sufficient, 0 if insufficient
+    v_check_result := CASE WHEN v_balance >= v_amount THEN 1 ELSE 0 END;
+
+    -- Update checks JSONB
+    UPDATE economy.pending_transfers
+    SET checks = jsonb_set(
+        coalesce(checks, '{}'::jsonb),
+        '{balance}',
+        to_jsonb(v_check_result)
+    ),
+    updated_at = timezone('utc', clock_timestamp())
+    WHERE transfer_id = p_transfer_id;
+
+    -- Send NOTIFY event
+    PERFORM economy.fn_emit_economy_event(
+        jsonb_build_object(
+            'event_type',
+            'transfer_check_result',
+            'transfer_id',
+            p_transfer_id,
+            'check_type',
+            'balance',
+            'result',
+            v_check_result,
+            'guild_id',
+            v_guild_id,
+            'initiator_id',
+            v_initiator_id,
+            'balance',
+            v_balance,
+            'required',
+            v_amount
+        )
+    );
+
+    -- Check if all checks are complete and passed
+    PERFORM economy._check_and_approve_transfer(p_transfer_id);
+END;
+$$;
+""",
+    # fn_check_transfer_cooldown.sql
+    """
+-- Check if initiator is on cooldown
+CREATE OR REPLACE FUNCTION economy.fn_check_transfer_cooldown(p_transfer_id uuid)
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_guild_id bigint;
+    v_initiator_id bigint;
+    v_throttled_until timestamptz;
+    v_now timestamptz := timezone('utc', clock_timestamp());
+    v_check_result int;
+    v_is_government boolean := false;
+BEGIN
+    SELECT guild_id, initiator_id
+    INTO v_guild_id, v_initiator_id
+    FROM economy.pending_transfers
+    WHERE transfer_id = p_transfer_id;
+
+    IF NOT FOUND THEN
+        RETURN;
+    END IF;
+
+    -- 冷卻時間與政府帳戶旗標（is_government）位於同一帳本列
+    SELECT throttled_until, is_government
+    INTO v_throttled_until, v_is_government
+    FROM economy.guild_member_balances
+    WHERE guild_id = v_guild_id AND member_id = v_initiator_id;
+
+    -- Exempt government accounts from cooldown
+    IF coalesce(v_is_government, false) THEN
+        v_check_result := 1;
+    ELSE
+        -- Set check result: 1 if not throttled or expired, 0 if still throttled
+        v_check_result := CASE
+            WHEN v_throttled_until IS NULL THEN 1
+            WHEN v_throttled_until <= v_now THEN 1
+            ELSE 0
+        END;
+    END IF;
+
+    -- Update checks JSONB
+    UPDATE economy.pending_transfers
+    SET checks = jsonb_set(
+        coalesce(checks, '{}'::jsonb),
+        '{cooldown}',
+        to_jsonb(v_check_result)
+    ),
+    updated_at = timezone('utc', clock_timestamp())
+    WHERE transfer_id = p_transfer_id;
+
+    -- Send NOTIFY event
+    PERFORM economy.fn_emit_economy_event(
+        jsonb_build_object(
+            'event_type',
+            'transfer_check_result',
+            'transfer_id',
+            p_transfer_id,
+            'check_type',
+            'cooldown',
+            'result',
+            v_check_result,
+            'guild_id',
+            v_guild_id,
+            'initiator_id',
+            v_initiator_id,
+            'throttled_until',
+            v_throttled_until
+        )
+    );
+
+    -- Check if all checks are complete and passed
+    PERFORM economy._check_and_approve_transfer(p_transfer_id);
+END;
+$$;
+""",
+    # fn_check_transfer_daily_limit.sql
+    """
+-- Check if initiator has exceeded daily transfer limit
+CREATE OR REPLACE FUNCTION economy.fn_check_transfer_daily_limit(p_transfer_id uuid)
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_guild_id bigint;
+    v_initiator_id bigint;
+    v_amount bigint;
+    v_total_today bigint;
+    -- 讀取應用層連線 GUC；未設定或 <= 0 視為「無上限」
+    v_daily_limit_text text := current_setting('app.transfer_daily_limit', true);
+    v_daily_limit bigint;
+    v_check_result int;
+    v_now timestamptz := timezone('utc', clock_timestamp());
+    v_is_government boolean := false;
+BEGIN
+    SELECT guild_id, initiator_id, amount
+    INTO v_guild_id, v_initiator_id, v_amount
+    FROM economy.pending_transfers
+    WHERE transfer_id = p_transfer_id;
+
+    IF NOT FOUND THEN
+        RETURN;
+    END IF;
+
+    -- Check if initiator is a government account（帳本列上的 is_government 旗標）
+    SELECT coalesce(
+        (
+            SELECT b.is_government
+            FROM economy.guild_member_balances b
+            WHERE b.guild_id = v_guild_id AND b.member_id = v_initiator_id
+        ),
+        false
+    )
+    INTO v_is_government;
+
+    -- Exempt government accounts from daily limit
+    IF v_is_government THEN
+        v_check_result := 1;
+    ELSE
+        -- 若未提供 GUC 或提供空字串／非正數，則視為「無上限」直接通過
+        IF v_daily_limit_text IS NULL OR NULLIF(v_daily_limit_text, '') IS NULL THEN
+            v_check_result := 1;
+        ELSE
+            v_daily_limit := v_daily_limit_text::bigint;
+            IF v_daily_limit <= 0 THEN
+                v_check_result := 1;
+            ELSE
+                -- 當日累計由 member_daily_transfer_totals 維護，O(1) 讀取
+                v_total_today := economy.fn_get_daily_transfer_total(
+                    v_guild_id, v_initiator_id, v_now
+                );
+
+                -- Set check result: 1 if within limit, 0 if exceeded
+                v_check_result := CASE
+                    WHEN v_total_today + v_amount <= v_daily_limit THEN 1
+                    ELSE 0
+                END;
+            END IF;
+        END IF;
+    END IF;
+
+    -- Update checks JSONB
+    UPDATE economy.pending_transfers
+    SET checks = jsonb_set(
+        coalesce(checks, '{}'::jsonb),
+        '{daily_limit}',
+        to_jsonb(v_check_result)
+    ),
+    updated_at = timezone('utc', clock_timestamp())
+    WHERE transfer_id = p_transfer_id;
+
+    -- Send NOTIFY event
+    PERFORM economy.fn_emit_economy_event(
+        jsonb_build_object(
+            'event_type',
+            'transfer_check_result',
+            'transfer_id',
+            p_transfer_id,
+            'check_type',
+            'daily_limit',
+            'result',
+            v_check_result,
+            'guild_id',
+            v_guild_id,
+            'initiator_id',
+            v_initiator_id,
+            'total_today',
+            v_total_today,
+            'attempted_amount',
+            v_amount,
+            'limit',
+            v_daily_limit
+        )
+    );
+
+    -- Check if all checks are complete and passed
+    PERFORM economy._check_and_approve_transfer(p_transfer_id);
+END;
+$$;
+""",
+)
+
+
+def upgrade() -> None:
+    op.execute(_load_sql("fn_economy_events.sql"))
+    for filename in _RELOADED:
+        op.execute(_load_sql(filename))
+
+
+def downgrade() -> None:
+    for sql in _PREVIOUS_FUNCTIONS:
+        op.execute(sql)
+    op.execute("DROP FUNCTION IF EXISTS economy.fn_emit_economy_events(jsonb)")
+    op.execute("DROP FUNCTION IF EXISTS economy._notify_economy_events(jsonb)")
+
+
+def _load_sql(filename: str) -> str:
+    base_path = Path(__file__).resolve().parents[2]
+    sql_path = base_path / "functions" / filename
+    return sql_path.read_text(encoding="utf-8")
@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import json
 import os
+import time
 from typing import TYPE_CHECKING, Any, cast
 from weakref import WeakKeyDictionary
 
@@ -65,6 +66,73 @@ _POOL_LOCKS: "WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = Weak
 _POOLS: "WeakKeyDictionary[asyncio.AbstractEventLoop, asyncpg.Pool]" = WeakKeyDictionary()
 _last_pool: asyncpg.Pool | None = None
 
+# 讀取副本落後量的檢查間隔；超過 3 個間隔未取得新量測值也視為過期
+_REPLICA_LAG_CHECK_SECONDS = 1.0
+_REPLICA_LAG_SQL = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE coalesce(extract(epoch FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+"""
+
+
+class _ReplicaMonitor:
+    """Holds the read replica pool and tracks its replication lag in the background."""
+
+    def __init__(self, pool: asyncpg.Pool, *, max_lag_seconds: float) -> None:
+        self.pool = pool
+        self._max_lag = max_lag_seconds
+        self._lag: float | None = None
+        self._checked_at = 0.0
+        self._fresh = False
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run(), name="db-read-replica-lag")
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def is_fresh(self) -> bool:
+        if self._lag is None or self._lag > self._max_lag:
+            return False
+        return time.monotonic() - self._checked_at <= 3 * _REPLICA_LAG_CHECK_SECONDS
+
+    async def check(self) -> None:
+        try:
+            async with self.pool.acquire() as conn:
+                lag = await cast(Any, conn).fetchval(_REPLICA_LAG_SQL)
+            self._lag = float(lag or 0)
+            self._checked_at = time.monotonic()
+        except Exception as exc:
+            self._lag = None
+            LOGGER.debug("db.read_pool.lag_check_failed", error=str(exc))
+
+        fresh = self.is_fresh()
+        if fresh != self._fresh:
+            self._fresh = fresh
+            if fresh:
+                LOGGER.info("db.read_pool.fresh", lag_seconds=self._lag)
+            else:
+                LOGGER.warning(
+                    "db.read_pool.stale", lag_seconds=self._lag, max_lag_seconds=self._max_lag
+                )
+
+    async def _run(self) -> None:
+        while True:
+            await self.check()
+            await asyncio.sleep(_REPLICA_LAG_CHECK_SECONDS)
+
+
+_REPLICAS: "WeakKeyDictionary[asyncio.AbstractEventLoop, _ReplicaMonitor]" = WeakKeyDictionary()
+
 
 async def init_pool(config: PoolConfig | None = None) -> asyncpg.Pool:
     """Initialise the asyncpg pool if it does not already exist."""
@@ -96,6 +164,7 @@ async def init_pool(config: PoolConfig | None = None) -> asyncpg.Pool:
             max_size=pool_config.max_size,
             init=_configure_connection,
             connection_class=_PatchedConnection,
+            server_settings=_server_settings(),
         )
         _POOLS[loop] = pool
         _last_pool = pool
@@ -130,14 +199,63 @@ async def init_pool(config: PoolConfig | None = None) -> asyncpg.Pool:
         except Exception as exc:  # pragma: no cover - non-fatal
             LOGGER.warning("db.pool.schema_check_failed", error=str(exc))
 
+        if pool_config.read_dsn:
+            await _init_read_pool(loop, pool_config)
+
         LOGGER.info(
             "db.pool.initialised",
             min_size=pool_config.min_size,
             max_size=pool_config.max_size,
+            read_replica=pool_config.read_dsn is not None,
         )
         return pool
 
 
+async def _init_read_pool(loop: asyncio.AbstractEventLoop, pool_config: PoolConfig) -> None:
+    """Create the replica pool; a replica that cannot be reached only disables routing."""
+    _apg = cast(Any, asyncpg)
+    try:
+        read_pool = await _apg.create_pool(
+            dsn=pool_config.read_dsn,
+            min_size=pool_config.min_size,
+            max_size=pool_config.max_size,
+            init=_configure_connection,
+            connection_class=_PatchedConnection,
+            # 副本連線一律唯讀，誤將寫入路由過來時會立即失敗而非靜默成功
+            server_settings={**_server_settings(), "default_transaction_read_only": "on"},
+        )
+    except Exception as exc:
+        LOGGER.warning("db.read_pool.init_failed", error=str(exc))
+        return
+
+    monitor = _ReplicaMonitor(read_pool, max_lag_seconds=pool_config.database_read_max_lag_seconds)
+    await monitor.check()
+    monitor.start()
+    _REPLICAS[loop] = monitor
+
+
+async def connect_listener(config: PoolConfig | None = None) -> asyncpg.Connection:
+    """Open a standalone (non-pool) connection for long-lived LISTEN sessions.
+
+    LISTEN 連線會在整個程序生命週期內持有；獨立建立可避免長期佔用 pool 名額，
+    斷線時也能由呼叫端單獨重連，不影響 pool 內其他連線。
+    """
+    if config is None:
+        load_dotenv(override=False)
+        pool_config = PoolConfig.model_validate({})
+    else:
+        pool_config = config
+
+    _apg = cast(Any, asyncpg)
+    connection = await _apg.connect(
+        dsn=pool_config.dsn,
+        connection_class=_PatchedConnection,
+        server_settings=_server_settings(),
+    )
+    await _configure_connection(connection)
+    return cast(asyncpg.Connection, connection)
+
+
 def get_pool() -> asyncpg.Pool:
     """Return the active pool or raise if it has not been initialised."""
     loop = _maybe_get_running_loop()
@@ -150,6 +268,19 @@ def get_pool() -> asyncpg.Pool:
     raise RuntimeError("Database pool not initialised. Call init_pool() first.")
 
 
+def get_read_pool(primary: asyncpg.Pool | None = None) -> asyncpg.Pool:
+    """Return the pool for read-only queries.
+
+    設定 DATABASE_READ_URL 且副本落後量在上限內時回傳副本連線池；否則回傳
+    `primary`（未提供時為 `get_pool()`）。只應用於可容忍短暫延遲的唯讀查詢。
+    """
+    loop = _maybe_get_running_loop()
+    monitor = _REPLICAS.get(loop) if loop is not None else None
+    if monitor is not None and monitor.is_fresh():
+        return monitor.pool
+    return primary if primary is not None else get_pool()
+
+
 async def close_pool() -> None:
     """Close the pool if one exists."""
     global _last_pool
@@ -158,6 +289,12 @@ async def close_pool() -> None:
 
     async with lock:
         pool = _POOLS.pop(loop, None)
+        monitor = _REPLICAS.pop(loop, None)
+
+    if monitor is not None:
+        await monitor.stop()
+        await monitor.pool.close()
+        LOGGER.info("db.read_pool.closed")
 
     if pool is not None:
         await pool.close()
@@ -183,6 +320,19 @@ def _maybe_get_running_loop() -> asyncio.AbstractEventLoop | None:
         return None
 
 
+def _server_settings() -> dict[str, str]:
+    """Session GUCs sent with the startup packet.
+
+    以啟動參數設定的 GUC 會成為連線的預設值，連線歸還 pool 時的 RESET ALL
+    不會清除它們（與 init 內 set_config 不同）。
+    """
+    settings: dict[str, str] = {}
+    # 精簡 NOTIFY 模式：economy_events 依交易合併為 economy_events_batch 送出
+    if os.getenv("ECONOMY_NOTIFY_COMPACT", "false").lower() == "true":
+        settings["app.economy_notify_compact"] = "on"
+    return settings
+
+
 async def _configure_connection(connection: asyncpg.Connection) -> None:
     # cast to Any 以避免第三方套件型別提示不完整造成的 reportUnknownMemberType 警告
     from typing import Any as _Any
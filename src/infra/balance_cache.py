@@ -0,0 +1,267 @@
+"""Process-wide member balance cache kept current by economy NOTIFY events.
+
+個人面板、轉帳後的 ephemeral 通知與國務院部門餘額（含排序）反覆讀取同一批帳戶——尤其是
+政府帳戶——的 `guild_member_balances`。本快取以 (guild_id, member_id) 為鍵保存 `BalanceRecord`：
+
+- `transaction_success` / `adjustment_success` 事件攜帶交易後餘額、throttled_until 與帳本列
+  版本（`last_modified_at`），TelemetryListener 收到通知時即以 `apply_payload()` 寫入；
+- 讀取未命中時由 `get_or_load()` 呼叫 loader 查詢資料庫並寫回；
+- 寫入前比對版本（帳本函式保證同一列的版本嚴格遞增），較舊的資料不會覆蓋較新的資料——
+  分派工作者並行處理事件、讀取與事件交錯、讀取副本落後時皆適用；
+- 只在 LISTEN 連線存活期間提供快取：斷線期間遺失的事件無從得知，`deactivate()` 清空並停用，
+  重連且補播完成後才 `activate()`。未啟用時 `get_or_load()` 直接呼叫 loader；
+- TTL 與大小上限作為最後防線。
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Mapping
+from datetime import datetime
+from typing import Any, cast
+
+import structlog
+
+from src.cython_ext.economy_query_models import BalanceRecord
+
+LOGGER = structlog.get_logger(__name__)
+
+_DEFAULT_TTL_SECONDS = 60.0
+_DEFAULT_MAXSIZE = 10000
+
+_CacheKey = tuple[int, int]
+
+
+class BalanceCache:
+    """TTL + size bounded, version-checked cache keyed by (guild_id, member_id)."""
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = _DEFAULT_TTL_SECONDS,
+        maxsize: int = _DEFAULT_MAXSIZE,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl = ttl_seconds
+        self._maxsize = maxsize
+        self._clock = clock
+        self._entries: OrderedDict[_CacheKey, tuple[float, BalanceRecord]] = OrderedDict()
+        # 每次失效遞增；載入期間若發生失效，載入結果不寫回快取
+        self._generation = 0
+        self._active = False
+        self.hits = 0
+        self.misses = 0
+        self.events_applied = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0 and self._maxsize > 0
+
+    @property
+    def active(self) -> bool:
+        """是否正在提供快取（已啟用且 LISTEN 連線存活）。"""
+        return self._active and self.enabled
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def activate(self) -> None:
+        """LISTEN 連線就緒（含斷線補播完成）後呼叫，開始接受事件並提供快取。"""
+        self._active = True
+
+    def deactivate(self) -> None:
+        """LISTEN 連線中斷或停止時呼叫：清空並停用，之後的讀取一律查詢資料庫。"""
+        self._active = False
+        self.invalidate()
+
+    async def get_or_load(
+        self,
+        guild_id: int,
+        member_id: int,
+        loader: Callable[[], Awaitable[BalanceRecord | None]],
+    ) -> BalanceRecord | None:
+        """Return the cached balance or await `loader()` and cache its (non-None) result."""
+        if not self.active:
+            return await loader()
+
+        key: _CacheKey = (guild_id, member_id)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > self._clock():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        generation = self._generation
+        record = await loader()
+        # 尚無帳本列的成員由 fn_get_balance 合成零餘額，其版本為讀取當下時間，
+        # 可能晚於隨後第一筆寫入的版本而擋下該事件；零餘額且未節流者一律不快取。
+        if (
+            record is not None
+            and generation == self._generation
+            and self.active
+            and (record.balance != 0 or record.throttled_until is not None)
+        ):
+            self._store(record)
+        return record
+
+    def invalidate(self, guild_id: int | None = None, member_id: int | None = None) -> int:
+        """Drop cached balances for a member, a whole guild, or everything."""
+        self._generation += 1
+        if guild_id is None:
+            removed = len(self._entries)
+            self._entries.clear()
+            return removed
+        if member_id is not None:
+            return 1 if self._entries.pop((guild_id, member_id), None) is not None else 0
+        stale = [key for key in self._entries if key[0] == guild_id]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def handle_notification(self, payload: str) -> None:
+        """Apply an `economy_events` NOTIFY payload (single event or compact batch)."""
+        if not self.active:
+            return
+        try:
+            parsed = json.loads(payload)
+        except (TypeError, ValueError):
+            return
+        self.apply_payload(parsed)
+
+    def apply_payload(self, parsed: Any) -> None:
+        """Apply an already decoded NOTIFY payload (single event or compact batch)."""
+        if not self.active or not isinstance(parsed, dict):
+            return
+        data = cast(dict[str, Any], parsed)
+        if data.get("event_type") == "economy_events_batch":
+            events = data.get("events")
+            if isinstance(events, list):
+                for event in events:
+                    if isinstance(event, dict):
+                        self.apply_event(cast(dict[str, Any], event))
+            return
+        self.apply_event(data)
+
+    def apply_event(self, data: Mapping[str, Any]) -> None:
+        """Update cached balances from one parsed economy event."""
+        if not self.active:
+            return
+        guild_id = _as_int(data.get("guild_id"))
+        if guild_id is None:
+            return
+
+        event_type = data.get("event_type")
+        if event_type == "transaction_success":
+            # 轉帳一律清除發起人的節流狀態
+            self._apply_side(data, guild_id, "initiator", throttled_until=None)
+            self._apply_side(
+                data,
+                guild_id,
+                "target",
+                throttled_until=_as_datetime(data.get("target_throttled_until")),
+            )
+        elif event_type == "adjustment_success":
+            self._apply_side(
+                data,
+                guild_id,
+                "target",
+                throttled_until=_as_datetime(data.get("target_throttled_until")),
+            )
+        elif event_type == "transaction_denied":
+            # 節流會更新 throttled_until 與版本，但事件不含餘額：直接失效
+            member_id = _as_int(data.get("initiator_id"))
+            if member_id is not None:
+                self.invalidate(guild_id, member_id)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "events_applied": self.events_applied,
+        }
+
+    def _apply_side(
+        self,
+        data: Mapping[str, Any],
+        guild_id: int,
+        side: str,
+        *,
+        throttled_until: datetime | None,
+    ) -> None:
+        member_id = _as_int(data.get(f"{side}_id"))
+        if member_id is None:
+            return
+        balance = _as_int(data.get(f"balance_after_{side}"))
+        version = _as_datetime(data.get(f"{side}_version"))
+        if balance is None or version is None:
+            # 尚未升級的帳本函式或補播事件沒有餘額／版本，無法判斷新舊
+            self.invalidate(guild_id, member_id)
+            return
+        record = BalanceRecord(guild_id, member_id, balance, version, throttled_until)
+        if self._store(record):
+            self.events_applied += 1
+
+    def _store(self, record: BalanceRecord) -> bool:
+        key: _CacheKey = (record.guild_id, record.member_id)
+        current = self._entries.get(key)
+        if current is not None and current[1].last_modified_at > record.last_modified_at:
+            return False
+        self._entries[key] = (self._clock() + self._ttl, record)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+        return True
+
+
+def _as_int(value: Any) -> int | None:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str) and value.lstrip("-").isdigit():
+        return int(value)
+    return None
+
+
+def _as_datetime(value: Any) -> datetime | None:
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    # 帳本時間皆為 timestamptz；缺少時區的值無法與資料庫讀取結果比較
+    return parsed if parsed.tzinfo is not None else None
+
+
+def _ttl_from_env() -> float:
+    raw = os.getenv("BALANCE_CACHE_TTL", "").strip()
+    if not raw:
+        return _DEFAULT_TTL_SECONDS
+    try:
+        return max(float(raw), 0.0)
+    except ValueError:
+        LOGGER.warning("balance_cache.ttl.invalid", value=raw)
+        return _DEFAULT_TTL_SECONDS
+
+
+_cache: BalanceCache | None = None
+
+
+def get_balance_cache() -> BalanceCache:
+    """Return the process-wide balance cache (created on first use)."""
+    global _cache
+    if _cache is None:
+        _cache = BalanceCache(ttl_seconds=_ttl_from_env())
+    return _cache
+
+
+__all__ = [
+    "BalanceCache",
+    "get_balance_cache",
+]
@@ -0,0 +1,158 @@
+"""Process-wide read-through cache for per-guild governance configuration.
+
+治理設定（常任理事會、國務院、最高人民會議、貨幣設定與部門角色對應）讀取頻繁但極少變更。
+各服務以 `get_or_load()` 讀取：命中時完全不取用連線；未命中時才呼叫 loader 查詢資料庫。
+
+失效來源：
+- 設定表上的觸發器於寫入後發出 `governance_config_changed` NOTIFY（payload 含 guild_id 與
+  scope），由 TelemetryListener 轉交 `handle_notification()`，讓多個 bot 程序同步失效；
+- 本程序內的寫入路徑亦會直接呼叫 `invalidate()`，確保「寫入後立即讀取」不會讀到舊值；
+- TTL 作為最後防線（LISTEN 斷線期間遺失的通知由重連時的全面清除補上）。
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, Literal, TypeVar, cast
+
+import structlog
+
+LOGGER = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+GOVERNANCE_CONFIG_CHANNEL = "governance_config_changed"
+
+ConfigScope = Literal["council", "state_council", "supreme_assembly", "currency"]
+
+_DEFAULT_TTL_SECONDS = 300.0
+_DEFAULT_MAXSIZE = 4096
+
+_CacheKey = tuple[str, int, Hashable]
+
+
+class GuildConfigCache:
+    """TTL + size bounded cache keyed by (scope, guild_id, key)."""
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = _DEFAULT_TTL_SECONDS,
+        maxsize: int = _DEFAULT_MAXSIZE,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl = ttl_seconds
+        self._maxsize = maxsize
+        self._clock = clock
+        self._entries: OrderedDict[_CacheKey, tuple[float, Any]] = OrderedDict()
+        # 每次失效遞增；載入期間若發生失效，載入結果不寫回快取，避免覆蓋成舊值
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0 and self._maxsize > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get_or_load(
+        self,
+        scope: ConfigScope,
+        guild_id: int,
+        key: Hashable,
+        loader: Callable[[], Awaitable[T]],
+    ) -> T:
+        """Return the cached value or await `loader()` and cache its result (None included)."""
+        if not self.enabled:
+            return await loader()
+
+        cache_key: _CacheKey = (scope, guild_id, key)
+        now = self._clock()
+        entry = self._entries.get(cache_key)
+        if entry is not None and entry[0] > now:
+            self._entries.move_to_end(cache_key)
+            self.hits += 1
+            return cast(T, entry[1])
+
+        self.misses += 1
+        generation = self._generation
+        value = await loader()
+        if generation == self._generation:
+            self._entries[cache_key] = (self._clock() + self._ttl, value)
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, guild_id: int | None = None, scope: str | None = None) -> int:
+        """Drop cached entries for a guild (optionally one scope); no guild clears everything."""
+        self._generation += 1
+        if guild_id is None and scope is None:
+            removed = len(self._entries)
+            self._entries.clear()
+            return removed
+        stale = [
+            key
+            for key in self._entries
+            if (guild_id is None or key[1] == guild_id) and (scope is None or key[0] == scope)
+        ]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def handle_notification(self, payload: str) -> None:
+        """Apply a `governance_config_changed` NOTIFY payload."""
+        try:
+            data = json.loads(payload)
+            guild_id = int(data["guild_id"])
+        except (TypeError, ValueError, KeyError):
+            LOGGER.warning("config_cache.notification.unparseable", payload=payload)
+            self.invalidate()
+            return
+        scope = data.get("scope")
+        removed = self.invalidate(guild_id, scope if isinstance(scope, str) else None)
+        LOGGER.debug(
+            "config_cache.invalidated",
+            guild_id=guild_id,
+            scope=scope,
+            removed=removed,
+        )
+
+    def stats(self) -> dict[str, int]:
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+def _ttl_from_env() -> float:
+    raw = os.getenv("GOVERNANCE_CONFIG_CACHE_TTL", "").strip()
+    if not raw:
+        return _DEFAULT_TTL_SECONDS
+    try:
+        return max(float(raw), 0.0)
+    except ValueError:
+        LOGGER.warning("config_cache.ttl.invalid", value=raw)
+        return _DEFAULT_TTL_SECONDS
+
+
+_cache: GuildConfigCache | None = None
+
+
+def get_config_cache() -> GuildConfigCache:
+    """Return the process-wide governance config cache (created on first use)."""
+    global _cache
+    if _cache is None:
+        _cache = GuildConfigCache(ttl_seconds=_ttl_from_env())
+    return _cache
+
+
+__all__ = [
+    "GOVERNANCE_CONFIG_CHANNEL",
+    "ConfigScope",
+    "GuildConfigCache",
+    "get_config_cache",
+]
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+
+__all__ = ["BoundedDedupCache"]
+
+
+class BoundedDedupCache:
+    """Bounded LRU set used to de-duplicate notifications.
+
+    以 OrderedDict 依「最後一次出現時間」排序，所有操作皆為 O(1)：
+    超過 `maxsize` 時淘汰最久未出現的項目；設定 `ttl_seconds` 時，
+    超過時間窗未再出現的項目視為未見過並於寫入時一併清除。
+    """
+
+    __slots__ = ("_entries", "_maxsize", "_ttl", "_clock", "hits", "misses", "evictions")
+
+    def __init__(
+        self,
+        maxsize: int = 10000,
+        *,
+        ttl_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self._entries: OrderedDict[Hashable, float] = OrderedDict()
+        self._maxsize = maxsize
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        stamp = self._entries.get(key)
+        if stamp is None:
+            return False
+        return self._ttl is None or self._clock() - stamp < self._ttl
+
+    def seen(self, key: Hashable) -> bool:
+        """Return True if `key` was seen recently; otherwise record it and return False."""
+        now = self._clock()
+        stamp = self._entries.get(key)
+        if stamp is not None and (self._ttl is None or now - stamp < self._ttl):
+            self.hits += 1
+            self._touch(key, now)
+            return True
+        self.misses += 1
+        self._touch(key, now)
+        return False
+
+    def add(self, key: Hashable) -> None:
+        """Record `key` without touching the hit/miss counters."""
+        self._touch(key, self._clock())
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "maxsize": self._maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _touch(self, key: Hashable, now: float) -> None:
+        entries = self._entries
+        entries[key] = now
+        entries.move_to_end(key)
+        # 項目依時間排序，過期者必定位於前端
+        if self._ttl is not None:
+            cutoff = now - self._ttl
+            while entries:
+                oldest_key, oldest_stamp = next(iter(entries.items()))
+                if oldest_stamp > cutoff:
+                    break
+                del entries[oldest_key]
+        while len(entries) > self._maxsize:
+            entries.popitem(last=False)
+            self.evictions += 1
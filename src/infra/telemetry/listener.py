@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import itertools
 import json
-from collections import deque
+import os
+import time
 from collections.abc import Awaitable, Callable
-from inspect import iscoroutinefunction
+from datetime import datetime, timedelta, timezone
 from typing import Any, cast
 from uuid import UUID
 
@@ -15,9 +17,16 @@ from src.bot.services.currency_config_service import (
     CurrencyConfigResult,
     CurrencyConfigService,
 )
+from src.bot.services.state_council_service import (
+    StateCouncilService,
+    invalidate_council_summary,
+)
 from src.db import pool as db_pool
-from src.db.gateway.economy_queries import EconomyQueryGateway
+from src.db.gateway.economy_pending_transfers import PendingTransferGateway
+from src.db.gateway.economy_queries import BalanceRecord, EconomyQueryGateway
 from src.db.gateway.state_council_governance import StateCouncilGovernanceGateway
+from src.infra.balance_cache import get_balance_cache
+from src.infra.config_cache import GOVERNANCE_CONFIG_CHANNEL, get_config_cache
 from src.infra.events.council_events import (
     CouncilEvent,
 )
@@ -30,11 +39,96 @@ from src.infra.events.state_council_events import (
 from src.infra.events.state_council_events import (
     publish as publish_state_council_event,
 )
+from src.infra.result import Err
+from src.infra.telemetry.dedup import BoundedDedupCache
 from src.infra.types.db import ConnectionProtocol, PoolProtocol
 
 LOGGER = structlog.get_logger(__name__)
 NotificationHandler = Callable[[str], Awaitable[None] | None]
 
+# LISTEN 連線健康檢查間隔與逾時（秒）
+_HEALTH_CHECK_SECONDS = 30.0
+_HEALTH_CHECK_TIMEOUT = 5.0
+# 重連退避：1s 起每次加倍，上限 60s
+_RECONNECT_BASE_DELAY = 1.0
+_RECONNECT_MAX_DELAY = 60.0
+# 補播起點往前多取的秒數，涵蓋最後一次健康檢查與實際斷線之間的空窗
+_REPLAY_OVERLAP_SECONDS = 30
+_REPLAY_BATCH_SIZE = 500
+# 去重快取容量；interaction token 於 Discord 端 15 分鐘後失效
+_DEDUP_MAXSIZE = 10000
+_INTERACTION_TOKEN_TTL_SECONDS = 15 * 60
+
+# 通知分派優先序（數字越小越先處理）；只有 CRITICAL 在佇列滿時不會被丟棄
+_PRIORITY_CRITICAL = 0  # 轉帳檢查：阻塞事件池流程
+_PRIORITY_NORMAL = 1  # 交易結果：DM、互動回覆、面板刷新與政府帳戶同步
+_PRIORITY_LOW = 2  # 其他：僅記錄
+_EVENT_PRIORITIES: dict[str, int] = {
+    "transfer_check_result": _PRIORITY_CRITICAL,
+    "transfer_check_approved": _PRIORITY_CRITICAL,
+    "transaction_success": _PRIORITY_NORMAL,
+    "transaction_denied": _PRIORITY_NORMAL,
+    "adjustment_success": _PRIORITY_NORMAL,
+}
+_DEFAULT_DISPATCH_WORKERS = 4
+_DEFAULT_DISPATCH_QUEUE_SIZE = 1000
+# 事件在佇列中等待超過此秒數時記錄延遲警告
+_DISPATCH_LAG_WARNING_SECONDS = 1.0
+# 停止時等待佇列清空的上限（秒）
+_DISPATCH_DRAIN_TIMEOUT = 5.0
+# 導出的機構帳戶區段（見各 service 的 derive_*account_id）：部門與最高人民會議為
+# 9.5e15 + guild_id + 部門代碼，公司為 9.6e15 + company_id；每段保留 1e14 個代碼
+_DEPARTMENT_ACCOUNT_BASE = 9_500_000_000_000_000
+_COMPANY_ACCOUNT_BASE = 9_600_000_000_000_000
+_ACCOUNT_CODE_SPAN = 100_000_000_000_000
+
+
+def _int_from_env(name: str, default: int) -> int:
+    raw = os.getenv(name, "").strip()
+    if not raw:
+        return default
+    try:
+        return max(int(raw), 0)
+    except ValueError:
+        LOGGER.warning("telemetry.listener.env.invalid", name=name, value=raw)
+        return default
+
+
+def _event_priority(event: Any) -> int:
+    if not isinstance(event, dict):
+        return _PRIORITY_LOW
+    event_type = cast(dict[str, Any], event).get("event_type")
+    if not isinstance(event_type, str):
+        return _PRIORITY_LOW
+    return _EVENT_PRIORITIES.get(event_type, _PRIORITY_LOW)
+
+
+# 無法解析的 payload；與合法的 JSON null 區分
+_UNPARSEABLE: Any = object()
+
+
+def _decode_payload(payload: str) -> Any:
+    """Decode a NOTIFY payload once; the result travels with it through the queue."""
+    try:
+        return json.loads(payload)
+    except (TypeError, ValueError):
+        return _UNPARSEABLE
+
+
+def _payload_priority(parsed: Any) -> int:
+    """Classify a decoded NOTIFY payload; batches take their most urgent event's priority."""
+    if isinstance(parsed, dict):
+        data = cast(dict[str, Any], parsed)
+        if data.get("event_type") == "economy_events_batch":
+            events = data.get("events")
+            if not isinstance(events, list):
+                return _PRIORITY_LOW
+            return min(
+                (_event_priority(event) for event in events),
+                default=_PRIORITY_LOW,
+            )
+    return _event_priority(parsed)
+
 
 class TelemetryListener:
     """Background listener for PostgreSQL NOTIFY events."""
@@ -46,18 +140,51 @@ class TelemetryListener:
         handler: NotificationHandler | None = None,
         transfer_coordinator: Any | None = None,
         discord_client: Any | None = None,
+        dispatch_workers: int | None = None,
+        dispatch_queue_size: int | None = None,
     ) -> None:
         self._channel = channel
         self._handler = handler or self._default_handler
+        # 預設處理器直接使用入列時已解析的 payload；自訂處理器仍接收原始字串
+        self._decodes_payload = handler is None
         self._transfer_coordinator = transfer_coordinator
         self._discord_client = discord_client
         self._task: asyncio.Task[None] | None = None
         self._stop_event: asyncio.Event | None = None
         # 最近處理過的交易/互動 Token，用於去重，以免重複通知
-        self._seen_tx: set[str] = set()
-        self._tx_order: deque[str] = deque(maxlen=10000)
-        self._seen_tokens: set[str] = set()
-        self._token_order: deque[str] = deque(maxlen=10000)
+        self._seen_tx = BoundedDedupCache(_DEDUP_MAXSIZE)
+        # interaction token 僅在 Discord 有效期內可用，以時間窗限制保留期間
+        self._seen_tokens = BoundedDedupCache(
+            _DEDUP_MAXSIZE, ttl_seconds=_INTERACTION_TOKEN_TTL_SECONDS
+        )
+        # 重連補播狀態：最後一次確認 LISTEN 連線健康的時間
+        self._connected_once = False
+        self._last_healthy_at: datetime | None = None
+        self._economy_gateway = EconomyQueryGateway()
+        self._pending_gateway = PendingTransferGateway()
+        # 分派佇列：NOTIFY 回呼只負責入列，由固定數量的 worker 依優先序處理；
+        # worker 數為 0 時沿用逐筆同步處理
+        self._dispatch_worker_count = (
+            _int_from_env("TELEMETRY_DISPATCH_WORKERS", _DEFAULT_DISPATCH_WORKERS)
+            if dispatch_workers is None
+            else max(dispatch_workers, 0)
+        )
+        self._dispatch_queue_size = (
+            _int_from_env("TELEMETRY_DISPATCH_QUEUE_SIZE", _DEFAULT_DISPATCH_QUEUE_SIZE)
+            if dispatch_queue_size is None
+            else max(dispatch_queue_size, 0)
+        )
+        self._queue: asyncio.PriorityQueue[tuple[int, int, float, str, Any]] | None = None
+        self._dispatch_tasks: list[asyncio.Task[None]] = []
+        self._dispatch_seq = itertools.count()
+        self._dispatch_metrics: dict[str, float] = {
+            "enqueued": 0,
+            "processed": 0,
+            "dropped": 0,
+            "max_depth": 0,
+            "wait_total_seconds": 0.0,
+            "wait_max_seconds": 0.0,
+        }
 
     async def start(self) -> None:
         """Begin listening for NOTIFY events."""
@@ -65,8 +192,18 @@ class TelemetryListener:
             return
 
         self._stop_event = asyncio.Event()
+        if self._dispatch_worker_count > 0:
+            self._queue = asyncio.PriorityQueue(maxsize=self._dispatch_queue_size)
+            self._dispatch_tasks = [
+                asyncio.create_task(self._dispatch_worker(), name=f"telemetry-dispatch-{index}")
+                for index in range(self._dispatch_worker_count)
+            ]
         self._task = asyncio.create_task(self._run(), name="telemetry-listener")
-        LOGGER.info("telemetry.listener.started", channel=self._channel)
+        LOGGER.info(
+            "telemetry.listener.started",
+            channel=self._channel,
+            dispatch_workers=self._dispatch_worker_count,
+        )
 
     async def stop(self) -> None:
         """Signal the listener to stop and wait for shutdown."""
@@ -81,25 +218,192 @@ class TelemetryListener:
         finally:
             self._task = None
             self._stop_event = None
+            await self._stop_dispatch_workers()
             LOGGER.info("telemetry.listener.stopped", channel=self._channel)
 
+    def dispatch_stats(self) -> dict[str, float]:
+        """Backpressure metrics for the dispatch queue (depth, drops, wait times)."""
+        metrics = dict(self._dispatch_metrics)
+        processed = metrics["processed"]
+        metrics["depth"] = self._queue.qsize() if self._queue is not None else 0
+        metrics["wait_avg_seconds"] = (
+            metrics["wait_total_seconds"] / processed if processed else 0.0
+        )
+        return metrics
+
+    async def _stop_dispatch_workers(self) -> None:
+        queue = self._queue
+        if queue is not None:
+            # 盡量處理完已入列的事件，逾時則放棄剩餘項目
+            try:
+                await asyncio.wait_for(queue.join(), timeout=_DISPATCH_DRAIN_TIMEOUT)
+            except asyncio.TimeoutError:
+                LOGGER.warning("telemetry.listener.dispatch.drain_timeout", remaining=queue.qsize())
+        for task in self._dispatch_tasks:
+            task.cancel()
+        if self._dispatch_tasks:
+            await asyncio.gather(*self._dispatch_tasks, return_exceptions=True)
+        self._dispatch_tasks = []
+        self._queue = None
+
     async def _run(self) -> None:
-        try:
-            pool = await db_pool.init_pool()
-            # 在部分環境中 asyncpg 缺少完整型別資訊；以 Any/Dynamic 呼叫即可。
-            async with cast(Any, pool).acquire() as connection:
+        """Hold a dedicated LISTEN connection, reconnecting with backoff until stopped."""
+        if self._stop_event is None:
+            self._stop_event = asyncio.Event()
+        stop_event = self._stop_event
+
+        attempt = 0
+        while not stop_event.is_set():
+            connection: Any | None = None
+            try:
+                connection = await db_pool.connect_listener()
+                lost = asyncio.Event()
+                add_termination = getattr(connection, "add_termination_listener", None)
+                if callable(add_termination):
+                    add_termination(lambda _conn, _lost=lost: _lost.set())
                 await connection.add_listener(self._channel, self._dispatch)
+                await connection.add_listener(GOVERNANCE_CONFIG_CHANNEL, self._on_config_changed)
+
+                if self._connected_once:
+                    # 先 LISTEN 再補播：補播期間抵達的通知不會遺失，重複者由去重略過
+                    LOGGER.info("telemetry.listener.reconnected", channel=self._channel)
+                    # 斷線期間的設定變更通知已遺失，整個設定快取重新載入
+                    get_config_cache().invalidate()
+                    await self._replay_gap(connection)
+                self._connected_once = True
+                # 自此起的餘額事件都會送達，餘額快取才可信
+                get_balance_cache().activate()
+                attempt = 0
+                self._last_healthy_at = datetime.now(timezone.utc)
+
+                await self._watch(connection, stop_event, lost)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                LOGGER.exception("telemetry.listener.error", channel=self._channel)
+            finally:
+                # 離線期間的餘額事件會遺失，停用並清空餘額快取直到重連補播完成
+                get_balance_cache().deactivate()
+                if connection is not None:
+                    await _close_quietly(connection)
+
+            if stop_event.is_set():
+                break
+
+            delay = min(_RECONNECT_BASE_DELAY * (2**attempt), _RECONNECT_MAX_DELAY)
+            attempt += 1
+            LOGGER.warning(
+                "telemetry.listener.reconnecting",
+                channel=self._channel,
+                attempt=attempt,
+                delay=delay,
+            )
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
 
-                try:
-                    if self._stop_event is None:
-                        self._stop_event = asyncio.Event()
+    async def _watch(
+        self,
+        connection: Any,
+        stop_event: asyncio.Event,
+        lost: asyncio.Event,
+    ) -> None:
+        """Block until stop is requested; raise when the connection is lost or unhealthy."""
+        while True:
+            waiters = [
+                asyncio.ensure_future(stop_event.wait()),
+                asyncio.ensure_future(lost.wait()),
+            ]
+            try:
+                await asyncio.wait(
+                    waiters,
+                    timeout=_HEALTH_CHECK_SECONDS,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+            finally:
+                for waiter in waiters:
+                    waiter.cancel()
 
-                    await self._stop_event.wait()
-                finally:
+            if stop_event.is_set():
+                try:
                     await connection.remove_listener(self._channel, self._dispatch)
-        except Exception:
-            LOGGER.exception("telemetry.listener.error")
-            raise
+                    await connection.remove_listener(
+                        GOVERNANCE_CONFIG_CHANNEL, self._on_config_changed
+                    )
+                except Exception:
+                    LOGGER.debug("telemetry.listener.remove_listener_failed", exc_info=True)
+                return
+            if lost.is_set():
+                raise ConnectionError("LISTEN connection terminated")
+
+            # 連線靜默斷開時 asyncpg 未必觸發 termination listener，以 ping 主動偵測
+            await connection.fetchval("SELECT 1", timeout=_HEALTH_CHECK_TIMEOUT)
+            self._last_healthy_at = datetime.now(timezone.utc)
+
+    async def _replay_gap(self, connection: Any) -> None:
+        """Replay events committed while the LISTEN connection was down."""
+        if self._last_healthy_at is None:
+            return
+        since = self._last_healthy_at - timedelta(seconds=_REPLAY_OVERLAP_SECONDS)
+        after_id: UUID | None = None
+        replayed = 0
+
+        while True:
+            result = await self._economy_gateway.fetch_events_since(
+                connection,
+                since=since,
+                after_transaction_id=after_id,
+                limit=_REPLAY_BATCH_SIZE,
+            )
+            if isinstance(result, Err):
+                LOGGER.warning("telemetry.listener.replay.failed", error=str(result.error))
+                break
+            rows = list(result.unwrap())
+            for row in rows:
+                tx_id = str(row["transaction_id"])
+                since = cast(datetime, row["created_at"])
+                after_id = cast(UUID, row["transaction_id"])
+                if tx_id in self._seen_tx:
+                    continue
+                payload = row["payload"]
+                if isinstance(payload, str):
+                    payload = json.loads(payload)
+                await self._handle_event(cast(dict[str, Any], payload))
+                replayed += 1
+            if len(rows) < _REPLAY_BATCH_SIZE:
+                break
+
+        approved = 0
+        if self._transfer_coordinator is not None:
+            # transfer_check_approved 通知可能在斷線期間遺失；重新交給協調器執行
+            try:
+                transfer_ids = await self._pending_gateway.list_approved(
+                    connection, limit=_REPLAY_BATCH_SIZE
+                )
+            except Exception:
+                LOGGER.warning("telemetry.listener.replay.approved_failed", exc_info=True)
+                transfer_ids = []
+            for transfer_id in transfer_ids:
+                await self._handle_transfer_check_approved({"transfer_id": transfer_id})
+            approved = len(transfer_ids)
+
+        LOGGER.info(
+            "telemetry.listener.replayed",
+            channel=self._channel,
+            events=replayed,
+            approved_transfers=approved,
+        )
+
+    def _on_config_changed(
+        self,
+        connection: Any,
+        pid: int,
+        channel: str,
+        payload: str,
+    ) -> None:
+        del connection, pid, channel
+        get_config_cache().handle_notification(payload)
 
     async def _dispatch(
         self,
@@ -109,15 +413,75 @@ class TelemetryListener:
         payload: str,
     ) -> None:
         del connection, pid, channel
+        # 每則通知只解析一次：餘額快取、優先序與後續處理共用同一份結果
+        parsed = _decode_payload(payload)
+        # 餘額快取在收到通知時即同步更新，不受佇列延遲或丟棄影響
+        get_balance_cache().apply_payload(parsed)
+        queue = self._queue
+        if queue is None:
+            await self._process(payload, parsed)
+            return
+
+        priority = _payload_priority(parsed)
+        item = (priority, next(self._dispatch_seq), time.monotonic(), payload, parsed)
+        metrics = self._dispatch_metrics
+        if priority == _PRIORITY_CRITICAL:
+            # 轉帳檢查不可丟棄：佇列滿時等待空位（背壓）
+            await queue.put(item)
+        else:
+            try:
+                queue.put_nowait(item)
+            except asyncio.QueueFull:
+                metrics["dropped"] += 1
+                LOGGER.warning(
+                    "telemetry.listener.dispatch.dropped",
+                    priority=priority,
+                    depth=queue.qsize(),
+                    dropped=int(metrics["dropped"]),
+                )
+                return
+        metrics["enqueued"] += 1
+        metrics["max_depth"] = max(metrics["max_depth"], queue.qsize())
+
+    async def _dispatch_worker(self) -> None:
+        queue = self._queue
+        assert queue is not None
+        metrics = self._dispatch_metrics
+        while True:
+            priority, _seq, enqueued_at, payload, parsed = await queue.get()
+            try:
+                waited = time.monotonic() - enqueued_at
+                metrics["wait_total_seconds"] += waited
+                metrics["wait_max_seconds"] = max(metrics["wait_max_seconds"], waited)
+                if waited >= _DISPATCH_LAG_WARNING_SECONDS:
+                    LOGGER.warning(
+                        "telemetry.listener.dispatch.lagging",
+                        priority=priority,
+                        wait_seconds=round(waited, 3),
+                        depth=queue.qsize(),
+                    )
+                await self._process(payload, parsed)
+            except Exception:
+                LOGGER.exception("telemetry.listener.dispatch.error", priority=priority)
+            finally:
+                metrics["processed"] += 1
+                queue.task_done()
+
+    async def _process(self, payload: str, parsed: Any) -> None:
+        if self._decodes_payload:
+            await self._handle_decoded(payload, parsed)
+            return
         result = self._handler(payload)
         if asyncio.iscoroutine(result):
             await result
 
     async def _default_handler(self, payload: str) -> None:
         """Default observer: parse JSON payloads and emit structured logs."""
-        try:
-            parsed = json.loads(payload)
-        except json.JSONDecodeError:
+        await self._handle_decoded(payload, _decode_payload(payload))
+
+    async def _handle_decoded(self, payload: str, parsed: Any) -> None:
+        """Log and route a decoded payload; `payload` is kept for diagnostics."""
+        if parsed is _UNPARSEABLE:
             LOGGER.warning(
                 "telemetry.listener.payload.unparseable",
                 payload=payload,
@@ -135,6 +499,21 @@ class TelemetryListener:
         from typing import cast as _cast
 
         data = _cast(dict[str, Any], parsed)
+        if data.get("event_type") == "economy_events_batch":
+            # 精簡 NOTIFY 模式：同一交易的多個事件合併為一則通知，依序處理
+            events = data.get("events")
+            if not isinstance(events, list):
+                LOGGER.warning("telemetry.listener.batch.invalid", payload=payload)
+                return
+            for event in events:
+                if isinstance(event, dict):
+                    await self._handle_event(_cast(dict[str, Any], event))
+            return
+
+        await self._handle_event(data)
+
+    async def _handle_event(self, data: dict[str, Any]) -> None:
+        """Route a single parsed economy event to its handler."""
         event_type = data.get("event_type", "unknown")
         if event_type == "transaction_success":
             tx_id_raw = data.get("transaction_id")
@@ -142,7 +521,7 @@ class TelemetryListener:
             if isinstance(tx_id_raw, str):
                 tx_id = tx_id_raw
             elif isinstance(tx_id_raw, dict):
-                txd: dict[str, Any] = _cast(dict[str, Any], tx_id_raw)
+                txd: dict[str, Any] = cast(dict[str, Any], tx_id_raw)
                 hexval = txd.get("hex")
                 if isinstance(hexval, str):
                     tx_id = hexval
@@ -195,6 +574,10 @@ class TelemetryListener:
                 reason=data.get("reason"),
                 metadata=data.get("metadata", {}),
             )
+            # 記錄交易 ID，讓重連補播略過已即時處理的調整
+            tx_raw = data.get("transaction_id")
+            if isinstance(tx_raw, str):
+                self._is_tx_seen(tx_raw)
             await _maybe_emit_state_council_event(data, cause="adjustment_success")
         elif event_type == "transfer_check_result":
             # Handle transfer check result events
@@ -209,7 +592,7 @@ class TelemetryListener:
         """以 DM 通知轉帳成功的接收者。
 
         僅在有提供 discord_client 時啟用，若找不到使用者則靜默略過。
-        政府帳戶（理事會或部門帳戶）不會收到通知。
+        政府部門帳戶（虛擬帳戶，不是真實的 Discord 用戶）不會收到通知。
         """
         if self._discord_client is None:
             return
@@ -232,10 +615,20 @@ class TelemetryListener:
         except Exception:
             return
 
-        # 跳過政府帳戶（理事會帳戶：9e15+，部門帳戶：9.5e15+）
-        # 這些是虛擬帳戶，不是真實的 Discord 用戶
-        if uid >= 9_000_000_000_000_000:
+        try:
+            guild_id = int(parsed.get("guild_id"))
+        except Exception:
+            guild_id = None
+        # 理事會、國務院主帳戶與公司帳戶未標記為政府帳戶，以導出公式判定，避免 fetch_user 404
+        if _is_derived_institution_account(guild_id, uid):
             return
+        # 以快取的政府帳戶集合判定；查詢失敗時照常嘗試（找不到使用者會靜默略過）
+        if guild_id is not None:
+            try:
+                if uid in await _government_account_departments(guild_id):
+                    return
+            except Exception:
+                LOGGER.debug("telemetry.listener.government_accounts.lookup_failed", exc_info=True)
 
         user = None
         try:
@@ -390,34 +783,37 @@ class TelemetryListener:
             except Exception:
                 target_display = "收款人"
 
-            # 查詢轉帳後的餘額（僅讀取，避免 fn_get_balance 造成鎖等待）
-            initiator_balance = None
+            # 轉帳後的餘額：事件本身即攜帶；舊版 payload 才經由餘額快取讀取
+            # （fn_get_balance 為純讀取，不會建立帳本列或取列鎖）
+            balance_after = parsed.get("balance_after_initiator")
+            initiator_balance = balance_after if isinstance(balance_after, int) else None
             currency_config: CurrencyConfigResult | None = None
             try:
                 pool = db_pool.get_pool()
             except RuntimeError:
                 pool = None
 
-            if pool is not None and guild_id is not None and initiator_id is not None:
+            if (
+                initiator_balance is None
+                and pool is not None
+                and guild_id is not None
+                and initiator_id is not None
+            ):
                 try:
                     economy = EconomyQueryGateway()
-                    async with cast(Any, pool).acquire() as conn:
-                        balance_result = None
 
-                        snapshot_fetcher = getattr(economy, "fetch_balance_snapshot", None)
-                        if snapshot_fetcher and iscoroutinefunction(snapshot_fetcher):
-                            balance_result = await snapshot_fetcher(
+                    async def _load_balance() -> BalanceRecord | None:
+                        async with cast(Any, pool).acquire() as conn:
+                            balance_result = await economy.fetch_balance(
                                 conn, guild_id=guild_id, member_id=initiator_id
                             )
-                        else:
-                            balance_fetcher = getattr(economy, "fetch_balance", None)
-                            if balance_fetcher and iscoroutinefunction(balance_fetcher):
-                                balance_result = await balance_fetcher(
-                                    conn, guild_id=guild_id, member_id=initiator_id
-                                )
-
-                    if balance_result is not None:
-                        initiator_balance = balance_result.balance
+                        return balance_result.unwrap() if balance_result.is_ok() else None
+
+                    record = await get_balance_cache().get_or_load(
+                        int(guild_id), int(initiator_id), _load_balance
+                    )
+                    if record is not None:
+                        initiator_balance = record.balance
                 except Exception:
                     # 查詢餘額失敗不影響通知發送
                     LOGGER.debug(
@@ -425,6 +821,8 @@ class TelemetryListener:
                         guild_id=guild_id,
                         initiator_id=initiator_id,
                     )
+
+            if pool is not None and guild_id is not None and initiator_id is not None:
                 try:
                     currency_service = CurrencyConfigService(pool)
                     currency_config = await currency_service.get_currency_config(guild_id=guild_id)
@@ -487,30 +885,18 @@ class TelemetryListener:
 
     def _is_tx_seen(self, tx: str) -> bool:
         """去重：檢查交易 ID 是否已處理。"""
-        if tx in self._seen_tx:
-            return True
-        self._seen_tx.add(tx)
-        self._tx_order.append(tx)
-        # deque 自動淘汰最舊項；維持 set 大小一致
-        while len(self._seen_tx) > len(self._tx_order):
-            oldest = self._tx_order[0] if self._tx_order else None
-            if oldest and oldest in self._seen_tx:
-                self._seen_tx.discard(oldest)
-            break
-        return False
+        return self._seen_tx.seen(tx)
 
     def _is_token_seen(self, token: str) -> bool:
         """去重：檢查 interaction token 是否已處理。"""
-        if token in self._seen_tokens:
-            return True
-        self._seen_tokens.add(token)
-        self._token_order.append(token)
-        while len(self._seen_tokens) > len(self._token_order):
-            oldest = self._token_order[0] if self._token_order else None
-            if oldest and oldest in self._seen_tokens:
-                self._seen_tokens.discard(oldest)
-            break
-        return False
+        return self._seen_tokens.seen(token)
+
+    def dedup_stats(self) -> dict[str, dict[str, int]]:
+        """Hit/miss counters and sizes of the de-duplication caches."""
+        return {
+            "transactions": self._seen_tx.stats(),
+            "interaction_tokens": self._seen_tokens.stats(),
+        }
 
     async def _handle_transfer_check_result(self, parsed: Any) -> None:
         """Handle transfer check result event."""
@@ -555,6 +941,17 @@ class TelemetryListener:
             LOGGER.exception("telemetry.listener.transfer_check_approved.error", payload=parsed)
 
 
+async def _close_quietly(connection: Any) -> None:
+    """Close a LISTEN connection, falling back to terminate() if close fails."""
+    try:
+        await connection.close(timeout=_HEALTH_CHECK_TIMEOUT)
+    except Exception:
+        try:
+            connection.terminate()
+        except Exception:
+            LOGGER.debug("telemetry.listener.close_failed", exc_info=True)
+
+
 def _format_currency_amount(amount: int, config: CurrencyConfigResult | None) -> str:
     """Format amount with guild currency settings."""
     name = config.currency_name if config else CurrencyConfigService.DEFAULT_CURRENCY_NAME
@@ -563,12 +960,50 @@ def _format_currency_amount(amount: int, config: CurrencyConfigResult | None) ->
     return f"{amount:,} {unit}"
 
 
+def _is_derived_institution_account(guild_id: int | None, account_id: int) -> bool:
+    """是否為以固定偏移導出的機構帳戶（理事會、國務院、部門或公司），而非 Discord 用戶。"""
+    if _COMPANY_ACCOUNT_BASE <= account_id < _COMPANY_ACCOUNT_BASE + _ACCOUNT_CODE_SPAN:
+        return True
+    if guild_id is None:
+        return False
+    if account_id in (
+        CouncilService.derive_council_account_id(guild_id),
+        StateCouncilService.derive_main_account_id(guild_id),
+    ):
+        return True
+    offset = account_id - guild_id - _DEPARTMENT_ACCOUNT_BASE
+    return 0 <= offset < _ACCOUNT_CODE_SPAN
+
+
+async def _government_account_departments(guild_id: int) -> dict[int, str]:
+    """回傳公會政府帳戶 account_id → 部門的對照。
+
+    經由 governance 設定快取讀取；政府帳戶新增、刪除或更換部門時，
+    `trigger_government_accounts_changed` 會發出 `state_council` 失效通知。
+    """
+
+    async def _load() -> dict[int, str]:
+        pool = cast(PoolProtocol, db_pool.get_pool())
+        async with pool.acquire() as conn:
+            conn_typed: ConnectionProtocol = conn
+            accounts = await StateCouncilGovernanceGateway().fetch_government_accounts(
+                conn_typed, guild_id=guild_id
+            )
+        return {acc.account_id: acc.department for acc in accounts}
+
+    return await get_config_cache().get_or_load(
+        "state_council", guild_id, "government_accounts", _load
+    )
+
+
 async def _maybe_emit_state_council_event(parsed: Any, *, cause: str) -> None:
     """若經濟事件涉及政府部門帳戶，發布國務院事件以觸發面板更新。
 
     - transfer：initiator/target 其中任一為政府帳戶
     - adjustment：target 為政府帳戶
     任何命中都發出 `department_balance_changed`。
+    治理層餘額由帳本觸發器（`trigger_government_account_balance`）在同一交易內投影，
+    此處只依通知內容與快取的政府帳戶對照判定部門，不查詢也不回寫資料庫。
     """
     try:
         guild_id = int(parsed.get("guild_id"))
@@ -579,62 +1014,29 @@ async def _maybe_emit_state_council_event(parsed: Any, *, cause: str) -> None:
     target_id = parsed.get("target_id")
 
     try:
-        pool = cast(PoolProtocol, db_pool.get_pool())
-        governance = StateCouncilGovernanceGateway()
-        economy = EconomyQueryGateway()
-        # 型別提示：PoolProtocol.acquire() 會回傳 AsyncContextManager[ConnectionProtocol]
-        async with pool.acquire() as conn:
-            # 在嚴格模式下，部分第三方庫的回傳型別較寬鬆；此處直接標註以協助型別推論
-            conn_typed: ConnectionProtocol = conn
-            accounts = await governance.fetch_government_accounts(conn_typed, guild_id=guild_id)
-            if not accounts:
-                return
-
-            id_to_dept = {acc.account_id: acc.department for acc in accounts}
-
-            # 判定受影響部門
-            affected_ids: set[int] = set()
-            if isinstance(initiator_id, int) and initiator_id in id_to_dept:
-                affected_ids.add(int(initiator_id))
-            if isinstance(target_id, int) and target_id in id_to_dept:
-                affected_ids.add(int(target_id))
-
-            if not affected_ids:
-                return
-
-            # 與經濟帳本對齊治理層餘額（最佳努力、單連線）
-            for acc in accounts:
-                if acc.account_id not in affected_ids:
-                    continue
-                try:
-                    snap = await economy.fetch_balance(
-                        conn_typed, guild_id=guild_id, member_id=acc.account_id
-                    )
-                    await governance.update_account_balance(
-                        conn_typed,
-                        account_id=acc.account_id,
-                        new_balance=snap.balance,  # type: ignore[union-attr]
-                    )
-                except Exception:
-                    # 設計上不讓 listener 失敗阻斷事件，失敗時略過同步
-                    LOGGER.debug(
-                        "telemetry.listener.sync_failed",
-                        guild_id=guild_id,
-                        account_id=acc.account_id,
-                        department=acc.department,
-                        cause=cause,
-                    )
-
-            affected_depts = tuple(sorted({id_to_dept[aid] for aid in affected_ids}))
+        id_to_dept = await _government_account_departments(guild_id)
+        affected_depts = tuple(
+            sorted(
+                {
+                    id_to_dept[account_id]
+                    for account_id in (initiator_id, target_id)
+                    if isinstance(account_id, int) and account_id in id_to_dept
+                }
+            )
+        )
+        if not affected_depts:
+            return
 
-            await publish_state_council_event(
-                StateCouncilEvent(
-                    guild_id=guild_id,
-                    kind="department_balance_changed",
-                    departments=affected_depts,
-                    cause=cause,
-                )
+        # 面板收到事件後重建摘要，須先讓總覽快照失效
+        invalidate_council_summary(guild_id)
+        await publish_state_council_event(
+            StateCouncilEvent(
+                guild_id=guild_id,
+                kind="department_balance_changed",
+                departments=affected_depts,
+                cause=cause,
             )
+        )
     except Exception:  # pragma: no cover - 防禦性處理避免中斷 listener
         LOGGER.warning(
             "telemetry.listener.state_council.emit_failed",
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import secrets
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterator
 
 import asyncpg
 import pytest
@@ -12,9 +12,18 @@ from faker import Faker
 
 from src.config.db_settings import PoolConfig
 from src.db.pool import close_pool, init_pool
+from src.infra.config_cache import get_config_cache
 from src.infra.di.container import DependencyContainer
 
 
+@pytest.fixture(autouse=True)
+def _reset_config_cache() -> Iterator[None]:
+    """Clear the process-wide governance config cache so tests never share cached rows."""
+    get_config_cache().invalidate()
+    yield
+    get_config_cache().invalidate()
+
+
 @pytest.fixture
 def faker() -> Faker:
     """Provide a Faker instance with Chinese and English locales for test data generation."""
@@ -316,7 +316,12 @@ async def test_state_council_panel_permission_denied() -> None:
     )
     service.get_config.return_value = expected_config
     service.check_leader_permission.return_value = False
-    service.check_department_permission.return_value = False
+    service.check_department_permissions_bulk.return_value = {
+        "內政部": False,
+        "財政部": False,
+        "國土安全部": False,
+        "中央銀行": False,
+    }
 
     command = build_state_council_group(service)
 
@@ -409,7 +414,13 @@ async def test_state_council_panel_department_access(monkeypatch: pytest.MonkeyP
     )
     service.get_config.return_value = expected_config
     service.check_leader_permission.return_value = False  # Not a leader
-    service.check_department_permission.return_value = True  # But has department access
+    # But has department access
+    service.check_department_permissions_bulk.return_value = {
+        "內政部": False,
+        "財政部": True,
+        "國土安全部": False,
+        "中央銀行": False,
+    }
 
     # Mock database pool
     mock_pool = MagicMock()
@@ -433,7 +444,7 @@ async def test_state_council_panel_department_access(monkeypatch: pytest.MonkeyP
 
     # Should check leader permission first, then department permissions
     assert service.check_leader_permission.called
-    assert service.check_department_permission.called
+    assert service.check_department_permissions_bulk.called
     assert interaction.response_sent
 
 
@@ -0,0 +1,87 @@
+\set ON_ERROR_STOP 1
+
+BEGIN;
+
+SELECT plan(8);
+SELECT set_config('search_path', 'pgtap, governance, public', false);
+
+SELECT has_function(
+    'governance',
+    'fn_cast_supreme_assembly_vote',
+    ARRAY['uuid', 'bigint', 'text'],
+    'fn_cast_supreme_assembly_vote exists with expected signature'
+);
+
+SELECT has_function(
+    'governance',
+    'fn_record_supreme_assembly_vote',
+    ARRAY['uuid', 'bigint', 'text'],
+    'fn_record_supreme_assembly_vote exists with expected signature'
+);
+
+-- Setup: snapshot of three members -> threshold 2
+CREATE TEMP TABLE test_proposal (proposal_id uuid);
+
+WITH inserted AS (
+    INSERT INTO governance.supreme_assembly_proposals (
+        guild_id, proposer_id, title, description, snapshot_n, threshold_t, deadline_at, status
+    ) VALUES (
+        2090000000000000000, 2090000000000000001, 'Cast vote', NULL, 3, 2,
+        timezone('utc', now()) + interval '72 hours', '進行中'
+    )
+    RETURNING proposal_id
+)
+INSERT INTO test_proposal SELECT proposal_id FROM inserted;
+
+INSERT INTO governance.supreme_assembly_proposal_snapshots (proposal_id, member_id)
+SELECT (SELECT proposal_id FROM test_proposal), m
+FROM unnest(ARRAY[2090000000000000010, 2090000000000000011, 2090000000000000012]::bigint[]) AS m;
+
+SELECT is(
+    (SELECT outcome FROM governance.fn_cast_supreme_assembly_vote(
+        (SELECT proposal_id FROM test_proposal), 2090000000000000099::bigint, 'approve')),
+    'not_in_snapshot',
+    'rejects voters outside the snapshot'
+);
+
+SELECT results_eq(
+    $$SELECT outcome, status, approve, total_voted FROM governance.fn_cast_supreme_assembly_vote(
+        (SELECT proposal_id FROM test_proposal), 2090000000000000010::bigint, 'approve')$$,
+    $$VALUES ('voted'::text, '進行中'::text, 1, 1)$$,
+    'first vote is counted and proposal stays open'
+);
+
+-- 投票不可更改
+SELECT results_eq(
+    $$SELECT outcome, approve, reject, total_voted FROM governance.fn_cast_supreme_assembly_vote(
+        (SELECT proposal_id FROM test_proposal), 2090000000000000010::bigint, 'reject')$$,
+    $$VALUES ('duplicate'::text, 1, 0, 1)$$,
+    'duplicate votes are not recorded and do not change the counters'
+);
+
+SELECT results_eq(
+    $$SELECT outcome, status, approve FROM governance.fn_cast_supreme_assembly_vote(
+        (SELECT proposal_id FROM test_proposal), 2090000000000000011::bigint, 'approve')$$,
+    $$VALUES ('voted'::text, '已通過'::text, 2)$$,
+    'passes once approvals reach the threshold'
+);
+
+SELECT is(
+    (SELECT outcome FROM governance.fn_cast_supreme_assembly_vote(
+        (SELECT proposal_id FROM test_proposal), 2090000000000000012::bigint, 'approve')),
+    'closed',
+    'does not accept votes on closed proposals'
+);
+
+SELECT is(
+    (SELECT total_voted FROM governance.supreme_assembly_proposals
+     WHERE proposal_id = (SELECT proposal_id FROM test_proposal)),
+    (SELECT count(*)::int FROM governance.supreme_assembly_votes
+     WHERE proposal_id = (SELECT proposal_id FROM test_proposal)),
+    'total_voted matches the votes table'
+);
+
+DROP TABLE test_proposal;
+
+SELECT finish();
+ROLLBACK;
@@ -0,0 +1,151 @@
+\set ON_ERROR_STOP 1
+
+BEGIN;
+
+SELECT plan(12);
+SELECT set_config('search_path', 'pgtap, governance, public', false);
+
+SELECT has_function(
+    'governance',
+    'fn_cast_vote',
+    ARRAY['uuid', 'bigint', 'text'],
+    'fn_cast_vote exists with expected signature'
+);
+
+-- Setup: snapshot of three members -> threshold 2
+SELECT governance.fn_upsert_council_config(
+    1090000000000000000::bigint,
+    1090000000000000001::bigint,
+    1090000000000000002::bigint
+);
+
+WITH proposal AS (
+    SELECT * FROM governance.fn_create_proposal(
+        1090000000000000000::bigint,
+        1090000000000000003::bigint,
+        1090000000000000004::bigint,
+        1000::bigint,
+        'Cast vote proposal',
+        NULL::text,
+        ARRAY[1090000000000000010, 1090000000000000011, 1090000000000000012]::bigint[],
+        72,
+        NULL::text
+    )
+)
+SELECT proposal_id INTO TEMP TABLE test_proposal FROM proposal;
+
+-- 非快照成員：不寫入
+SELECT is(
+    (SELECT outcome FROM governance.fn_cast_vote(
+        (SELECT proposal_id FROM test_proposal), 1090000000000000099::bigint, 'approve')),
+    'not_in_snapshot',
+    'rejects voters outside the snapshot'
+);
+
+SELECT is(
+    (SELECT count(*)::int FROM governance.votes
+     WHERE proposal_id = (SELECT proposal_id FROM test_proposal)),
+    0,
+    'does not record a vote for non-snapshot voters'
+);
+
+DROP TABLE IF EXISTS result;
+CREATE TEMP TABLE result AS
+SELECT * FROM governance.fn_cast_vote(
+    (SELECT proposal_id FROM test_proposal), 1090000000000000010::bigint, 'approve');
+
+SELECT results_eq(
+    'SELECT outcome, status, approve, reject, total_voted FROM result',
+    $$VALUES ('voted'::text, '進行中'::text, 1, 0, 1)$$,
+    'first approve vote is counted and proposal stays open'
+);
+
+-- 改選：計數移轉，總票數不變
+DROP TABLE IF EXISTS result;
+CREATE TEMP TABLE result AS
+SELECT * FROM governance.fn_cast_vote(
+    (SELECT proposal_id FROM test_proposal), 1090000000000000010::bigint, 'reject');
+
+SELECT results_eq(
+    'SELECT approve, reject, abstain, total_voted FROM result',
+    $$VALUES (0, 1, 0, 1)$$,
+    'changing a vote moves the counter without changing total_voted'
+);
+
+SELECT is(
+    (SELECT status FROM result),
+    '進行中',
+    'proposal stays open while approval is still reachable'
+);
+
+-- 第二張反對票：0 贊成 + 1 未投 < 門檻 2 -> 提前否決
+DROP TABLE IF EXISTS result;
+CREATE TEMP TABLE result AS
+SELECT * FROM governance.fn_cast_vote(
+    (SELECT proposal_id FROM test_proposal), 1090000000000000011::bigint, 'reject');
+
+SELECT results_eq(
+    'SELECT outcome, status, reject, total_voted FROM result',
+    $$VALUES ('voted'::text, '已否決'::text, 2, 2)$$,
+    'rejects early once the threshold is unreachable'
+);
+
+-- 已結案：不寫入
+SELECT is(
+    (SELECT outcome FROM governance.fn_cast_vote(
+        (SELECT proposal_id FROM test_proposal), 1090000000000000012::bigint, 'approve')),
+    'closed',
+    'does not accept votes on closed proposals'
+);
+
+SELECT results_eq(
+    $$SELECT approve, reject, abstain, total_voted
+      FROM governance.fn_fetch_tally((SELECT proposal_id FROM test_proposal))$$,
+    $$SELECT count(*) FILTER (WHERE choice = 'approve')::int,
+             count(*) FILTER (WHERE choice = 'reject')::int,
+             count(*) FILTER (WHERE choice = 'abstain')::int,
+             count(*)::int
+      FROM governance.votes WHERE proposal_id = (SELECT proposal_id FROM test_proposal)$$,
+    'counters match the votes table'
+);
+
+-- 達門檻即通過
+WITH proposal AS (
+    SELECT * FROM governance.fn_create_proposal(
+        1090000000000000000::bigint,
+        1090000000000000003::bigint,
+        1090000000000000004::bigint,
+        500::bigint,
+        'Passing proposal',
+        NULL::text,
+        ARRAY[1090000000000000010, 1090000000000000011, 1090000000000000012]::bigint[],
+        72,
+        NULL::text
+    )
+)
+SELECT proposal_id INTO TEMP TABLE passing_proposal FROM proposal;
+
+SELECT governance.fn_cast_vote(
+    (SELECT proposal_id FROM passing_proposal), 1090000000000000010::bigint, 'approve');
+
+SELECT results_eq(
+    $$SELECT outcome, status, approve FROM governance.fn_cast_vote(
+        (SELECT proposal_id FROM passing_proposal), 1090000000000000012::bigint, 'approve')$$,
+    $$VALUES ('voted'::text, '已通過'::text, 2)$$,
+    'passes once approvals reach the threshold'
+);
+
+DROP TABLE IF EXISTS result;
+CREATE TEMP TABLE result AS
+SELECT * FROM governance.fn_cast_vote(
+    '00000000-0000-0000-0000-000000000000'::uuid, 1090000000000000010::bigint, 'approve');
+
+SELECT is((SELECT outcome FROM result), 'not_found', 'reports missing proposals');
+SELECT ok((SELECT proposal_id IS NULL FROM result), 'returns no proposal for missing ids');
+
+DROP TABLE result;
+DROP TABLE passing_proposal;
+DROP TABLE test_proposal;
+
+SELECT finish();
+ROLLBACK;
@@ -194,7 +194,7 @@ ON CONFLICT (account_id) DO UPDATE SET department = EXCLUDED.department;
 
 INSERT INTO guild_member_balances (guild_id, member_id, current_balance)
 VALUES (8600000000000000000, 8600000000000000003, 10000)
-ON CONFLICT (guild_id, member_id) DO NOTHING;
+ON CONFLICT (guild_id, member_id) DO UPDATE SET current_balance = EXCLUDED.current_balance;
 
 SET app.transfer_daily_limit = '100';
 
@@ -0,0 +1,61 @@
+\set ON_ERROR_STOP 1
+
+BEGIN;
+
+SELECT plan(5);
+SELECT set_config('search_path', 'pgtap, governance, public', false);
+
+SELECT has_function(
+    'governance',
+    'fn_get_department_permission_map',
+    ARRAY['bigint'],
+    'fn_get_department_permission_map exists with expected signature'
+);
+
+-- 未設定國務院的公會不回傳任何列
+SELECT is_empty(
+    $$ SELECT * FROM governance.fn_get_department_permission_map(8950000000000000000) $$,
+    'returns no rows for an unconfigured guild'
+);
+
+INSERT INTO governance.state_council_config (
+    guild_id, leader_id, leader_role_id,
+    internal_affairs_account_id, finance_account_id, security_account_id, central_bank_account_id
+) VALUES (
+    8950000000000000001, 8950000000000000010, 8950000000000000011,
+    9500000000000001, 9500000000000002, 9500000000000003, 9500000000000004
+);
+
+-- 已設定但尚無部門：仍回傳一列攜帶領袖設定
+SELECT results_eq(
+    $$ SELECT leader_id, leader_role_id, department
+       FROM governance.fn_get_department_permission_map(8950000000000000001) $$,
+    $$ VALUES (8950000000000000010::bigint, 8950000000000000011::bigint, NULL::text) $$,
+    'returns the leader row when no departments are configured'
+);
+
+INSERT INTO governance.department_configs (guild_id, department, role_id)
+VALUES (8950000000000000001, '財政部', 200);
+INSERT INTO governance.state_council_department_role_ids (guild_id, department, role_id)
+VALUES (8950000000000000001, '財政部', 300),
+       (8950000000000000001, '財政部', 200),
+       (8950000000000000001, '內政部', 400);
+
+SELECT results_eq(
+    $$ SELECT department, role_ids
+       FROM governance.fn_get_department_permission_map(8950000000000000001)
+       ORDER BY department $$,
+    $$ VALUES ('內政部'::text, ARRAY[400]::bigint[]),
+              ('財政部'::text, ARRAY[200, 300]::bigint[]) $$,
+    'merges multi-role and legacy single-role mappings per department'
+);
+
+SELECT is(
+    (SELECT count(DISTINCT leader_id)::int
+     FROM governance.fn_get_department_permission_map(8950000000000000001)),
+    1,
+    'every row carries the same leader configuration'
+);
+
+SELECT finish();
+ROLLBACK;
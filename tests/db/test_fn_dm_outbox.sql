@@ -0,0 +1,100 @@
+\set ON_ERROR_STOP 1
+
+BEGIN;
+
+SELECT plan(10);
+SELECT set_config('search_path', 'pgtap, governance, public', false);
+
+SELECT has_table('governance', 'dm_outbox', 'governance.dm_outbox exists');
+
+SELECT has_function(
+    'governance',
+    'fn_enqueue_dm',
+    ARRAY['bigint', 'bigint[]', 'text', 'jsonb'],
+    'fn_enqueue_dm exists with expected signature'
+);
+
+-- 同一批中的重複收件人只入列一次
+SELECT is(
+    governance.fn_enqueue_dm(
+        2100000000000000000,
+        ARRAY[2100000000000000001, 2100000000000000002, 2100000000000000002]::bigint[],
+        'test:vote:1',
+        '{"content": "vote"}'::jsonb
+    ),
+    2,
+    'enqueues each recipient once'
+);
+
+SELECT is(
+    governance.fn_enqueue_dm(
+        2100000000000000000,
+        ARRAY[2100000000000000001, 2100000000000000003]::bigint[],
+        'test:vote:1',
+        '{"content": "vote"}'::jsonb
+    ),
+    1,
+    'skips recipients already queued under the same dedup key'
+);
+
+CREATE TEMP TABLE claimed AS
+SELECT * FROM governance.fn_claim_dm_outbox(100, 300)
+WHERE guild_id = 2100000000000000000;
+
+SELECT results_eq(
+    $$SELECT recipient_id, attempts FROM claimed ORDER BY recipient_id$$,
+    $$VALUES (2100000000000000001::bigint, 1), (2100000000000000002::bigint, 1),
+             (2100000000000000003::bigint, 1)$$,
+    'claims due rows and counts the attempt'
+);
+
+SELECT is(
+    (SELECT count(*)::int FROM governance.fn_claim_dm_outbox(100, 300)
+     WHERE guild_id = 2100000000000000000),
+    0,
+    'leased rows are not claimed again'
+);
+
+SELECT is(
+    governance.fn_complete_dm_outbox(
+        ARRAY(SELECT outbox_id FROM claimed WHERE recipient_id = 2100000000000000001)
+    ),
+    1,
+    'marks delivered rows as sent'
+);
+
+SELECT governance.fn_defer_dm_outbox(
+    (SELECT outbox_id FROM claimed WHERE recipient_id = 2100000000000000002),
+    'Cannot send messages to this user', 0, true
+);
+SELECT governance.fn_defer_dm_outbox(
+    (SELECT outbox_id FROM claimed WHERE recipient_id = 2100000000000000003),
+    'Service unavailable', 0, false
+);
+
+SELECT results_eq(
+    $$SELECT recipient_id, status FROM governance.dm_outbox
+      WHERE dedup_key = 'test:vote:1' ORDER BY recipient_id$$,
+    $$VALUES (2100000000000000001::bigint, 'sent'::text),
+             (2100000000000000002::bigint, 'failed'::text),
+             (2100000000000000003::bigint, 'pending'::text)$$,
+    'records delivery, give-up and retry outcomes'
+);
+
+SELECT results_eq(
+    $$SELECT recipient_id, attempts FROM governance.fn_claim_dm_outbox(100, 300)
+      WHERE guild_id = 2100000000000000000$$,
+    $$VALUES (2100000000000000003::bigint, 2)$$,
+    'deferred rows become claimable again'
+);
+
+SELECT is(
+    governance.fn_prune_dm_outbox(timezone('utc', clock_timestamp()) + interval '1 minute'),
+    2,
+    'prunes finished rows only'
+);
+
+DROP TABLE claimed;
+
+SELECT finish();
+ROLLBACK;
@@ -0,0 +1,106 @@
+\set ON_ERROR_STOP 1
+
+BEGIN;
+
+SELECT plan(10);
+
+SELECT set_config('search_path', 'pgtap, economy, public', false);
+
+SELECT has_function(
+    'economy',
+    'fn_emit_economy_event',
+    ARRAY['jsonb'],
+    'fn_emit_economy_event exists with expected signature'
+);
+
+SELECT has_function(
+    'economy',
+    'fn_flush_economy_events',
+    'fn_flush_economy_events exists'
+);
+
+SELECT has_function(
+    'economy',
+    'fn_emit_economy_events',
+    ARRAY['jsonb'],
+    'fn_emit_economy_events exists with expected signature'
+);
+
+-- 預設模式：直接送出，不會暫存
+SELECT set_config('app.economy_notify_compact', 'off', true);
+SELECT economy.fn_emit_economy_event(jsonb_build_object('event_type', 'test_event'));
+SELECT is(
+    economy.fn_flush_economy_events(),
+    0,
+    'default mode does not buffer events'
+);
+
+-- 精簡模式：暫存並於 flush 時合併送出
+SELECT set_config('app.economy_notify_compact', 'on', true);
+SELECT economy.fn_emit_economy_event(jsonb_build_object('event_type', 'test_event', 'n', g))
+FROM generate_series(1, 3) AS g;
+
+SELECT is(
+    jsonb_array_length(current_setting('app.economy_event_buffer')::jsonb),
+    3,
+    'compact mode buffers events in the transaction'
+);
+
+SELECT is(
+    economy.fn_flush_economy_events(),
+    1,
+    'small buffer flushes as a single notification'
+);
+
+-- 超過 NOTIFY 上限時切段
+SELECT economy.fn_emit_economy_event(
+    jsonb_build_object('event_type', 'test_event', 'padding', repeat('x', 3000), 'n', g)
+)
+FROM generate_series(1, 5) AS g;
+
+SELECT cmp_ok(
+    economy.fn_flush_economy_events(),
+    '>',
+    1,
+    'oversized buffer is split into several notifications'
+);
+
+-- 批次送出：精簡模式下先送出已暫存的事件，本批不經過暫存區
+SELECT economy.fn_emit_economy_event(jsonb_build_object('event_type', 'test_event', 'n', 0));
+SELECT economy.fn_emit_economy_events(
+    (SELECT jsonb_agg(jsonb_build_object('event_type', 'test_event', 'n', g))
+     FROM generate_series(1, 500) AS g)
+);
+
+SELECT is(
+    current_setting('app.economy_event_buffer'),
+    '[]',
+    'compact bulk emit flushes the buffer and bypasses it'
+);
+
+SELECT is(
+    economy._notify_economy_events(
+        (SELECT jsonb_agg(jsonb_build_object('event_type', 'test_event', 'padding', repeat('x', 3000), 'n', g))
+         FROM generate_series(1, 5) AS g)
+    ),
+    3,
+    'bulk events are chunked below the NOTIFY limit'
+);
+
+-- 預設模式：逐筆送出，同樣不寫入暫存區
+SELECT set_config('app.economy_notify_compact', 'off', true);
+SELECT economy.fn_emit_economy_events('[{"event_type": "test_event"}]'::jsonb);
+
+SELECT is(
+    current_setting('app.economy_event_buffer'),
+    '[]',
+    'default bulk emit sends each event directly'
+);
+
+SELECT lives_ok(
+    $$SELECT economy.fn_emit_economy_events('[]'::jsonb)$$,
+    'empty bulk emit is a no-op'
+);
+
+SELECT finish();
+ROLLBACK;
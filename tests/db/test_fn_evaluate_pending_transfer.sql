@@ -0,0 +1,142 @@
+\set ON_ERROR_STOP 1
+
+BEGIN;
+
+SELECT plan(7);
+SELECT set_config('search_path', 'pgtap, economy, public', false);
+
+SELECT has_function(
+    'economy',
+    'fn_evaluate_pending_transfer',
+    ARRAY['uuid'],
+    'fn_evaluate_pending_transfer exists with expected signature'
+);
+
+-- Setup: Create balances
+WITH ids AS (
+    SELECT 8920000000000000000::bigint AS guild_id,
+           8920000000000000001::bigint AS initiator_id,
+           8920000000000000002::bigint AS target_id
+)
+INSERT INTO guild_member_balances (guild_id, member_id, current_balance, throttled_until)
+SELECT guild_id, initiator_id, 1000, NULL::timestamptz FROM ids
+UNION ALL
+SELECT guild_id, target_id, 0, NULL::timestamptz FROM ids
+ON CONFLICT (guild_id, member_id) DO UPDATE SET current_balance = EXCLUDED.current_balance;
+
+-- Test 1: 建立時由觸發器一次評估並核准
+DROP TABLE IF EXISTS last_transfer;
+CREATE TEMP TABLE last_transfer AS
+SELECT economy.fn_create_pending_transfer(
+    8920000000000000000::bigint,
+    8920000000000000001::bigint,
+    8920000000000000002::bigint,
+    500::bigint,
+    '{}'::jsonb,
+    NULL::timestamptz
+) AS transfer_id;
+
+SELECT is(
+    (
+        SELECT checks
+        FROM economy.pending_transfers
+        WHERE transfer_id = (SELECT transfer_id FROM last_transfer)
+    ),
+    '{"balance": 1, "cooldown": 1, "daily_limit": 1}'::jsonb,
+    'writes all three checks at once'
+);
+
+SELECT is(
+    (
+        SELECT status
+        FROM economy.pending_transfers
+        WHERE transfer_id = (SELECT transfer_id FROM last_transfer)
+    ),
+    'approved',
+    'approves transfer when all checks pass'
+);
+
+-- Test 2: 餘額不足時停留在 checking
+DROP TABLE IF EXISTS last_transfer;
+CREATE TEMP TABLE last_transfer AS
+SELECT economy.fn_create_pending_transfer(
+    8920000000000000000::bigint,
+    8920000000000000001::bigint,
+    8920000000000000002::bigint,
+    5000::bigint,
+    '{}'::jsonb,
+    NULL::timestamptz
+) AS transfer_id;
+
+SELECT is(
+    (
+        SELECT (status, checks->>'balance')::text
+        FROM economy.pending_transfers
+        WHERE transfer_id = (SELECT transfer_id FROM last_transfer)
+    ),
+    '(checking,0)',
+    'leaves transfer in checking when balance is insufficient'
+);
+
+-- Test 3: 補足餘額後重新評估即核准
+UPDATE guild_member_balances
+SET current_balance = 10000
+WHERE guild_id = 8920000000000000000 AND member_id = 8920000000000000001;
+
+SELECT economy.fn_evaluate_pending_transfer((SELECT transfer_id FROM last_transfer));
+
+SELECT is(
+    (
+        SELECT status
+        FROM economy.pending_transfers
+        WHERE transfer_id = (SELECT transfer_id FROM last_transfer)
+    ),
+    'approved',
+    're-evaluation approves once balance is sufficient'
+);
+
+-- Test 4: 冷卻中時 cooldown 為 0
+UPDATE guild_member_balances
+SET throttled_until = timezone('utc', now()) + interval '10 minutes'
+WHERE guild_id = 8920000000000000000 AND member_id = 8920000000000000001;
+
+DROP TABLE IF EXISTS last_transfer;
+CREATE TEMP TABLE last_transfer AS
+SELECT economy.fn_create_pending_transfer(
+    8920000000000000000::bigint,
+    8920000000000000001::bigint,
+    8920000000000000002::bigint,
+    100::bigint,
+    '{}'::jsonb,
+    NULL::timestamptz
+) AS transfer_id;
+
+SELECT is(
+    (
+        SELECT (status, checks->>'cooldown')::text
+        FROM economy.pending_transfers
+        WHERE transfer_id = (SELECT transfer_id FROM last_transfer)
+    ),
+    '(checking,0)',
+    'cooldown check fails while throttled'
+);
+
+-- Test 5: 已終結的轉帳不會被重新評估
+UPDATE economy.pending_transfers
+SET status = 'rejected'
+WHERE transfer_id = (SELECT transfer_id FROM last_transfer);
+
+SELECT economy.fn_evaluate_pending_transfer((SELECT transfer_id FROM last_transfer));
+
+SELECT is(
+    (
+        SELECT status
+        FROM economy.pending_transfers
+        WHERE transfer_id = (SELECT transfer_id FROM last_transfer)
+    ),
+    'rejected',
+    'ignores transfers that are no longer pending or checking'
+);
+
+SELECT finish();
+ROLLBACK;
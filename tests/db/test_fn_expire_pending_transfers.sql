@@ -0,0 +1,75 @@
+\set ON_ERROR_STOP 1
+
+BEGIN;
+
+SELECT plan(5);
+SELECT set_config('search_path', 'pgtap, economy, public', false);
+
+SELECT has_function(
+    'economy',
+    'fn_expire_pending_transfers',
+    ARRAY['integer'],
+    'fn_expire_pending_transfers exists with expected signature'
+);
+
+-- Setup: 餘額不足的轉帳會停留在 checking
+WITH ids AS (
+    SELECT 8940000000000000000::bigint AS guild_id,
+           8940000000000000001::bigint AS initiator_id,
+           8940000000000000002::bigint AS target_id
+)
+INSERT INTO guild_member_balances (guild_id, member_id, current_balance)
+SELECT guild_id, initiator_id, 10 FROM ids
+UNION ALL
+SELECT guild_id, target_id, 0 FROM ids
+ON CONFLICT (guild_id, member_id) DO UPDATE SET current_balance = EXCLUDED.current_balance;
+
+DROP TABLE IF EXISTS expiring_transfers;
+CREATE TEMP TABLE expiring_transfers AS
+SELECT economy.fn_create_pending_transfer(
+    8940000000000000000::bigint,
+    8940000000000000001::bigint,
+    8940000000000000002::bigint,
+    500::bigint,
+    '{}'::jsonb,
+    NULL::timestamptz
+) AS transfer_id
+FROM generate_series(1, 3);
+
+-- 其中兩筆已逾期
+UPDATE economy.pending_transfers
+SET expires_at = timezone('utc', clock_timestamp()) - interval '1 minute'
+WHERE transfer_id IN (SELECT transfer_id FROM expiring_transfers ORDER BY transfer_id LIMIT 2);
+
+-- Test 1: 依 p_limit 分批處理
+SELECT is(
+    (SELECT count(*) FROM economy.fn_expire_pending_transfers(1)),
+    1::bigint,
+    'respects the batch limit'
+);
+
+SELECT is(
+    (SELECT count(*) FROM economy.fn_expire_pending_transfers(10)),
+    1::bigint,
+    'next batch picks up the remaining expired transfer'
+);
+
+-- Test 2: 逾期的轉帳皆轉為 rejected，未逾期者不受影響
+SELECT is(
+    (
+        SELECT count(*) FROM economy.pending_transfers
+        WHERE transfer_id IN (SELECT transfer_id FROM expiring_transfers)
+          AND status = 'rejected'
+    ),
+    2::bigint,
+    'expired transfers are rejected'
+);
+
+-- Test 3: 沒有逾期資料時回傳空集合
+SELECT is_empty(
+    'SELECT * FROM economy.fn_expire_pending_transfers(10)',
+    'returns nothing when no transfers are expired'
+);
+
+SELECT finish();
+ROLLBACK;
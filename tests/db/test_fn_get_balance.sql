@@ -2,7 +2,7 @@
 
 BEGIN;
 
-SELECT plan(9);
+SELECT plan(10);
 
 SELECT set_config('search_path', 'pgtap, economy, public', false);
 
@@ -30,13 +30,19 @@ SELECT is(
 );
 
 SELECT ok(
-    EXISTS (
+    NOT EXISTS (
         SELECT 1
         FROM guild_member_balances
         WHERE guild_id = 8300000000000000000
           AND member_id = 8300000000000000001
     ),
-    'fn_get_balance upserts guild_member_balances row'
+    'fn_get_balance does not create a ledger row on read'
+);
+
+SELECT is(
+    (SELECT provolatile FROM pg_proc WHERE oid = 'economy.fn_get_balance(bigint, bigint)'::regprocedure),
+    's'::"char",
+    'fn_get_balance is STABLE so it can run in read-only transactions'
 );
 
 INSERT INTO guild_member_balances (guild_id, member_id, current_balance, last_modified_at, created_at)
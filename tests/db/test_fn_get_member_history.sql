@@ -0,0 +1,95 @@
+\set ON_ERROR_STOP 1
+
+BEGIN;
+
+SELECT plan(9);
+SELECT set_config('search_path', 'pgtap, economy, public', false);
+
+SELECT has_function(
+    'economy',
+    'fn_get_member_history',
+    ARRAY['bigint', 'bigint', 'integer', 'timestamptz', 'uuid'],
+    'fn_get_member_history exists with expected signature'
+);
+
+INSERT INTO guild_member_balances (guild_id, member_id, current_balance)
+VALUES (9110000000000000000, 9110000000000000001, 0),
+       (9110000000000000000, 9110000000000000002, 0)
+ON CONFLICT (guild_id, member_id) DO NOTHING;
+
+-- T3、T4 同一時間點，用於驗證 (created_at, transaction_id) keyset 不會漏列或重複
+INSERT INTO currency_transactions (
+    transaction_id, guild_id, initiator_id, target_id, amount, direction, reason,
+    balance_after_initiator, balance_after_target, created_at
+)
+VALUES
+    ('00000000-0000-0000-0000-000000000002', 9110000000000000000, 9110000000000000001, 9110000000000000002, 100, 'transfer', 'T2', 900, 100, timestamptz '2025-01-01 11:00:00+00'),
+    ('00000000-0000-0000-0000-000000000003', 9110000000000000000, 9110000000000000002, 9110000000000000001, 50, 'transfer', 'T3', 50, 950, timestamptz '2025-01-01 12:00:00+00'),
+    ('00000000-0000-0000-0000-000000000004', 9110000000000000000, 9110000000000000001, 9110000000000000002, 10, 'transfer', 'T4', 940, 60, timestamptz '2025-01-01 12:00:00+00'),
+    ('00000000-0000-0000-0000-000000000005', 9110000000000000000, 9110000000000000001, 9110000000000000002, 10, 'transfer', 'T5', 930, 70, timestamptz '2025-01-01 13:00:00+00');
+
+-- 已歸檔的較舊交易
+INSERT INTO currency_transactions_archive (
+    transaction_id, guild_id, initiator_id, target_id, amount, direction, reason,
+    balance_after_initiator, balance_after_target, metadata, created_at
+)
+VALUES
+    ('00000000-0000-0000-0000-000000000001', 9110000000000000000, 9110000000000000002, 9110000000000000001, 1000, 'transfer', 'T1', 0, 1000, '{}'::jsonb, timestamptz '2024-11-01 10:00:00+00');
+
+SELECT results_eq(
+    $$ SELECT reason FROM economy.fn_get_member_history(9110000000000000000, 9110000000000000001, 2, NULL, NULL) $$,
+    $$ VALUES ('T5'::text), ('T4'::text), ('T3'::text) $$,
+    'returns limit + 1 rows newest first with transaction_id as tie-breaker'
+);
+
+SELECT results_eq(
+    $$ SELECT reason FROM economy.fn_get_member_history(
+           9110000000000000000, 9110000000000000001, 2,
+           timestamptz '2025-01-01 12:00:00+00', '00000000-0000-0000-0000-000000000004'
+       ) $$,
+    $$ VALUES ('T3'::text), ('T2'::text), ('T1'::text) $$,
+    'keyset cursor continues within the same timestamp and falls through to the archive'
+);
+
+SELECT results_eq(
+    $$ SELECT reason FROM economy.fn_get_member_history(
+           9110000000000000000, 9110000000000000001, 10,
+           timestamptz '2025-01-01 12:00:00+00', NULL
+       ) $$,
+    $$ VALUES ('T2'::text), ('T1'::text) $$,
+    'timestamp-only cursor keeps the legacy created_at < cursor semantics'
+);
+
+SELECT is(
+    (SELECT count(*) FROM economy.fn_get_member_history(9110000000000000000, 9110000000000000002, 10, NULL, NULL)),
+    5::bigint,
+    'includes live and archived rows where member is initiator or target'
+);
+
+SELECT is(
+    (SELECT count(*) FROM economy.fn_get_member_history(8999999999999999999, 8999999999999999999, 10, NULL, NULL)),
+    0::bigint,
+    'returns empty result for non-existent guild/member'
+);
+
+SELECT throws_like(
+    $$ SELECT economy.fn_get_member_history(9110000000000000000, 9110000000000000001, NULL, NULL, NULL) $$,
+    '%History limit cannot be null%',
+    'NULL limit raises exception'
+);
+
+SELECT throws_like(
+    $$ SELECT economy.fn_get_member_history(9110000000000000000, 9110000000000000001, 51, NULL, NULL) $$,
+    '%History limit must be between 1 and 50%',
+    'limit > 50 raises exception'
+);
+
+SELECT has_index(
+    'economy',
+    'currency_transactions',
+    'ix_currency_transactions_guild_target_history',
+    'target-side history index exists'
+);
+
+SELECT finish();
+ROLLBACK;
@@ -0,0 +1,44 @@
+\set ON_ERROR_STOP 1
+
+BEGIN;
+
+SELECT plan(4);
+
+SELECT set_config('search_path', 'pgtap, economy, governance, public', false);
+
+SELECT has_trigger(
+    'economy', 'guild_member_balances', 'trigger_government_account_balance',
+    'ledger balance projection trigger exists'
+);
+
+INSERT INTO economy.guild_member_balances (guild_id, member_id, current_balance)
+VALUES (9180000000000000000, 9180000000000000001, 1000)
+ON CONFLICT (guild_id, member_id) DO UPDATE SET current_balance = EXCLUDED.current_balance;
+
+-- 建立政府帳戶（帳本列自動建立、餘額 0）不覆寫治理層既有餘額
+SELECT governance.fn_upsert_government_account(
+    9180000000000000002::bigint, 9180000000000000000::bigint, '財政部', 300::bigint
+);
+
+SELECT is(
+    (SELECT balance FROM governance.government_accounts WHERE account_id = 9180000000000000002),
+    300::bigint,
+    'creating the ledger row leaves the governance balance untouched'
+);
+
+UPDATE economy.guild_member_balances SET current_balance = 500
+WHERE guild_id = 9180000000000000000 AND member_id = 9180000000000000002;
+
+SELECT lives_ok(
+    $$ SELECT economy.fn_transfer_currency(9180000000000000000, 9180000000000000001, 9180000000000000002, 250, '{}'::jsonb) $$,
+    'transfer into a government account succeeds'
+);
+
+SELECT is(
+    (SELECT balance FROM governance.government_accounts WHERE account_id = 9180000000000000002),
+    750::bigint,
+    'governance balance follows the ledger inside the transfer transaction'
+);
+
+SELECT finish();
+ROLLBACK;
@@ -0,0 +1,68 @@
+\set ON_ERROR_STOP 1
+
+BEGIN;
+
+SELECT plan(6);
+
+SELECT set_config('search_path', 'pgtap, economy, governance, public', false);
+
+SELECT has_column(
+    'economy', 'guild_member_balances', 'is_government',
+    'guild_member_balances has is_government flag'
+);
+
+-- 既有帳本列：建立政府帳戶後旗標被設定，餘額保持不變
+INSERT INTO economy.guild_member_balances (guild_id, member_id, current_balance)
+VALUES (9170000000000000000, 9170000000000000001, 500)
+ON CONFLICT (guild_id, member_id) DO UPDATE SET current_balance = EXCLUDED.current_balance;
+
+INSERT INTO governance.government_accounts (account_id, guild_id, department, balance)
+VALUES (9170000000000000001, 9170000000000000000, '財政部', 0),
+       (9170000000000000002, 9170000000000000000, '內政部', 0);
+
+SELECT results_eq(
+    $$ SELECT current_balance, is_government FROM economy.guild_member_balances
+       WHERE guild_id = 9170000000000000000 AND member_id = 9170000000000000001 $$,
+    $$ VALUES (500::bigint, true) $$,
+    'existing ledger row is flagged and keeps its balance'
+);
+
+SELECT is(
+    (SELECT is_government FROM economy.guild_member_balances
+     WHERE guild_id = 9170000000000000000 AND member_id = 9170000000000000002),
+    true,
+    'ledger row is created for a new government account'
+);
+
+-- 餘額同步不影響旗標
+UPDATE governance.government_accounts SET balance = 42
+WHERE account_id = 9170000000000000001;
+
+SELECT is(
+    (SELECT is_government FROM economy.guild_member_balances
+     WHERE guild_id = 9170000000000000000 AND member_id = 9170000000000000001),
+    true,
+    'balance sync keeps the flag'
+);
+
+DELETE FROM governance.government_accounts WHERE account_id = 9170000000000000002;
+
+SELECT is(
+    (SELECT is_government FROM economy.guild_member_balances
+     WHERE guild_id = 9170000000000000000 AND member_id = 9170000000000000002),
+    false,
+    'removing the government account clears the flag'
+);
+
+-- 旗標讓轉帳函式免除每日上限
+SET app.transfer_daily_limit = '1';
+
+SELECT lives_ok(
+    $$ SELECT economy.fn_transfer_currency(9170000000000000000, 9170000000000000001, 9170000000000000002, 100, '{}'::jsonb) $$,
+    'flagged government account is exempt from the daily limit'
+);
+
+RESET app.transfer_daily_limit;
+
+SELECT finish();
+ROLLBACK;
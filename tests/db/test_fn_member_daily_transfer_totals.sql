@@ -0,0 +1,81 @@
+\set ON_ERROR_STOP 1
+
+BEGIN;
+
+SELECT plan(8);
+
+SELECT set_config('search_path', 'pgtap, economy, public', false);
+
+SELECT has_table('economy', 'member_daily_transfer_totals', 'member_daily_transfer_totals exists');
+
+SELECT has_function(
+    'economy',
+    'fn_get_daily_transfer_total',
+    ARRAY['bigint', 'bigint', 'timestamptz'],
+    'fn_get_daily_transfer_total exists with expected signature'
+);
+
+INSERT INTO guild_member_balances (guild_id, member_id, current_balance)
+VALUES (9160000000000000000, 9160000000000000001, 10000),
+       (9160000000000000000, 9160000000000000002, 0)
+ON CONFLICT (guild_id, member_id) DO UPDATE SET current_balance = EXCLUDED.current_balance;
+
+-- 一次插入多列：觸發器以 GROUP BY 合併；非 transfer 與昨日的交易不計入今日
+INSERT INTO currency_transactions (
+    guild_id, initiator_id, target_id, amount, direction, reason,
+    balance_after_initiator, balance_after_target, created_at
+)
+VALUES
+    (9160000000000000000, 9160000000000000001, 9160000000000000002, 100, 'transfer', NULL, 0, 0, timezone('utc', now())),
+    (9160000000000000000, 9160000000000000001, 9160000000000000002, 250, 'transfer', NULL, 0, 0, timezone('utc', now())),
+    (9160000000000000000, 9160000000000000001, NULL, 999, 'adjustment', NULL, 0, NULL, timezone('utc', now())),
+    (9160000000000000000, 9160000000000000001, 9160000000000000002, 40, 'transfer', NULL, 0, 0, timezone('utc', now()) - interval '1 day');
+
+SELECT is(
+    economy.fn_get_daily_transfer_total(9160000000000000000, 9160000000000000001),
+    350::bigint,
+    'today total only counts outgoing transfers from today'
+);
+
+SELECT is(
+    economy.fn_get_daily_transfer_total(
+        9160000000000000000, 9160000000000000001, timezone('utc', now()) - interval '1 day'
+    ),
+    40::bigint,
+    'each UTC day keeps its own total'
+);
+
+SELECT is(
+    economy.fn_get_daily_transfer_total(9160000000000000000, 9160000000000000002),
+    0::bigint,
+    'members without transfers read as zero'
+);
+
+DELETE FROM currency_transactions
+WHERE guild_id = 9160000000000000000 AND amount = 100;
+
+SELECT is(
+    economy.fn_get_daily_transfer_total(9160000000000000000, 9160000000000000001),
+    250::bigint,
+    'deleting transactions subtracts from the total'
+);
+
+-- 轉帳函式直接讀取累計表：把累計推到上限附近後，下一筆轉帳應被拒絕
+SET app.transfer_daily_limit = '500';
+
+SELECT lives_ok(
+    $$ SELECT economy.fn_transfer_currency(9160000000000000000, 9160000000000000001, 9160000000000000002, 250, '{}'::jsonb) $$,
+    'transfer within the daily limit succeeds and is added to the total'
+);
+
+SELECT throws_ok(
+    $$ SELECT economy.fn_transfer_currency(9160000000000000000, 9160000000000000001, 9160000000000000002, 1, '{}'::jsonb) $$,
+    'P0001',
+    'Transfer throttled: daily limit of 500 exceeded.',
+    'transfer over the materialised daily total is throttled'
+);
+
+RESET app.transfer_daily_limit;
+
+SELECT finish();
+ROLLBACK;
@@ -0,0 +1,32 @@
+\set ON_ERROR_STOP 1
+
+BEGIN;
+
+SELECT plan(8);
+SELECT set_config('search_path', 'pgtap, governance, public', false);
+
+SELECT has_function(
+    'governance',
+    'fn_notify_config_changed',
+    'fn_notify_config_changed exists'
+);
+
+SELECT has_trigger('governance', 'council_config', 'trigger_council_config_changed',
+    'council_config notifies on change');
+SELECT has_trigger('governance', 'council_role_ids', 'trigger_council_role_ids_changed',
+    'council_role_ids notifies on change');
+SELECT has_trigger('governance', 'state_council_config', 'trigger_state_council_config_changed',
+    'state_council_config notifies on change');
+SELECT has_trigger('governance', 'department_configs', 'trigger_department_configs_changed',
+    'department_configs notifies on change');
+SELECT has_trigger('governance', 'state_council_department_role_ids',
+    'trigger_department_role_ids_changed',
+    'state_council_department_role_ids notifies on change');
+SELECT has_trigger('governance', 'supreme_assembly_configurations',
+    'trigger_supreme_assembly_config_changed',
+    'supreme_assembly_configurations notifies on change');
+SELECT has_trigger('economy', 'economy_configurations', 'trigger_economy_configurations_changed',
+    'economy_configurations notifies on change');
+
+SELECT finish();
+ROLLBACK;
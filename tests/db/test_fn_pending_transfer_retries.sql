@@ -0,0 +1,89 @@
+\set ON_ERROR_STOP 1
+
+BEGIN;
+
+SELECT plan(8);
+SELECT set_config('search_path', 'pgtap, economy, public', false);
+
+SELECT has_function(
+    'economy',
+    'fn_schedule_pending_transfer_retry',
+    ARRAY['uuid', 'integer'],
+    'fn_schedule_pending_transfer_retry exists with expected signature'
+);
+
+SELECT has_function(
+    'economy',
+    'fn_claim_due_pending_transfer_retries',
+    ARRAY['integer'],
+    'fn_claim_due_pending_transfer_retries exists with expected signature'
+);
+
+-- Setup: 餘額不足的轉帳會停留在 checking
+WITH ids AS (
+    SELECT 8930000000000000000::bigint AS guild_id,
+           8930000000000000001::bigint AS initiator_id,
+           8930000000000000002::bigint AS target_id
+)
+INSERT INTO guild_member_balances (guild_id, member_id, current_balance)
+SELECT guild_id, initiator_id, 10 FROM ids
+UNION ALL
+SELECT guild_id, target_id, 0 FROM ids
+ON CONFLICT (guild_id, member_id) DO UPDATE SET current_balance = EXCLUDED.current_balance;
+
+DROP TABLE IF EXISTS last_transfer;
+CREATE TEMP TABLE last_transfer AS
+SELECT economy.fn_create_pending_transfer(
+    8930000000000000000::bigint,
+    8930000000000000001::bigint,
+    8930000000000000002::bigint,
+    500::bigint,
+    '{}'::jsonb,
+    NULL::timestamptz
+) AS transfer_id;
+
+-- Test 1: 第一次排程成功並累加 retry_count
+SELECT isnt(
+    economy.fn_schedule_pending_transfer_retry((SELECT transfer_id FROM last_transfer)),
+    NULL,
+    'schedules the first retry'
+);
+
+-- Test 2: 重複排程不會再次累加
+SELECT is(
+    economy.fn_schedule_pending_transfer_retry((SELECT transfer_id FROM last_transfer)),
+    NULL,
+    'does not reschedule an already scheduled retry'
+);
+
+SELECT is(
+    (SELECT retry_count FROM economy.pending_transfers WHERE transfer_id = (SELECT transfer_id FROM last_transfer)),
+    1,
+    'retry_count is incremented once'
+);
+
+-- Test 3: 尚未到期時不會被領取
+SELECT is_empty(
+    'SELECT * FROM economy.fn_claim_due_pending_transfer_retries(10)',
+    'does not claim retries that are not yet due'
+);
+
+-- Test 4: 到期後領取並清除排程
+UPDATE economy.pending_transfers
+SET next_retry_at = timezone('utc', clock_timestamp()) - interval '1 second'
+WHERE transfer_id = (SELECT transfer_id FROM last_transfer);
+
+SELECT results_eq(
+    'SELECT * FROM economy.fn_claim_due_pending_transfer_retries(10)',
+    'SELECT transfer_id FROM last_transfer',
+    'claims due retries'
+);
+
+SELECT is(
+    (SELECT next_retry_at FROM economy.pending_transfers WHERE transfer_id = (SELECT transfer_id FROM last_transfer)),
+    NULL,
+    'claiming clears next_retry_at'
+);
+
+SELECT finish();
+ROLLBACK;
@@ -0,0 +1,95 @@
+\set ON_ERROR_STOP 1
+
+BEGIN;
+
+SELECT plan(6);
+SELECT set_config('search_path', 'pgtap, economy, public', false);
+
+SELECT has_function(
+    'economy',
+    'fn_list_economy_events_since',
+    ARRAY['timestamp with time zone', 'uuid', 'integer'],
+    'fn_list_economy_events_since exists with expected signature'
+);
+
+SELECT has_function(
+    'economy',
+    'fn_list_approved_pending_transfers',
+    ARRAY['integer'],
+    'fn_list_approved_pending_transfers exists with expected signature'
+);
+
+-- Setup: 兩筆轉帳
+WITH ids AS (
+    SELECT 8950000000000000000::bigint AS guild_id,
+           8950000000000000001::bigint AS initiator_id,
+           8950000000000000002::bigint AS target_id
+)
+INSERT INTO guild_member_balances (guild_id, member_id, current_balance)
+SELECT guild_id, initiator_id, 1000 FROM ids
+UNION ALL
+SELECT guild_id, target_id, 0 FROM ids
+ON CONFLICT (guild_id, member_id) DO UPDATE SET current_balance = EXCLUDED.current_balance;
+
+DROP TABLE IF EXISTS replay_since;
+CREATE TEMP TABLE replay_since AS SELECT now() - interval '1 minute' AS since;
+
+INSERT INTO economy.currency_transactions
+    (guild_id, initiator_id, target_id, amount, direction, balance_after_initiator, balance_after_target)
+VALUES
+    (8950000000000000000, 8950000000000000001, 8950000000000000002, 10, 'transfer', 990, 10),
+    (8950000000000000000, 8950000000000000001, 8950000000000000002, 20, 'transfer', 970, 30);
+
+-- Test 1: 以 NOTIFY 相同格式回傳事件
+SELECT is(
+    (
+        SELECT payload->>'event_type'
+        FROM economy.fn_list_economy_events_since((SELECT since FROM replay_since), NULL, 10)
+        WHERE (payload->>'guild_id')::bigint = 8950000000000000000
+        LIMIT 1
+    ),
+    'transaction_success',
+    'replays transfers as transaction_success events'
+);
+
+-- Test 2: 依 p_limit 分頁
+SELECT is(
+    (SELECT count(*) FROM economy.fn_list_economy_events_since((SELECT since FROM replay_since), NULL, 1)),
+    1::bigint,
+    'respects the page size'
+);
+
+-- Test 3: 由最後一筆游標繼續，不重複回傳
+SELECT is(
+    (
+        SELECT count(*)
+        FROM economy.fn_list_economy_events_since(
+            (SELECT created_at FROM economy.fn_list_economy_events_since((SELECT since FROM replay_since), NULL, 2) ORDER BY created_at DESC, transaction_id DESC LIMIT 1),
+            (SELECT transaction_id FROM economy.fn_list_economy_events_since((SELECT since FROM replay_since), NULL, 2) ORDER BY created_at DESC, transaction_id DESC LIMIT 1),
+            10
+        )
+        WHERE (payload->>'guild_id')::bigint = 8950000000000000000
+    ),
+    0::bigint,
+    'keyset cursor excludes already replayed rows'
+);
+
+-- Test 4: 列出已核准但未執行的轉帳
+INSERT INTO economy.pending_transfers (guild_id, initiator_id, target_id, amount, status, checks)
+VALUES (
+    8950000000000000000, 8950000000000000001, 8950000000000000002, 1, 'approved',
+    '{"balance": 1, "cooldown": 1, "daily_limit": 1}'::jsonb
+);
+
+SELECT ok(
+    EXISTS (
+        SELECT 1
+        FROM economy.fn_list_approved_pending_transfers(1000) AS t(transfer_id)
+        JOIN economy.pending_transfers pt USING (transfer_id)
+        WHERE pt.guild_id = 8950000000000000000
+    ),
+    'lists approved pending transfers'
+);
+
+SELECT finish();
+ROLLBACK;
@@ -0,0 +1,97 @@
+\set ON_ERROR_STOP 1
+
+BEGIN;
+
+SELECT plan(9);
+
+SELECT set_config('search_path', 'pgtap, governance, public', false);
+
+SELECT has_function(
+    'governance',
+    'fn_report_financial_totals',
+    ARRAY['bigint', 'timestamptz', 'timestamptz'],
+    'fn_report_financial_totals exists with expected signature'
+);
+
+SELECT has_function(
+    'governance',
+    'fn_report_activity',
+    ARRAY['bigint', 'timestamptz', 'timestamptz', 'integer'],
+    'fn_report_activity exists with expected signature'
+);
+
+-- 期間外（12 月與 2 月）的紀錄不應計入 1 月報表
+INSERT INTO governance.welfare_disbursements (guild_id, recipient_id, amount, disbursement_type, reference_id, disbursed_at)
+VALUES (9200000000000000000, 9200000000000000001, 1000, '定期福利', NULL, '2024-01-15 10:00+00'),
+       (9200000000000000000, 9200000000000000002, 1500, '特殊福利', NULL, '2024-01-20 10:00+00'),
+       (9200000000000000000, 9200000000000000001, 9999, '定期福利', NULL, '2023-12-31 23:59+00');
+
+INSERT INTO governance.tax_records (guild_id, taxpayer_id, taxable_amount, tax_rate_percent, tax_amount, tax_type, assessment_period, collected_at)
+VALUES (9200000000000000000, 9200000000000000001, 10000, 10, 1000, '所得稅', '2024-01', '2024-01-10 10:00+00'),
+       (9200000000000000000, 9200000000000000003, 20000, 15, 3000, '所得稅', '2024-01', '2024-01-25 10:00+00');
+
+-- 身分紀錄：兩天各一筆，高峰日取較晚的一天；動作同數時取最近一次
+INSERT INTO governance.identity_records (guild_id, target_id, action, reason, performed_by, performed_at)
+VALUES (9200000000000000000, 9200000000000000004, '標記疑犯', NULL, 9200000000000000009, '2024-01-05 10:00+00'),
+       (9200000000000000000, 9200000000000000001, '移除公民身分', NULL, 9200000000000000009, '2024-01-15 10:00+00');
+
+INSERT INTO governance.currency_issuances (guild_id, amount, reason, performed_by, month_period, issued_at)
+VALUES (9200000000000000000, 5000, 'stimulus', 9200000000000000009, '2024-01', '2024-01-01 00:00+00'),
+       (9200000000000000000, 3000, 'liquidity', 9200000000000000009, '2024-01', '2024-01-31 23:59:59.999999+00'),
+       (9200000000000000000, 7000, 'next month', 9200000000000000009, '2024-02', '2024-02-01 00:00+00');
+
+SELECT results_eq(
+    $$ SELECT * FROM governance.fn_report_financial_totals(
+           9200000000000000000, '2024-01-01 00:00+00', '2024-01-31 23:59:59.999999+00') $$,
+    $$ VALUES (2500::bigint, 4000::bigint, 8000::bigint) $$,
+    'financial totals honour the inclusive period'
+);
+
+SELECT results_eq(
+    $$ SELECT * FROM governance.fn_report_department_metrics(
+           9200000000000000000, '內政部', '2024-01-01 00:00+00', '2024-01-31 23:59:59.999999+00') $$,
+    $$ VALUES (2::bigint, 2500::bigint, '2024-01-20'::text, '福利發放'::text) $$,
+    'welfare metrics pick the later day on a tie'
+);
+
+SELECT results_eq(
+    $$ SELECT * FROM governance.fn_report_department_metrics(
+           9200000000000000000, '國土安全部', '2024-01-01 00:00+00', '2024-01-31 23:59:59.999999+00') $$,
+    $$ VALUES (2::bigint, 2::bigint, '2024-01-15'::text, '移除公民身分'::text) $$,
+    'identity metrics count actions and prefer the most recent action on a tie'
+);
+
+SELECT results_eq(
+    $$ SELECT * FROM governance.fn_report_department_metrics(
+           9200000000000000000, '中央銀行', '2024-03-01 00:00+00', '2024-03-31 23:59:59+00') $$,
+    $$ VALUES (0::bigint, 0::bigint, NULL::text, NULL::text) $$,
+    'empty period returns zero aggregates'
+);
+
+SELECT results_eq(
+    $$ SELECT label, operations FROM governance.fn_report_activity(
+           9200000000000000000, '2024-01-01 00:00+00', '2024-01-31 23:59:59.999999+00')
+       WHERE section = 'operation' ORDER BY label $$,
+    $$ VALUES ('福利發放'::text, 2::bigint), ('稅收徵收', 2), ('貨幣發行', 2), ('身分管理', 2) $$,
+    'activity breakdown counts each operation type'
+);
+
+-- 使用者 1：福利、稅收、身分各一次；發行的執行者 9 兩次
+SELECT results_eq(
+    $$ SELECT label, operations FROM governance.fn_report_activity(
+           9200000000000000000, '2024-01-01 00:00+00', '2024-01-31 23:59:59.999999+00', 2)
+       WHERE section = 'performer' ORDER BY operations DESC, label $$,
+    $$ VALUES ('9200000000000000001'::text, 3::bigint), ('9200000000000000009', 2) $$,
+    'top performers are ranked and limited in SQL'
+);
+
+SELECT is(
+    (SELECT operations FROM governance.fn_report_activity(
+         9200000000000000000, '2024-01-01 00:00+00', '2024-01-31 23:59:59.999999+00')
+     WHERE section = 'unique_users'),
+    5::bigint,
+    'unique users are counted across all operation types'
+);
+
+SELECT finish();
+ROLLBACK;
@@ -0,0 +1,67 @@
+\set ON_ERROR_STOP 1
+
+BEGIN;
+
+SELECT plan(5);
+
+SELECT set_config('search_path', 'pgtap, governance, economy, public', false);
+
+SELECT has_function(
+    'governance',
+    'fn_state_council_summary',
+    ARRAY['bigint', 'text'],
+    'fn_state_council_summary exists with expected signature'
+);
+
+INSERT INTO governance.government_accounts (account_id, guild_id, department, balance)
+VALUES (9190000000000000001, 9190000000000000000, '內政部', 111),
+       (9190000000000000002, 9190000000000000000, '財政部', 222),
+       (9190000000000000003, 9190000000000000000, '國土安全部', 0),
+       (9190000000000000004, 9190000000000000000, '中央銀行', 0);
+
+-- 帳本餘額優先於治理層餘額
+UPDATE economy.guild_member_balances SET current_balance = 5000
+WHERE guild_id = 9190000000000000000 AND member_id = 9190000000000000001;
+
+INSERT INTO governance.welfare_disbursements (guild_id, recipient_id, amount, disbursement_type, reference_id)
+SELECT 9190000000000000000, 9190000000000000100 + g, 10, '定期福利', NULL
+FROM generate_series(1, 1500) AS g;
+
+INSERT INTO governance.tax_records (guild_id, taxpayer_id, taxable_amount, tax_rate_percent, tax_amount, tax_type, assessment_period)
+VALUES (9190000000000000000, 9190000000000000100, 1000, 10, 100, '所得稅', '2026-01'),
+       (9190000000000000000, 9190000000000000101, 500, 10, 50, '所得稅', '2026-01');
+
+INSERT INTO governance.currency_issuances (guild_id, amount, reason, performed_by, month_period)
+VALUES (9190000000000000000, 700, 'current', 9190000000000000100, '2026-02'),
+       (9190000000000000000, 300, 'previous', 9190000000000000100, '2026-01');
+
+SELECT results_eq(
+    $$ SELECT department, balance FROM governance.fn_state_council_summary(9190000000000000000, '2026-02')
+       WHERE department IN ('內政部', '財政部') ORDER BY department $$,
+    $$ VALUES ('內政部'::text, 5000::bigint), ('財政部'::text, 0::bigint) $$,
+    'balances come from the economy ledger'
+);
+
+SELECT is(
+    (SELECT total_welfare_disbursed FROM governance.fn_state_council_summary(9190000000000000000, '2026-02')
+     WHERE department = '內政部'),
+    15000::bigint,
+    'welfare total covers every record, not only the latest 1000'
+);
+
+SELECT is(
+    (SELECT total_tax_collected FROM governance.fn_state_council_summary(9190000000000000000, '2026-02')
+     WHERE department = '財政部'),
+    150::bigint,
+    'tax total is assigned to the finance department'
+);
+
+SELECT is(
+    (SELECT currency_issued FROM governance.fn_state_council_summary(9190000000000000000, '2026-02')
+     WHERE department = '中央銀行'),
+    700::bigint,
+    'issuance only counts the requested month'
+);
+
+SELECT finish();
+ROLLBACK;
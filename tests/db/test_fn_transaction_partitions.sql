@@ -0,0 +1,172 @@
+\set ON_ERROR_STOP 1
+
+BEGIN;
+
+SELECT plan(13);
+SELECT set_config('search_path', 'pgtap, economy, public', false);
+
+SELECT has_function(
+    'economy',
+    'fn_ensure_transaction_partitions',
+    ARRAY['integer', 'timestamptz'],
+    'fn_ensure_transaction_partitions exists with expected signature'
+);
+
+SELECT has_function(
+    'economy',
+    'fn_archive_transaction_partitions',
+    ARRAY['interval'],
+    'fn_archive_transaction_partitions exists with expected signature'
+);
+
+SELECT is(
+    (SELECT relkind::text FROM pg_class WHERE oid = 'economy.currency_transactions'::regclass),
+    'p',
+    'currency_transactions is a partitioned table'
+);
+
+-- 以 EXPLAIN 文字檢查實際掃描的分區（執行期剪枝的分區不會出現在計畫中）
+CREATE FUNCTION pg_temp.plan_text(p_query text)
+RETURNS text
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_line text;
+    v_plan text := '';
+BEGIN
+    FOR v_line IN EXECUTE 'EXPLAIN (COSTS OFF) ' || p_query LOOP
+        v_plan := v_plan || v_line || E'\n';
+    END LOOP;
+    RETURN v_plan;
+END;
+$$;
+
+CREATE FUNCTION pg_temp.partition_name(p_offset integer)
+RETURNS text
+LANGUAGE sql
+AS $$
+    SELECT 'currency_transactions_p'
+        || to_char(date_trunc('month', timezone('utc', now())) + make_interval(months => p_offset), 'YYYYMM');
+$$;
+
+SELECT economy.fn_ensure_transaction_partitions(2);
+
+SELECT ok(
+    to_regclass('economy.' || pg_temp.partition_name(2)) IS NOT NULL,
+    'partitions are created ahead of the current month'
+);
+
+SELECT is(
+    economy.fn_ensure_transaction_partitions(2),
+    0,
+    'ensuring again is a no-op'
+);
+
+-- DEFAULT 分區中屬於新月份的列會在建立分區時移入
+INSERT INTO guild_member_balances (guild_id, member_id, current_balance)
+VALUES (9140000000000000000, 9140000000000000001, 0)
+ON CONFLICT (guild_id, member_id) DO NOTHING;
+
+INSERT INTO currency_transactions (
+    guild_id, initiator_id, target_id, amount, direction, reason,
+    balance_after_initiator, balance_after_target, created_at
+)
+VALUES (
+    9140000000000000000, 9140000000000000001, NULL, 10, 'adjustment', 'future',
+    0, NULL, date_trunc('month', now()) + interval '4 months' + interval '1 day'
+);
+
+SELECT economy.fn_ensure_transaction_partitions(4);
+
+SELECT results_eq(
+    format('SELECT reason FROM economy.%I', pg_temp.partition_name(4)),
+    ARRAY['future'],
+    'rows in the default partition move into the newly created month'
+);
+
+-- 保留期限為 -1 個月：本月分區整月早於期限，應被移到 archive
+SELECT results_eq(
+    $$ SELECT * FROM economy.fn_archive_transaction_partitions(interval '-1 month') $$,
+    ARRAY[pg_temp.partition_name(0)],
+    'only partitions whose whole month is past the retention window are archived'
+);
+
+SELECT is(
+    (
+        SELECT i.inhparent::regclass::text
+        FROM pg_inherits i
+        WHERE i.inhrelid = to_regclass('economy.' || pg_temp.partition_name(0))
+    ),
+    'currency_transactions_archive',
+    'archived partition is attached to the archive table'
+);
+
+SELECT is(
+    (
+        SELECT count(*)::int
+        FROM pg_constraint
+        WHERE conrelid = to_regclass('economy.' || pg_temp.partition_name(0))
+          AND contype = 'f'
+    ),
+    0,
+    'archived partition no longer references live balances'
+);
+
+-- 建立兩個月前的分區，驗證每日上限與歷史分頁查詢的分區剪枝
+SELECT economy.fn_ensure_transaction_partitions(0, now() - interval '2 months');
+
+SELECT ok(
+    position(pg_temp.partition_name(-2) IN pg_temp.plan_text($$
+        SELECT coalesce(sum(amount), 0)
+        FROM economy.currency_transactions
+        WHERE guild_id = 9140000000000000000
+          AND initiator_id = 9140000000000000001
+          AND direction = 'transfer'
+          AND created_at >= date_trunc('day', now())
+    $$)) = 0,
+    'daily limit query skips partitions of past months'
+);
+
+SELECT ok(
+    position(pg_temp.partition_name(2) IN pg_temp.plan_text($$
+        SELECT transaction_id
+        FROM economy.currency_transactions
+        WHERE guild_id = 9140000000000000000
+          AND initiator_id = 9140000000000000001
+          AND created_at <= now() - interval '40 days'
+          AND (created_at, transaction_id)
+              < (now() - interval '40 days', '00000000-0000-0000-0000-000000000000'::uuid)
+        ORDER BY created_at DESC, transaction_id DESC
+        LIMIT 11
+    $$)) = 0,
+    'history page with an older cursor skips later partitions'
+);
+
+-- 早於歸檔表既有範圍的月分區無法 ATTACH，應改為搬移列後移除
+INSERT INTO currency_transactions (
+    guild_id, initiator_id, target_id, amount, direction, reason,
+    balance_after_initiator, balance_after_target, created_at
+)
+VALUES (
+    9140000000000000000, 9140000000000000001, NULL, 10, 'adjustment', 'old',
+    0, NULL, now() - interval '2 months'
+);
+
+SELECT ok(
+    pg_temp.partition_name(-2) IN (
+        SELECT * FROM economy.fn_archive_transaction_partitions(interval '30 days')
+    ),
+    'expired month partition is archived'
+);
+
+SELECT results_eq(
+    $$
+        SELECT reason FROM economy.currency_transactions_archive
+        WHERE guild_id = 9140000000000000000 AND reason = 'old'
+    $$,
+    ARRAY['old'],
+    'archived rows are readable through the archive table'
+);
+
+SELECT finish();
+ROLLBACK;
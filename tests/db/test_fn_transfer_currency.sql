@@ -2,7 +2,7 @@
 
 BEGIN;
 
-SELECT plan(10);
+SELECT plan(12);
 
 SELECT set_config('search_path', 'pgtap, economy, public', false);
 
@@ -141,5 +141,28 @@ SELECT ok(
     'throttle utility returns throttled_until timestamp'
 );
 
+-- 餘額版本嚴格遞增：即使既有版本晚於本交易的時間戳，寫入後仍會再往後推進
+UPDATE guild_member_balances
+SET last_modified_at = timezone('utc', now()) + interval '1 hour'
+WHERE guild_id = 8400000000000000000 AND member_id = 8600000000000000000;
+
+SELECT lives_ok(
+    $$ SELECT economy.fn_transfer_currency(
+        8400000000000000000,
+        8600000000000000000,
+        8500000000000000000,
+        1,
+        '{}'::jsonb
+    ) $$,
+    'transfer from a member with a later ledger version succeeds'
+);
+
+SELECT is(
+    (SELECT last_modified_at FROM guild_member_balances
+     WHERE guild_id = 8400000000000000000 AND member_id = 8600000000000000000),
+    timezone('utc', now()) + interval '1 hour' + interval '1 microsecond',
+    'ledger version strictly increases past an existing later version'
+);
+
 SELECT finish();
 ROLLBACK;
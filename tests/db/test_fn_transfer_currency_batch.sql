@@ -0,0 +1,93 @@
+\set ON_ERROR_STOP 1
+
+BEGIN;
+
+SELECT plan(8);
+
+SELECT set_config('search_path', 'pgtap, economy, public', false);
+
+SELECT has_function(
+    'economy',
+    'fn_transfer_currency_batch',
+    ARRAY['bigint', 'jsonb'],
+    'fn_transfer_currency_batch exists with expected signature'
+);
+
+INSERT INTO guild_member_balances (guild_id, member_id, current_balance)
+VALUES (8410000000000000000, 8510000000000000000, 1000)
+ON CONFLICT (guild_id, member_id) DO UPDATE
+SET current_balance = EXCLUDED.current_balance,
+    throttled_until = NULL,
+    last_modified_at = now();
+
+CREATE TEMP TABLE batch_outcome AS
+SELECT *
+FROM economy.fn_transfer_currency_batch(
+    8410000000000000000,
+    jsonb_build_array(
+        jsonb_build_object('initiator_id', 8510000000000000000, 'target_id', 8610000000000000001, 'amount', 100,
+                           'metadata', jsonb_build_object('reason', 'payroll')),
+        jsonb_build_object('initiator_id', 8510000000000000000, 'target_id', 8610000000000000002, 'amount', 200),
+        jsonb_build_object('initiator_id', 8610000000000000002, 'target_id', 8610000000000000001, 'amount', 50)
+    )
+);
+
+SELECT is(
+    (SELECT count(*) FROM batch_outcome),
+    3::bigint,
+    'batch returns one result per item'
+);
+
+SELECT is(
+    (SELECT current_balance FROM guild_member_balances
+     WHERE guild_id = 8410000000000000000 AND member_id = 8510000000000000000),
+    700::bigint,
+    'initiator debited for all items'
+);
+
+SELECT is(
+    (SELECT current_balance FROM guild_member_balances
+     WHERE guild_id = 8410000000000000000 AND member_id = 8610000000000000001),
+    150::bigint,
+    'later items see balances credited by earlier items'
+);
+
+SELECT is(
+    (SELECT count(*) FROM currency_transactions
+     WHERE guild_id = 8410000000000000000 AND direction = 'transfer'),
+    3::bigint,
+    'each item writes a ledger row'
+);
+
+SELECT throws_like(
+    $$ SELECT * FROM economy.fn_transfer_currency_batch(
+        8410000000000000000,
+        jsonb_build_array(
+            jsonb_build_object('initiator_id', 8510000000000000000, 'target_id', 8610000000000000003, 'amount', 10),
+            jsonb_build_object('initiator_id', 8510000000000000000, 'target_id', 8610000000000000003, 'amount', 100000)
+        )
+    ) $$,
+    '%insufficient%',
+    'insufficient funds in any item raises'
+);
+
+SELECT is(
+    (SELECT current_balance FROM guild_member_balances
+     WHERE guild_id = 8410000000000000000 AND member_id = 8510000000000000000),
+    700::bigint,
+    'failed batch leaves balances untouched'
+);
+
+SELECT throws_like(
+    $$ SELECT * FROM economy.fn_transfer_currency_batch(
+        8410000000000000000,
+        jsonb_build_array(
+            jsonb_build_object('initiator_id', 8510000000000000000, 'target_id', 8510000000000000000, 'amount', 10)
+        )
+    ) $$,
+    '%distinct%',
+    'self transfer rejected'
+);
+
+SELECT finish();
+ROLLBACK;
@@ -21,6 +21,7 @@ from src.bot.services.transfer_service import TransferService
 from src.db.gateway.state_council_governance import (
     CurrencyIssuance,
     DepartmentConfig,
+    DepartmentStats,
     GovernmentAccount,
     IdentityRecord,
     InterdepartmentTransfer,
@@ -760,15 +761,21 @@ class TestStateCouncilFlow:
                 ),
             ]
 
-            # Mock gateway responses
+            # Mock gateway responses：各部門餘額與統計由單一聚合查詢取得
             gw = cast(AsyncMock, service._gateway)
             gw.fetch_state_council_config.return_value = config
-            gw.fetch_government_accounts.return_value = accounts
+            gw.fetch_all_department_stats.return_value = [
+                DepartmentStats(
+                    department=account.department,
+                    balance=account.balance,
+                    total_welfare_disbursed=0,
+                    total_tax_collected=0,
+                    identity_actions_count=0,
+                    currency_issued=0,
+                )
+                for account in accounts
+            ]
             gw.fetch_interdepartment_transfers.return_value = []
-            gw.fetch_welfare_disbursements.return_value = []
-            gw.fetch_tax_records.return_value = []
-            gw.fetch_identity_records.return_value = []
-            gw.fetch_currency_issuances.return_value = []
 
             # Generate council summary
             summary = await service.get_council_summary(guild_id=guild_id)
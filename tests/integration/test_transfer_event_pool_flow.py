@@ -78,9 +78,7 @@ async def test_event_pool_success_flow(
         # Manually trigger checks (simulating trigger behavior)
         await db_connection.execute(
             """
-            SELECT economy.fn_check_transfer_balance($1);
-            SELECT economy.fn_check_transfer_cooldown($1);
-            SELECT economy.fn_check_transfer_daily_limit($1);
+            SELECT economy.fn_evaluate_pending_transfer($1);
             """,
             transfer_id,
         )
@@ -155,9 +153,7 @@ async def test_event_pool_retry_flow(
         # Trigger checks - balance should fail
         await db_connection.execute(
             """
-            SELECT economy.fn_check_transfer_balance($1);
-            SELECT economy.fn_check_transfer_cooldown($1);
-            SELECT economy.fn_check_transfer_daily_limit($1);
+            SELECT economy.fn_evaluate_pending_transfer($1);
             """,
             transfer_id,
         )
@@ -181,9 +177,18 @@ async def test_event_pool_retry_flow(
             500,
         )
 
-        # Retry checks
-        # 使用同一個測試連線觸發重試，避免跨連線看不到未提交的餘額更新
-        await coordinator._retry_checks(transfer_id, connection=db_connection)
+        # 模擬退避時間已到：排程迴圈以 SKIP LOCKED 領取到期列並重新評估
+        await db_connection.execute(
+            """
+            UPDATE economy.pending_transfers
+            SET next_retry_at = timezone('utc', clock_timestamp())
+            WHERE transfer_id = $1
+            """,
+            transfer_id,
+        )
+        # 使用同一個測試連線領取，避免跨連線看不到未提交的餘額更新
+        claimed = await coordinator._run_due_retries(connection=db_connection)
+        assert claimed >= 1
 
         await asyncio.sleep(0.3)
 
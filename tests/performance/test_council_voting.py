@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 import secrets
 import statistics
@@ -31,6 +32,25 @@ class _FakeGatewayWithPerformance(FakeGateway):
         return [p for p in self._proposals.values() if p.status == "進行中"]
 
 
+class _LockingGateway(_FakeGatewayWithPerformance):
+    """以提案鎖序列化 cast_vote，並讓出事件迴圈以模擬資料庫往返；記錄呼叫次數。"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.row_lock = asyncio.Lock()
+        self.calls: dict[str, int] = {"cast_vote": 0, "fetch_snapshot": 0}
+
+    async def cast_vote(self, connection: Any, **kwargs: Any) -> Any:
+        self.calls["cast_vote"] += 1
+        await asyncio.sleep(0)
+        async with self.row_lock:
+            return await super().cast_vote(connection, **kwargs)
+
+    async def fetch_snapshot(self, connection: Any, **kwargs: Any) -> Any:
+        self.calls["fetch_snapshot"] += 1
+        return await super().fetch_snapshot(connection, **kwargs)
+
+
 class FakeTransferService:
     def __init__(self, *, should_fail: bool = False) -> None:
         self.should_fail = should_fail
@@ -219,3 +239,65 @@ async def test_council_list_active_proposals_latency(
         assert (
             p95_latency < 1.0
         ), f"P95 list latency {p95_latency:.3f}s exceeds 1s budget. Avg: {avg_latency:.3f}s"
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_council_concurrent_voting_500_voters(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """效能測試：500 名快照成員同時投票，每票單次往返且票數一致。"""
+    voter_count = int(os.getenv("PERF_COUNCIL_CONCURRENT_VOTERS", "500"))
+
+    gw = _LockingGateway()
+    conn = FakeConnection(gw)
+    pool = FakePool(conn)
+    fake_transfer = FakeTransferService()
+    monkeypatch.setattr("src.bot.services.council_service.get_pool", lambda: pool)
+
+    svc = CouncilService(gateway=gw, transfer_service=cast(TransferService, fake_transfer))
+    await svc.set_config(guild_id=100, council_role_id=200)
+
+    snapshot_member_ids = [_snowflake() for _ in range(voter_count)]
+    proposal = (
+        await svc.create_transfer_proposal(
+            guild_id=100,
+            proposer_id=snapshot_member_ids[0],
+            target_id=_snowflake(),
+            amount=100,
+            description="concurrent voting",
+            attachment_url=None,
+            snapshot_member_ids=snapshot_member_ids,
+        )
+    ).unwrap()
+
+    async def _cast(index: int, voter_id: int) -> float:
+        # 三分之一反對，其餘贊成：提案會在投票途中達門檻並執行
+        choice = "reject" if index % 3 == 0 else "approve"
+        t0 = time.perf_counter()
+        result = await svc.vote(proposal_id=proposal.proposal_id, voter_id=voter_id, choice=choice)
+        elapsed = time.perf_counter() - t0
+        assert result.is_ok(), result
+        return elapsed
+
+    t_start = time.perf_counter()
+    latencies = await asyncio.gather(
+        *(_cast(i, voter_id) for i, voter_id in enumerate(snapshot_member_ids))
+    )
+    wall = time.perf_counter() - t_start
+
+    # 每票僅一次 cast_vote，不再載入快照名單
+    assert gw.calls["cast_vote"] == voter_count
+    assert gw.calls["fetch_snapshot"] == 0
+
+    # 通過後的投票不寫入；記錄的票數恰好停在門檻
+    tally = await gw.fetch_tally(conn, proposal_id=proposal.proposal_id)
+    assert tally.approve == proposal.threshold_t
+    final = gw.get_proposal(proposal.proposal_id)
+    assert final is not None and final.status == "已執行"
+    assert len(fake_transfer.calls) == 1
+
+    p95_latency = sorted(latencies)[int(len(latencies) * 0.95)]
+    assert (
+        p95_latency < 3.0
+    ), f"P95 concurrent vote latency {p95_latency:.3f}s exceeds 3s budget. Wall: {wall:.3f}s"
@@ -0,0 +1,105 @@
+"""效能測試：治理私訊 fan-out 的吞吐量（假 Discord client，5,000 名收件人）。"""
+
+from __future__ import annotations
+
+import os
+import time
+from typing import Any, cast
+
+import pytest
+
+from src.bot.services.dm_dispatcher import DmDispatcher, DmMessage
+from tests.unit.test_dm_dispatcher import (
+    FakeClient,
+    FakeOutboxGateway,
+    FakePool,
+    FakeUser,
+)
+
+RECIPIENTS = int(os.getenv("PERF_DM_RECIPIENTS", "5000"))
+# 每則私訊模擬的 API 往返延遲（秒）
+LATENCY = float(os.getenv("PERF_DM_LATENCY", "0.005"))
+CONCURRENCY = 50
+
+
+def _users() -> list[FakeUser]:
+    return [FakeUser(1_000_000 + i, latency=LATENCY) for i in range(RECIPIENTS)]
+
+
+def _report(label: str, elapsed: float) -> None:
+    rate = RECIPIENTS / elapsed if elapsed else float("inf")
+    print(f"\n{label}: {RECIPIENTS} DMs in {elapsed:.3f}s ({rate:.0f} DMs/sec)")
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_direct_fan_out_throughput() -> None:
+    """並行送出應遠快於逐一 await，且重複收件人只收到一則。"""
+    users = _users()
+    dispatcher = DmDispatcher(rate_per_second=0, concurrency=CONCURRENCY)
+
+    t0 = time.perf_counter()
+    # 提案人同時也是成員等情況：名單含重複收件人
+    sent = await dispatcher.fan_out(
+        users + users[:100], DmMessage(content="vote"), guild_id=1, dedup_key="perf:vote"
+    )
+    elapsed = time.perf_counter() - t0
+    _report("direct fan-out", elapsed)
+
+    assert sent == RECIPIENTS
+    assert all(len(u.received) == 1 for u in users)
+    sequential = RECIPIENTS * LATENCY
+    assert elapsed < sequential / 4, f"{elapsed:.3f}s vs {sequential:.3f}s sequential"
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_fan_out_honours_rate_limit() -> None:
+    """令牌桶：burst 用完後以設定速率送出。"""
+    rate = RECIPIENTS / 2
+    users = [FakeUser(i) for i in range(RECIPIENTS)]
+    dispatcher = DmDispatcher(rate_per_second=rate, concurrency=CONCURRENCY)
+
+    t0 = time.perf_counter()
+    await dispatcher.fan_out(users, DmMessage(content="x"), guild_id=1, dedup_key="perf:rate")
+    elapsed = time.perf_counter() - t0
+    _report(f"rate-limited fan-out ({rate:.0f}/s)", elapsed)
+
+    # 預設 burst 為一秒份的令牌，其餘依速率補充
+    minimum = (RECIPIENTS - rate) / rate
+    assert elapsed >= minimum * 0.95
+    assert all(len(u.received) == 1 for u in users)
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_outbox_fan_out_throughput() -> None:
+    """outbox 模式：入列立即返回，worker 依 ID 解析使用者並送出，每人恰好一則。"""
+    users = _users()
+    client = FakeClient(users)
+    gateway = FakeOutboxGateway()
+    dispatcher = DmDispatcher(
+        pool=cast(Any, FakePool()), gateway=gateway, rate_per_second=0, concurrency=CONCURRENCY
+    )
+    dispatcher._running = True
+    dispatcher._client = client  # type: ignore[assignment]
+
+    t0 = time.perf_counter()
+    queued = await dispatcher.fan_out(
+        [u.id for u in users], DmMessage(content="result"), guild_id=1, dedup_key="perf:result"
+    )
+    enqueue_elapsed = time.perf_counter() - t0
+    again = await dispatcher.fan_out(
+        [u.id for u in users], DmMessage(content="result"), guild_id=1, dedup_key="perf:result"
+    )
+    while await dispatcher._drain_once():
+        pass
+    elapsed = time.perf_counter() - t0
+    _report("outbox fan-out", elapsed)
+    print(f"enqueue returned after {enqueue_elapsed:.3f}s")
+
+    assert (queued, again) == (RECIPIENTS, 0)
+    assert gateway.statuses() == {"sent": RECIPIENTS}
+    assert all(len(u.received) == 1 for u in users)
+    assert enqueue_elapsed < elapsed
+    assert dispatcher.metrics()["users_fetched"] == RECIPIENTS
@@ -0,0 +1,105 @@
+"""效能測試：國務院面板開啟時的部門權限判斷（逐部門查詢 vs 單次批次查詢）。"""
+
+from __future__ import annotations
+
+import os
+import secrets
+import statistics
+import time
+from typing import Any
+
+import pytest
+
+from src.bot.services.state_council_service import StateCouncilService
+from src.infra.config_cache import get_config_cache
+
+DEPARTMENTS = ["內政部", "財政部", "國土安全部", "中央銀行"]
+
+
+def _snowflake() -> int:
+    """生成 Discord snowflake ID。"""
+    return secrets.randbits(63)
+
+
+async def _seed_state_council(pool: Any, *, guild_id: int) -> None:
+    async with pool.acquire() as conn:
+        await conn.execute(
+            """
+            INSERT INTO governance.state_council_config (
+                guild_id, leader_id, leader_role_id, internal_affairs_account_id,
+                finance_account_id, security_account_id, central_bank_account_id
+            ) VALUES ($1, $2, $3, 9500000000000001, 9500000000000002,
+                      9500000000000003, 9500000000000004)
+            """,
+            guild_id,
+            _snowflake(),
+            _snowflake(),
+        )
+        for index, department in enumerate(DEPARTMENTS):
+            await conn.execute(
+                """
+                INSERT INTO governance.department_configs (guild_id, department, role_id)
+                VALUES ($1, $2, $3)
+                """,
+                guild_id,
+                department,
+                1000 + index,
+            )
+
+
+async def _cleanup(pool: Any, *, guild_id: int) -> None:
+    async with pool.acquire() as conn:
+        await conn.execute(
+            "DELETE FROM governance.department_configs WHERE guild_id = $1", guild_id
+        )
+        await conn.execute(
+            "DELETE FROM governance.state_council_config WHERE guild_id = $1", guild_id
+        )
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_bulk_department_permission_faster_than_per_department(db_pool: Any) -> None:
+    """面板開啟（冷快取）時，批次判斷應比逐部門判斷更快。"""
+    iterations = int(os.getenv("PERF_PANEL_PERMISSION_ITERATIONS", "200"))
+    guild_id = _snowflake()
+    user_roles = [_snowflake(), 1003]  # 僅具備中央銀行身分組，需檢查全部部門
+    service = StateCouncilService()
+    cache = get_config_cache()
+
+    await _seed_state_council(db_pool, guild_id=guild_id)
+    per_department: list[float] = []
+    bulk: list[float] = []
+    try:
+        for _ in range(iterations):
+            # 每輪清空設定快取，量測的是面板首次開啟的成本
+            cache.invalidate()
+            t0 = time.perf_counter()
+            before = [
+                dept
+                for dept in DEPARTMENTS
+                if await service.check_department_permission(
+                    guild_id=guild_id, user_id=1, department=dept, user_roles=user_roles
+                )
+            ]
+            per_department.append(time.perf_counter() - t0)
+
+            cache.invalidate()
+            t0 = time.perf_counter()
+            allowed = await service.check_department_permissions_bulk(
+                guild_id=guild_id, user_id=1, user_roles=user_roles, departments=DEPARTMENTS
+            )
+            after = [dept for dept in DEPARTMENTS if allowed[dept]]
+            bulk.append(time.perf_counter() - t0)
+
+            assert before == after == ["中央銀行"]
+    finally:
+        await _cleanup(db_pool, guild_id=guild_id)
+
+    before_ms = statistics.median(per_department) * 1000
+    after_ms = statistics.median(bulk) * 1000
+    print(f"\nPanel permission latency ({iterations} cold opens, median):")
+    print(f"per-department: {before_ms:.3f}ms")
+    print(f"bulk:           {after_ms:.3f}ms ({before_ms / after_ms:.1f}x)")
+
+    assert after_ms < before_ms
@@ -0,0 +1,89 @@
+"""效能測試：批次轉帳（fn_transfer_currency_batch）與逐筆呼叫的吞吐量比較。"""
+
+from __future__ import annotations
+
+import os
+import secrets
+import time
+from typing import Any
+
+import pytest
+
+from src.bot.services.transfer_service import TransferItem, TransferService
+
+
+def _snowflake() -> int:
+    """生成 Discord snowflake ID。"""
+    return secrets.randbits(63)
+
+
+async def _seed_payer(connection: Any, *, guild_id: int, payer_id: int) -> None:
+    await connection.execute(
+        """
+        INSERT INTO economy.guild_member_balances (guild_id, member_id, current_balance)
+        VALUES ($1, $2, $3)
+        """,
+        guild_id,
+        payer_id,
+        100_000_000,
+    )
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_transfer_many_outperforms_per_call_loop(
+    db_pool: Any,
+    db_connection: Any,
+) -> None:
+    """模擬發薪情境：同一付款帳戶對數百名成員發放，批次應明顯快於逐筆呼叫。"""
+    recipients = int(os.getenv("PERF_BATCH_RECIPIENTS", "300"))
+
+    svc = TransferService(db_pool)
+
+    # --- 逐筆呼叫（現行作法）---
+    loop_guild = _snowflake()
+    loop_payer = _snowflake()
+    await _seed_payer(db_connection, guild_id=loop_guild, payer_id=loop_payer)
+    loop_targets = [_snowflake() for _ in range(recipients)]
+
+    t0 = time.perf_counter()
+    for target_id in loop_targets:
+        await svc.transfer_currency(
+            guild_id=loop_guild,
+            initiator_id=loop_payer,
+            target_id=target_id,
+            amount=1,
+            reason="payroll",
+            connection=db_connection,
+        )
+    loop_elapsed = time.perf_counter() - t0
+
+    # --- 批次 ---
+    batch_guild = _snowflake()
+    batch_payer = _snowflake()
+    await _seed_payer(db_connection, guild_id=batch_guild, payer_id=batch_payer)
+    items = [
+        TransferItem(initiator_id=batch_payer, target_id=_snowflake(), amount=1, reason="payroll")
+        for _ in range(recipients)
+    ]
+
+    t0 = time.perf_counter()
+    results = await svc.transfer_many(
+        guild_id=batch_guild, transfers=items, connection=db_connection
+    )
+    batch_elapsed = time.perf_counter() - t0
+
+    assert len(results) == recipients
+    assert results[-1].initiator_balance == 100_000_000 - recipients
+
+    loop_tps = recipients / loop_elapsed if loop_elapsed else float("inf")
+    batch_tps = recipients / batch_elapsed if batch_elapsed else float("inf")
+    print(f"\nPayroll transfer throughput ({recipients} recipients):")
+    print(f"per-call loop: {loop_elapsed:.4f}s ({loop_tps:.0f} transfers/sec)")
+    print(f"transfer_many: {batch_elapsed:.4f}s ({batch_tps:.0f} transfers/sec)")
+    print(f"Speedup: {loop_elapsed / batch_elapsed:.2f}x")
+
+    assert batch_elapsed < loop_elapsed, (
+        f"Batch ({batch_elapsed:.3f}s) should be faster than per-call loop "
+        f"({loop_elapsed:.3f}s)"
+    )
@@ -0,0 +1,117 @@
+"""效能測試：事件池執行 worker（SKIP LOCKED 領取、逐筆提交）在 1 / 4 / 16 個 worker 下的吞吐量。"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import secrets
+import time
+from typing import Any
+
+import asyncpg
+import pytest
+
+from src.bot.services.transfer_event_pool import TransferEventPoolCoordinator
+from src.config.db_settings import PoolConfig
+
+WORKER_COUNTS = (1, 4, 16)
+
+
+def _snowflake() -> int:
+    """生成 Discord snowflake ID。"""
+    return secrets.randbits(63)
+
+
+async def _seed_approved(pool: Any, *, guild_id: int, count: int) -> None:
+    """建立 count 筆已核准的轉帳，發起人彼此獨立以避免帳本列鎖競爭。"""
+    initiators = [_snowflake() for _ in range(count)]
+    targets = [_snowflake() for _ in range(count)]
+    async with pool.acquire() as conn:
+        await conn.execute(
+            """
+            INSERT INTO economy.guild_member_balances (guild_id, member_id, current_balance)
+            SELECT $1, m, 1000 FROM unnest($2::bigint[]) AS m
+            """,
+            guild_id,
+            initiators,
+        )
+        # 直接以 approved 狀態寫入；插入觸發器只評估 pending/checking 的列
+        await conn.execute(
+            """
+            INSERT INTO economy.pending_transfers
+                (guild_id, initiator_id, target_id, amount, status, checks)
+            SELECT $1, i, t, 1, 'approved',
+                   '{"balance": 1, "cooldown": 1, "daily_limit": 1}'::jsonb
+            FROM unnest($2::bigint[], $3::bigint[]) AS x(i, t)
+            """,
+            guild_id,
+            initiators,
+            targets,
+        )
+
+
+async def _cleanup(pool: Any, *, guild_id: int) -> None:
+    async with pool.acquire() as conn:
+        await conn.execute("DELETE FROM economy.pending_transfers WHERE guild_id = $1", guild_id)
+        await conn.execute(
+            "DELETE FROM economy.currency_transactions WHERE guild_id = $1", guild_id
+        )
+        await conn.execute(
+            "DELETE FROM economy.guild_member_balances WHERE guild_id = $1", guild_id
+        )
+
+
+async def _drain_with_workers(coordinator: TransferEventPoolCoordinator, workers: int) -> None:
+    async def worker() -> None:
+        while await coordinator._drain_approved() > 0:
+            pass
+
+    await asyncio.gather(*(worker() for _ in range(workers)))
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_worker_pool_throughput_scales(db_pool: Any) -> None:
+    """已核准轉帳的清空速度應隨 worker 數增加而提升。"""
+    transfers = int(os.getenv("PERF_POOL_TRANSFERS", "2000"))
+
+    # 專用連線池，確保 16 個 worker 各自有連線可用
+    config = PoolConfig.model_validate({})
+    pool = await asyncpg.create_pool(dsn=config.dsn, min_size=1, max_size=max(WORKER_COUNTS) + 1)
+    assert pool is not None
+    results: dict[int, float] = {}
+    try:
+        for workers in WORKER_COUNTS:
+            guild_id = _snowflake()
+            await _seed_approved(pool, guild_id=guild_id, count=transfers)
+            coordinator = TransferEventPoolCoordinator(pool=pool, workers=workers)
+            coordinator._running = True
+            try:
+                t0 = time.perf_counter()
+                await _drain_with_workers(coordinator, workers)
+                results[workers] = time.perf_counter() - t0
+
+                async with pool.acquire() as conn:
+                    remaining = await conn.fetchval(
+                        """
+                        SELECT count(*) FROM economy.pending_transfers
+                        WHERE guild_id = $1 AND status <> 'completed'
+                        """,
+                        guild_id,
+                    )
+                assert remaining == 0
+            finally:
+                coordinator._running = False
+                await _cleanup(pool, guild_id=guild_id)
+    finally:
+        await pool.close()
+
+    print(f"\nEvent pool execution throughput ({transfers} approved transfers):")
+    for workers, elapsed in results.items():
+        tps = transfers / elapsed if elapsed else float("inf")
+        print(f"{workers:>2} worker(s): {elapsed:.4f}s ({tps:.0f} transfers/sec)")
+
+    assert results[max(WORKER_COUNTS)] < results[1], (
+        f"{max(WORKER_COUNTS)} workers ({results[max(WORKER_COUNTS)]:.3f}s) should drain "
+        f"faster than 1 worker ({results[1]:.3f}s)"
+    )
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from typing import Any, Callable
 
@@ -164,3 +165,105 @@ async def test_configure_connection_sets_codecs_and_guc(
 
     # 應根據 TRANSFER_DAILY_LIMIT 建立 GUC
     assert any("set_config('app.transfer_daily_limit'" in q for (q, _args) in conn.executed)
+
+
+class _ReplicaConnection:
+    def __init__(self, lag: float) -> None:
+        self.lag = lag
+
+    async def fetchval(self, query: str) -> float:
+        # 模擬副本落後量查詢（秒）
+        return self.lag
+
+
+def _reset_pool_state() -> None:
+    pool_module._POOL_LOCKS.clear()
+    pool_module._POOLS.clear()
+    pool_module._REPLICAS.clear()
+    pool_module._last_pool = None
+
+
+def _replica_config(max_lag: float = 5.0) -> PoolConfig:
+    return PoolConfig.model_validate(
+        {
+            "DATABASE_URL": "postgresql://primary-db",
+            "DATABASE_READ_URL": "postgresql://replica-db",
+            "DATABASE_READ_MAX_LAG_SECONDS": max_lag,
+            "DB_POOL_MIN_SIZE": 1,
+            "DB_POOL_MAX_SIZE": 2,
+        }
+    )
+
+
+@pytest.mark.asyncio
+async def test_read_pool_routes_to_fresh_replica(monkeypatch: pytest.MonkeyPatch) -> None:
+    _reset_pool_state()
+    primary = _DummyPool(_DummyConnection(exists=True))
+    replica_conn = _ReplicaConnection(lag=0.5)
+    replica = _DummyPool(replica_conn)  # type: ignore[arg-type]
+    created_args: list[dict[str, Any]] = []
+
+    async def fake_create_pool(**kwargs: Any) -> _DummyPool:
+        created_args.append(kwargs)
+        return primary if kwargs["dsn"] == "postgresql://primary-db" else replica
+
+    monkeypatch.setattr(pool_module.asyncpg, "create_pool", fake_create_pool)
+
+    pool = await pool_module.init_pool(_replica_config())
+
+    assert pool is primary
+    assert pool_module.get_pool() is primary
+    assert pool_module.get_read_pool() is replica
+    # 副本連線預設唯讀
+    assert created_args[1]["server_settings"]["default_transaction_read_only"] == "on"
+
+    # 副本落後超過上限時回退主庫（或呼叫端指定的連線池）
+    replica_conn.lag = 30.0
+    await pool_module._REPLICAS[asyncio.get_running_loop()].check()
+    assert pool_module.get_read_pool() is primary
+    fallback = object()
+    assert pool_module.get_read_pool(fallback) is fallback  # type: ignore[arg-type]
+
+    await pool_module.close_pool()
+    assert primary.closed is True
+    assert replica.closed is True
+    assert not pool_module._REPLICAS
+
+
+@pytest.mark.asyncio
+async def test_read_pool_falls_back_when_replica_unreachable(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _reset_pool_state()
+    primary = _DummyPool(_DummyConnection(exists=True))
+
+    async def fake_create_pool(**kwargs: Any) -> _DummyPool:
+        if kwargs["dsn"] == "postgresql://replica-db":
+            raise OSError("connection refused")
+        return primary
+
+    monkeypatch.setattr(pool_module.asyncpg, "create_pool", fake_create_pool)
+
+    await pool_module.init_pool(_replica_config())
+
+    assert pool_module.get_read_pool() is primary
+    await pool_module.close_pool()
+
+
+@pytest.mark.asyncio
+async def test_read_pool_without_replica_uses_primary(monkeypatch: pytest.MonkeyPatch) -> None:
+    _reset_pool_state()
+    primary = _DummyPool(_DummyConnection(exists=True))
+
+    async def fake_create_pool(**_: Any) -> _DummyPool:
+        return primary
+
+    monkeypatch.setattr(pool_module.asyncpg, "create_pool", fake_create_pool)
+    monkeypatch.delenv("DATABASE_READ_URL", raising=False)
+
+    await pool_module.init_pool(
+        PoolConfig.model_validate({"DATABASE_URL": "postgresql://primary-db"})
+    )
+
+    assert pool_module.get_read_pool() is primary
+    await pool_module.close_pool()
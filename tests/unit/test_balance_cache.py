@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+
+from src.cython_ext.economy_query_models import BalanceRecord
+from src.infra.balance_cache import BalanceCache
+
+_T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _record(member_id: int, balance: int, version: datetime = _T0) -> BalanceRecord:
+    return BalanceRecord(1, member_id, balance, version, None)
+
+
+class _Loader:
+    def __init__(self, value: BalanceRecord | None) -> None:
+        self.value = value
+        self.calls = 0
+
+    async def __call__(self) -> BalanceRecord | None:
+        self.calls += 1
+        return self.value
+
+
+def _transfer_event(**overrides: Any) -> dict[str, Any]:
+    event: dict[str, Any] = {
+        "event_type": "transaction_success",
+        "guild_id": 1,
+        "initiator_id": 10,
+        "target_id": 20,
+        "amount": 50,
+        "balance_after_initiator": 950,
+        "balance_after_target": 150,
+        "initiator_version": (_T0 + timedelta(seconds=5)).isoformat(),
+        "target_version": (_T0 + timedelta(seconds=5)).isoformat(),
+        "target_throttled_until": None,
+    }
+    event.update(overrides)
+    return event
+
+
+def _active_cache(**kwargs: Any) -> BalanceCache:
+    cache = BalanceCache(**kwargs)
+    cache.activate()
+    return cache
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_inactive_cache_always_loads() -> None:
+    cache = BalanceCache()
+    loader = _Loader(_record(10, 100))
+
+    await cache.get_or_load(1, 10, loader)
+    await cache.get_or_load(1, 10, loader)
+    cache.apply_event(_transfer_event())
+
+    # LISTEN 連線未就緒前不快取也不接受事件
+    assert loader.calls == 2
+    assert len(cache) == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_hit_skips_loader() -> None:
+    cache = _active_cache()
+    loader = _Loader(_record(10, 100))
+
+    assert (await cache.get_or_load(1, 10, loader)) == _record(10, 100)
+    assert (await cache.get_or_load(1, 10, loader)) == _record(10, 100)
+
+    assert loader.calls == 1
+    assert cache.stats() == {"size": 1, "hits": 1, "misses": 1, "events_applied": 0}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_zero_balance_reads_are_not_cached() -> None:
+    cache = _active_cache()
+    loader = _Loader(_record(10, 0))
+
+    await cache.get_or_load(1, 10, loader)
+    await cache.get_or_load(1, 10, loader)
+
+    # 可能是 fn_get_balance 合成的零餘額，其版本不可信
+    assert loader.calls == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_transfer_event_updates_both_members() -> None:
+    cache = _active_cache()
+    cache.handle_notification(json.dumps(_transfer_event()))
+
+    initiator = await cache.get_or_load(1, 10, _Loader(None))
+    target = await cache.get_or_load(1, 20, _Loader(None))
+
+    assert initiator is not None and initiator.balance == 950
+    assert target is not None and target.balance == 150
+    assert initiator.last_modified_at == _T0 + timedelta(seconds=5)
+    assert cache.events_applied == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_compact_batch_applies_events_in_order() -> None:
+    cache = _active_cache()
+    second = _transfer_event(
+        balance_after_initiator=900,
+        initiator_version=(_T0 + timedelta(seconds=6)).isoformat(),
+    )
+    payload = {"event_type": "economy_events_batch", "events": [_transfer_event(), second]}
+
+    cache.handle_notification(json.dumps(payload))
+
+    record = await cache.get_or_load(1, 10, _Loader(None))
+    assert record is not None and record.balance == 900
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_older_event_does_not_overwrite_newer_balance() -> None:
+    cache = _active_cache()
+    await cache.get_or_load(1, 10, _Loader(_record(10, 700, _T0 + timedelta(seconds=9))))
+
+    cache.apply_event(_transfer_event())
+
+    record = await cache.get_or_load(1, 10, _Loader(None))
+    assert record is not None and record.balance == 700
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_stale_load_does_not_overwrite_event() -> None:
+    cache = _active_cache()
+    gate = asyncio.Event()
+
+    async def _slow_loader() -> BalanceRecord | None:
+        await gate.wait()
+        return _record(10, 1000)
+
+    pending = asyncio.create_task(cache.get_or_load(1, 10, _slow_loader))
+    await asyncio.sleep(0)
+    cache.apply_event(_transfer_event())
+    gate.set()
+    await pending
+
+    record = await cache.get_or_load(1, 10, _Loader(None))
+    assert record is not None and record.balance == 950
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_adjustment_event_updates_target() -> None:
+    cache = _active_cache()
+    cache.apply_event(
+        {
+            "event_type": "adjustment_success",
+            "guild_id": 1,
+            "admin_id": 99,
+            "target_id": 20,
+            "balance_after_target": 300,
+            "target_version": (_T0 + timedelta(seconds=1)).isoformat(),
+            "target_throttled_until": (_T0 + timedelta(minutes=5)).isoformat(),
+        }
+    )
+
+    record = await cache.get_or_load(1, 20, _Loader(None))
+    assert record is not None
+    assert record.balance == 300
+    assert record.throttled_until == _T0 + timedelta(minutes=5)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_events_without_versions_invalidate() -> None:
+    cache = _active_cache()
+    await cache.get_or_load(1, 10, _Loader(_record(10, 100)))
+
+    legacy = _transfer_event()
+    del legacy["initiator_version"]
+    cache.apply_event(legacy)
+
+    loader = _Loader(_record(10, 50))
+    assert (await cache.get_or_load(1, 10, loader)) == _record(10, 50)
+    assert loader.calls == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_throttle_denial_invalidates_initiator() -> None:
+    cache = _active_cache()
+    await cache.get_or_load(1, 10, _Loader(_record(10, 100)))
+
+    cache.apply_event(
+        {
+            "event_type": "transaction_denied",
+            "reason": "throttle_block",
+            "guild_id": 1,
+            "initiator_id": 10,
+        }
+    )
+
+    assert len(cache) == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_deactivate_clears_and_bypasses() -> None:
+    cache = _active_cache()
+    await cache.get_or_load(1, 10, _Loader(_record(10, 100)))
+
+    cache.deactivate()
+    loader = _Loader(_record(10, 100))
+    await cache.get_or_load(1, 10, loader)
+
+    assert len(cache) == 0
+    assert loader.calls == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_maxsize_evicts_least_recently_used() -> None:
+    cache = _active_cache(maxsize=2)
+    for member_id in (10, 20, 30):
+        await cache.get_or_load(1, member_id, _Loader(_record(member_id, 100)))
+
+    loader = _Loader(_record(10, 100))
+    await cache.get_or_load(1, 10, loader)
+
+    assert len(cache) == 2
+    assert loader.calls == 1
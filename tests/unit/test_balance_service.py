@@ -22,6 +22,7 @@ from src.cython_ext.economy_balance_models import (
 )
 from src.cython_ext.economy_query_models import BalanceRecord, HistoryRecord
 from src.db.gateway.economy_queries import EconomyQueryGateway
+from src.infra.balance_cache import BalanceCache
 from src.infra.result import DatabaseError, Err, Ok
 
 
@@ -278,6 +279,95 @@ async def test_get_balance_snapshot_result_mode_success(faker: Faker) -> None:
     assert snapshot.balance == 7500
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_balance_snapshot_result_mode_reads_primary(
+    faker: Faker, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Cached balance loads skip the read replica so lagging rows are never cached."""
+    guild_id = _snowflake(faker)
+    member_id = _snowflake(faker)
+
+    mock_gateway = AsyncMock(spec=EconomyQueryGateway)
+    mock_gateway.fetch_balance.return_value = Ok(
+        _create_balance_record(guild_id=guild_id, member_id=member_id)
+    )
+
+    primary_conn = FakeConnection()
+    replica_pool = FakePool(FakeConnection())
+    monkeypatch.setattr(
+        "src.bot.services.balance_service.db_pool.get_read_pool", lambda primary=None: replica_pool
+    )
+    cache = BalanceCache()
+    cache.activate()
+    monkeypatch.setattr("src.bot.services.balance_service.get_balance_cache", lambda: cache)
+    service = BalanceService(FakePool(primary_conn), gateway=mock_gateway)
+
+    result = await service.get_balance_snapshot(guild_id=guild_id, requester_id=member_id)
+
+    assert isinstance(result, Ok)
+    assert mock_gateway.fetch_balance.await_args.args[0] is primary_conn
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_history_result_mode_uses_read_replica(
+    faker: Faker, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Uncached history pages go through the read replica pool when one is available."""
+    guild_id = _snowflake(faker)
+    member_id = _snowflake(faker)
+
+    mock_gateway = AsyncMock(spec=EconomyQueryGateway)
+    mock_gateway.fetch_history.return_value = Ok([])
+
+    replica_conn = FakeConnection()
+    replica_pool = FakePool(replica_conn)
+    seen_primary: list[Any] = []
+
+    def fake_get_read_pool(primary: Any = None) -> Any:
+        seen_primary.append(primary)
+        return replica_pool
+
+    monkeypatch.setattr(
+        "src.bot.services.balance_service.db_pool.get_read_pool", fake_get_read_pool
+    )
+    primary_pool = FakePool(FakeConnection())
+    service = BalanceService(primary_pool, gateway=mock_gateway)
+
+    result = await service.get_history(guild_id=guild_id, requester_id=member_id)
+
+    assert isinstance(result, Ok)
+    assert seen_primary == [primary_pool]
+    assert mock_gateway.fetch_history.await_args.args[0] is replica_conn
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_balance_snapshot_result_mode_served_from_balance_cache(
+    faker: Faker, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Repeated Result mode reads hit the in-process balance cache once it is active."""
+    guild_id = _snowflake(faker)
+    member_id = _snowflake(faker)
+
+    mock_gateway = AsyncMock(spec=EconomyQueryGateway)
+    mock_gateway.fetch_balance.return_value = Ok(
+        _create_balance_record(guild_id=guild_id, member_id=member_id, balance=1234)
+    )
+    cache = BalanceCache()
+    cache.activate()
+    monkeypatch.setattr("src.bot.services.balance_service.get_balance_cache", lambda: cache)
+    service = BalanceService(FakePool(FakeConnection()), gateway=mock_gateway)
+
+    first = await service.get_balance_snapshot(guild_id=guild_id, requester_id=member_id)
+    second = await service.get_balance_snapshot(guild_id=guild_id, requester_id=member_id)
+
+    assert isinstance(first, Ok) and isinstance(second, Ok)
+    assert second.unwrap().balance == 1234
+    assert mock_gateway.fetch_balance.await_count == 1
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_get_balance_snapshot_result_mode_permission_error(faker: Faker) -> None:
@@ -545,18 +635,23 @@ async def test_get_history_legacy_mode_with_cursor(faker: Faker) -> None:
     assert isinstance(page, HistoryPage)
     assert len(page.items) == 2
     mock_gateway.fetch_history.assert_called_once_with(
-        mock_conn, guild_id=guild_id, member_id=member_id, limit=5, cursor=cursor
+        mock_conn,
+        guild_id=guild_id,
+        member_id=member_id,
+        limit=5,
+        cursor=cursor,
+        cursor_transaction_id=None,
     )
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_get_history_legacy_mode_has_more_true(faker: Faker) -> None:
-    """Test get_history sets next_cursor when has_more is True."""
+    """Test get_history sets next_cursor when the gateway returns a lookahead row."""
     guild_id = _snowflake(faker)
     member_id = _snowflake(faker)
 
-    # Arrange - return exactly 3 items (matching limit)
+    # Arrange - return limit + 1 items (the extra row signals has_more)
     now = datetime.now(timezone.utc)
     history_records = [
         _create_history_record(
@@ -564,14 +659,13 @@ async def test_get_history_legacy_mode_has_more_true(faker: Faker) -> None:
             initiator_id=member_id,
             created_at=now - timedelta(minutes=i),
         )
-        for i in range(3)
+        for i in range(4)
     ]
 
     mock_gateway = AsyncMock(spec=EconomyQueryGateway)
     mock_gateway.fetch_history.return_value = Ok(history_records)
 
     mock_conn = AsyncMock()
-    mock_conn.fetchval.return_value = True  # has_more = True
 
     service = BalanceService(AsyncMock(), gateway=mock_gateway)
 
@@ -585,9 +679,12 @@ async def test_get_history_legacy_mode_has_more_true(faker: Faker) -> None:
 
     # Assert
     assert isinstance(page, HistoryPage)
+    assert len(page.items) == 3
     assert page.next_cursor is not None
     assert page.next_cursor == page.items[-1].created_at
-    mock_conn.fetchval.assert_called_once()
+    assert page.next_cursor_transaction_id == page.items[-1].transaction_id
+    # limit + 1 取代 fn_has_more_history 的第二次查詢
+    mock_conn.fetchval.assert_not_called()
 
 
 @pytest.mark.unit
@@ -798,7 +895,7 @@ async def test_get_history_result_mode_with_pagination(faker: Faker) -> None:
     guild_id = _snowflake(faker)
     member_id = _snowflake(faker)
 
-    # Arrange - exactly 5 items matching limit
+    # Arrange - limit + 1 items
     now = datetime.now(timezone.utc)
     history_records = [
         _create_history_record(
@@ -806,7 +903,7 @@ async def test_get_history_result_mode_with_pagination(faker: Faker) -> None:
             initiator_id=member_id,
             created_at=now - timedelta(minutes=i),
         )
-        for i in range(5)
+        for i in range(6)
     ]
 
     mock_gateway = AsyncMock(spec=EconomyQueryGateway)
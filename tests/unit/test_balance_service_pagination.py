@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
 from typing import Any, Sequence, cast
+from uuid import UUID, uuid4
 
 import pytest
 
@@ -13,6 +14,7 @@ from src.infra.result import Ok
 class _FakeGateway:
     def __init__(self, records: Sequence[HistoryRecord]) -> None:
         self._records = list(records)
+        self.calls: list[dict[str, Any]] = []
 
     async def fetch_history(
         self,
@@ -22,21 +24,20 @@ class _FakeGateway:
         member_id: int,
         limit: int,
         cursor: datetime | None,
+        cursor_transaction_id: UUID | None = None,
     ) -> Sequence[HistoryRecord]:
         # 回傳預先準備好的資料列；不強制等於傳入的 limit
+        self.calls.append({"cursor": cursor, "cursor_transaction_id": cursor_transaction_id})
         return list(self._records)
 
 
 class _FakeConn:
-    def __init__(self, *, has_more: bool) -> None:
-        self.has_more = has_more
+    def __init__(self) -> None:
         self.sql_seen: str | None = None
 
-    async def fetchval(
-        self, sql: str, guild_id: int, member_id: int, last_created: datetime
-    ) -> bool:
+    async def fetchval(self, sql: str, *args: Any) -> Any:
         self.sql_seen = sql
-        return self.has_more
+        return None
 
 
 class _FakeAcquire:
@@ -60,8 +61,6 @@ class _FakePool:
 
 def _mk_record(created_at: datetime) -> HistoryRecord:
     # 建立最小可用的 HistoryRecord 供轉換
-    from uuid import uuid4
-
     return HistoryRecord(
         transaction_id=uuid4(),
         guild_id=1,
@@ -79,12 +78,12 @@ def _mk_record(created_at: datetime) -> HistoryRecord:
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_history_pagination_calls_db_has_more(monkeypatch: pytest.MonkeyPatch) -> None:
-    # 準備剛好等於 limit 筆數 → 會觸發 has_more 查詢
+async def test_history_pagination_uses_lookahead_row(monkeypatch: pytest.MonkeyPatch) -> None:
+    # gateway 多回傳一列 → 有下一頁，且不再額外查詢 has_more
     now = datetime.now(timezone.utc)
-    items = [_mk_record(now - timedelta(seconds=i)) for i in range(3)]
+    items = [_mk_record(now - timedelta(seconds=i)) for i in range(4)]
 
-    fake_conn = _FakeConn(has_more=True)
+    fake_conn = _FakeConn()
     fake_pool = _FakePool(fake_conn)
 
     svc = BalanceService(fake_pool, gateway=cast(EconomyQueryGateway, _FakeGateway(items)))
@@ -101,17 +100,38 @@ async def test_history_pagination_calls_db_has_more(monkeypatch: pytest.MonkeyPa
     assert isinstance(result, Ok)
     page = result.unwrap()
 
-    assert page.items and page.next_cursor is not None
-    # 驗證經由 SQL 函式觸發 has_more 判斷
-    assert fake_conn.sql_seen == "SELECT economy.fn_has_more_history($1,$2,$3)"
+    assert len(page.items) == 3
+    assert page.next_cursor == items[2].created_at
+    assert page.next_cursor_transaction_id == items[2].transaction_id
+    assert fake_conn.sql_seen is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_history_passes_keyset_cursor_to_gateway() -> None:
+    now = datetime.now(timezone.utc)
+    cursor_id = uuid4()
+    gateway = _FakeGateway([_mk_record(now)])
+    svc = BalanceService(_FakePool(_FakeConn()), gateway=cast(EconomyQueryGateway, gateway))
+
+    result = await svc.get_history(
+        guild_id=1,
+        requester_id=42,
+        limit=3,
+        cursor=now,
+        cursor_transaction_id=cursor_id,
+    )
+
+    assert isinstance(result, Ok)
+    assert gateway.calls == [{"cursor": now, "cursor_transaction_id": cursor_id}]
 
 
 @pytest.mark.asyncio
 async def test_history_no_next_cursor_when_less_than_limit(monkeypatch: pytest.MonkeyPatch) -> None:
-    # 筆數少於 limit → 不觸發 has_more 查詢
+    # 筆數未超過 limit → 沒有下一頁
     now = datetime.now(timezone.utc)
     items = [_mk_record(now)]
-    fake_conn = _FakeConn(has_more=True)
+    fake_conn = _FakeConn()
     fake_pool = _FakePool(fake_conn)
     svc = BalanceService(fake_pool, gateway=cast(EconomyQueryGateway, _FakeGateway(items)))
 
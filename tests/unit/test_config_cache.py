@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from src.infra.config_cache import GuildConfigCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _Loader:
+    def __init__(self, value: object) -> None:
+        self.value = value
+        self.calls = 0
+
+    async def __call__(self) -> object:
+        self.calls += 1
+        return self.value
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_hit_skips_loader() -> None:
+    cache = GuildConfigCache()
+    loader = _Loader("cfg")
+
+    assert await cache.get_or_load("council", 1, "config", loader) == "cfg"
+    assert await cache.get_or_load("council", 1, "config", loader) == "cfg"
+
+    assert loader.calls == 1
+    assert cache.stats() == {"size": 1, "hits": 1, "misses": 1}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_none_is_cached() -> None:
+    cache = GuildConfigCache()
+    loader = _Loader(None)
+
+    await cache.get_or_load("council", 1, "config", loader)
+    await cache.get_or_load("council", 1, "config", loader)
+
+    # 未設定的公會同樣不應每次都查詢資料庫
+    assert loader.calls == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_entries_expire_after_ttl() -> None:
+    clock = _Clock()
+    cache = GuildConfigCache(ttl_seconds=10, clock=clock)
+    loader = _Loader("cfg")
+
+    await cache.get_or_load("currency", 1, "config", loader)
+    clock.now = 11
+    await cache.get_or_load("currency", 1, "config", loader)
+
+    assert loader.calls == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_zero_ttl_disables_cache() -> None:
+    cache = GuildConfigCache(ttl_seconds=0)
+    loader = _Loader("cfg")
+
+    await cache.get_or_load("council", 1, "config", loader)
+    await cache.get_or_load("council", 1, "config", loader)
+
+    assert loader.calls == 2
+    assert len(cache) == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_maxsize_evicts_least_recently_used() -> None:
+    cache = GuildConfigCache(maxsize=2)
+    for guild_id in (1, 2):
+        await cache.get_or_load("council", guild_id, "config", _Loader(guild_id))
+    await cache.get_or_load("council", 1, "config", _Loader(1))
+    await cache.get_or_load("council", 3, "config", _Loader(3))
+
+    loader = _Loader(2)
+    await cache.get_or_load("council", 2, "config", loader)
+    assert loader.calls == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_invalidate_is_scoped_to_guild_and_scope() -> None:
+    cache = GuildConfigCache()
+    await cache.get_or_load("council", 1, "config", _Loader("a"))
+    await cache.get_or_load("state_council", 1, "config", _Loader("b"))
+    await cache.get_or_load("council", 2, "config", _Loader("c"))
+
+    assert cache.invalidate(1, "council") == 1
+    assert len(cache) == 2
+    assert cache.invalidate(1) == 1
+    assert cache.invalidate() == 1
+    assert len(cache) == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_invalidation_during_load_discards_stale_value() -> None:
+    cache = GuildConfigCache()
+    release = asyncio.Event()
+
+    async def slow_loader() -> str:
+        await release.wait()
+        return "old"
+
+    task = asyncio.create_task(cache.get_or_load("council", 1, "config", slow_loader))
+    await asyncio.sleep(0)
+    cache.invalidate(1, "council")
+    release.set()
+
+    assert await task == "old"
+    # 載入期間發生失效：舊值不可寫回快取
+    assert len(cache) == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_handle_notification_invalidates_matching_entries() -> None:
+    cache = GuildConfigCache()
+    await cache.get_or_load("council", 1, "config", _Loader("a"))
+    await cache.get_or_load("currency", 1, "config", _Loader("b"))
+
+    cache.handle_notification(json.dumps({"guild_id": 1, "scope": "council"}))
+
+    assert len(cache) == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_unparseable_notification_clears_everything() -> None:
+    cache = GuildConfigCache()
+    await cache.get_or_load("council", 1, "config", _Loader("a"))
+
+    cache.handle_notification("not-json")
+
+    assert len(cache) == 0
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock
 from uuid import uuid4
 
@@ -56,3 +57,60 @@ class TestCouncilGovernanceGateway:
 
         assert members == [333333333333333333, 444444444444444444]
         mock_connection.fetch.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cast_vote_returns_outcome_proposal_and_tally(
+        self,
+        gateway: CouncilGovernanceGateway,
+        mock_connection: AsyncMock,
+    ) -> None:
+        proposal_id = uuid4()
+        now = datetime.now(timezone.utc)
+        mock_connection.fetchrow.return_value = {
+            "outcome": "voted",
+            "proposal_id": proposal_id,
+            "guild_id": 1,
+            "proposer_id": 2,
+            "target_id": 3,
+            "amount": 100,
+            "description": None,
+            "attachment_url": None,
+            "snapshot_n": 3,
+            "threshold_t": 2,
+            "deadline_at": now,
+            "status": "已通過",
+            "reminder_sent": False,
+            "created_at": now,
+            "updated_at": now,
+            "target_department_id": None,
+            "approve": 2,
+            "reject": 0,
+            "abstain": 0,
+            "total_voted": 2,
+        }
+
+        outcome, proposal, tally = await gateway.cast_vote(
+            mock_connection, proposal_id=proposal_id, voter_id=4, choice="approve"
+        )
+
+        assert outcome == "voted"
+        assert proposal is not None and proposal.status == "已通過"
+        assert (tally.approve, tally.total_voted) == (2, 2)
+        mock_connection.fetchrow.assert_awaited_once()
+        assert "fn_cast_vote" in mock_connection.fetchrow.call_args[0][0]
+
+    @pytest.mark.asyncio
+    async def test_cast_vote_missing_proposal(
+        self,
+        gateway: CouncilGovernanceGateway,
+        mock_connection: AsyncMock,
+    ) -> None:
+        mock_connection.fetchrow.return_value = {"outcome": "not_found", "proposal_id": None}
+
+        outcome, proposal, tally = await gateway.cast_vote(
+            mock_connection, proposal_id=uuid4(), voter_id=4, choice="approve"
+        )
+
+        assert outcome == "not_found"
+        assert proposal is None
+        assert tally.total_voted == 0
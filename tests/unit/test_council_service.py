@@ -214,6 +214,33 @@ class FakeGateway(CouncilGovernanceGateway):
             total_voted=sum(counts.values()),
         )
 
+    async def cast_vote(
+        self,
+        connection: Any,
+        *,
+        proposal_id: UUID,
+        voter_id: int,
+        choice: str,
+    ) -> tuple[str, Proposal | None, Tally]:
+        # 對應 governance.fn_cast_vote 的判定順序
+        p = self._proposals.get(proposal_id)
+        if p is None:
+            return "not_found", None, Tally(approve=0, reject=0, abstain=0, total_voted=0)
+        if p.status != "進行中":
+            return "closed", p, await self.fetch_tally(connection, proposal_id=proposal_id)
+        if voter_id not in self._snapshot.get(proposal_id, []):
+            return "not_in_snapshot", p, await self.fetch_tally(connection, proposal_id=proposal_id)
+        await self.upsert_vote(
+            connection, proposal_id=proposal_id, voter_id=voter_id, choice=choice
+        )
+        tally = await self.fetch_tally(connection, proposal_id=proposal_id)
+        remaining = max(0, p.snapshot_n - tally.total_voted)
+        if tally.approve >= p.threshold_t:
+            await self.mark_status(connection, proposal_id=proposal_id, status="已通過")
+        elif tally.approve + remaining < p.threshold_t:
+            await self.mark_status(connection, proposal_id=proposal_id, status="已否決")
+        return "voted", self._proposals[proposal_id], tally
+
     async def mark_status(
         self,
         connection: Any,
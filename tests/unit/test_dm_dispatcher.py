@@ -0,0 +1,458 @@
+"""Unit tests for the governance DM dispatcher."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Any, Mapping, Sequence, cast
+from unittest.mock import MagicMock
+
+import discord
+import pytest
+
+from src.bot.services.dm_dispatcher import (
+    DmDispatcher,
+    DmMessage,
+    TokenBucket,
+    _classify_failure,
+)
+from src.db.gateway.dm_outbox import DmOutboxGateway
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeUser:
+    """記錄收到的私訊；`error` 設定時每次送出皆拋出該例外。"""
+
+    def __init__(self, user_id: int, *, latency: float = 0.0) -> None:
+        self.id = user_id
+        self.latency = latency
+        self.error: BaseException | None = None
+        self.received: list[dict[str, Any]] = []
+
+    async def send(self, **kwargs: Any) -> None:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.error is not None:
+            raise self.error
+        self.received.append(kwargs)
+
+
+class FakeClient:
+    def __init__(self, users: Sequence[FakeUser] = ()) -> None:
+        self.users = {u.id: u for u in users}
+        self.fetched: list[int] = []
+
+    def get_user(self, user_id: int) -> FakeUser | None:
+        return None
+
+    async def fetch_user(self, user_id: int) -> FakeUser:
+        self.fetched.append(user_id)
+        return self.users[user_id]
+
+
+class FakeOutboxGateway(DmOutboxGateway):
+    """以記憶體模擬 governance.dm_outbox 的去重、租約與重試語意。"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.rows: dict[int, dict[str, Any]] = {}
+        self._next_id = 1
+
+    def _now(self) -> datetime:
+        return datetime.now(timezone.utc)
+
+    async def enqueue(
+        self,
+        connection: Any,
+        *,
+        guild_id: int,
+        recipient_ids: Sequence[int],
+        dedup_key: str,
+        payload: Mapping[str, Any],
+    ) -> int:
+        existing = {(r["dedup_key"], r["recipient_id"]) for r in self.rows.values()}
+        inserted = 0
+        for recipient_id in dict.fromkeys(recipient_ids):
+            if (dedup_key, recipient_id) in existing:
+                continue
+            self.rows[self._next_id] = {
+                "outbox_id": self._next_id,
+                "guild_id": guild_id,
+                "recipient_id": recipient_id,
+                "dedup_key": dedup_key,
+                "payload": dict(payload),
+                "status": "pending",
+                "attempts": 0,
+                "next_attempt_at": self._now(),
+                "last_error": None,
+            }
+            self._next_id += 1
+            inserted += 1
+        return inserted
+
+    async def claim(
+        self, connection: Any, *, limit: int = 100, lease_seconds: int = 300
+    ) -> list[Mapping[str, Any]]:
+        now = self._now()
+        due = [
+            r
+            for r in self.rows.values()
+            if r["status"] == "pending" and r["next_attempt_at"] <= now
+        ][:limit]
+        for row in due:
+            row["attempts"] += 1
+            row["next_attempt_at"] = now + timedelta(seconds=lease_seconds)
+        return [dict(r) for r in due]
+
+    async def mark_sent(self, connection: Any, *, outbox_ids: Sequence[int]) -> int:
+        for outbox_id in outbox_ids:
+            self.rows[outbox_id]["status"] = "sent"
+        return len(outbox_ids)
+
+    async def defer(
+        self,
+        connection: Any,
+        *,
+        outbox_id: int,
+        error: str,
+        retry_after: float,
+        give_up: bool = False,
+    ) -> None:
+        row = self.rows[outbox_id]
+        row["status"] = "failed" if give_up else "pending"
+        row["last_error"] = error
+        row["next_attempt_at"] = self._now() + timedelta(seconds=retry_after)
+
+    async def prune(self, connection: Any, *, before: datetime) -> int:
+        return 0
+
+    def statuses(self) -> dict[str, int]:
+        counts: dict[str, int] = {}
+        for row in self.rows.values():
+            counts[row["status"]] = counts.get(row["status"], 0) + 1
+        return counts
+
+
+class FakePool:
+    def acquire(self) -> _Acquire:
+        return _Acquire()
+
+
+class _Acquire:
+    async def __aenter__(self) -> object:
+        return object()
+
+    async def __aexit__(self, *exc: object) -> None:
+        return None
+
+
+def _forbidden() -> discord.Forbidden:
+    return discord.Forbidden(MagicMock(status=403, reason="Forbidden"), "Cannot send messages")
+
+
+def _http_error(status: int) -> discord.HTTPException:
+    return discord.HTTPException(MagicMock(status=status, reason="error"), "failure")
+
+
+def _outbox_dispatcher(gateway: FakeOutboxGateway, **kwargs: Any) -> DmDispatcher:
+    # 未呼叫 start()：直接標記為執行中，由測試手動 _drain_once()，不啟動背景 worker
+    dispatcher = DmDispatcher(pool=cast(Any, FakePool()), gateway=gateway, **kwargs)
+    dispatcher._running = True
+    return dispatcher
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_token_bucket_spaces_out_after_burst() -> None:
+    clock = FakeClock()
+    bucket = TokenBucket(10.0, capacity=2, clock=clock, sleep=clock.sleep)
+
+    for _ in range(6):
+        await bucket.acquire()
+
+    # 兩個 burst 令牌之後每 0.1 秒補充一個
+    assert clock.now == pytest.approx(0.4)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_token_bucket_pause_blocks_until_retry_after() -> None:
+    clock = FakeClock()
+    bucket = TokenBucket(10.0, capacity=5, clock=clock, sleep=clock.sleep)
+
+    bucket.pause(3.0)
+    await bucket.acquire()
+
+    # 暫停結束後從空桶開始補充
+    assert clock.now == pytest.approx(3.1)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_token_bucket_zero_rate_is_unlimited() -> None:
+    clock = FakeClock()
+    bucket = TokenBucket(0.0, clock=clock, sleep=clock.sleep)
+
+    for _ in range(100):
+        await bucket.acquire()
+
+    assert clock.sleeps == []
+
+
+@pytest.mark.unit
+def test_message_payload_round_trip() -> None:
+    embed = discord.Embed(title="提案結果", color=0x2ECC71)
+    embed.add_field(name="最終狀態", value="已執行", inline=False)
+    message = DmMessage(content="hi", embed=embed, view=("council_vote", "abc"))
+
+    restored = DmMessage.from_payload(message.to_payload())
+
+    assert restored.content == "hi"
+    assert restored.view == ("council_vote", "abc")
+    assert restored.embed is not None
+    assert restored.embed.to_dict() == embed.to_dict()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_direct_fan_out_dedups_per_key() -> None:
+    dispatcher = DmDispatcher(rate_per_second=0, concurrency=4)
+    alice, bob = FakeUser(1), FakeUser(2)
+
+    sent = await dispatcher.fan_out(
+        [alice, bob, alice], DmMessage(content="vote"), guild_id=10, dedup_key="k1"
+    )
+    again = await dispatcher.fan_out(
+        [alice, bob], DmMessage(content="vote"), guild_id=10, dedup_key="k1"
+    )
+    other = await dispatcher.fan_out(
+        [alice], DmMessage(content="result"), guild_id=10, dedup_key="k2"
+    )
+
+    assert (sent, again, other) == (2, 0, 1)
+    assert [m["content"] for m in alice.received] == ["vote", "result"]
+    assert len(bob.received) == 1
+    assert dispatcher.metrics()["deduplicated"] == 3
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_direct_fan_out_resolves_ids_and_reports_failures() -> None:
+    alice, bob = FakeUser(1), FakeUser(2)
+    bob.error = _forbidden()
+    client = FakeClient([alice, bob])
+    dispatcher = DmDispatcher(rate_per_second=0)
+
+    sent = await dispatcher.fan_out(
+        [1, 2], DmMessage(content="hi"), guild_id=10, dedup_key="k", client=client  # type: ignore[arg-type]
+    )
+
+    assert sent == 1
+    assert client.fetched == [1, 2]
+    assert dispatcher.metrics()["failed"] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_direct_fan_out_retries_failed_recipients() -> None:
+    dispatcher = DmDispatcher(rate_per_second=0)
+    alice, bob = FakeUser(1), FakeUser(2)
+    bob.error = _http_error(500)
+
+    first = await dispatcher.fan_out(
+        [alice, bob], DmMessage(content="remind"), guild_id=10, dedup_key="k"
+    )
+    bob.error = None
+    second = await dispatcher.fan_out(
+        [alice, bob], DmMessage(content="remind"), guild_id=10, dedup_key="k"
+    )
+
+    # 失敗的送出不記入去重：第二次只補送給 bob
+    assert (first, second) == (1, 1)
+    assert len(alice.received) == 1
+    assert len(bob.received) == 1
+    assert dispatcher.metrics()["deduplicated"] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_direct_fan_out_shares_built_view() -> None:
+    dispatcher = DmDispatcher(rate_per_second=0)
+    built: list[str] = []
+    view = object()
+
+    def _builder(arg: str) -> Any:
+        built.append(arg)
+        return view
+
+    dispatcher.register_view_builder("council_vote", _builder)
+    users = [FakeUser(i) for i in range(3)]
+
+    await dispatcher.fan_out(
+        users, DmMessage(content="x", view=("council_vote", "p1")), guild_id=1, dedup_key="k"
+    )
+
+    assert built == ["p1"]
+    assert all(u.received[0]["view"] is view for u in users)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_concurrency_limit_is_respected() -> None:
+    dispatcher = DmDispatcher(rate_per_second=0, concurrency=3)
+    active = 0
+    peak = 0
+
+    class _Tracking(FakeUser):
+        async def send(self, **kwargs: Any) -> None:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.001)
+            active -= 1
+
+    await dispatcher.fan_out(
+        [_Tracking(i) for i in range(20)], DmMessage(content="x"), guild_id=1, dedup_key="k"
+    )
+
+    assert peak == 3
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_rate_limited_response_pauses_bucket() -> None:
+    clock = FakeClock()
+    dispatcher = DmDispatcher(rate_per_second=100.0, clock=clock)
+    dispatcher._bucket = TokenBucket(100.0, clock=clock, sleep=clock.sleep)
+    user = FakeUser(1)
+    user.error = discord.RateLimited(2.5)
+
+    await dispatcher.fan_out([user], DmMessage(content="x"), guild_id=1, dedup_key="k")
+    user.error = None
+    await dispatcher.fan_out([user], DmMessage(content="y"), guild_id=1, dedup_key="k2")
+
+    assert dispatcher.metrics()["rate_limited"] == 1
+    assert clock.now >= 2.5
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_outbox_fan_out_queues_and_drains() -> None:
+    gateway = FakeOutboxGateway()
+    dispatcher = _outbox_dispatcher(gateway, rate_per_second=0)
+    users = [FakeUser(i) for i in range(1, 4)]
+
+    queued = await dispatcher.fan_out(users, DmMessage(content="vote"), guild_id=5, dedup_key="k")
+    duplicate = await dispatcher.fan_out(
+        users, DmMessage(content="vote"), guild_id=5, dedup_key="k"
+    )
+
+    # 入列後立即返回，實際送出由 worker 負責
+    assert (queued, duplicate) == (3, 0)
+    assert all(not u.received for u in users)
+
+    assert await dispatcher._drain_once() == 3
+    assert all(u.received == [{"content": "vote"}] for u in users)
+    assert gateway.statuses() == {"sent": 3}
+    assert dispatcher.metrics()["queued"] == 3
+    assert dispatcher.metrics()["deduplicated"] == 3
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_outbox_forbidden_gives_up_and_transient_error_retries() -> None:
+    gateway = FakeOutboxGateway()
+    dispatcher = _outbox_dispatcher(gateway, rate_per_second=0)
+    closed, flaky = FakeUser(1), FakeUser(2)
+    closed.error = _forbidden()
+    flaky.error = _http_error(500)
+
+    await dispatcher.fan_out([closed, flaky], DmMessage(content="x"), guild_id=1, dedup_key="k")
+    await dispatcher._drain_once()
+
+    rows = {r["recipient_id"]: r for r in gateway.rows.values()}
+    assert rows[1]["status"] == "failed"
+    assert rows[2]["status"] == "pending"
+    assert rows[2]["next_attempt_at"] > datetime.now(timezone.utc)
+    assert dispatcher.metrics()["failed"] == 1
+    assert dispatcher.metrics()["retried"] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_restart_sends_pending_rows_by_id() -> None:
+    gateway = FakeOutboxGateway()
+    alice = FakeUser(1)
+    first = _outbox_dispatcher(gateway, rate_per_second=0)
+    await first.fan_out([alice], DmMessage(content="vote"), guild_id=1, dedup_key="k")
+    await first.stop()
+
+    # 新程序沒有成員物件快取，改以 client 解析 ID
+    client = FakeClient([alice])
+    second = _outbox_dispatcher(gateway, rate_per_second=0)
+    second._client = client  # type: ignore[assignment]
+    await second._drain_once()
+
+    assert client.fetched == [1]
+    assert alice.received == [{"content": "vote"}]
+    assert gateway.statuses() == {"sent": 1}
+
+
+@pytest.mark.unit
+def test_classify_failure() -> None:
+    assert _classify_failure(_forbidden(), 1) == (True, 0.0)
+    assert _classify_failure(_http_error(500), 1) == (False, 5.0)
+    assert _classify_failure(_http_error(500), 3) == (False, 20.0)
+    assert _classify_failure(_http_error(500), 5)[0] is True
+    assert _classify_failure(discord.RateLimited(7.0), 1) == (False, 7.0)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_start_without_database_falls_back_to_direct(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def _no_pool() -> Any:
+        raise RuntimeError("DATABASE_URL not set")
+
+    monkeypatch.setattr("src.bot.services.dm_dispatcher.db_pool.init_pool", _no_pool)
+    dispatcher = DmDispatcher(rate_per_second=0)
+
+    await dispatcher.start(MagicMock(spec=discord.Client))
+    user = FakeUser(1)
+    sent = await dispatcher.fan_out([user], DmMessage(content="x"), guild_id=1, dedup_key="k")
+    await dispatcher.stop()
+
+    assert dispatcher.persistent is False
+    assert sent == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_worker_drains_backlog_on_start() -> None:
+    gateway = FakeOutboxGateway()
+    alice = FakeUser(1)
+    await gateway.enqueue(
+        object(), guild_id=1, recipient_ids=[1], dedup_key="k", payload={"content": "left over"}
+    )
+    dispatcher = DmDispatcher(pool=cast(Any, FakePool()), gateway=gateway, rate_per_second=0)
+
+    await dispatcher.start(FakeClient([alice]))  # type: ignore[arg-type]
+    for _ in range(50):
+        if alice.received:
+            break
+        await asyncio.sleep(0.01)
+    await dispatcher.stop()
+
+    assert dispatcher.persistent is False
+    assert alice.received == [{"content": "left over"}]
@@ -0,0 +1,84 @@
+"""Unit tests for the governance DM outbox gateway."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+import asyncpg
+import pytest
+
+from src.db.gateway.dm_outbox import DmOutboxGateway
+
+
+@pytest.mark.unit
+class TestDmOutboxGateway:
+    @pytest.fixture
+    def mock_connection(self) -> AsyncMock:
+        return AsyncMock(spec=asyncpg.Connection)
+
+    @pytest.fixture
+    def gateway(self) -> DmOutboxGateway:
+        return DmOutboxGateway()
+
+    @pytest.mark.asyncio
+    async def test_enqueue(self, gateway: DmOutboxGateway, mock_connection: AsyncMock) -> None:
+        mock_connection.fetchval.return_value = 2
+
+        inserted = await gateway.enqueue(
+            mock_connection,
+            guild_id=1,
+            recipient_ids=(10, 20),
+            dedup_key="council:vote:abc",
+            payload={"content": "hi"},
+        )
+
+        assert inserted == 2
+        mock_connection.fetchval.assert_awaited_once_with(
+            "SELECT governance.fn_enqueue_dm($1, $2, $3, $4)",
+            1,
+            [10, 20],
+            "council:vote:abc",
+            {"content": "hi"},
+        )
+
+    @pytest.mark.asyncio
+    async def test_claim(self, gateway: DmOutboxGateway, mock_connection: AsyncMock) -> None:
+        row = {"outbox_id": 1, "guild_id": 1, "recipient_id": 10, "payload": {}, "attempts": 1}
+        mock_connection.fetch.return_value = [row]
+
+        rows = await gateway.claim(mock_connection, limit=50, lease_seconds=120)
+
+        assert rows == [row]
+        mock_connection.fetch.assert_awaited_once_with(
+            "SELECT * FROM governance.fn_claim_dm_outbox($1, $2)", 50, 120
+        )
+
+    @pytest.mark.asyncio
+    async def test_mark_sent(self, gateway: DmOutboxGateway, mock_connection: AsyncMock) -> None:
+        mock_connection.fetchval.return_value = 3
+
+        assert await gateway.mark_sent(mock_connection, outbox_ids=(1, 2, 3)) == 3
+        mock_connection.fetchval.assert_awaited_once_with(
+            "SELECT governance.fn_complete_dm_outbox($1)", [1, 2, 3]
+        )
+
+    @pytest.mark.asyncio
+    async def test_defer(self, gateway: DmOutboxGateway, mock_connection: AsyncMock) -> None:
+        await gateway.defer(
+            mock_connection, outbox_id=7, error="Forbidden", retry_after=0, give_up=True
+        )
+
+        mock_connection.execute.assert_awaited_once_with(
+            "SELECT governance.fn_defer_dm_outbox($1, $2, $3, $4)", 7, "Forbidden", 0.0, True
+        )
+
+    @pytest.mark.asyncio
+    async def test_prune(self, gateway: DmOutboxGateway, mock_connection: AsyncMock) -> None:
+        before = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        mock_connection.fetchval.return_value = None
+
+        assert await gateway.prune(mock_connection, before=before) == 0
+        mock_connection.fetchval.assert_awaited_once_with(
+            "SELECT governance.fn_prune_dm_outbox($1)", before
+        )
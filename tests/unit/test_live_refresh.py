@@ -0,0 +1,180 @@
+"""Unit tests for the live panel refresh debouncer and shared summaries."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import discord
+import pytest
+
+from src.bot.ui.live_refresh import (
+    PanelRefreshDebouncer,
+    live_refresh_metrics,
+    shared_summary,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_first_event_refreshes_immediately_and_burst_is_coalesced() -> None:
+    calls = 0
+
+    async def _refresh() -> None:
+        nonlocal calls
+        calls += 1
+
+    before = live_refresh_metrics()
+    debouncer = PanelRefreshDebouncer(_refresh, name="test", window_seconds=0.05)
+
+    await debouncer.trigger()
+    assert calls == 1
+
+    for _ in range(50):
+        await debouncer.trigger()
+    assert calls == 1
+
+    await asyncio.sleep(0.1)
+    assert calls == 2
+
+    after = live_refresh_metrics()
+    assert after["events"] - before["events"] == 51
+    assert after["events_coalesced"] - before["events_coalesced"] == 50
+    assert after["refreshes"] - before["refreshes"] == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_idle_panel_refreshes_each_event_after_window() -> None:
+    clock = _Clock()
+    calls = 0
+
+    async def _refresh() -> None:
+        nonlocal calls
+        calls += 1
+
+    debouncer = PanelRefreshDebouncer(_refresh, name="test", window_seconds=2.0, clock=clock)
+
+    await debouncer.trigger()
+    clock.now += 2.5
+    await debouncer.trigger()
+
+    assert calls == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_cancel_drops_pending_refresh() -> None:
+    calls = 0
+
+    async def _refresh() -> None:
+        nonlocal calls
+        calls += 1
+
+    debouncer = PanelRefreshDebouncer(_refresh, name="test", window_seconds=0.05)
+    await debouncer.trigger()
+    await debouncer.trigger()
+    debouncer.cancel()
+    await asyncio.sleep(0.1)
+
+    assert calls == 1
+
+
+@pytest.mark.unit
+def test_render_changed_skips_identical_render() -> None:
+    before = live_refresh_metrics()["edits_skipped"]
+    debouncer = PanelRefreshDebouncer(_noop, name="test", window_seconds=0)
+
+    assert debouncer.render_changed(discord.Embed(title="餘額", description="100"), None)
+    assert not debouncer.render_changed(discord.Embed(title="餘額", description="100"), None)
+    assert debouncer.render_changed(discord.Embed(title="餘額", description="120"), None)
+
+    debouncer.forget_render()
+    assert debouncer.render_changed(discord.Embed(title="餘額", description="120"), None)
+    assert live_refresh_metrics()["edits_skipped"] - before == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_shared_summary_runs_loader_once_for_concurrent_callers() -> None:
+    calls = 0
+    release = asyncio.Event()
+
+    async def _load() -> dict[str, Any]:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return {"total": 42}
+
+    tasks = [
+        asyncio.create_task(shared_summary(("state_council", 1, "summary"), _load))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert calls == 1
+    assert results == [{"total": 42}] * 3
+
+    # 查詢完成後不保留結果，下一次刷新重新讀取
+    await shared_summary(("state_council", 1, "summary"), _load)
+    assert calls == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_shared_summary_propagates_errors_to_all_callers() -> None:
+    release = asyncio.Event()
+
+    async def _load() -> int:
+        await release.wait()
+        raise RuntimeError("db down")
+
+    tasks = [
+        asyncio.create_task(shared_summary(("council", 1, "balance"), _load)) for _ in range(2)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_shared_summary_survives_first_caller_cancellation() -> None:
+    release = asyncio.Event()
+    calls = 0
+
+    async def _load() -> int:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return 7
+
+    first = asyncio.create_task(shared_summary(("state_council", 2, "summary"), _load))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(shared_summary(("state_council", 2, "summary"), _load))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    # 第一個呼叫端被取消；其他等待者仍取得同一次查詢的結果
+    assert await second == 7
+    assert first.cancelled()
+    assert calls == 1
+
+
+async def _noop() -> None:
+    return None
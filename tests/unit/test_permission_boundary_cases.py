@@ -53,6 +53,7 @@ class TestPermissionBoundaryCases:
         service = MagicMock(spec=StateCouncilService)
         service.check_leader_permission = AsyncMock()
         service.check_department_permission = AsyncMock()
+        service.check_department_permissions_bulk = AsyncMock()
         return service
 
     @pytest.fixture
@@ -178,6 +179,46 @@ class TestPermissionBoundaryCases:
         error = result.error
         assert isinstance(error, DatabaseError)
 
+    # 測試批次部門權限
+    @pytest.mark.asyncio
+    async def test_bulk_department_permissions_state_council(
+        self, mock_state_council_service: MagicMock
+    ) -> None:
+        """批次檢查應為每個部門回傳一筆 PermissionResult"""
+        checker = StateCouncilPermissionChecker(mock_state_council_service)
+        mock_state_council_service.check_leader_permission.return_value = False
+        mock_state_council_service.check_department_permissions_bulk.return_value = {
+            "內政部": True,
+            "財政部": False,
+        }
+
+        result = await checker.check_departments_bulk(
+            guild_id=12345, user_id=67890, user_roles=[123], departments=["內政部", "財政部"]
+        )
+
+        assert isinstance(result, Ok)
+        assert result.value["內政部"].allowed is True
+        assert result.value["內政部"].permission_level == "department_head"
+        assert result.value["財政部"].allowed is False
+        mock_state_council_service.check_department_permission.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_bulk_department_permissions_database_error(
+        self, mock_state_council_service: MagicMock
+    ) -> None:
+        """批次檢查遇到資料庫錯誤時回傳 Err"""
+        checker = StateCouncilPermissionChecker(mock_state_council_service)
+        mock_state_council_service.check_department_permissions_bulk.return_value = Err(
+            DatabaseError("數據庫錯誤")
+        )
+
+        result = await checker.check_departments_bulk(
+            guild_id=12345, user_id=67890, user_roles=[123], departments=["內政部"]
+        )
+
+        assert isinstance(result, Err)
+        assert isinstance(result.error, DatabaseError)
+
     # 測試無效的身分組ID
     @pytest.mark.asyncio
     async def test_invalid_role_ids(self, mock_supreme_assembly_service: MagicMock) -> None:
@@ -622,7 +622,9 @@ class TestStateCouncilCommandLogic:
 
         # Mock permission checks
         mock_state_council_service.check_leader_permission = AsyncMock(return_value=False)
-        mock_state_council_service.check_department_permission = AsyncMock(return_value=False)
+        mock_state_council_service.check_department_permissions_bulk = AsyncMock(
+            return_value={"內政部": False, "財政部": False, "國土安全部": False, "中央銀行": False}
+        )
 
         # Mock interaction
         fake_interaction.response = AsyncMock()
@@ -10,6 +10,7 @@ import pytest
 from src.bot.services.state_council_service import StateCouncilService
 from src.db.gateway.state_council_governance import (
     DepartmentConfig,
+    DepartmentPermissionMap,
     DepartmentRoleConfig,
     StateCouncilConfig,
     StateCouncilGovernanceGateway,
@@ -186,6 +187,26 @@ class _FakeGateway(StateCouncilGovernanceGateway):
                     )
         return configs
 
+    async def fetch_department_permission_map(
+        self, connection: Any, *, guild_id: int
+    ) -> DepartmentPermissionMap | None:
+        config = self._data["state_council_configs"].get(guild_id)
+        if config is None:
+            return None
+        role_ids: dict[str, list[int]] = {}
+        for (g, d), ids in self._data.get("department_role_ids", {}).items():
+            if g == guild_id:
+                role_ids.setdefault(d, []).extend(ids)
+        for (g, d), dept_config in self._data["department_configs"].items():
+            if g == guild_id and dept_config.role_id is not None:
+                role_ids.setdefault(d, []).append(dept_config.role_id)
+        return DepartmentPermissionMap(
+            guild_id=guild_id,
+            leader_id=config.leader_id,
+            leader_role_id=config.leader_role_id,
+            department_role_ids=role_ids,
+        )
+
     def set_department_config(
         self, guild_id: int, department: str, config: DepartmentConfig
     ) -> None:
@@ -439,3 +460,63 @@ async def test_backward_compatibility_with_existing_config(monkeypatch: pytest.M
     # Verify no multiple roles are configured
     role_ids = await svc.get_department_role_ids(guild_id=100, department="內政部")
     assert role_ids == []
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_check_department_permissions_bulk_matches_single_checks(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """批次權限判斷需與逐部門 check_department_permission 的結果一致。"""
+    gw = _FakeGateway()
+    conn = _FakeConnection(gw)
+    pool = _FakePool(conn)
+    monkeypatch.setattr("src.bot.services.state_council_service.get_pool", lambda: pool)
+
+    svc = StateCouncilService(gateway=gw)
+    gw._data["state_council_configs"][100] = StateCouncilConfig(
+        guild_id=100,
+        leader_id=1,
+        leader_role_id=50,
+        internal_affairs_account_id=1001,
+        finance_account_id=1002,
+        security_account_id=1003,
+        central_bank_account_id=1004,
+        created_at=datetime.now(timezone.utc),
+        updated_at=datetime.now(timezone.utc),
+    )
+    gw.set_department_config(
+        100,
+        "財政部",
+        DepartmentConfig(
+            id=1,
+            guild_id=100,
+            department="財政部",
+            role_id=200,
+            welfare_amount=0,
+            welfare_interval_hours=24,
+            tax_rate_basis=0,
+            tax_rate_percent=0,
+            max_issuance_per_month=0,
+            created_at=datetime.now(timezone.utc),
+            updated_at=datetime.now(timezone.utc),
+        ),
+    )
+    await svc.add_department_role(guild_id=100, department="內政部", role_id=300)
+
+    departments = ["內政部", "財政部", "國土安全部", "中央銀行"]
+    cases = [(2, [300]), (2, [200]), (2, [200, 300]), (2, [999]), (1, []), (2, [50])]
+    for user_id, roles in cases:
+        bulk = await svc.check_department_permissions_bulk(
+            guild_id=100, user_id=user_id, user_roles=roles, departments=departments
+        )
+        for dept in departments:
+            single = await svc.check_department_permission(
+                guild_id=100, user_id=user_id, department=dept, user_roles=roles
+            )
+            assert bulk[dept] is single, (user_id, roles, dept)
+
+    # 未完成國務院設定的公會一律拒絕
+    assert await svc.check_department_permissions_bulk(
+        guild_id=999, user_id=1, user_roles=[50], departments=departments
+    ) == dict.fromkeys(departments, False)
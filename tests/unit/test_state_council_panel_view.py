@@ -328,6 +328,39 @@ class TestStateCouncilPanelViewEventHandling:
 
         fake_message.edit.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_handle_event_skips_edit_when_render_unchanged(
+        self,
+        mock_state_council_service: MagicMock,
+        mock_currency_service: MagicMock,
+        fake_guild: MagicMock,
+        fake_message: MagicMock,
+    ) -> None:
+        """畫面內容未變動時不重複編輯訊息。"""
+        view = StateCouncilPanelView(
+            service=mock_state_council_service,
+            currency_service=mock_currency_service,
+            guild=fake_guild,
+            guild_id=12345,
+            author_id=67890,
+            leader_id=67890,
+            leader_role_id=None,
+            user_roles=[],
+        )
+        view.message = fake_message
+        view._live_refresh._window = 0
+
+        event = StateCouncilEvent(guild_id=12345, kind="department_balance_changed")
+
+        with patch.object(view, "refresh_options", new_callable=AsyncMock):
+            with patch.object(view, "build_summary_embed", new_callable=AsyncMock) as mock_build:
+                mock_build.return_value = discord.Embed(title="國務院總覽", description="100")
+
+                await view._handle_event(event)
+                await view._handle_event(event)
+
+        fake_message.edit.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_handle_event_ignores_other_guilds(
         self,
@@ -556,12 +589,14 @@ class TestAllowedDepartmentsComputation:
         """測試有部分權限的允許部門計算。"""
 
         # 只允許財政部和內政部
-        async def check_dept(
-            guild_id: int, user_id: int, department: str, user_roles: list
-        ) -> bool:
-            return department in ["財政部", "內政部"]
+        async def check_depts(
+            *, guild_id: int, user_id: int, user_roles: list, departments: list[str]
+        ) -> dict[str, bool]:
+            return {dept: dept in ["財政部", "內政部"] for dept in departments}
 
-        mock_state_council_service.check_department_permission = AsyncMock(side_effect=check_dept)
+        mock_state_council_service.check_department_permissions_bulk = AsyncMock(
+            side_effect=check_depts
+        )
 
         view = StateCouncilPanelView(
             service=mock_state_council_service,
@@ -580,6 +615,8 @@ class TestAllowedDepartmentsComputation:
         assert "財政部" in result
         assert "內政部" in result
         assert "國土安全部" not in result
+        # 所有部門以單次批次查詢判斷
+        mock_state_council_service.check_department_permissions_bulk.assert_awaited_once()
 
 
 if __name__ == "__main__":
@@ -6,7 +6,6 @@ import secrets
 from datetime import datetime, timezone
 from typing import cast
 from unittest.mock import AsyncMock
-from uuid import UUID
 
 import asyncpg
 import pytest
@@ -17,13 +16,7 @@ from src.bot.services.state_council_reports import (
     FinancialSummary,
     StateCouncilReportGenerator,
 )
-from src.db.gateway.state_council_governance import (
-    CurrencyIssuance,
-    IdentityRecord,
-    InterdepartmentTransfer,
-    TaxRecord,
-    WelfareDisbursement,
-)
+from src.db.gateway.state_council_governance import DepartmentStats
 
 
 def _snowflake() -> int:
@@ -46,129 +39,20 @@ class TestStateCouncilReportGenerator:
         return StateCouncilReportGenerator()
 
     @pytest.fixture
-    def sample_welfare_records(self) -> list[WelfareDisbursement]:
-        """Sample welfare disbursement records."""
-        return [
-            WelfareDisbursement(
-                disbursement_id=UUID(int=1),
-                guild_id=_snowflake(),
-                recipient_id=_snowflake(),
-                amount=1000,
-                disbursement_type="定期福利",
-                reference_id=None,
-                disbursed_at=datetime(2024, 1, 15, tzinfo=timezone.utc),
-            ),
-            WelfareDisbursement(
-                disbursement_id=UUID(int=2),
-                guild_id=_snowflake(),
-                recipient_id=_snowflake(),
-                amount=1500,
-                disbursement_type="特殊福利",
-                reference_id="REF123",
-                disbursed_at=datetime(2024, 1, 20, tzinfo=timezone.utc),
-            ),
-        ]
-
-    @pytest.fixture
-    def sample_tax_records(self) -> list[TaxRecord]:
-        """Sample tax records."""
-        return [
-            TaxRecord(
-                tax_id=UUID(int=1),
-                guild_id=_snowflake(),
-                taxpayer_id=_snowflake(),
-                taxable_amount=10000,
-                tax_rate_percent=10,
-                tax_amount=1000,
-                tax_type="所得稅",
-                assessment_period="2024-01",
-                collected_at=datetime(2024, 1, 10, tzinfo=timezone.utc),
-            ),
-            TaxRecord(
-                tax_id=UUID(int=2),
-                guild_id=_snowflake(),
-                taxpayer_id=_snowflake(),
-                taxable_amount=20000,
-                tax_rate_percent=15,
-                tax_amount=3000,
-                tax_type="所得稅",
-                assessment_period="2024-01",
-                collected_at=datetime(2024, 1, 25, tzinfo=timezone.utc),
-            ),
-        ]
-
-    @pytest.fixture
-    def sample_identity_records(self) -> list[IdentityRecord]:
-        """Sample identity records."""
-        return [
-            IdentityRecord(
-                record_id=UUID(int=1),
-                guild_id=_snowflake(),
-                target_id=_snowflake(),
-                action="移除公民身分",
-                reason="違反規定",
-                performed_by=_snowflake(),
-                performed_at=datetime(2024, 1, 5, tzinfo=timezone.utc),
-            ),
-            IdentityRecord(
-                record_id=UUID(int=2),
-                guild_id=_snowflake(),
-                target_id=_snowflake(),
-                action="標記疑犯",
-                reason="可疑行為",
-                performed_by=_snowflake(),
-                performed_at=datetime(2024, 1, 15, tzinfo=timezone.utc),
-            ),
-        ]
-
-    @pytest.fixture
-    def sample_currency_records(self) -> list[CurrencyIssuance]:
-        """Sample currency issuance records."""
+    def sample_activity_rows(self) -> list[tuple[str, str | None, int]]:
+        """Activity aggregates as returned by fn_report_activity."""
         return [
-            CurrencyIssuance(
-                issuance_id=UUID(int=1),
-                guild_id=_snowflake(),
-                amount=5000,
-                reason="經濟刺激",
-                performed_by=_snowflake(),
-                month_period="2024-01",
-                issued_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
-            ),
-            CurrencyIssuance(
-                issuance_id=UUID(int=2),
-                guild_id=_snowflake(),
-                amount=3000,
-                reason="流動性支持",
-                performed_by=_snowflake(),
-                month_period="2024-01",
-                issued_at=datetime(2024, 1, 15, tzinfo=timezone.utc),
-            ),
-        ]
-
-    @pytest.fixture
-    def sample_transfer_records(self) -> list[InterdepartmentTransfer]:
-        """Sample interdepartment transfer records."""
-        return [
-            InterdepartmentTransfer(
-                transfer_id=UUID(int=1),
-                guild_id=_snowflake(),
-                from_department="內政部",
-                to_department="財政部",
-                amount=2000,
-                reason="預算調整",
-                performed_by=_snowflake(),
-                transferred_at=datetime(2024, 1, 10, tzinfo=timezone.utc),
-            ),
-            InterdepartmentTransfer(
-                transfer_id=UUID(int=2),
-                guild_id=_snowflake(),
-                from_department="財政部",
-                to_department="國土安全部",
-                amount=1500,
-                reason="安全預算",
-                performed_by=_snowflake(),
-                transferred_at=datetime(2024, 1, 20, tzinfo=timezone.utc),
-            ),
+            ("operation", "福利發放", 2),
+            ("operation", "稅收徵收", 2),
+            ("operation", "身分管理", 2),
+            ("operation", "貨幣發行", 2),
+            ("day", "2024-01-15", 3),
+            ("day", "2024-01-01", 1),
+            ("day", "2024-01-20", 4),
+            ("performer", "456", 2),
+            ("performer", "123", 3),
+            ("performer", "789", 2),
+            ("unique_users", None, 6),
         ]
 
     # --- Financial Summary Tests ---
@@ -178,9 +62,6 @@ class TestStateCouncilReportGenerator:
         self,
         generator: StateCouncilReportGenerator,
         mock_connection: AsyncMock,
-        sample_welfare_records: list[WelfareDisbursement],
-        sample_tax_records: list[TaxRecord],
-        sample_currency_records: list[CurrencyIssuance],
     ) -> None:
         """Test generating financial summary."""
         guild_id = _snowflake()
@@ -189,9 +70,7 @@ class TestStateCouncilReportGenerator:
 
         # Mock gateway methods (cast for mypy strict)
         gateway = cast(AsyncMock, generator._gateway)
-        gateway.fetch_welfare_disbursements.return_value = sample_welfare_records
-        gateway.fetch_tax_records.return_value = sample_tax_records
-        gateway.fetch_currency_issuances.return_value = sample_currency_records
+        gateway.fetch_report_financial_totals.return_value = (2500, 4000, 8000)
 
         summary = await generator.generate_financial_summary(
             mock_connection,
@@ -201,23 +80,20 @@ class TestStateCouncilReportGenerator:
         )
 
         assert isinstance(summary, FinancialSummary)
-        assert summary.total_welfare_disbursed == 2500  # 1000 + 1500
-        assert summary.total_tax_collected == 4000  # 1000 + 3000
-        assert summary.total_currency_issued == 8000  # 5000 + 3000
+        assert summary.total_welfare_disbursed == 2500
+        assert summary.total_tax_collected == 4000
+        assert summary.total_currency_issued == 8000
         assert summary.net_flow == 9500  # 4000 + 8000 - 2500
         assert summary.period_start == start_date
         assert summary.period_end == end_date
 
-        # Verify gateway calls
-        gateway.fetch_welfare_disbursements.assert_called_once_with(
-            mock_connection, guild_id=guild_id, limit=10000
-        )
-        gateway.fetch_tax_records.assert_called_once_with(
-            mock_connection, guild_id=guild_id, limit=10000
-        )
-        gateway.fetch_currency_issuances.assert_called_once_with(
-            mock_connection, guild_id=guild_id, limit=10000
+        # 期間交由 SQL 過濾，不再整批取回紀錄
+        gateway.fetch_report_financial_totals.assert_awaited_once_with(
+            mock_connection, guild_id=guild_id, start=start_date, end=end_date
         )
+        gateway.fetch_welfare_disbursements.assert_not_called()
+        gateway.fetch_tax_records.assert_not_called()
+        gateway.fetch_currency_issuances.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_generate_financial_summary_empty_data(
@@ -228,11 +104,8 @@ class TestStateCouncilReportGenerator:
         start_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
         end_date = datetime(2024, 1, 31, tzinfo=timezone.utc)
 
-        # Mock empty data
         gateway = cast(AsyncMock, generator._gateway)
-        gateway.fetch_welfare_disbursements.return_value = []
-        gateway.fetch_tax_records.return_value = []
-        gateway.fetch_currency_issuances.return_value = []
+        gateway.fetch_report_financial_totals.return_value = (0, 0, 0)
 
         summary = await generator.generate_financial_summary(
             mock_connection, guild_id=guild_id, start_date=start_date, end_date=end_date
@@ -246,128 +119,74 @@ class TestStateCouncilReportGenerator:
     # --- Department Metrics Tests ---
 
     @pytest.mark.asyncio
-    async def test_generate_department_metrics_internal_affairs(
+    @pytest.mark.parametrize(
+        ("department", "aggregates", "average"),
+        [
+            ("內政部", (2, 2500, "2024-01-20", "福利發放"), 1250.0),
+            ("財政部", (2, 4000, "2024-01-25", "稅收徵收"), 2000.0),
+            ("國土安全部", (2, 2, "2024-01-15", "移除公民身分"), 1.0),
+            ("中央銀行", (2, 8000, "2024-01-15", "貨幣發行"), 4000.0),
+        ],
+    )
+    async def test_generate_department_metrics(
         self,
         generator: StateCouncilReportGenerator,
         mock_connection: AsyncMock,
-        sample_welfare_records: list[WelfareDisbursement],
+        department: str,
+        aggregates: tuple[int, int, str, str],
+        average: float,
     ) -> None:
-        """Test generating metrics for Internal Affairs department."""
+        """Test department metrics are built from the SQL aggregates."""
         guild_id = _snowflake()
         start_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
         end_date = datetime(2024, 1, 31, tzinfo=timezone.utc)
 
         gateway = cast(AsyncMock, generator._gateway)
-        gateway.fetch_welfare_disbursements.return_value = sample_welfare_records
+        gateway.fetch_report_department_metrics.return_value = aggregates
 
         metrics = await generator.generate_department_metrics(
             mock_connection,
             guild_id=guild_id,
-            department="內政部",
+            department=department,
             start_date=start_date,
             end_date=end_date,
         )
 
         assert isinstance(metrics, DepartmentMetrics)
-        assert metrics.department == "內政部"
-        assert metrics.total_operations == 2
-        assert metrics.total_amount == 2500
-        assert metrics.average_per_operation == 1250.0
-        assert metrics.peak_activity_day == "2024-01-20"
-        assert metrics.most_common_operation == "福利發放"
-
-    @pytest.mark.asyncio
-    async def test_generate_department_metrics_finance(
-        self,
-        generator: StateCouncilReportGenerator,
-        mock_connection: AsyncMock,
-        sample_tax_records: list[TaxRecord],
-    ) -> None:
-        """Test generating metrics for Finance department."""
-        guild_id = _snowflake()
-        start_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        end_date = datetime(2024, 1, 31, tzinfo=timezone.utc)
-
-        gateway = cast(AsyncMock, generator._gateway)
-        gateway.fetch_tax_records.return_value = sample_tax_records
-
-        metrics = await generator.generate_department_metrics(
-            mock_connection,
-            guild_id=guild_id,
-            department="財政部",
-            start_date=start_date,
-            end_date=end_date,
-        )
-
-        assert isinstance(metrics, DepartmentMetrics)
-        assert metrics.department == "財政部"
-        assert metrics.total_operations == 2
-        assert metrics.total_amount == 4000
-        assert metrics.average_per_operation == 2000.0
-        assert metrics.peak_activity_day == "2024-01-25"
-        assert metrics.most_common_operation == "稅收徵收"
-
-    @pytest.mark.asyncio
-    async def test_generate_department_metrics_security(
-        self,
-        generator: StateCouncilReportGenerator,
-        mock_connection: AsyncMock,
-        sample_identity_records: list[IdentityRecord],
-    ) -> None:
-        """Test generating metrics for Security department."""
-        guild_id = _snowflake()
-        start_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        end_date = datetime(2024, 1, 31, tzinfo=timezone.utc)
-
-        gateway = cast(AsyncMock, generator._gateway)
-        gateway.fetch_identity_records.return_value = sample_identity_records
-
-        metrics = await generator.generate_department_metrics(
+        assert metrics.department == department
+        assert metrics.total_operations == aggregates[0]
+        assert metrics.total_amount == aggregates[1]
+        assert metrics.average_per_operation == average
+        assert metrics.peak_activity_day == aggregates[2]
+        assert metrics.most_common_operation == aggregates[3]
+        gateway.fetch_report_department_metrics.assert_awaited_once_with(
             mock_connection,
             guild_id=guild_id,
-            department="國土安全部",
-            start_date=start_date,
-            end_date=end_date,
+            department=department,
+            start=start_date,
+            end=end_date,
         )
 
-        assert isinstance(metrics, DepartmentMetrics)
-        assert metrics.department == "國土安全部"
-        assert metrics.total_operations == 2
-        assert metrics.total_amount == 2  # Count of identity actions
-        assert metrics.average_per_operation == 1.0
-        assert metrics.peak_activity_day == "2024-01-15"
-        assert metrics.most_common_operation == "移除公民身分"  # First encountered
-
     @pytest.mark.asyncio
-    async def test_generate_department_metrics_central_bank(
-        self,
-        generator: StateCouncilReportGenerator,
-        mock_connection: AsyncMock,
-        sample_currency_records: list[CurrencyIssuance],
+    async def test_generate_department_metrics_no_records(
+        self, generator: StateCouncilReportGenerator, mock_connection: AsyncMock
     ) -> None:
-        """Test generating metrics for Central Bank department."""
-        guild_id = _snowflake()
-        start_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        end_date = datetime(2024, 1, 31, tzinfo=timezone.utc)
-
+        """Test metrics for a known department without records in the period."""
         gateway = cast(AsyncMock, generator._gateway)
-        gateway.fetch_currency_issuances.return_value = sample_currency_records
+        gateway.fetch_report_department_metrics.return_value = (0, 0, None, None)
 
         metrics = await generator.generate_department_metrics(
             mock_connection,
-            guild_id=guild_id,
-            department="中央銀行",
-            start_date=start_date,
-            end_date=end_date,
+            guild_id=_snowflake(),
+            department="內政部",
+            start_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            end_date=datetime(2024, 1, 31, tzinfo=timezone.utc),
         )
 
-        assert isinstance(metrics, DepartmentMetrics)
-        assert metrics.department == "中央銀行"
-        assert metrics.total_operations == 2
-        assert metrics.total_amount == 8000
-        assert metrics.average_per_operation == 4000.0
-        assert metrics.peak_activity_day == "2024-01-15"
-        assert metrics.most_common_operation == "貨幣發行"
+        assert metrics.total_operations == 0
+        assert metrics.average_per_operation == 0.0
+        assert metrics.peak_activity_day == "無數據"
+        assert metrics.most_common_operation == "無操作"
 
     @pytest.mark.asyncio
     async def test_generate_department_metrics_unknown_department(
@@ -393,6 +212,7 @@ class TestStateCouncilReportGenerator:
         assert metrics.average_per_operation == 0.0
         assert metrics.peak_activity_day == "無數據"
         assert metrics.most_common_operation == "無操作"
+        cast(AsyncMock, generator._gateway).fetch_report_department_metrics.assert_not_called()
 
     # --- Activity Report Tests ---
 
@@ -401,24 +221,15 @@ class TestStateCouncilReportGenerator:
         self,
         generator: StateCouncilReportGenerator,
         mock_connection: AsyncMock,
-        sample_welfare_records: list[WelfareDisbursement],
-        sample_tax_records: list[TaxRecord],
-        sample_identity_records: list[IdentityRecord],
-        sample_currency_records: list[CurrencyIssuance],
-        sample_transfer_records: list[InterdepartmentTransfer],
+        sample_activity_rows: list[tuple[str, str | None, int]],
     ) -> None:
         """Test generating comprehensive activity report."""
         guild_id = _snowflake()
         start_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
         end_date = datetime(2024, 1, 31, tzinfo=timezone.utc)
 
-        # Mock all gateway methods
         gateway = cast(AsyncMock, generator._gateway)
-        gateway.fetch_welfare_disbursements.return_value = sample_welfare_records
-        gateway.fetch_tax_records.return_value = sample_tax_records
-        gateway.fetch_identity_records.return_value = sample_identity_records
-        gateway.fetch_currency_issuances.return_value = sample_currency_records
-        gateway.fetch_interdepartment_transfers.return_value = sample_transfer_records
+        gateway.fetch_report_activity.return_value = sample_activity_rows
 
         report = await generator.generate_activity_report(
             mock_connection,
@@ -429,27 +240,53 @@ class TestStateCouncilReportGenerator:
 
         assert isinstance(report, ActivityReport)
         assert "2024-01-01 至 2024-01-31" in report.period
-        assert report.total_operations == 8  # 2 + 2 + 2 + 2 (all records)
-        assert report.unique_users > 0
-        assert len(report.operation_breakdown) > 0
-        assert len(report.daily_activity) > 0
-        assert len(report.top_performers) > 0
-
-        # Check operation breakdown
-        assert "福利發放" in report.operation_breakdown
-        assert "稅收徵收" in report.operation_breakdown
-        assert "身分管理" in report.operation_breakdown
-        assert "貨幣發行" in report.operation_breakdown
-        assert "部門轉帳" in report.operation_breakdown
+        assert report.total_operations == 8  # 2 + 2 + 2 + 2
+        assert report.unique_users == 6
+        assert report.operation_breakdown == {
+            "福利發放": 2,
+            "稅收徵收": 2,
+            "身分管理": 2,
+            "貨幣發行": 2,
+            "部門轉帳": 0,
+        }
+        assert list(report.daily_activity) == ["2024-01-01", "2024-01-15", "2024-01-20"]
+        assert report.daily_activity["2024-01-20"] == 4
+        assert report.top_performers == [
+            {"user_id": 123, "operations": 3},
+            {"user_id": 456, "operations": 2},
+            {"user_id": 789, "operations": 2},
+        ]
+        gateway.fetch_report_activity.assert_awaited_once_with(
+            mock_connection, guild_id=guild_id, start=start_date, end=end_date, top_limit=10
+        )
+
+    @pytest.mark.asyncio
+    async def test_generate_activity_report_empty(
+        self, generator: StateCouncilReportGenerator, mock_connection: AsyncMock
+    ) -> None:
+        """Test activity report when the period has no records."""
+        gateway = cast(AsyncMock, generator._gateway)
+        gateway.fetch_report_activity.return_value = [("unique_users", None, 0)]
+
+        report = await generator.generate_activity_report(
+            mock_connection,
+            guild_id=_snowflake(),
+            start_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            end_date=datetime(2024, 1, 31, tzinfo=timezone.utc),
+        )
+
+        assert report.total_operations == 0
+        assert report.unique_users == 0
+        assert set(report.operation_breakdown.values()) == {0}
+        assert report.daily_activity == {}
+        assert report.top_performers == []
 
     @pytest.mark.asyncio
     async def test_generate_monthly_summary(
         self,
         generator: StateCouncilReportGenerator,
         mock_connection: AsyncMock,
-        sample_welfare_records: list[WelfareDisbursement],
-        sample_tax_records: list[TaxRecord],
-        sample_currency_records: list[CurrencyIssuance],
+        sample_activity_rows: list[tuple[str, str | None, int]],
     ) -> None:
         """Test generating monthly summary."""
         guild_id = _snowflake()
@@ -458,16 +295,24 @@ class TestStateCouncilReportGenerator:
 
         # Mock gateway methods
         gateway = cast(AsyncMock, generator._gateway)
-        gateway.fetch_welfare_disbursements.return_value = sample_welfare_records
-        gateway.fetch_tax_records.return_value = sample_tax_records
-        gateway.fetch_identity_records.return_value = []
-        gateway.fetch_currency_issuances.return_value = sample_currency_records
-        gateway.fetch_interdepartment_transfers.return_value = []
-        gateway.fetch_government_accounts.return_value = [
-            AsyncMock(department="內政部", balance=5000),
-            AsyncMock(department="財政部", balance=3000),
-            AsyncMock(department="國土安全部", balance=2000),
-            AsyncMock(department="中央銀行", balance=10000),
+        gateway.fetch_report_financial_totals.return_value = (2500, 4000, 8000)
+        gateway.fetch_report_department_metrics.return_value = (2, 2500, "2024-01-20", "福利發放")
+        gateway.fetch_report_activity.return_value = sample_activity_rows
+        gateway.fetch_all_department_stats.return_value = [
+            DepartmentStats(
+                department=department,
+                balance=balance,
+                total_welfare_disbursed=0,
+                total_tax_collected=0,
+                identity_actions_count=0,
+                currency_issued=0,
+            )
+            for department, balance in (
+                ("內政部", 5000),
+                ("財政部", 3000),
+                ("國土安全部", 2000),
+                ("中央銀行", 10000),
+            )
         ]
 
         summary = await generator.generate_monthly_summary(
@@ -496,11 +341,21 @@ class TestStateCouncilReportGenerator:
         assert "中央銀行" in dept_metrics
 
         # Check account balances
-        balances = summary["account_balances"]
-        assert "內政部" in balances
-        assert "財政部" in balances
-        assert "國土安全部" in balances
-        assert "中央銀行" in balances
+        assert summary["account_balances"] == {
+            "內政部": 5000,
+            "財政部": 3000,
+            "國土安全部": 2000,
+            "中央銀行": 10000,
+        }
+        gateway.fetch_all_department_stats.assert_awaited_once_with(
+            mock_connection, guild_id=guild_id, month_period="2024-01"
+        )
+
+        # 月份邊界：1 月整月（含最後一微秒）
+        start = gateway.fetch_report_financial_totals.await_args.kwargs["start"]
+        end = gateway.fetch_report_financial_totals.await_args.kwargs["end"]
+        assert start == datetime(2024, 1, 1, tzinfo=timezone.utc)
+        assert end == datetime(2024, 1, 31, 23, 59, 59, 999999, tzinfo=timezone.utc)
 
     # --- Report Formatting Tests ---
 
@@ -627,14 +482,14 @@ class TestStateCouncilReportGenerator:
 
     # --- Helper Method Tests ---
 
-    def test_calculate_metrics_empty_operations(
-        self, generator: StateCouncilReportGenerator
-    ) -> None:
-        """Test calculating metrics with empty operations."""
-        metrics = generator._calculate_metrics(
+    def test_build_metrics_empty_operations(self, generator: StateCouncilReportGenerator) -> None:
+        """Test building metrics without operations."""
+        metrics = generator._build_metrics(
             department="測試部門",
-            operations=[],
+            total_operations=0,
             total_amount=0,
+            peak_day=None,
+            most_common=None,
         )
 
         assert metrics.department == "測試部門"
@@ -644,18 +499,14 @@ class TestStateCouncilReportGenerator:
         assert metrics.peak_activity_day == "無數據"
         assert metrics.most_common_operation == "無操作"
 
-    def test_calculate_metrics_single_operation(
-        self, generator: StateCouncilReportGenerator
-    ) -> None:
-        """Test calculating metrics with single operation."""
-        operations: list[tuple[str, int, datetime, int | None]] = [
-            ("測試操作", 1000, datetime(2024, 1, 15, tzinfo=timezone.utc), 12345)
-        ]
-
-        metrics = generator._calculate_metrics(
+    def test_build_metrics_single_operation(self, generator: StateCouncilReportGenerator) -> None:
+        """Test building metrics with a single operation."""
+        metrics = generator._build_metrics(
             department="測試部門",
-            operations=operations,
+            total_operations=1,
             total_amount=1000,
+            peak_day="2024-01-15",
+            most_common="測試操作",
         )
 
         assert metrics.department == "測試部門"
@@ -17,11 +17,13 @@ from src.bot.services.state_council_service import (
     StateCouncilNotConfiguredError,
     StateCouncilService,
     StateCouncilSummary,
+    invalidate_council_summary,
 )
 from src.bot.services.transfer_service import InsufficientBalanceError
 from src.db.gateway.state_council_governance import (
     CurrencyIssuance,
     DepartmentConfig,
+    DepartmentStats,
     GovernmentAccount,
     InterdepartmentTransfer,
     StateCouncilConfig,
@@ -418,7 +420,7 @@ class TestStateCouncilService:
             # Use spec to avoid MagicMock having is_err attribute (which confuses Result detection)
             balance_record = MagicMock(spec=["balance"])
             balance_record.balance = sample_account.balance
-            econ.fetch_balance_snapshot.return_value = balance_record
+            econ.fetch_balance.return_value = balance_record
             service._economy = econ
 
             balance = await service.get_department_balance(
@@ -443,7 +445,7 @@ class TestStateCouncilService:
 
             # Mock economy service to raise exception (fallback to governance record, which doesn't exist)
             econ = AsyncMock()
-            econ.fetch_balance_snapshot.side_effect = Exception("Account not found")
+            econ.fetch_balance.side_effect = Exception("Account not found")
             service._economy = econ
 
             balance = await service.get_department_balance(
@@ -572,7 +574,7 @@ class TestStateCouncilService:
             econ = AsyncMock()
             balance_record = MagicMock(spec=["balance"])
             balance_record.balance = 100
-            econ.fetch_balance_snapshot.return_value = balance_record
+            econ.fetch_balance.return_value = balance_record
             service._economy = econ
 
             # 注入可觀察的 adjustment 物件
@@ -767,7 +769,7 @@ class TestStateCouncilService:
             econ = AsyncMock()
             balance_record = MagicMock(spec=["balance"])
             balance_record.balance = 5000
-            econ.fetch_balance_snapshot.return_value = balance_record
+            econ.fetch_balance.return_value = balance_record
             service._economy = econ
 
             with patch.object(service, "check_department_permission", return_value=True):
@@ -854,7 +856,7 @@ class TestStateCouncilService:
             econ = AsyncMock()
             balance_record = MagicMock(spec=["balance"])
             balance_record.balance = 200
-            econ.fetch_balance_snapshot.return_value = balance_record
+            econ.fetch_balance.return_value = balance_record
             service._economy = econ
 
             # 注入調整器以觀察被呼叫
@@ -1070,12 +1072,18 @@ class TestStateCouncilService:
             # Setup mocks
             gw = cast(AsyncMock, service._gateway)
             gw.fetch_state_council_config.return_value = sample_config
-            gw.fetch_government_accounts.return_value = accounts
+            gw.fetch_all_department_stats.return_value = [
+                DepartmentStats(
+                    department=acc.department,
+                    balance=acc.balance,
+                    total_welfare_disbursed=0,
+                    total_tax_collected=0,
+                    identity_actions_count=0,
+                    currency_issued=0,
+                )
+                for acc in accounts
+            ]
             gw.fetch_interdepartment_transfers.return_value = []
-            gw.fetch_welfare_disbursements.return_value = []
-            gw.fetch_tax_records.return_value = []
-            gw.fetch_identity_records.return_value = []
-            gw.fetch_currency_issuances.return_value = []
 
             summary = await service.get_council_summary(guild_id=guild_id)
 
@@ -1086,6 +1094,28 @@ class TestStateCouncilService:
             assert len(summary.department_stats) == 2
             assert "內政部" in summary.department_stats
             assert "財政部" in summary.department_stats
+            gw.fetch_all_department_stats.assert_awaited_once()
+            assert gw.fetch_all_department_stats.await_args.kwargs["month_period"] == datetime.now(
+                tz=timezone.utc
+            ).strftime("%Y-%m")
+            gw.fetch_welfare_disbursements.assert_not_called()
+
+            # 快照期間內的再次讀取不查詢資料庫；失效後重新載入
+            await service.get_council_summary(guild_id=guild_id)
+            gw.fetch_all_department_stats.assert_awaited_once()
+            invalidate_council_summary(guild_id)
+            await service.get_council_summary(guild_id=guild_id)
+            assert gw.fetch_all_department_stats.await_count == 2
+
+            # 另一個 service 實例（各自的 gateway）不會讀到本實例的快照
+            other_gw = AsyncMock(spec=StateCouncilGovernanceGateway)
+            other_gw.fetch_state_council_config.return_value = sample_config
+            other_gw.fetch_all_department_stats.return_value = []
+            other_gw.fetch_interdepartment_transfers.return_value = []
+            other = StateCouncilService(gateway=other_gw, transfer_service=AsyncMock())
+            other_summary = await other.get_council_summary(guild_id=guild_id)
+            assert other_summary.total_balance == 0
+            other_gw.fetch_all_department_stats.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_get_council_summary_not_configured(self, service: StateCouncilService) -> None:
@@ -1241,7 +1271,7 @@ class TestStateCouncilService:
                 rec.balance = bal
                 return rec
 
-            econ.fetch_balance_snapshot.side_effect = [
+            econ.fetch_balance.side_effect = [
                 make_balance_record(1000),  # 內政部（已存在，檢查餘額同步）
                 make_balance_record(2500),  # 財政部（缺失，建立時使用）
                 make_balance_record(3000),  # 國土安全部（已存在，檢查餘額同步）
@@ -1328,7 +1358,7 @@ class TestStateCouncilService:
             econ = AsyncMock()
             balance_record = MagicMock(spec=["balance"])
             balance_record.balance = 1500  # 經濟系統餘額
-            econ.fetch_balance_snapshot.return_value = balance_record
+            econ.fetch_balance.return_value = balance_record
             service._economy = econ
 
             await service.ensure_government_accounts(guild_id=guild_id, admin_id=admin_id)
@@ -1383,7 +1413,7 @@ class TestStateCouncilService:
 
             # Mock 經濟系統查詢失敗
             econ = AsyncMock()
-            econ.fetch_balance_snapshot.side_effect = Exception("Database error")
+            econ.fetch_balance.side_effect = Exception("Database error")
             service._economy = econ
 
             # Mock upsert_government_account 回傳值
@@ -73,7 +73,7 @@ class TestStateCouncilServiceExtended:
             gw.fetch_government_accounts.return_value = accounts
 
             econ = AsyncMock()
-            econ.fetch_balance_snapshot.return_value = MagicMock(spec=["balance"], balance=500)
+            econ.fetch_balance.return_value = MagicMock(spec=["balance"], balance=500)
             service._economy = econ
 
             adj_service = AsyncMock()
@@ -338,7 +338,7 @@ class TestSupremeAssemblyGovernanceGateway:
         proposal_id = UUID(int=123)
         voter_id = _snowflake()
         choice = "approve"
-        mock_connection.fetchval.return_value = None  # vote doesn't exist
+        mock_connection.fetchval.return_value = True  # vote recorded
 
         await gateway.upsert_vote(
             mock_connection,
@@ -347,7 +347,8 @@ class TestSupremeAssemblyGovernanceGateway:
             choice=choice,
         )
 
-        mock_connection.execute.assert_called_once()
+        mock_connection.fetchval.assert_called_once()
+        assert "fn_record_supreme_assembly_vote" in mock_connection.fetchval.call_args[0][0]
 
     @pytest.mark.asyncio
     async def test_upsert_vote_already_exists(
@@ -356,7 +357,7 @@ class TestSupremeAssemblyGovernanceGateway:
         """Test vote insertion fails when vote already exists."""
         proposal_id = UUID(int=123)
         voter_id = _snowflake()
-        mock_connection.fetchval.return_value = 1  # vote exists
+        mock_connection.fetchval.return_value = False  # vote exists
 
         with pytest.raises(RuntimeError, match="already exists"):
             await gateway.upsert_vote(
@@ -366,6 +367,57 @@ class TestSupremeAssemblyGovernanceGateway:
                 choice="approve",
             )
 
+    @pytest.mark.asyncio
+    async def test_cast_vote_duplicate(
+        self, gateway: SupremeAssemblyGovernanceGateway, mock_connection: AsyncMock
+    ) -> None:
+        """Test single round-trip vote returning the duplicate outcome."""
+        proposal_id = UUID(int=123)
+        now = datetime.now(timezone.utc)
+        mock_connection.fetchrow.return_value = {
+            "outcome": "duplicate",
+            "proposal_id": proposal_id,
+            "guild_id": 1,
+            "proposer_id": 2,
+            "title": "t",
+            "description": None,
+            "snapshot_n": 3,
+            "threshold_t": 2,
+            "deadline_at": now,
+            "status": "進行中",
+            "reminder_sent": False,
+            "created_at": now,
+            "updated_at": now,
+            "approve": 1,
+            "reject": 0,
+            "abstain": 0,
+            "total_voted": 1,
+        }
+
+        outcome, proposal, tally = await gateway.cast_vote(
+            mock_connection, proposal_id=proposal_id, voter_id=_snowflake(), choice="reject"
+        )
+
+        assert outcome == "duplicate"
+        assert proposal is not None and proposal.status == "進行中"
+        assert tally.approve == 1
+        assert "fn_cast_supreme_assembly_vote" in mock_connection.fetchrow.call_args[0][0]
+
+    @pytest.mark.asyncio
+    async def test_cast_vote_not_found(
+        self, gateway: SupremeAssemblyGovernanceGateway, mock_connection: AsyncMock
+    ) -> None:
+        """Test single round-trip vote on a missing proposal."""
+        mock_connection.fetchrow.return_value = {"outcome": "not_found", "proposal_id": None}
+
+        outcome, proposal, tally = await gateway.cast_vote(
+            mock_connection, proposal_id=UUID(int=1), voter_id=_snowflake(), choice="approve"
+        )
+
+        assert outcome == "not_found"
+        assert proposal is None
+        assert tally.total_voted == 0
+
     @pytest.mark.asyncio
     async def test_fetch_tally(
         self, gateway: SupremeAssemblyGovernanceGateway, mock_connection: AsyncMock
@@ -201,6 +201,36 @@ class _FakeGateway(SupremeAssemblyGovernanceGateway):
             raise RuntimeError("Vote already exists and cannot be changed")
         self._votes.setdefault(proposal_id, {})[voter_id] = choice
 
+    async def cast_vote(
+        self,
+        conn: Any,
+        *,
+        proposal_id: UUID,
+        voter_id: int,
+        choice: str,
+    ) -> tuple[str, Proposal | None, Tally]:
+        # 對應 governance.fn_cast_supreme_assembly_vote 的判定順序
+        p = self._proposals.get(proposal_id)
+        if p is None:
+            return "not_found", None, Tally(approve=0, reject=0, abstain=0, total_voted=0)
+        outcome = "voted"
+        if p.status != "進行中":
+            outcome = "closed"
+        elif voter_id not in self._snapshot.get(proposal_id, []):
+            outcome = "not_in_snapshot"
+        elif voter_id in self._votes.get(proposal_id, {}):
+            outcome = "duplicate"
+        else:
+            await self.upsert_vote(conn, proposal_id=proposal_id, voter_id=voter_id, choice=choice)
+        tally = await self.fetch_tally(conn, proposal_id=proposal_id)
+        if outcome == "voted":
+            remaining = max(0, p.snapshot_n - tally.total_voted)
+            if tally.approve >= p.threshold_t:
+                await self.mark_status(conn, proposal_id=proposal_id, status="已通過")
+            elif tally.approve + remaining < p.threshold_t:
+                await self.mark_status(conn, proposal_id=proposal_id, status="已否決")
+        return outcome, self._proposals[proposal_id], tally
+
     async def fetch_tally(self, conn: Any, *, proposal_id: UUID) -> Tally:
         votes = self._votes.get(proposal_id, {})
         counts = {"approve": 0, "reject": 0, "abstain": 0}
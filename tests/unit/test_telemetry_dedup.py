@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import pytest
+
+from src.infra.telemetry.dedup import BoundedDedupCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.unit
+def test_seen_records_then_hits() -> None:
+    cache = BoundedDedupCache(3)
+
+    assert cache.seen("a") is False
+    assert cache.seen("a") is True
+    assert "a" in cache
+    assert cache.stats() == {"size": 1, "maxsize": 3, "hits": 1, "misses": 1, "evictions": 0}
+
+
+@pytest.mark.unit
+def test_evicts_least_recently_seen() -> None:
+    cache = BoundedDedupCache(2)
+    cache.seen("a")
+    cache.seen("b")
+    # 重新出現會更新新近度，因此被淘汰的是 b
+    cache.seen("a")
+    cache.seen("c")
+
+    assert len(cache) == 2
+    assert "a" in cache
+    assert "b" not in cache
+    assert cache.evictions == 1
+
+
+@pytest.mark.unit
+def test_ttl_window_expires_entries() -> None:
+    clock = _Clock()
+    cache = BoundedDedupCache(10, ttl_seconds=5, clock=clock)
+    cache.seen("a")
+
+    clock.now = 4.9
+    assert "a" in cache
+
+    clock.now = 10.0
+    assert "a" not in cache
+    assert cache.seen("a") is False
+    # 寫入時一併清除過期項目
+    cache.add("b")
+    clock.now = 16.0
+    cache.add("c")
+    assert len(cache) == 1
+
+
+@pytest.mark.unit
+def test_add_does_not_count() -> None:
+    cache = BoundedDedupCache(2)
+    cache.add("a")
+
+    assert "a" in cache
+    assert cache.hits == 0
+    assert cache.misses == 0
+
+
+@pytest.mark.unit
+def test_rejects_non_positive_size() -> None:
+    with pytest.raises(ValueError):
+        BoundedDedupCache(0)
@@ -1,15 +1,20 @@
 from __future__ import annotations
 
+import asyncio
 import json
-from collections import deque
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import UUID
 
 import pytest
 
+from src.infra.result import Ok
+from src.infra.telemetry.dedup import BoundedDedupCache
 from src.infra.telemetry.listener import (
     TelemetryListener,
+    _decode_payload,
     _maybe_emit_state_council_event,
+    _payload_priority,
 )
 
 # --- Fixtures and Mocks ---
@@ -85,10 +90,8 @@ class TestTelemetryListenerBasics:
         assert listener._channel == "test_channel"
         assert listener._task is None
         assert listener._stop_event is None
-        assert isinstance(listener._seen_tx, set)
-        assert isinstance(listener._tx_order, deque)
-        assert isinstance(listener._seen_tokens, set)
-        assert isinstance(listener._token_order, deque)
+        assert isinstance(listener._seen_tx, BoundedDedupCache)
+        assert isinstance(listener._seen_tokens, BoundedDedupCache)
 
     def test_initialization_with_custom_handler(self) -> None:
         """測試使用自定義處理器初始化"""
@@ -105,14 +108,12 @@ class TestTelemetryListenerBasics:
     async def test_start_and_stop(self, telemetry_listener: TelemetryListener) -> None:
         """測試啟動和停止"""
         # Mock the database operations
-        with patch("src.infra.telemetry.listener.db_pool.init_pool") as mock_init_pool:
-            mock_pool = MagicMock()
+        with patch("src.infra.telemetry.listener.db_pool.connect_listener") as mock_connect:
             mock_conn = MagicMock()
-            mock_pool.acquire.return_value.__aenter__.return_value = mock_conn
-            mock_pool.acquire.return_value.__aexit__ = AsyncMock()
             mock_conn.add_listener = AsyncMock()
             mock_conn.remove_listener = AsyncMock()
-            mock_init_pool.return_value = mock_pool
+            mock_conn.close = AsyncMock()
+            mock_connect.return_value = mock_conn
 
             # Start listener
             await telemetry_listener.start()
@@ -132,14 +133,12 @@ class TestTelemetryListenerBasics:
     @pytest.mark.asyncio
     async def test_multiple_start_calls(self, telemetry_listener: TelemetryListener) -> None:
         """測試多次調用 start"""
-        with patch("src.infra.telemetry.listener.db_pool.init_pool") as mock_init_pool:
-            mock_pool = MagicMock()
+        with patch("src.infra.telemetry.listener.db_pool.connect_listener") as mock_connect:
             mock_conn = MagicMock()
-            mock_pool.acquire.return_value.__aenter__.return_value = mock_conn
-            mock_pool.acquire.return_value.__aexit__ = AsyncMock()
             mock_conn.add_listener = AsyncMock()
             mock_conn.remove_listener = AsyncMock()
-            mock_init_pool.return_value = mock_pool
+            mock_conn.close = AsyncMock()
+            mock_connect.return_value = mock_conn
 
             # Start listener twice
             await telemetry_listener.start()
@@ -244,6 +243,71 @@ class TestDefaultHandler:
         await listener._default_handler(json.dumps(payload))
 
 
+class TestCompactBatchPayload:
+    """測試精簡 NOTIFY 模式的批次 payload"""
+
+    @pytest.mark.asyncio
+    async def test_batch_payload_dispatches_each_event_in_order(
+        self, mock_transfer_coordinator: MagicMock
+    ) -> None:
+        """economy_events_batch 內的事件應依序交由既有處理流程"""
+        listener = TelemetryListener(transfer_coordinator=mock_transfer_coordinator)
+        transfer_id = "12345678-1234-5678-1234-567812345678"
+
+        payload = {
+            "event_type": "economy_events_batch",
+            "events": [
+                {
+                    "event_type": "transfer_check_result",
+                    "transfer_id": transfer_id,
+                    "check_type": check_type,
+                    "result": 1,
+                }
+                for check_type in ("balance", "cooldown", "daily_limit")
+            ]
+            + [{"event_type": "transfer_check_approved", "transfer_id": transfer_id}],
+        }
+
+        await listener._default_handler(json.dumps(payload))
+
+        checked = [
+            call.kwargs["check_type"]
+            for call in mock_transfer_coordinator.handle_check_result.await_args_list
+        ]
+        assert checked == ["balance", "cooldown", "daily_limit"]
+        mock_transfer_coordinator.handle_check_approved.assert_awaited_once_with(
+            transfer_id=UUID(transfer_id)
+        )
+
+    @pytest.mark.asyncio
+    async def test_single_event_payload_still_supported(
+        self, mock_transfer_coordinator: MagicMock
+    ) -> None:
+        """未啟用精簡模式時的逐筆 payload 行為不變"""
+        listener = TelemetryListener(transfer_coordinator=mock_transfer_coordinator)
+        transfer_id = "12345678-1234-5678-1234-567812345678"
+
+        await listener._default_handler(
+            json.dumps({"event_type": "transfer_check_approved", "transfer_id": transfer_id})
+        )
+
+        mock_transfer_coordinator.handle_check_approved.assert_awaited_once_with(
+            transfer_id=UUID(transfer_id)
+        )
+
+    @pytest.mark.asyncio
+    async def test_batch_payload_invalid_events_ignored(self) -> None:
+        """events 欄位格式錯誤時僅記錄警告"""
+        listener = TelemetryListener()
+
+        with patch("src.infra.telemetry.listener.LOGGER") as mock_logger:
+            await listener._default_handler(
+                json.dumps({"event_type": "economy_events_batch", "events": "oops"})
+            )
+
+            mock_logger.warning.assert_called_once()
+
+
 class TestTransactionSuccess:
     """測試交易成功事件處理"""
 
@@ -412,18 +476,70 @@ class TestNotificationMethods:
         """測試政府帳戶不發送 DM"""
         listener = TelemetryListener(discord_client=mock_discord_client)
 
-        # Government account (ID >= 9,000,000,000,000,000)
         parsed = {
-            "initiator_id": 12345,
+            "guild_id": 12345,
+            "initiator_id": 67890,
             "target_id": 9500000000000000,  # 政府部門帳戶
             "amount": 1000,
         }
 
-        await listener._notify_target_dm(parsed)
+        with patch(
+            "src.infra.telemetry.listener._government_account_departments",
+            AsyncMock(return_value={9500000000000000: "財政部"}),
+        ):
+            await listener._notify_target_dm(parsed)
 
         # Should not call get_user for government accounts
         mock_discord_client.get_user.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_notify_target_dm_real_snowflake_not_treated_as_government(
+        self, mock_discord_client: MagicMock
+    ) -> None:
+        """真實 Discord ID（約 1e18）不在政府帳戶集合內時照常發送 DM"""
+        listener = TelemetryListener(discord_client=mock_discord_client)
+        user = MagicMock()
+        user.send = AsyncMock()
+        mock_discord_client.get_user.return_value = user
+        snowflake = 1_234_567_890_123_456_789
+
+        parsed = {"guild_id": 12345, "initiator_id": 67890, "target_id": snowflake}
+
+        with patch(
+            "src.infra.telemetry.listener._government_account_departments",
+            AsyncMock(return_value={9500000000000000: "財政部"}),
+        ):
+            await listener._notify_target_dm(parsed)
+
+        mock_discord_client.get_user.assert_called_once_with(snowflake)
+        user.send.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_notify_target_dm_skips_derived_institution_accounts(
+        self, mock_discord_client: MagicMock
+    ) -> None:
+        """理事會、國務院主帳戶與公司帳戶未標記為政府帳戶，仍不查詢 Discord 用戶"""
+        listener = TelemetryListener(discord_client=mock_discord_client)
+        guild_id = 1_234_567_890_123_456_789
+        targets = [
+            9_000_000_000_000_000 + guild_id,  # 常任理事會
+            9_100_000_000_000_000 + guild_id,  # 國務院主帳戶
+            9_500_000_000_000_000 + guild_id + 200,  # 最高人民會議
+            9_600_000_000_000_000 + 42,  # 公司
+        ]
+
+        with patch(
+            "src.infra.telemetry.listener._government_account_departments",
+            AsyncMock(return_value={}),
+        ):
+            for target_id in targets:
+                await listener._notify_target_dm(
+                    {"guild_id": guild_id, "initiator_id": 67890, "target_id": target_id}
+                )
+
+        mock_discord_client.get_user.assert_not_called()
+        mock_discord_client.fetch_user.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_notify_target_dm_user_not_found(self, mock_discord_client: MagicMock) -> None:
         """測試找不到用戶時的 DM 通知"""
@@ -476,6 +592,7 @@ class TestNotificationMethods:
         listener = TelemetryListener(discord_client=mock_discord_client)
 
         parsed = {
+            "guild_id": 111,
             "initiator_id": 12345,
             "target_id": 67890,
             "amount": 1000,
@@ -491,14 +608,19 @@ class TestNotificationMethods:
 
             # Mock economy gateway
             with patch("src.infra.telemetry.listener.EconomyQueryGateway") as mock_economy:
-                mock_economy.return_value.fetch_balance_snapshot = AsyncMock(
-                    return_value=MagicMock(balance=5000)
+                mock_economy.return_value.fetch_balance = AsyncMock(
+                    return_value=Ok(MagicMock(balance=5000))
                 )
 
                 await listener._notify_initiator_server(parsed)
 
                 # Should send HTTP request
                 mock_discord_client.http.request.assert_called_once()
+                mock_economy.return_value.fetch_balance.assert_awaited_once_with(
+                    mock_conn, guild_id=111, member_id=12345
+                )
+                content = mock_discord_client.http.request.call_args.kwargs["json"]["content"]
+                assert "目前的餘額" in content
 
     @pytest.mark.asyncio
     async def test_notify_initiator_server_no_token(self, mock_discord_client: MagicMock) -> None:
@@ -665,8 +787,10 @@ class TestTxAndTokenTracking:
             listener._is_tx_seen(f"tx_{i}")
 
         # Should not grow beyond max size
-        assert len(listener._seen_tx) <= max_size
-        assert len(listener._tx_order) <= max_size
+        assert len(listener._seen_tx) == max_size
+        # Oldest entries are evicted, newest are kept
+        assert "tx_0" not in listener._seen_tx
+        assert f"tx_{max_size + 99}" in listener._seen_tx
 
     def test_is_token_seen_new_token(self) -> None:
         """測試新 token"""
@@ -693,8 +817,8 @@ class TestTxAndTokenTracking:
             listener._is_token_seen(f"token_{i}")
 
         # Should not grow beyond max size
-        assert len(listener._seen_tokens) <= max_size
-        assert len(listener._token_order) <= max_size
+        assert len(listener._seen_tokens) == max_size
+        assert listener.dedup_stats()["interaction_tokens"]["evictions"] == 100
 
 
 class TestMaybeEmitStateCouncilEvent:
@@ -814,21 +938,69 @@ class TestMaybeEmitStateCouncilEvent:
                     # Should log warning
                     mock_logger.warning.assert_called()
 
+    @pytest.mark.asyncio
+    async def test_emit_event_reuses_cached_government_accounts(self) -> None:
+        """政府帳戶清單經設定快取讀取；事件本身不回寫治理層餘額"""
+        mock_pool = MagicMock()
+        mock_pool.acquire.return_value.__aenter__.return_value = MagicMock()
+        mock_account = MagicMock(account_id=99999, department="財政部")
+
+        with (
+            patch("src.infra.telemetry.listener.db_pool.get_pool", return_value=mock_pool),
+            patch("src.infra.telemetry.listener.StateCouncilGovernanceGateway") as mock_governance,
+            patch("src.infra.telemetry.listener.publish_state_council_event") as mock_publish,
+        ):
+            mock_governance.return_value.fetch_government_accounts = AsyncMock(
+                return_value=[mock_account]
+            )
+            mock_governance.return_value.update_account_balance = AsyncMock()
+
+            await _maybe_emit_state_council_event(
+                {"guild_id": 12345, "initiator_id": 99999, "target_id": 67890}, cause="transfer"
+            )
+            mock_pool.acquire.reset_mock()
+            await _maybe_emit_state_council_event(
+                {"guild_id": 12345, "initiator_id": 67890, "target_id": 99999}, cause="transfer"
+            )
+            await _maybe_emit_state_council_event(
+                {"guild_id": 12345, "initiator_id": 11111, "target_id": 67890}, cause="transfer"
+            )
+
+            mock_governance.return_value.fetch_government_accounts.assert_awaited_once()
+            mock_governance.return_value.update_account_balance.assert_not_called()
+            mock_pool.acquire.assert_not_called()
+            assert mock_publish.call_count == 2
+            assert mock_publish.call_args.args[0].departments == ("財政部",)
+
 
 class TestErrorHandler:
     """測試錯誤處理"""
 
     @pytest.mark.asyncio
     async def test_run_with_exception(self) -> None:
-        """測試運行時發生異常"""
+        """測試連線失敗時以退避重試，停止後結束"""
         listener = TelemetryListener()
-
-        with patch(
-            "src.infra.telemetry.listener.db_pool.init_pool",
-            side_effect=RuntimeError("Database error"),
+        listener._stop_event = asyncio.Event()
+        attempts = 0
+
+        async def failing_connect() -> None:
+            nonlocal attempts
+            attempts += 1
+            if attempts >= 2:
+                assert listener._stop_event is not None
+                listener._stop_event.set()
+            raise RuntimeError("Database error")
+
+        with (
+            patch(
+                "src.infra.telemetry.listener.db_pool.connect_listener",
+                side_effect=failing_connect,
+            ),
+            patch("src.infra.telemetry.listener._RECONNECT_BASE_DELAY", 0.01),
         ):
-            with pytest.raises(RuntimeError):
-                await listener._run()
+            await asyncio.wait_for(listener._run(), timeout=5)
+
+        assert attempts == 2
 
     @pytest.mark.asyncio
     async def test_handler_exception(self) -> None:
@@ -860,3 +1032,197 @@ class TestErrorHandler:
         # Should not raise exception
         await listener._notify_target_dm(parsed)
         await listener._notify_initiator_dm(parsed)
+
+
+class TestReconnectAndReplay:
+    """測試 LISTEN 連線斷線重連與補播"""
+
+    @staticmethod
+    def _make_connection() -> MagicMock:
+        conn = MagicMock()
+        conn.add_listener = AsyncMock()
+        conn.remove_listener = AsyncMock()
+        conn.close = AsyncMock()
+        conn.add_termination_listener = MagicMock()
+        return conn
+
+    @pytest.mark.asyncio
+    async def test_reconnects_after_failed_health_check_and_replays(self) -> None:
+        """測試健康檢查失敗時重新連線，且只在重連後補播"""
+        listener = TelemetryListener()
+        listener._stop_event = asyncio.Event()
+
+        broken = self._make_connection()
+        broken.fetchval = AsyncMock(side_effect=ConnectionError("connection reset"))
+        healthy = self._make_connection()
+
+        async def replay(connection: MagicMock) -> None:
+            assert connection is healthy
+            assert listener._stop_event is not None
+            listener._stop_event.set()
+
+        replay_mock = AsyncMock(side_effect=replay)
+
+        with (
+            patch(
+                "src.infra.telemetry.listener.db_pool.connect_listener",
+                AsyncMock(side_effect=[broken, healthy]),
+            ),
+            patch("src.infra.telemetry.listener._HEALTH_CHECK_SECONDS", 0.01),
+            patch("src.infra.telemetry.listener._RECONNECT_BASE_DELAY", 0.01),
+            patch.object(listener, "_replay_gap", replay_mock),
+        ):
+            await asyncio.wait_for(listener._run(), timeout=5)
+
+        replay_mock.assert_awaited_once_with(healthy)
+        broken.close.assert_awaited()
+        # 經濟事件與治理設定兩個頻道皆需取消 LISTEN
+        assert healthy.remove_listener.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_replay_gap_skips_seen_and_requeues_approved(
+        self, mock_transfer_coordinator: MagicMock
+    ) -> None:
+        """測試補播略過已處理交易，並重新派送已核准但未執行的轉帳"""
+        listener = TelemetryListener(transfer_coordinator=mock_transfer_coordinator)
+        listener._last_healthy_at = datetime.now(timezone.utc)
+
+        seen_id = UUID("00000000-0000-0000-0000-000000000001")
+        missed_id = UUID("00000000-0000-0000-0000-000000000002")
+        listener._is_tx_seen(str(seen_id))
+        missed_payload = {"event_type": "transaction_success", "transaction_id": str(missed_id)}
+        rows = [
+            {
+                "transaction_id": seen_id,
+                "created_at": datetime.now(timezone.utc),
+                "payload": {"event_type": "transaction_success"},
+            },
+            {
+                "transaction_id": missed_id,
+                "created_at": datetime.now(timezone.utc),
+                "payload": json.dumps(missed_payload),
+            },
+        ]
+        listener._economy_gateway.fetch_events_since = AsyncMock(  # type: ignore[method-assign]
+            return_value=Ok(rows)
+        )
+        approved_id = UUID("00000000-0000-0000-0000-000000000003")
+        listener._pending_gateway.list_approved = AsyncMock(  # type: ignore[method-assign]
+            return_value=[approved_id]
+        )
+
+        with patch.object(listener, "_handle_event", AsyncMock()) as handle_event:
+            await listener._replay_gap(MagicMock())
+
+        handle_event.assert_awaited_once_with(missed_payload)
+        mock_transfer_coordinator.handle_check_approved.assert_awaited_once_with(
+            transfer_id=approved_id
+        )
+
+
+class TestDispatchQueue:
+    """測試有界分派佇列（優先序、丟棄策略與背壓指標）"""
+
+    CHECK_PAYLOAD = json.dumps(
+        {
+            "event_type": "transfer_check_approved",
+            "transfer_id": "00000000-0000-0000-0000-000000000001",
+        }
+    )
+    SUCCESS_PAYLOAD = json.dumps({"event_type": "transaction_success", "guild_id": 1})
+
+    def test_payload_priority(self) -> None:
+        """測試事件分類：轉帳檢查優先於交易結果，批次取最高優先序"""
+        batch = {
+            "event_type": "economy_events_batch",
+            "events": [
+                {"event_type": "transaction_success"},
+                {"event_type": "transfer_check_result"},
+            ],
+        }
+        check = json.loads(self.CHECK_PAYLOAD)
+        success = json.loads(self.SUCCESS_PAYLOAD)
+        assert _payload_priority(check) < _payload_priority(success)
+        assert _payload_priority(batch) == _payload_priority(check)
+        assert _payload_priority(_decode_payload("not json")) > _payload_priority(success)
+
+    @pytest.mark.asyncio
+    async def test_payload_is_decoded_once(self) -> None:
+        """測試每則通知只解析一次，入列的解析結果直接交給預設處理器"""
+        listener = TelemetryListener(dispatch_workers=1, dispatch_queue_size=10)
+        listener._queue = asyncio.PriorityQueue(maxsize=10)
+
+        with patch("src.infra.telemetry.listener.json.loads", side_effect=json.loads) as mock_loads:
+            await listener._dispatch(None, 1, "economy_events", self.SUCCESS_PAYLOAD)
+            _priority, _seq, _at, payload, parsed = listener._queue.get_nowait()
+            with patch.object(listener, "_handle_event", AsyncMock()) as handle_event:
+                await listener._process(payload, parsed)
+
+        assert mock_loads.call_count == 1
+        handle_event.assert_awaited_once_with(json.loads(self.SUCCESS_PAYLOAD))
+
+    @pytest.mark.asyncio
+    async def test_critical_events_jump_the_queue(self) -> None:
+        """測試轉帳檢查事件排在先入列的交易結果之前"""
+        listener = TelemetryListener(dispatch_workers=1, dispatch_queue_size=10)
+        listener._queue = asyncio.PriorityQueue(maxsize=10)
+
+        await listener._dispatch(None, 1, "economy_events", self.SUCCESS_PAYLOAD)
+        await listener._dispatch(None, 1, "economy_events", self.CHECK_PAYLOAD)
+
+        first = listener._queue.get_nowait()
+        assert first[3] == self.CHECK_PAYLOAD
+
+    @pytest.mark.asyncio
+    async def test_full_queue_sheds_non_critical_events(self) -> None:
+        """測試佇列滿時丟棄非關鍵事件，關鍵事件則等待空位"""
+        listener = TelemetryListener(dispatch_workers=1, dispatch_queue_size=1)
+        listener._queue = asyncio.PriorityQueue(maxsize=1)
+
+        await listener._dispatch(None, 1, "economy_events", self.SUCCESS_PAYLOAD)
+        await listener._dispatch(None, 1, "economy_events", self.SUCCESS_PAYLOAD)
+        assert listener.dispatch_stats()["dropped"] == 1
+
+        blocked = asyncio.create_task(
+            listener._dispatch(None, 1, "economy_events", self.CHECK_PAYLOAD)
+        )
+        await asyncio.sleep(0)
+        assert not blocked.done()
+
+        listener._queue.get_nowait()
+        listener._queue.task_done()
+        await asyncio.wait_for(blocked, timeout=1)
+        assert listener.dispatch_stats()["dropped"] == 1
+        assert listener._queue.get_nowait()[3] == self.CHECK_PAYLOAD
+
+    @pytest.mark.asyncio
+    async def test_workers_process_events_and_record_metrics(self) -> None:
+        """測試 worker 處理入列事件並記錄等待時間；處理器例外不會中斷 worker"""
+        handled: list[str] = []
+
+        async def handler(payload: str) -> None:
+            handled.append(payload)
+            if payload == "boom":
+                raise RuntimeError("handler failed")
+
+        listener = TelemetryListener(handler=handler, dispatch_workers=2, dispatch_queue_size=10)
+        with patch("src.infra.telemetry.listener.db_pool.connect_listener") as mock_connect:
+            mock_conn = MagicMock()
+            mock_conn.add_listener = AsyncMock()
+            mock_conn.remove_listener = AsyncMock()
+            mock_conn.close = AsyncMock()
+            mock_connect.return_value = mock_conn
+
+            await listener.start()
+            await listener._dispatch(None, 1, "economy_events", "boom")
+            await listener._dispatch(None, 1, "economy_events", self.SUCCESS_PAYLOAD)
+            assert listener._queue is not None
+            await asyncio.wait_for(listener._queue.join(), timeout=1)
+            stats = listener.dispatch_stats()
+            await listener.stop()
+
+        assert sorted(handled) == sorted(["boom", self.SUCCESS_PAYLOAD])
+        assert stats["processed"] == 2
+        assert stats["depth"] == 0
+        assert stats["wait_max_seconds"] >= 0
+        assert listener._dispatch_tasks == []
@@ -10,6 +10,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from src.db.gateway.economy_queries import BalanceRecord
+from src.infra.result import Ok
 from src.infra.telemetry.listener import TelemetryListener
 
 
@@ -59,12 +60,14 @@ async def test_notify_initiator_server_with_token(
         with patch("src.infra.telemetry.listener.EconomyQueryGateway") as mock_gateway_class:
             mock_gateway = MagicMock()
             mock_gateway.fetch_balance = AsyncMock(
-                return_value=BalanceRecord(
-                    guild_id=guild_id,
-                    member_id=initiator_id,
-                    balance=300,
-                    last_modified_at=datetime.now(timezone.utc),
-                    throttled_until=None,
+                return_value=Ok(
+                    BalanceRecord(
+                        guild_id=guild_id,
+                        member_id=initiator_id,
+                        balance=300,
+                        last_modified_at=datetime.now(timezone.utc),
+                        throttled_until=None,
+                    )
                 )
             )
             mock_gateway_class.return_value = mock_gateway
@@ -260,12 +263,14 @@ async def test_notify_initiator_server_message_formatting() -> None:
         with patch("src.infra.telemetry.listener.EconomyQueryGateway") as mock_gateway_class:
             mock_gateway = MagicMock()
             mock_gateway.fetch_balance = AsyncMock(
-                return_value=BalanceRecord(
-                    guild_id=guild_id,
-                    member_id=initiator_id,
-                    balance=1000,
-                    last_modified_at=datetime.now(timezone.utc),
-                    throttled_until=None,
+                return_value=Ok(
+                    BalanceRecord(
+                        guild_id=guild_id,
+                        member_id=initiator_id,
+                        balance=1000,
+                        last_modified_at=datetime.now(timezone.utc),
+                        throttled_until=None,
+                    )
                 )
             )
             mock_gateway_class.return_value = mock_gateway
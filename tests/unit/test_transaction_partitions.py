@@ -0,0 +1,117 @@
+"""Unit tests for TransactionPartitionMaintainer."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.bot.services.transaction_partitions import (
+    TransactionPartitionMaintainer,
+    _retention_from_env,
+)
+from src.infra.result import DatabaseError, Err, Ok
+
+
+def _pool_with(conn: Any) -> MagicMock:
+    acquire = MagicMock()
+    acquire.__aenter__ = AsyncMock(return_value=conn)
+    acquire.__aexit__ = AsyncMock(return_value=None)
+    pool = MagicMock()
+    pool.acquire.return_value = acquire
+    return pool
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_run_once_ensures_then_archives() -> None:
+    conn = object()
+    gateway = MagicMock()
+    gateway.ensure_transaction_partitions = AsyncMock(return_value=Ok(1))
+    gateway.archive_transaction_partitions = AsyncMock(
+        return_value=Ok(["currency_transactions_p202608"])
+    )
+    gateway.prune_daily_transfer_totals = AsyncMock(return_value=Ok(0))
+    maintainer = TransactionPartitionMaintainer(
+        pool=_pool_with(conn), gateway=gateway, retention=timedelta(days=30)
+    )
+
+    created, archived = await maintainer.run_once()
+
+    assert created == 1
+    assert archived == ["currency_transactions_p202608"]
+    gateway.ensure_transaction_partitions.assert_awaited_once_with(conn, months_ahead=2)
+    gateway.archive_transaction_partitions.assert_awaited_once_with(
+        conn, retention=timedelta(days=30)
+    )
+    before = gateway.prune_daily_transfer_totals.await_args.kwargs["before"]
+    assert before == (datetime.now(timezone.utc) - timedelta(days=30)).date()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_run_once_archive_failure_keeps_created_partitions() -> None:
+    gateway = MagicMock()
+    gateway.ensure_transaction_partitions = AsyncMock(return_value=Ok(2))
+    gateway.archive_transaction_partitions = AsyncMock(
+        return_value=Err(DatabaseError("lock timeout"))
+    )
+    gateway.prune_daily_transfer_totals = AsyncMock(return_value=Ok(0))
+    maintainer = TransactionPartitionMaintainer(pool=_pool_with(object()), gateway=gateway)
+
+    assert await maintainer.run_once() == (2, [])
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_start_without_pool_does_not_schedule_task() -> None:
+    gateway = MagicMock()
+    maintainer = TransactionPartitionMaintainer(gateway=gateway)
+
+    with patch(
+        "src.bot.services.transaction_partitions.db_pool.init_pool",
+        AsyncMock(side_effect=RuntimeError("no database")),
+    ):
+        await maintainer.start()
+
+    assert maintainer._task is None
+    assert await maintainer.run_once() == (0, [])
+    await maintainer.stop()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_loop_runs_immediately_and_stops_cleanly() -> None:
+    ran = asyncio.Event()
+    gateway = MagicMock()
+
+    async def _ensure(*_args: Any, **_kwargs: Any) -> Any:
+        ran.set()
+        return Ok(0)
+
+    gateway.ensure_transaction_partitions = AsyncMock(side_effect=_ensure)
+    gateway.archive_transaction_partitions = AsyncMock(return_value=Ok([]))
+    gateway.prune_daily_transfer_totals = AsyncMock(return_value=Ok(0))
+    maintainer = TransactionPartitionMaintainer(
+        pool=_pool_with(object()), gateway=gateway, interval_seconds=3600
+    )
+
+    await maintainer.start()
+    await asyncio.wait_for(ran.wait(), timeout=1)
+    await maintainer.stop()
+
+    assert maintainer._task is None
+    gateway.ensure_transaction_partitions.assert_awaited_once()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [("", 30), ("45", 45), ("0", 1), ("abc", 30)],
+)
+def test_retention_from_env(monkeypatch: pytest.MonkeyPatch, raw: str, expected: int) -> None:
+    monkeypatch.setenv("ECONOMY_ARCHIVE_RETENTION_DAYS", raw)
+    assert _retention_from_env() == timedelta(days=expected)
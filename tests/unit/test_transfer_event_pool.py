@@ -3,17 +3,21 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from datetime import datetime, timezone
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 from uuid import UUID, uuid4
 
+import asyncpg
 import pytest
 from faker import Faker
 
+from src.bot.services import transfer_event_pool
 from src.bot.services.council_service import CouncilService
 from src.bot.services.transfer_event_pool import TransferEventPoolCoordinator
 from src.db.gateway.economy_pending_transfers import PendingTransfer
+from src.infra.result import DatabaseError, Err, Ok
 
 
 def _snowflake(faker: Faker) -> int:
@@ -498,11 +502,13 @@ async def test_expired_cleanup_logic() -> None:
     await coordinator.start()
 
     try:
+        mock_pending_gateway.expire_pending_transfers = AsyncMock(return_value=[])
+
         # Manually trigger cleanup
         await coordinator._cleanup_expired()
 
-        # Verify cleanup query was executed
-        mock_conn.execute.assert_called()
+        # Verify the set-based expiry sweep was executed
+        mock_pending_gateway.expire_pending_transfers.assert_awaited_once()
 
     finally:
         await coordinator.stop()
@@ -705,8 +711,8 @@ async def test_execute_transfer_no_pool() -> None:
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_schedule_retry_exponential_delay(faker: Faker) -> None:
-    """Test schedule retry calculates exponential delay (Task 2.5)."""
+async def test_schedule_retry_persists_next_retry_at(faker: Faker) -> None:
+    """Test schedule retry persists the schedule instead of spawning a sleeping task."""
     mock_pool = MagicMock()
     mock_conn = AsyncMock()
 
@@ -721,17 +727,12 @@ async def test_schedule_retry_exponential_delay(faker: Faker) -> None:
     mock_pool.acquire = MagicMock(return_value=mock_context)
     mock_conn.execute = AsyncMock()
 
-    guild_id = _snowflake(faker)
-    initiator_id = _snowflake(faker)
-    target_id = _snowflake(faker)
     transfer_id = uuid4()
-
-    # Use retry_count = 3, so delay should be 2^3 = 8 seconds
     mock_pending = _create_mock_pending_transfer(
         transfer_id=transfer_id,
-        guild_id=guild_id,
-        initiator_id=initiator_id,
-        target_id=target_id,
+        guild_id=_snowflake(faker),
+        initiator_id=_snowflake(faker),
+        target_id=_snowflake(faker),
         amount=faker.random_int(min=1, max=10000),
         status="checking",
         retry_count=3,
@@ -739,7 +740,7 @@ async def test_schedule_retry_exponential_delay(faker: Faker) -> None:
 
     mock_pending_gateway = AsyncMock()
     mock_pending_gateway.get_pending_transfer = AsyncMock(return_value=mock_pending)
-    mock_pending_gateway.update_status = AsyncMock()
+    mock_pending_gateway.schedule_retry = AsyncMock(return_value=datetime.now(timezone.utc))
 
     coordinator = TransferEventPoolCoordinator(
         pool=mock_pool,
@@ -748,14 +749,13 @@ async def test_schedule_retry_exponential_delay(faker: Faker) -> None:
 
     await coordinator.start()
     try:
+        tasks_before = len(asyncio.all_tasks())
         await coordinator._schedule_retry(transfer_id)
 
-        # Verify retry task was scheduled
-        assert transfer_id in coordinator._retry_tasks
+        mock_pending_gateway.schedule_retry.assert_awaited_once()
+        assert mock_pending_gateway.schedule_retry.await_args.kwargs["transfer_id"] == transfer_id
+        assert len(asyncio.all_tasks()) == tasks_before
     finally:
-        # Cancel the scheduled task
-        if transfer_id in coordinator._retry_tasks:
-            coordinator._retry_tasks[transfer_id].cancel()
         await coordinator.stop()
 
 
@@ -777,17 +777,12 @@ async def test_schedule_retry_max_delay_cap(faker: Faker) -> None:
     mock_pool.acquire = MagicMock(return_value=mock_context)
     mock_conn.execute = AsyncMock()
 
-    guild_id = _snowflake(faker)
-    initiator_id = _snowflake(faker)
-    target_id = _snowflake(faker)
     transfer_id = uuid4()
-
-    # Use retry_count = 9, so 2^9 = 512, but should be capped at 300
     mock_pending = _create_mock_pending_transfer(
         transfer_id=transfer_id,
-        guild_id=guild_id,
-        initiator_id=initiator_id,
-        target_id=target_id,
+        guild_id=_snowflake(faker),
+        initiator_id=_snowflake(faker),
+        target_id=_snowflake(faker),
         amount=faker.random_int(min=1, max=10000),
         status="checking",
         retry_count=9,
@@ -805,18 +800,16 @@ async def test_schedule_retry_max_delay_cap(faker: Faker) -> None:
     try:
         await coordinator._schedule_retry(transfer_id)
 
-        # Verify retry task was scheduled
-        assert transfer_id in coordinator._retry_tasks
+        kwargs = mock_pending_gateway.schedule_retry.await_args.kwargs
+        assert kwargs["max_delay_seconds"] == 300
     finally:
-        if transfer_id in coordinator._retry_tasks:
-            coordinator._retry_tasks[transfer_id].cancel()
         await coordinator.stop()
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_schedule_retry_increments_count(faker: Faker) -> None:
-    """Test schedule retry increments retry count (Task 2.7)."""
+async def test_schedule_retry_already_scheduled(faker: Faker) -> None:
+    """Test a retry that is already scheduled (e.g. by another replica) is left alone."""
     mock_pool = MagicMock()
     mock_conn = AsyncMock()
 
@@ -831,16 +824,12 @@ async def test_schedule_retry_increments_count(faker: Faker) -> None:
     mock_pool.acquire = MagicMock(return_value=mock_context)
     mock_conn.execute = AsyncMock()
 
-    guild_id = _snowflake(faker)
-    initiator_id = _snowflake(faker)
-    target_id = _snowflake(faker)
     transfer_id = uuid4()
-
     mock_pending = _create_mock_pending_transfer(
         transfer_id=transfer_id,
-        guild_id=guild_id,
-        initiator_id=initiator_id,
-        target_id=target_id,
+        guild_id=_snowflake(faker),
+        initiator_id=_snowflake(faker),
+        target_id=_snowflake(faker),
         amount=faker.random_int(min=1, max=10000),
         status="checking",
         retry_count=2,
@@ -848,6 +837,7 @@ async def test_schedule_retry_increments_count(faker: Faker) -> None:
 
     mock_pending_gateway = AsyncMock()
     mock_pending_gateway.get_pending_transfer = AsyncMock(return_value=mock_pending)
+    mock_pending_gateway.schedule_retry = AsyncMock(return_value=None)
 
     coordinator = TransferEventPoolCoordinator(
         pool=mock_pool,
@@ -858,19 +848,16 @@ async def test_schedule_retry_increments_count(faker: Faker) -> None:
     try:
         await coordinator._schedule_retry(transfer_id)
 
-        # Verify UPDATE query was executed to increment retry_count
-        execute_calls = list(mock_conn.execute.call_args_list)
-        assert any("retry_count = retry_count + 1" in str(call) for call in execute_calls)
+        mock_pending_gateway.schedule_retry.assert_awaited_once()
+        mock_pending_gateway.update_status.assert_not_awaited()
     finally:
-        if transfer_id in coordinator._retry_tasks:
-            coordinator._retry_tasks[transfer_id].cancel()
         await coordinator.stop()
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_schedule_retry_cancels_existing(faker: Faker) -> None:
-    """Test schedule retry cancels existing retry task (Task 2.8)."""
+async def test_run_due_retries_claims_and_evaluates() -> None:
+    """Test the scheduler claims due retries and re-evaluates them in one transaction."""
     mock_pool = MagicMock()
     mock_conn = AsyncMock()
 
@@ -885,50 +872,54 @@ async def test_schedule_retry_cancels_existing(faker: Faker) -> None:
     mock_pool.acquire = MagicMock(return_value=mock_context)
     mock_conn.execute = AsyncMock()
 
-    guild_id = _snowflake(faker)
-    initiator_id = _snowflake(faker)
-    target_id = _snowflake(faker)
-    transfer_id = uuid4()
-
-    mock_pending = _create_mock_pending_transfer(
-        transfer_id=transfer_id,
-        guild_id=guild_id,
-        initiator_id=initiator_id,
-        target_id=target_id,
-        amount=faker.random_int(min=1, max=10000),
-        status="checking",
-        retry_count=1,
-    )
-
+    claimed = [uuid4(), uuid4()]
     mock_pending_gateway = AsyncMock()
-    mock_pending_gateway.get_pending_transfer = AsyncMock(return_value=mock_pending)
+    mock_pending_gateway.claim_due_retries = AsyncMock(return_value=claimed)
 
     coordinator = TransferEventPoolCoordinator(
         pool=mock_pool,
         pending_gateway=mock_pending_gateway,
     )
+    coordinator._check_store.record(claimed[0], "balance", 0)
 
-    await coordinator.start()
-    try:
-        # Schedule first retry
-        await coordinator._schedule_retry(transfer_id)
-        first_task = coordinator._retry_tasks[transfer_id]
+    count = await coordinator._run_due_retries()
 
-        # Schedule second retry (should cancel first)
-        await coordinator._schedule_retry(transfer_id)
-        second_task = coordinator._retry_tasks[transfer_id]
+    assert count == 2
+    mock_conn.transaction.assert_called_once()
+    mock_pending_gateway.evaluate_transfers.assert_awaited_once_with(
+        mock_conn, transfer_ids=claimed
+    )
+    assert claimed[0] not in coordinator._check_states
 
-        # Give time for cancellation to propagate
-        await asyncio.sleep(0.01)
 
-        # First task should be cancelled or done (cancellation requested)
-        # The task might be in 'cancelling' state rather than 'cancelled'
-        assert first_task.cancelling() > 0 or first_task.cancelled() or first_task.done()
-        assert second_task != first_task
-    finally:
-        if transfer_id in coordinator._retry_tasks:
-            coordinator._retry_tasks[transfer_id].cancel()
-        await coordinator.stop()
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_run_due_retries_nothing_due() -> None:
+    """Test the scheduler does not evaluate anything when no retry is due."""
+    mock_pool = MagicMock()
+    mock_conn = AsyncMock()
+
+    mock_tx = MagicMock()
+    mock_tx.__aenter__ = AsyncMock(return_value=mock_tx)
+    mock_tx.__aexit__ = AsyncMock(return_value=None)
+    mock_conn.transaction = MagicMock(return_value=mock_tx)
+
+    mock_context = MagicMock()
+    mock_context.__aenter__ = AsyncMock(return_value=mock_conn)
+    mock_context.__aexit__ = AsyncMock(return_value=None)
+    mock_pool.acquire = MagicMock(return_value=mock_context)
+    mock_conn.execute = AsyncMock()
+
+    mock_pending_gateway = AsyncMock()
+    mock_pending_gateway.claim_due_retries = AsyncMock(return_value=[])
+
+    coordinator = TransferEventPoolCoordinator(
+        pool=mock_pool,
+        pending_gateway=mock_pending_gateway,
+    )
+
+    assert await coordinator._run_due_retries() == 0
+    mock_pending_gateway.evaluate_transfers.assert_not_awaited()
 
 
 @pytest.mark.unit
@@ -982,8 +973,8 @@ async def test_schedule_retry_sends_denied_notification(faker: Faker) -> None:
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_retry_checks_resets_status(faker: Faker) -> None:
-    """Test retry checks resets status to checking (Task 2.10)."""
+async def test_cleanup_expired_updates_status(faker: Faker) -> None:
+    """Test cleanup expired rejects transfers via the set-based sweep (Task 2.13)."""
     mock_pool = MagicMock()
     mock_conn = AsyncMock()
 
@@ -991,12 +982,9 @@ async def test_retry_checks_resets_status(faker: Faker) -> None:
     mock_context.__aenter__ = AsyncMock(return_value=mock_conn)
     mock_context.__aexit__ = AsyncMock(return_value=None)
     mock_pool.acquire = MagicMock(return_value=mock_context)
-    mock_conn.execute = AsyncMock()
 
     mock_pending_gateway = AsyncMock()
-    mock_pending_gateway.update_status = AsyncMock()
-
-    transfer_id = uuid4()
+    mock_pending_gateway.expire_pending_transfers = AsyncMock(return_value=[])
 
     coordinator = TransferEventPoolCoordinator(
         pool=mock_pool,
@@ -1005,238 +993,138 @@ async def test_retry_checks_resets_status(faker: Faker) -> None:
 
     await coordinator.start()
     try:
-        await coordinator._retry_checks(transfer_id)
+        await coordinator._cleanup_expired()
 
-        # Verify status was reset to checking
-        mock_pending_gateway.update_status.assert_awaited_with(
-            mock_conn, transfer_id=transfer_id, new_status="checking"
+        mock_pending_gateway.expire_pending_transfers.assert_awaited_once_with(
+            mock_conn, limit=transfer_event_pool._EXPIRY_BATCH_SIZE
         )
+        # 不再逐列 UPDATE / pg_notify
+        mock_conn.execute.assert_not_called()
     finally:
         await coordinator.stop()
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_retry_checks_triggers_all_functions(faker: Faker) -> None:
-    """Test retry checks triggers all check functions (Task 2.11)."""
-    mock_pool = MagicMock()
+async def test_cleanup_expired_forgets_expired_states(faker: Faker) -> None:
+    """Test cleanup expired drops in-memory state for rejected transfers (Task 2.14)."""
     mock_conn = AsyncMock()
-
-    mock_context = MagicMock()
-    mock_context.__aenter__ = AsyncMock(return_value=mock_conn)
-    mock_context.__aexit__ = AsyncMock(return_value=None)
-    mock_pool.acquire = MagicMock(return_value=mock_context)
-    mock_conn.execute = AsyncMock()
+    transfer_id = uuid4()
 
     mock_pending_gateway = AsyncMock()
-    mock_pending_gateway.update_status = AsyncMock()
-
-    transfer_id = uuid4()
+    mock_pending_gateway.expire_pending_transfers = AsyncMock(return_value=[transfer_id])
 
     coordinator = TransferEventPoolCoordinator(
-        pool=mock_pool,
+        pool=None,
         pending_gateway=mock_pending_gateway,
     )
+    coordinator._check_store.record(transfer_id, "balance", 1)
 
-    await coordinator.start()
-    try:
-        await coordinator._retry_checks(transfer_id)
+    await coordinator._cleanup_expired(connection=mock_conn)
 
-        # Verify all check functions were called
-        execute_calls = [str(call) for call in mock_conn.execute.call_args_list]
-        assert any("fn_check_transfer_balance" in call for call in execute_calls)
-        assert any("fn_check_transfer_cooldown" in call for call in execute_calls)
-        assert any("fn_check_transfer_daily_limit" in call for call in execute_calls)
-    finally:
-        await coordinator.stop()
+    assert transfer_id not in coordinator._check_states
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_retry_checks_clears_state(faker: Faker) -> None:
-    """Test retry checks clears check state (Task 2.12)."""
-    mock_pool = MagicMock()
+async def test_cleanup_expired_processes_chunks_until_short_batch(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test cleanup expired keeps sweeping while chunks come back full."""
+    monkeypatch.setattr(transfer_event_pool, "_EXPIRY_BATCH_SIZE", 2)
     mock_conn = AsyncMock()
 
-    mock_context = MagicMock()
-    mock_context.__aenter__ = AsyncMock(return_value=mock_conn)
-    mock_context.__aexit__ = AsyncMock(return_value=None)
-    mock_pool.acquire = MagicMock(return_value=mock_context)
-    mock_conn.execute = AsyncMock()
-
     mock_pending_gateway = AsyncMock()
-    mock_pending_gateway.update_status = AsyncMock()
-
-    transfer_id = uuid4()
+    mock_pending_gateway.expire_pending_transfers = AsyncMock(
+        side_effect=[[uuid4(), uuid4()], [uuid4(), uuid4()], [uuid4()]]
+    )
 
     coordinator = TransferEventPoolCoordinator(
-        pool=mock_pool,
+        pool=None,
         pending_gateway=mock_pending_gateway,
     )
 
-    await coordinator.start()
-    try:
-        # First, record some check results
-        coordinator._check_store.record(transfer_id, "balance", 0)
-        coordinator._check_store.record(transfer_id, "cooldown", 1)
-
-        # Then retry checks
-        await coordinator._retry_checks(transfer_id)
+    await coordinator._cleanup_expired(connection=mock_conn)
 
-        # Check state should be cleared
-        assert transfer_id not in coordinator._check_states
-    finally:
-        await coordinator.stop()
+    assert mock_pending_gateway.expire_pending_transfers.await_count == 3
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_retry_checks_with_connection(faker: Faker) -> None:
-    """Test retry checks with externally provided connection."""
-    mock_conn = AsyncMock()
-    mock_conn.execute = AsyncMock()
-
-    mock_pending_gateway = AsyncMock()
-    mock_pending_gateway.update_status = AsyncMock()
-
+async def test_lock_registry_serialises_same_transfer() -> None:
+    """Test events for the same transfer share one lock while it is held."""
+    coordinator = TransferEventPoolCoordinator(pool=None)
     transfer_id = uuid4()
+    order: list[str] = []
 
-    coordinator = TransferEventPoolCoordinator(
-        pool=None,  # No pool
-        pending_gateway=mock_pending_gateway,
-    )
+    async def worker(name: str) -> None:
+        async with coordinator._locks.hold(transfer_id):
+            order.append(f"{name}-in")
+            await asyncio.sleep(0)
+            order.append(f"{name}-out")
 
-    await coordinator.start()
-    try:
-        await coordinator._retry_checks(transfer_id, connection=mock_conn)
+    await asyncio.gather(worker("a"), worker("b"))
 
-        # Verify check functions were called with provided connection
-        mock_pending_gateway.update_status.assert_awaited()
-    finally:
-        await coordinator.stop()
+    assert order == ["a-in", "a-out", "b-in", "b-out"]
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_cleanup_expired_updates_status(faker: Faker) -> None:
-    """Test cleanup expired updates status to rejected (Task 2.13)."""
-    mock_pool = MagicMock()
-    mock_conn = AsyncMock()
-
-    mock_context = MagicMock()
-    mock_context.__aenter__ = AsyncMock(return_value=mock_conn)
-    mock_context.__aexit__ = AsyncMock(return_value=None)
-    mock_pool.acquire = MagicMock(return_value=mock_context)
-
-    mock_tx = MagicMock()
-    mock_tx.__aenter__ = AsyncMock(return_value=mock_tx)
-    mock_tx.__aexit__ = AsyncMock(return_value=None)
-    mock_conn.transaction = MagicMock(return_value=mock_tx)
-    mock_conn.execute = AsyncMock()
-    mock_conn.fetch = AsyncMock(return_value=[])  # No expired transfers
-
-    mock_pending_gateway = AsyncMock()
-
-    coordinator = TransferEventPoolCoordinator(
-        pool=mock_pool,
-        pending_gateway=mock_pending_gateway,
-    )
+async def test_lock_registry_evicts_released_locks() -> None:
+    """Test locks are dropped once the last holder leaves (including on cancel)."""
+    coordinator = TransferEventPoolCoordinator(pool=None)
+    transfer_id = uuid4()
 
-    await coordinator.start()
-    try:
-        await coordinator._cleanup_expired()
+    async with coordinator._locks.hold(transfer_id):
+        assert coordinator.stats()["locks"] == 1
+        waiter = asyncio.create_task(coordinator._locks.hold(transfer_id).__aenter__())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
 
-        # Verify UPDATE query was executed
-        execute_calls = [str(call) for call in mock_conn.execute.call_args_list]
-        assert any("status = 'rejected'" in call for call in execute_calls)
-    finally:
-        await coordinator.stop()
+    assert coordinator.stats()["locks"] == 0
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_cleanup_expired_sends_notifications(faker: Faker) -> None:
-    """Test cleanup expired sends notifications (Task 2.14)."""
+async def test_execute_transfer_releases_check_state() -> None:
+    """Test check state is dropped when a transfer reaches a terminal status."""
     mock_pool = MagicMock()
     mock_conn = AsyncMock()
 
-    mock_context = MagicMock()
-    mock_context.__aenter__ = AsyncMock(return_value=mock_conn)
-    mock_context.__aexit__ = AsyncMock(return_value=None)
-    mock_pool.acquire = MagicMock(return_value=mock_context)
-
     mock_tx = MagicMock()
     mock_tx.__aenter__ = AsyncMock(return_value=mock_tx)
     mock_tx.__aexit__ = AsyncMock(return_value=None)
     mock_conn.transaction = MagicMock(return_value=mock_tx)
-    mock_conn.execute = AsyncMock()
-
-    # Return expired transfers
-    transfer_id = uuid4()
-    guild_id = _snowflake(faker)
-    initiator_id = _snowflake(faker)
-    target_id = _snowflake(faker)
-    amount = faker.random_int(min=1, max=10000)
-
-    mock_conn.fetch = AsyncMock(
-        return_value=[
-            {
-                "transfer_id": transfer_id,
-                "guild_id": guild_id,
-                "initiator_id": initiator_id,
-                "target_id": target_id,
-                "amount": amount,
-            }
-        ]
-    )
-
-    mock_pending_gateway = AsyncMock()
-
-    coordinator = TransferEventPoolCoordinator(
-        pool=mock_pool,
-        pending_gateway=mock_pending_gateway,
-    )
-
-    await coordinator.start()
-    try:
-        await coordinator._cleanup_expired()
-
-        # Verify pg_notify was called for each expired transfer
-        execute_calls = [str(call) for call in mock_conn.execute.call_args_list]
-        assert any(
-            "pg_notify" in call and "transfer_checks_expired" in call for call in execute_calls
-        )
-    finally:
-        await coordinator.stop()
-
+    mock_conn.fetchrow = AsyncMock(return_value=None)
 
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_get_lock_same_transfer(faker: Faker) -> None:
-    """Test get_lock returns same lock for same transfer (Task 2.15)."""
-    coordinator = TransferEventPoolCoordinator(pool=None)
+    mock_context = MagicMock()
+    mock_context.__aenter__ = AsyncMock(return_value=mock_conn)
+    mock_context.__aexit__ = AsyncMock(return_value=None)
+    mock_pool.acquire = MagicMock(return_value=mock_context)
 
+    coordinator = TransferEventPoolCoordinator(pool=mock_pool)
     transfer_id = uuid4()
+    for check in ("balance", "cooldown", "daily_limit"):
+        coordinator._check_store.record(transfer_id, check, 1)
 
-    lock1 = coordinator._get_lock(transfer_id)
-    lock2 = coordinator._get_lock(transfer_id)
+    await coordinator._execute_transfer(transfer_id)
 
-    assert lock1 is lock2
+    assert transfer_id not in coordinator._check_states
+    assert coordinator.stats() == {"locks": 0, "check_states": 0}
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
-async def test_get_lock_different_transfers(faker: Faker) -> None:
-    """Test get_lock returns different locks for different transfers."""
+def test_prune_stale_states_drops_expired_entries() -> None:
+    """Test check state that never reaches a terminal status is evicted by TTL."""
     coordinator = TransferEventPoolCoordinator(pool=None)
+    coordinator._check_store.record(uuid4(), "balance", 0)
+    coordinator._check_store.record(uuid4(), "cooldown", 1)
 
-    transfer_id1 = uuid4()
-    transfer_id2 = uuid4()
-
-    lock1 = coordinator._get_lock(transfer_id1)
-    lock2 = coordinator._get_lock(transfer_id2)
-
-    assert lock1 is not lock2
+    assert coordinator._check_store.prune(60.0, now=time.monotonic()) == 0
+    assert coordinator._check_store.prune(60.0, now=time.monotonic() + 120.0) == 2
+    assert coordinator.stats()["check_states"] == 0
 
 
 @pytest.mark.unit
@@ -1280,8 +1168,8 @@ async def test_handle_check_approved_not_running() -> None:
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_stop_cancels_retry_tasks(faker: Faker) -> None:
-    """Test stop cancels all retry tasks."""
+async def test_stop_cancels_retry_scheduler() -> None:
+    """Test stop cancels the retry scheduler loop."""
     mock_pool = MagicMock()
     mock_conn = AsyncMock()
 
@@ -1296,23 +1184,8 @@ async def test_stop_cancels_retry_tasks(faker: Faker) -> None:
     mock_pool.acquire = MagicMock(return_value=mock_context)
     mock_conn.execute = AsyncMock()
 
-    guild_id = _snowflake(faker)
-    initiator_id = _snowflake(faker)
-    target_id = _snowflake(faker)
-    transfer_id = uuid4()
-
-    mock_pending = _create_mock_pending_transfer(
-        transfer_id=transfer_id,
-        guild_id=guild_id,
-        initiator_id=initiator_id,
-        target_id=target_id,
-        amount=faker.random_int(min=1, max=10000),
-        status="checking",
-        retry_count=1,
-    )
-
     mock_pending_gateway = AsyncMock()
-    mock_pending_gateway.get_pending_transfer = AsyncMock(return_value=mock_pending)
+    mock_pending_gateway.claim_due_retries = AsyncMock(return_value=[])
 
     coordinator = TransferEventPoolCoordinator(
         pool=mock_pool,
@@ -1320,17 +1193,13 @@ async def test_stop_cancels_retry_tasks(faker: Faker) -> None:
     )
 
     await coordinator.start()
+    task = coordinator._retry_scheduler_task
+    assert task is not None
+    assert not task.done()
 
-    # Schedule a retry
-    await coordinator._schedule_retry(transfer_id)
-    task = coordinator._retry_tasks[transfer_id]
-
-    # Stop coordinator
     await coordinator.stop()
 
-    # Task should be cancelled
     assert task.cancelled() or task.done()
-    assert len(coordinator._retry_tasks) == 0
 
 
 @pytest.mark.unit
@@ -1359,8 +1228,8 @@ async def test_schedule_retry_pending_not_found(faker: Faker) -> None:
     try:
         await coordinator._schedule_retry(transfer_id)
 
-        # No retry task should be scheduled
-        assert transfer_id not in coordinator._retry_tasks
+        # No retry should be scheduled
+        mock_pending_gateway.schedule_retry.assert_not_awaited()
     finally:
         await coordinator.stop()
 
@@ -1433,14 +1302,8 @@ async def test_cleanup_expired_with_connection() -> None:
     """Test cleanup expired with externally provided connection."""
     mock_conn = AsyncMock()
 
-    mock_tx = MagicMock()
-    mock_tx.__aenter__ = AsyncMock(return_value=mock_tx)
-    mock_tx.__aexit__ = AsyncMock(return_value=None)
-    mock_conn.transaction = MagicMock(return_value=mock_tx)
-    mock_conn.execute = AsyncMock()
-    mock_conn.fetch = AsyncMock(return_value=[])
-
     mock_pending_gateway = AsyncMock()
+    mock_pending_gateway.expire_pending_transfers = AsyncMock(return_value=[])
 
     coordinator = TransferEventPoolCoordinator(
         pool=None,  # No pool
@@ -1451,16 +1314,18 @@ async def test_cleanup_expired_with_connection() -> None:
     try:
         await coordinator._cleanup_expired(connection=mock_conn)
 
-        # Verify UPDATE query was executed
-        mock_conn.execute.assert_called()
+        # Verify the sweep ran on the provided connection
+        mock_pending_gateway.expire_pending_transfers.assert_awaited_once_with(
+            mock_conn, limit=transfer_event_pool._EXPIRY_BATCH_SIZE
+        )
     finally:
         await coordinator.stop()
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_retry_checks_no_pool_no_connection() -> None:
-    """Test retry checks returns early when no pool and no connection."""
+async def test_schedule_retry_no_pool() -> None:
+    """Test schedule retry returns early when no pool."""
     mock_pending_gateway = AsyncMock()
     transfer_id = uuid4()
 
@@ -1471,48 +1336,169 @@ async def test_retry_checks_no_pool_no_connection() -> None:
 
     await coordinator.start()
     try:
-        await coordinator._retry_checks(transfer_id)
+        await coordinator._schedule_retry(transfer_id)
 
         # Nothing should be called
-        mock_pending_gateway.update_status.assert_not_awaited()
+        mock_pending_gateway.get_pending_transfer.assert_not_awaited()
     finally:
         await coordinator.stop()
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_schedule_retry_no_pool() -> None:
-    """Test schedule retry returns early when no pool."""
+async def test_cleanup_expired_no_pool() -> None:
+    """Test cleanup expired returns early when no pool and no connection."""
     mock_pending_gateway = AsyncMock()
-    transfer_id = uuid4()
 
     coordinator = TransferEventPoolCoordinator(
         pool=None,
         pending_gateway=mock_pending_gateway,
     )
 
-    await coordinator.start()
-    try:
-        await coordinator._schedule_retry(transfer_id)
+    # Don't start (or start without pool)
+    await coordinator._cleanup_expired()
 
-        # Nothing should be called
-        mock_pending_gateway.get_pending_transfer.assert_not_awaited()
-    finally:
-        await coordinator.stop()
+    # Nothing should happen, no exceptions
+
+
+def _mock_pool_with_transactions() -> tuple[MagicMock, AsyncMock]:
+    mock_pool = MagicMock()
+    mock_conn = AsyncMock()
+
+    mock_tx = MagicMock()
+    mock_tx.__aenter__ = AsyncMock(return_value=mock_tx)
+    mock_tx.__aexit__ = AsyncMock(return_value=None)
+    mock_conn.transaction = MagicMock(return_value=mock_tx)
+
+    mock_context = MagicMock()
+    mock_context.__aenter__ = AsyncMock(return_value=mock_conn)
+    mock_context.__aexit__ = AsyncMock(return_value=None)
+    mock_pool.acquire = MagicMock(return_value=mock_context)
+    return mock_pool, mock_conn
+
+
+def _approved_row(faker: Faker) -> dict[str, object]:
+    return {
+        "transfer_id": uuid4(),
+        "guild_id": _snowflake(faker),
+        "initiator_id": _snowflake(faker),
+        "target_id": _snowflake(faker),
+        "amount": faker.random_int(min=1, max=10000),
+        "metadata": {},
+    }
+
+
+@pytest.mark.unit
+def test_workers_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test worker count is read from TRANSFER_EVENT_POOL_WORKERS."""
+    monkeypatch.setenv("TRANSFER_EVENT_POOL_WORKERS", "4")
+    assert TransferEventPoolCoordinator(pool=None)._worker_count == 4
+
+    monkeypatch.setenv("TRANSFER_EVENT_POOL_WORKERS", "not-a-number")
+    assert TransferEventPoolCoordinator(pool=None)._worker_count == 0
+
+    assert TransferEventPoolCoordinator(pool=None, workers=2)._worker_count == 2
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_cleanup_expired_no_pool() -> None:
-    """Test cleanup expired returns early when no pool and no connection."""
+async def test_drain_approved_executes_claimed_batch(faker: Faker) -> None:
+    """Test workers execute every claimed row and mark it completed."""
+    mock_pool, mock_conn = _mock_pool_with_transactions()
+    rows = [_approved_row(faker) for _ in range(3)]
+
     mock_pending_gateway = AsyncMock()
+    mock_pending_gateway.claim_approved = AsyncMock(side_effect=[[row] for row in rows] + [[]])
+    mock_transfer_gateway = AsyncMock()
+    mock_transfer_gateway.transfer_currency = AsyncMock(
+        return_value=Ok(SimpleNamespace(transaction_id=uuid4()))
+    )
 
     coordinator = TransferEventPoolCoordinator(
-        pool=None,
+        pool=mock_pool,
         pending_gateway=mock_pending_gateway,
+        transfer_gateway=mock_transfer_gateway,
+        workers=0,
     )
 
-    # Don't start (or start without pool)
-    await coordinator._cleanup_expired()
+    assert await coordinator._drain_approved() == 3
+    assert mock_transfer_gateway.transfer_currency.await_count == 3
+    statuses = [c.kwargs["new_status"] for c in mock_pending_gateway.update_status.await_args_list]
+    assert statuses == ["completed"] * 3
+    # 每筆各自領取並提交：一個外層交易加一個 savepoint，最後一次領取為空
+    assert all(c.kwargs["limit"] == 1 for c in mock_pending_gateway.claim_approved.await_args_list)
+    assert mock_conn.transaction.call_count == 3 * 2 + 1
 
-    # Nothing should happen, no exceptions
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_drain_approved_rejects_failed_and_skips_conflicts(faker: Faker) -> None:
+    """Test a failing row is rejected while a lock conflict ends the sweep."""
+    mock_pool, mock_conn = _mock_pool_with_transactions()
+    ok_row, failed_row, conflict_row = (_approved_row(faker) for _ in range(3))
+
+    mock_pending_gateway = AsyncMock()
+    untouched_row = _approved_row(faker)
+    mock_pending_gateway.claim_approved = AsyncMock(
+        side_effect=[[ok_row], [failed_row], [conflict_row], [untouched_row]]
+    )
+    mock_transfer_gateway = AsyncMock()
+    mock_transfer_gateway.transfer_currency = AsyncMock(
+        side_effect=[
+            Ok(SimpleNamespace(transaction_id=uuid4())),
+            Err(DatabaseError("insufficient funds")),
+            Err(DatabaseError("deadlock", cause=asyncpg.DeadlockDetectedError("deadlock"))),
+        ]
+    )
+
+    coordinator = TransferEventPoolCoordinator(
+        pool=mock_pool,
+        pending_gateway=mock_pending_gateway,
+        transfer_gateway=mock_transfer_gateway,
+        workers=0,
+    )
+
+    assert await coordinator._drain_approved() == 3
+    updates = {
+        c.kwargs["transfer_id"]: c.kwargs["new_status"]
+        for c in mock_pending_gateway.update_status.await_args_list
+    }
+    assert updates == {
+        ok_row["transfer_id"]: "completed",
+        failed_row["transfer_id"]: "rejected",
+    }
+    # 衝突後結束本輪，不再領取
+    assert mock_pending_gateway.claim_approved.await_count == 3
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_handle_check_approved_wakes_workers() -> None:
+    """Test approval events only wake the worker pool when workers are enabled."""
+    mock_pool, _ = _mock_pool_with_transactions()
+    mock_pending_gateway = AsyncMock()
+    mock_pending_gateway.claim_approved = AsyncMock(return_value=[])
+    mock_pending_gateway.claim_due_retries = AsyncMock(return_value=[])
+
+    coordinator = TransferEventPoolCoordinator(
+        pool=mock_pool,
+        pending_gateway=mock_pending_gateway,
+        workers=2,
+    )
+
+    await coordinator.start()
+    try:
+        assert len(coordinator._worker_tasks) == 2
+        await asyncio.sleep(0.01)
+        mock_pending_gateway.claim_approved.assert_awaited()
+        mock_pending_gateway.claim_approved.reset_mock()
+
+        await coordinator.handle_check_approved(transfer_id=uuid4())
+        await asyncio.sleep(0.01)
+
+        mock_pending_gateway.claim_approved.assert_awaited()
+        mock_pending_gateway.get_pending_transfer.assert_not_awaited()
+    finally:
+        await coordinator.stop()
+
+    assert coordinator._worker_tasks == []
@@ -14,6 +14,7 @@ from faker import Faker
 from src.bot.services.transfer_service import (
     InsufficientBalanceError,
     TransferError,
+    TransferItem,
     TransferService,
     TransferThrottleError,
     TransferValidationError,
@@ -1224,3 +1225,170 @@ async def test_transfer_currency_metadata_isolation(faker: Faker) -> None:
     assert call_kwargs["metadata"]["reason"] == reason
     assert call_kwargs["metadata"]["key1"] == "value1"
     assert call_kwargs["metadata"]["key2"] == "value2"
+
+
+# =============================================================================
+# Test: transfer_many batch API
+# =============================================================================
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_transfer_many_success_preserves_order(faker: Faker) -> None:
+    """Batch transfers return one TransferResult per item, in input order."""
+    guild_id = _snowflake(faker)
+    initiator_id = _snowflake(faker)
+    targets = [_snowflake(faker) for _ in range(3)]
+
+    mock_gateway = AsyncMock()
+    mock_gateway.transfer_currency_batch.return_value = Ok(
+        [
+            _create_transfer_procedure_result(
+                guild_id=guild_id,
+                initiator_id=initiator_id,
+                target_id=target_id,
+                amount=index + 1,
+            )
+            for index, target_id in enumerate(targets)
+        ]
+    )
+
+    fake_conn = FakeConnection()
+    service = TransferService(
+        pool=FakePool(fake_conn),  # type: ignore[arg-type]
+        gateway=mock_gateway,
+        event_pool_enabled=True,  # 批次轉帳不經過事件池
+    )
+
+    results = await service.transfer_many(
+        guild_id=guild_id,
+        transfers=[
+            TransferItem(initiator_id=initiator_id, target_id=target_id, amount=index + 1)
+            for index, target_id in enumerate(targets)
+        ],
+    )
+
+    assert [r.target_id for r in results] == targets
+    assert all(isinstance(r, TransferResult) for r in results)
+    assert fake_conn._txn is not None and fake_conn._txn.committed
+    mock_gateway.transfer_currency_batch.assert_awaited_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_transfer_many_merges_reason_into_metadata(faker: Faker) -> None:
+    """Reason is folded into each item's metadata without mutating the caller's dict."""
+    guild_id = _snowflake(faker)
+    initiator_id = _snowflake(faker)
+    target_id = _snowflake(faker)
+    metadata = {"source": "payroll"}
+
+    mock_gateway = AsyncMock()
+    mock_gateway.transfer_currency_batch.return_value = Ok(
+        [
+            _create_transfer_procedure_result(
+                guild_id=guild_id,
+                initiator_id=initiator_id,
+                target_id=target_id,
+                amount=10,
+            )
+        ]
+    )
+
+    service = TransferService(
+        pool=FakePool(FakeConnection()),  # type: ignore[arg-type]
+        gateway=mock_gateway,
+    )
+
+    await service.transfer_many(
+        guild_id=guild_id,
+        transfers=[
+            TransferItem(
+                initiator_id=initiator_id,
+                target_id=target_id,
+                amount=10,
+                reason="福利發放",
+                metadata=metadata,
+            )
+        ],
+    )
+
+    sent = mock_gateway.transfer_currency_batch.call_args.kwargs["transfers"]
+    assert sent == [
+        {
+            "initiator_id": initiator_id,
+            "target_id": target_id,
+            "amount": 10,
+            "metadata": {"source": "payroll", "reason": "福利發放"},
+        }
+    ]
+    assert metadata == {"source": "payroll"}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_transfer_many_empty_is_noop(faker: Faker) -> None:
+    """An empty batch never touches the database."""
+    mock_gateway = AsyncMock()
+    service = TransferService(
+        pool=FakePool(FakeConnection()),  # type: ignore[arg-type]
+        gateway=mock_gateway,
+    )
+
+    assert await service.transfer_many(guild_id=_snowflake(faker), transfers=[]) == []
+    mock_gateway.transfer_currency_batch.assert_not_awaited()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_transfer_many_validation_reports_position(faker: Faker) -> None:
+    """Invalid items are rejected before reaching the database."""
+    guild_id = _snowflake(faker)
+    member_id = _snowflake(faker)
+    mock_gateway = AsyncMock()
+    service = TransferService(
+        pool=FakePool(FakeConnection()),  # type: ignore[arg-type]
+        gateway=mock_gateway,
+    )
+
+    with pytest.raises(TransferValidationError) as exc_info:
+        await service.transfer_many(
+            guild_id=guild_id,
+            transfers=[
+                TransferItem(initiator_id=member_id, target_id=_snowflake(faker), amount=5),
+                TransferItem(initiator_id=member_id, target_id=_snowflake(faker), amount=0),
+            ],
+        )
+
+    assert "#2" in str(exc_info.value)
+    mock_gateway.transfer_currency_batch.assert_not_awaited()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_transfer_many_insufficient_balance_rolls_back(faker: Faker) -> None:
+    """A failing item maps to the same exception types as single transfers."""
+    pg_error = asyncpg.RaiseError("Transfer denied: insufficient funds for batch item #3.")
+    pg_error.sqlstate = "P0001"
+
+    mock_gateway = AsyncMock()
+    mock_gateway.transfer_currency_batch.return_value = Err(
+        DatabaseError("Database error", cause=pg_error)
+    )
+
+    fake_conn = FakeConnection()
+    service = TransferService(
+        pool=FakePool(fake_conn),  # type: ignore[arg-type]
+        gateway=mock_gateway,
+    )
+
+    with pytest.raises(InsufficientBalanceError):
+        await service.transfer_many(
+            guild_id=_snowflake(faker),
+            transfers=[
+                TransferItem(initiator_id=_snowflake(faker), target_id=_snowflake(faker), amount=1)
+            ],
+        )
+
+    assert fake_conn._txn is not None and fake_conn._txn.rolled_back
+    assert not fake_conn._txn.committed